@@ -57,15 +57,16 @@ export default function AdminDashboard() {
       
       // Load data from multiple admin endpoints
       const [paymentsRes, violationsRes, usersRes] = await Promise.all([
-        fetch('/api/admin/payments').catch(() => ({ ok: false })),
+        fetch('/api/admin/payments/analytics?timeframe=all').catch(() => ({ ok: false })),
         fetch('/api/admin/violations').catch(() => ({ ok: false })),
         fetch('/api/admin/users').catch(() => ({ ok: false }))
       ])
 
-      // Process payments data
-      let paymentsData = { payments: [], statistics: {} }
+      // Process payment analytics (USD totals)
+      let paymentTotals = null
       if (paymentsRes.ok) {
-        paymentsData = await paymentsRes.json()
+        const paymentsData = await paymentsRes.json()
+        paymentTotals = paymentsData.analytics?.by_currency?.find(row => row.currency === 'USD') || null
       }
 
       // Process violations data  
@@ -77,12 +78,15 @@ export default function AdminDashboard() {
       // Calculate comprehensive metrics
       const metrics = {
         total_users: 156, // Mock data - would come from users endpoint
-        total_payments: paymentsData.payments?.length || 0,
-        total_volume: paymentsData.payments?.reduce((sum, p) => sum + (p.amount_cents || 0), 0) || 0,
+        total_payments: paymentTotals
+          ? paymentTotals.completed_count + paymentTotals.escrow_count + paymentTotals.pending_count +
+            paymentTotals.refunded_count + paymentTotals.failed_count
+          : 0,
+        total_volume: paymentTotals?.volume_cents || 0,
         active_offers: 23, // Mock data
         pending_payouts: 5, // Mock data  
         active_violations: violationsData.statistics?.violations_today || 0,
-        platform_revenue: Math.round((paymentsData.payments?.reduce((sum, p) => sum + (p.amount_cents || 0), 0) || 0) * 0.2),
+        platform_revenue: paymentTotals?.fees_cents || 0,
         growth_rate: 12.5 // Mock data
       }
 
@@ -25,6 +25,7 @@ import {
   Plus
 } from 'lucide-react';
 import { formatPrice, formatDate } from '@/lib/formatters';
+import { authGetSession } from '@/lib/auth';
 
 const ManualPayoutsPage = () => {
   const [payouts, setPayouts] = useState([]);
@@ -36,98 +37,39 @@ const ManualPayoutsPage = () => {
   const [selectedPayouts, setSelectedPayouts] = useState([]);
   const [showCreateModal, setShowCreateModal] = useState(false);
   const [processingPayout, setProcessingPayout] = useState(null);
+  const [bulkReleasing, setBulkReleasing] = useState(false);
 
-  // Mock payout data for demonstration
-  const mockPayouts = [
-    {
-      id: '1',
-      creator_id: 'creator-1',
-      creator_name: 'Sarah Johnson',
-      creator_email: 'sarah@example.com',
-      amount_cents: 45000, // $450.00
-      currency: 'USD',
-      status: 'pending',
-      created_at: '2025-01-10T10:00:00Z',
-      offer_id: 'offer-1',
-      campaign_title: 'Summer Campaign 2025',
-      payment_method: 'manual',
-      notes: 'Stripe Connect not yet set up',
-      priority: 'normal'
-    },
-    {
-      id: '2',
-      creator_id: 'creator-2',
-      creator_name: 'Mike Chen',
-      creator_email: 'mike@example.com',
-      amount_cents: 78000, // $780.00
-      currency: 'USD',
-      status: 'processing',
-      created_at: '2025-01-09T15:30:00Z',
-      offer_id: 'offer-2',
-      campaign_title: 'Product Launch Campaign',
-      payment_method: 'manual',
-      notes: 'High priority payout',
-      priority: 'high'
-    },
-    {
-      id: '3',
-      creator_id: 'creator-3',
-      creator_name: 'Emma Rodriguez',
-      creator_email: 'emma@example.com',
-      amount_cents: 32000, // $320.00
-      currency: 'USD',
-      status: 'completed',
-      created_at: '2025-01-08T09:15:00Z',
-      completed_at: '2025-01-08T14:30:00Z',
-      offer_id: 'offer-3',
-      campaign_title: 'Brand Awareness Campaign',
-      payment_method: 'manual',
-      notes: 'Paid via bank transfer',
-      priority: 'normal'
-    },
-    {
-      id: '4',
-      creator_id: 'creator-4',
-      creator_name: 'David Wilson',
-      creator_email: 'david@example.com',
-      amount_cents: 56000, // $560.00
-      currency: 'USD',
-      status: 'failed',
-      created_at: '2025-01-07T16:45:00Z',
-      offer_id: 'offer-4',
-      campaign_title: 'Holiday Special Campaign',
-      payment_method: 'manual',
-      notes: 'Bank details incorrect - need update',
-      priority: 'normal',
-      failure_reason: 'Invalid bank account information'
-    },
-    {
-      id: '5',
-      creator_id: 'creator-5',
-      creator_name: 'Lisa Thompson',
-      creator_email: 'lisa@example.com',
-      amount_cents: 92000, // $920.00
-      currency: 'USD',
-      status: 'pending',
-      created_at: '2025-01-11T11:20:00Z',
-      offer_id: 'offer-5',
-      campaign_title: 'Influencer Collaboration',
-      payment_method: 'manual',
-      notes: 'Large payout - requires approval',
-      priority: 'high'
+  // Admin API routes authenticate with the Supabase session token
+  const authHeaders = async () => {
+    const { session } = await authGetSession();
+    if (!session?.access_token) {
+      throw new Error('Your session has expired - please sign in again');
     }
-  ];
+    return { Authorization: `Bearer ${session.access_token}` };
+  };
+
+  // Flatten the payouts API rows into the fields the console renders; released shows as completed
+  const toPayoutView = (payout) => ({
+    ...payout,
+    status: payout.status === 'released' ? 'completed' : payout.status,
+    creator_name: payout.creator?.full_name || 'Unknown creator',
+    creator_email: payout.creator?.email || '',
+    campaign_title: payout.payment?.offer?.campaign?.title || '',
+    payment_method: payout.method,
+    notes: payout.admin_notes,
+    priority: 'normal'
+  });
 
   const payoutStats = {
-    total_payouts: mockPayouts.length,
-    pending_payouts: mockPayouts.filter(p => p.status === 'pending').length,
-    processing_payouts: mockPayouts.filter(p => p.status === 'processing').length,
-    completed_payouts: mockPayouts.filter(p => p.status === 'completed').length,
-    failed_payouts: mockPayouts.filter(p => p.status === 'failed').length,
-    total_pending_amount: mockPayouts
+    total_payouts: payouts.length,
+    pending_payouts: payouts.filter(p => p.status === 'pending').length,
+    processing_payouts: payouts.filter(p => p.status === 'processing').length,
+    completed_payouts: payouts.filter(p => p.status === 'completed').length,
+    failed_payouts: payouts.filter(p => p.status === 'failed').length,
+    total_pending_amount: payouts
       .filter(p => p.status === 'pending')
       .reduce((sum, p) => sum + p.amount_cents, 0),
-    total_completed_amount: mockPayouts
+    total_completed_amount: payouts
       .filter(p => p.status === 'completed')
       .reduce((sum, p) => sum + p.amount_cents, 0)
   };
@@ -139,14 +81,18 @@ const ManualPayoutsPage = () => {
   const loadPayouts = async () => {
     try {
       setLoading(true);
-      // In production, this would call: const response = await fetch('/api/admin/payouts');
-      // For now, use mock data
-      setTimeout(() => {
-        setPayouts(mockPayouts);
-        setLoading(false);
-      }, 1000);
+      const response = await fetch('/api/admin/payouts', { headers: await authHeaders() });
+      const result = await response.json();
+
+      if (!response.ok) {
+        throw new Error(result.error || 'Failed to load payouts');
+      }
+
+      setPayouts((result.payouts || []).map(toPayoutView));
+      setSelectedPayouts([]);
     } catch (err) {
-      setError('Failed to load payouts');
+      setError(err.message || 'Failed to load payouts');
+    } finally {
       setLoading(false);
     }
   };
@@ -207,6 +153,46 @@ const ManualPayoutsPage = () => {
     }
   };
 
+  // Release all selected payouts in one request; each payout gets its own outcome back
+  const handleBulkRelease = async () => {
+    if (selectedPayouts.length === 0) return;
+
+    try {
+      setBulkReleasing(true);
+
+      const response = await fetch('/api/admin/payouts/bulk-release', {
+        method: 'POST',
+        headers: { ...(await authHeaders()), 'Content-Type': 'application/json' },
+        body: JSON.stringify({ payout_ids: selectedPayouts })
+      });
+      const result = await response.json();
+
+      if (!response.ok) {
+        throw new Error(result.error || 'Failed to release payouts');
+      }
+
+      const outcomes = new Map(result.results.map(r => [r.payout_id, r.outcome]));
+      setPayouts(payouts.map(payout =>
+        outcomes.get(payout.id) === 'released'
+          ? { ...payout, status: 'completed', completed_at: new Date().toISOString() }
+          : payout
+      ));
+      setSelectedPayouts(selectedPayouts.filter(id => outcomes.get(id) !== 'released'));
+
+      setSuccess(result.message);
+      setTimeout(() => setSuccess(''), 3000);
+      if (result.failed > 0) {
+        setError(`${result.failed} payout${result.failed === 1 ? '' : 's'} could not be released`);
+        setTimeout(() => setError(''), 5000);
+      }
+    } catch (err) {
+      setError(err.message || 'Failed to release payouts');
+      setTimeout(() => setError(''), 3000);
+    } finally {
+      setBulkReleasing(false);
+    }
+  };
+
   const filteredPayouts = payouts.filter(payout => {
     const matchesSearch = payout.creator_name.toLowerCase().includes(searchTerm.toLowerCase()) ||
                          payout.creator_email.toLowerCase().includes(searchTerm.toLowerCase()) ||
@@ -217,6 +203,21 @@ const ManualPayoutsPage = () => {
     return matchesSearch && matchesStatus;
   });
 
+  // Only pending manual payouts can be bulk released; stripe payouts go through the transfer runner
+  const isReleasable = (payout) => payout.status === 'pending' && payout.payment_method === 'manual';
+
+  const selectablePayoutIds = filteredPayouts
+    .filter(isReleasable)
+    .map(payout => payout.id);
+  const allSelectableSelected = selectablePayoutIds.length > 0 &&
+    selectablePayoutIds.every(id => selectedPayouts.includes(id));
+
+  const toggleSelectAll = () => {
+    setSelectedPayouts(allSelectableSelected
+      ? selectedPayouts.filter(id => !selectablePayoutIds.includes(id))
+      : [...new Set([...selectedPayouts, ...selectablePayoutIds])]);
+  };
+
   if (loading) {
     return (
       <ProtectedRoute requiredRole="admin">
@@ -361,7 +362,34 @@ const ManualPayoutsPage = () => {
         {/* Payouts List */}
         <Card>
           <CardHeader>
-            <CardTitle>Payout Queue ({filteredPayouts.length})</CardTitle>
+            <div className="flex items-center justify-between">
+              <CardTitle>Payout Queue ({filteredPayouts.length})</CardTitle>
+              {selectablePayoutIds.length > 0 && (
+                <div className="flex items-center space-x-3">
+                  <label className="flex items-center space-x-2 text-sm text-gray-600">
+                    <input
+                      type="checkbox"
+                      checked={allSelectableSelected}
+                      onChange={toggleSelectAll}
+                    />
+                    <span>Select all pending</span>
+                  </label>
+                  <Button
+                    size="sm"
+                    onClick={handleBulkRelease}
+                    disabled={selectedPayouts.length === 0 || bulkReleasing}
+                    className="bg-green-600 hover:bg-green-700"
+                  >
+                    {bulkReleasing ? (
+                      <RefreshCw className="w-4 h-4 mr-1 animate-spin" />
+                    ) : (
+                      <CheckCircle className="w-4 h-4 mr-1" />
+                    )}
+                    Release Selected ({selectedPayouts.length})
+                  </Button>
+                </div>
+              )}
+            </div>
           </CardHeader>
           <CardContent>
             {filteredPayouts.length === 0 ? (
@@ -381,6 +409,19 @@ const ManualPayoutsPage = () => {
                     <CardContent className="pt-4">
                       <div className="flex items-center justify-between">
                         <div className="flex items-center space-x-4">
+                          {isReleasable(payout) && (
+                            <input
+                              type="checkbox"
+                              checked={selectedPayouts.includes(payout.id)}
+                              onChange={(e) => {
+                                if (e.target.checked) {
+                                  setSelectedPayouts([...selectedPayouts, payout.id]);
+                                } else {
+                                  setSelectedPayouts(selectedPayouts.filter(id => id !== payout.id));
+                                }
+                              }}
+                            />
+                          )}
                           <div className="w-10 h-10 bg-purple-100 rounded-full flex items-center justify-center">
                             <User className="w-5 h-5 text-purple-600" />
                           </div>
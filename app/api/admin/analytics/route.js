@@ -1,5 +1,6 @@
 import { NextResponse } from 'next/server';
 import { verifyAdminAccess } from '../../../../lib/auth-helpers.js';
+import { getPaymentAnalytics, ANALYTICS_TIMEFRAMES } from '../../../../lib/marketplace/payment-analytics.js';
 
 // Force dynamic rendering for this API route
 export const dynamic = 'force-dynamic';
@@ -120,14 +121,20 @@ export async function GET(request) {
     // Financial Metrics
     if (metrics.includes('all') || metrics.includes('financial')) {
       try {
-        const { data: allPayments } = await supabase
-          .from('payments')
-          .select('id, amount_cents, currency, platform_fee_cents, status, created_at');
+        // Payment totals are aggregated in SQL (cached, invalidated on payment events)
+        const periodTimeframe = ANALYTICS_TIMEFRAMES.includes(timeframe) ? timeframe : '30d';
+        const [allTimeResult, periodResult] = await Promise.all([
+          getPaymentAnalytics(supabase, { timeframe: 'all' }),
+          getPaymentAnalytics(supabase, { timeframe: periodTimeframe })
+        ]);
+        if (allTimeResult.error) throw allTimeResult.error;
+        if (periodResult.error) throw periodResult.error;
 
-        const { data: newPayments } = await supabase
-          .from('payments')
-          .select('id, amount_cents, currency, platform_fee_cents, status, created_at')
-          .gte('created_at', startDate.toISOString());
+        const sumTotals = (rows, field) => rows.reduce((sum, row) => sum + row[field], 0);
+        const countPayments = (rows) => rows.reduce((sum, row) =>
+          sum + row.completed_count + row.escrow_count + row.pending_count + row.refunded_count + row.failed_count, 0);
+        const allPayments = allTimeResult.data.by_currency;
+        const newPayments = periodResult.data.by_currency;
 
         const { data: allPayouts } = await supabase
           .from('payouts')
@@ -139,17 +146,19 @@ export async function GET(request) {
           .gte('created_at', startDate.toISOString());
 
         analytics.financial_metrics = {
-          total_payments: allPayments?.length || 0,
-          total_revenue: allPayments?.reduce((sum, p) => sum + (p.amount_cents || 0), 0) || 0,
-          total_fees_collected: allPayments?.reduce((sum, p) => sum + (p.platform_fee_cents || 0), 0) || 0,
-          new_payments_period: newPayments?.length || 0,
-          new_revenue_period: newPayments?.reduce((sum, p) => sum + (p.amount_cents || 0), 0) || 0,
-          new_fees_period: newPayments?.reduce((sum, p) => sum + (p.platform_fee_cents || 0), 0) || 0,
+          total_payments: countPayments(allPayments),
+          total_revenue: sumTotals(allPayments, 'volume_cents'),
+          total_fees_collected: sumTotals(allPayments, 'fees_cents'),
+          new_payments_period: countPayments(newPayments),
+          new_revenue_period: sumTotals(newPayments, 'volume_cents'),
+          new_fees_period: sumTotals(newPayments, 'fees_cents'),
           total_payouts: allPayouts?.length || 0,
           total_payout_amount: allPayouts?.reduce((sum, p) => sum + (p.amount_cents || 0), 0) || 0,
           pending_payouts: allPayouts?.filter(p => p.status === 'pending').length || 0,
           completed_payouts: allPayouts?.filter(p => p.status === 'completed').length || 0,
-          escrowed_payments: allPayments?.filter(p => p.status === 'paid_escrow').length || 0
+          escrowed_payments: sumTotals(allPayments, 'escrow_count'),
+          active_escrow_cents: sumTotals(allPayments, 'escrow_cents'),
+          payments_by_currency: allPayments
         };
       } catch (error) {
         console.error('Error fetching financial metrics:', error);
@@ -0,0 +1,80 @@
+// app/api/admin/fx-rates/route.js
+import { NextResponse } from 'next/server'
+import { verifyAdminAccess } from '@/lib/auth-helpers'
+import { createClient } from '@supabase/supabase-js'
+import { loadFxRates, refreshFxRates } from '@/lib/marketplace/fx-rates'
+
+// Force dynamic rendering for this API route
+export const dynamic = 'force-dynamic'
+
+// Create Supabase client with environment variable checks
+function getSupabaseAdminClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for admin fx-rates')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
+// GET /api/admin/fx-rates - active rates (units per USD)
+export async function GET(request) {
+  try {
+    const adminCheck = await verifyAdminAccess(request)
+    if (!adminCheck.success) {
+      return NextResponse.json({ error: 'Unauthorized access' }, { status: 403 })
+    }
+
+    const supabase = getSupabaseAdminClient()
+    if (!supabase) {
+      return NextResponse.json({ error: 'Database service unavailable' }, { status: 503 })
+    }
+
+    const { data: rates, error, cacheHit } = await loadFxRates(supabase)
+
+    return NextResponse.json({
+      rates,
+      base: 'USD',
+      cached: cacheHit,
+      stale: Boolean(error)
+    })
+  } catch (error) {
+    console.error('❌ Error in admin fx-rates GET:', error)
+    return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
+  }
+}
+
+// POST /api/admin/fx-rates - refresh fx_rates from the configured provider
+export async function POST(request) {
+  try {
+    const adminCheck = await verifyAdminAccess(request)
+    if (!adminCheck.success) {
+      return NextResponse.json({ error: 'Unauthorized access' }, { status: 403 })
+    }
+
+    const supabase = getSupabaseAdminClient()
+    if (!supabase) {
+      return NextResponse.json({ error: 'Database service unavailable' }, { status: 503 })
+    }
+
+    console.log('👨‍💼 Admin refreshing FX rates')
+    const { data: rates, error } = await refreshFxRates(supabase)
+
+    if (error) {
+      console.error('❌ Error refreshing FX rates:', error.message)
+      return NextResponse.json(
+        { error: 'Failed to refresh FX rates', details: error.message },
+        { status: error.status || 500 }
+      )
+    }
+
+    console.log('✅ FX rates refreshed:', rates)
+    return NextResponse.json({ rates, base: 'USD', message: 'FX rates refreshed successfully' })
+  } catch (error) {
+    console.error('❌ Error in admin fx-rates POST:', error)
+    return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
+  }
+}
@@ -0,0 +1,56 @@
+// app/api/admin/payments/[id]/events/route.js
+import { NextResponse } from 'next/server'
+import { createClient } from '@supabase/supabase-js'
+import { verifyAdminAccess } from '@/lib/auth-helpers'
+import { listPaymentEvents, parsePaymentEventParams } from '@/lib/marketplace/payment-events'
+
+// Force dynamic rendering for this API route
+export const dynamic = 'force-dynamic'
+
+// Create Supabase client with environment variable checks
+function getSupabaseAdminClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for payment events')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
+// GET /api/admin/payments/[id]/events?cursor=&limit= - payment history, newest first
+export async function GET(request, { params }) {
+  try {
+    const adminCheck = await verifyAdminAccess(request)
+    if (!adminCheck.isAdmin) {
+      return NextResponse.json(
+        { error: 'Admin access required' },
+        { status: 403 }
+      )
+    }
+
+    const supabase = getSupabaseAdminClient()
+    if (!supabase) {
+      return NextResponse.json({ error: 'Database service unavailable' }, { status: 503 })
+    }
+
+    const { searchParams } = new URL(request.url)
+    const { data, error } = await listPaymentEvents(supabase, params.id, parsePaymentEventParams(searchParams))
+
+    if (error) {
+      console.error('❌ Error fetching payment events:', error)
+      return NextResponse.json({ error: error.message }, { status: error.status || 500 })
+    }
+
+    return NextResponse.json({ events: data.events, nextCursor: data.nextCursor, success: true })
+
+  } catch (error) {
+    console.error('❌ Payment events API error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+}
@@ -0,0 +1,65 @@
+// app/api/admin/payments/analytics/route.js
+import { NextResponse } from 'next/server'
+import { createClient } from '@supabase/supabase-js'
+import { verifyAdminAccess } from '@/lib/auth-helpers'
+import { getPaymentAnalytics, parsePaymentAnalyticsParams } from '@/lib/marketplace/payment-analytics'
+
+// Force dynamic rendering for this API route
+export const dynamic = 'force-dynamic'
+
+// Create Supabase client with environment variable checks
+function getSupabaseAdminClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for payment analytics')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
+// GET /api/admin/payments/analytics?timeframe=30d&bucket=day - volume, fees, escrow and status
+// counts per currency, with a per-period series
+export async function GET(request) {
+  try {
+    const adminCheck = await verifyAdminAccess(request)
+    if (!adminCheck.isAdmin) {
+      return NextResponse.json(
+        { error: 'Admin access required' },
+        { status: 403 }
+      )
+    }
+
+    const { searchParams } = new URL(request.url)
+    const params = parsePaymentAnalyticsParams(searchParams)
+    if (params.error) {
+      return NextResponse.json({ error: params.error }, { status: 400 })
+    }
+
+    const supabase = getSupabaseAdminClient()
+    if (!supabase) {
+      return NextResponse.json({ error: 'Database service unavailable' }, { status: 503 })
+    }
+
+    const { data, error, cacheHit } = await getPaymentAnalytics(supabase, params)
+
+    if (error) {
+      console.error('❌ Error fetching payment analytics:', error)
+      return NextResponse.json({ error: 'Failed to fetch payment analytics' }, { status: 500 })
+    }
+
+    return NextResponse.json(
+      { analytics: data, success: true },
+      { headers: { 'X-Cache': cacheHit ? 'HIT' : 'MISS' } }
+    )
+
+  } catch (error) {
+    console.error('❌ Payment analytics API error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+}
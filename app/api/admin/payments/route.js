@@ -2,6 +2,7 @@
 import { NextResponse } from 'next/server'
 import { getPayments, updatePayment } from '@/lib/supabase'
 import { verifyAdminAccess } from '@/lib/auth-helpers'
+import { parseLimit } from '@/lib/pagination'
 
 export async function GET(request) {
   try {
@@ -16,15 +17,15 @@ export async function GET(request) {
     
     const { searchParams } = new URL(request.url)
     const status = searchParams.get('status')
-    const page = parseInt(searchParams.get('page') || '1')
-    const limit = parseInt(searchParams.get('limit') || '20')
+    const page = Math.max(parseInt(searchParams.get('page') || '1') || 1, 1)
+    const limit = parseLimit(searchParams.get('limit'))
     
     console.log('👨‍💼 Admin fetching payments:', { status, page, limit })
     
-    const filters = {}
+    const filters = { limit, offset: (page - 1) * limit }
     if (status) filters.status = status
     
-    const { data: payments, error } = await getPayments(filters)
+    const { data: payments, error, count } = await getPayments(filters)
     
     if (error) {
       console.error('❌ Error fetching payments:', error)
@@ -34,20 +35,15 @@ export async function GET(request) {
       )
     }
     
-    // Apply pagination
-    const startIndex = (page - 1) * limit
-    const endIndex = startIndex + limit
-    const paginatedPayments = payments?.slice(startIndex, endIndex) || []
-    
-    console.log('✅ Payments fetched for admin:', paginatedPayments.length)
+    console.log('✅ Payments fetched for admin:', payments?.length || 0)
     
     return NextResponse.json({
-      payments: paginatedPayments,
+      payments: payments || [],
       pagination: {
         current_page: page,
         per_page: limit,
-        total_items: payments?.length || 0,
-        total_pages: Math.ceil((payments?.length || 0) / limit)
+        total_items: count || 0,
+        total_pages: Math.ceil((count || 0) / limit)
       },
       success: true
     })
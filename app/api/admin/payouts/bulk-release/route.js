@@ -0,0 +1,72 @@
+// app/api/admin/payouts/bulk-release/route.js
+import { NextResponse } from 'next/server'
+import { createClient } from '@supabase/supabase-js'
+import { verifyAdminAccess } from '@/lib/auth-helpers'
+import { parseBulkReleaseRequest, releaseManualPayouts } from '@/lib/marketplace/payout-release'
+
+// Force dynamic rendering for this API route
+export const dynamic = 'force-dynamic'
+
+// Create Supabase client with environment variable checks
+function getSupabaseAdminClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for bulk payout release')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
+// POST /api/admin/payouts/bulk-release - release many pending manual payouts in one statement
+// Body: { payout_ids: [...] } or { filter: { creator_id, created_before, limit } },
+//       plus optional reference_number and admin_notes
+export async function POST(request) {
+  try {
+    const adminCheck = await verifyAdminAccess(request)
+    if (!adminCheck.isAdmin) {
+      return NextResponse.json(
+        { error: 'Admin access required' },
+        { status: 403 }
+      )
+    }
+
+    const supabase = getSupabaseAdminClient()
+    if (!supabase) {
+      return NextResponse.json({ error: 'Database service unavailable' }, { status: 503 })
+    }
+
+    const body = await request.json().catch(() => ({}))
+    const releaseRequest = parseBulkReleaseRequest(body)
+    if (releaseRequest.error) {
+      return NextResponse.json({ error: releaseRequest.error }, { status: 400 })
+    }
+
+    const { data, error } = await releaseManualPayouts(supabase, releaseRequest)
+
+    if (error) {
+      console.error('❌ Error releasing payouts:', error)
+      return NextResponse.json(
+        { error: 'Failed to release payouts' },
+        { status: 500 }
+      )
+    }
+
+    console.log('✅ Bulk payout release:', { released: data.released, failed: data.failed })
+
+    return NextResponse.json({
+      ...data,
+      message: `${data.released} of ${data.results.length} payouts released`,
+      success: true
+    })
+
+  } catch (error) {
+    console.error('❌ Bulk payout release error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+}
@@ -0,0 +1,64 @@
+// app/api/admin/payouts/transfers/route.js
+import { NextResponse } from 'next/server'
+import { createClient } from '@supabase/supabase-js'
+import { verifyAdminAccess } from '@/lib/auth-helpers'
+import { runPayoutTransfers } from '@/lib/marketplace/payout-transfers'
+
+// Force dynamic rendering for this API route
+export const dynamic = 'force-dynamic'
+
+// Create Supabase client with environment variable checks
+function getSupabaseAdminClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for payout transfers')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
+// POST /api/admin/payouts/transfers - run Stripe transfers for pending stripe payouts
+// Body (optional): { payout_ids: [...], limit }. Re-run while `requeued` > 0 to drain a large queue
+export async function POST(request) {
+  try {
+    const adminCheck = await verifyAdminAccess(request)
+    if (!adminCheck.isAdmin) {
+      return NextResponse.json(
+        { error: 'Admin access required' },
+        { status: 403 }
+      )
+    }
+
+    const supabase = getSupabaseAdminClient()
+    if (!supabase) {
+      return NextResponse.json({ error: 'Database service unavailable' }, { status: 503 })
+    }
+
+    const body = await request.json().catch(() => ({}))
+    const payoutIds = Array.isArray(body.payout_ids) ? body.payout_ids : null
+
+    console.log('👨‍💼 Admin starting payout transfer run:', payoutIds ? `${payoutIds.length} payouts` : 'queue')
+
+    const { data: run, error } = await runPayoutTransfers(supabase, {
+      payoutIds,
+      limit: Number(body.limit) || undefined
+    })
+
+    if (error) {
+      console.error('❌ Payout transfer run failed:', error)
+      return NextResponse.json({ error: 'Failed to run payout transfers' }, { status: 500 })
+    }
+
+    return NextResponse.json({ run, success: true })
+
+  } catch (error) {
+    console.error('❌ Payout transfers API error:', error)
+    return NextResponse.json(
+      { error: 'Internal server error' },
+      { status: 500 }
+    )
+  }
+}
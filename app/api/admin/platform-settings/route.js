@@ -2,6 +2,7 @@
 import { NextResponse } from 'next/server'
 import { verifyAdminAccess } from '@/lib/auth-helpers'
 import { createClient } from '@supabase/supabase-js'
+import { getPlatformSettings, invalidatePlatformSettings } from '@/lib/marketplace/platform-settings'
 
 // Force dynamic rendering for this API route
 export const dynamic = 'force-dynamic'
@@ -40,13 +41,8 @@ export async function GET(request) {
     
     console.log('👨‍💼 Admin fetching platform settings')
     
-    // Get platform settings
-    const { data: settings, error } = await supabase
-      .from('platform_settings')
-      .select('*')
-      .order('updated_at', { ascending: false })
-      .limit(1)
-      .single()
+    // Get platform settings (cached, revalidated against the row version)
+    const { data: settings, error } = await getPlatformSettings(supabase)
     
     if (error) {
       console.error('❌ Error fetching platform settings:', error)
@@ -155,6 +151,9 @@ export async function PUT(request) {
         )
       }
       
+      // Refresh the settings cache with the saved row; other instances pick it up at their next version check
+      await invalidatePlatformSettings(settings)
+      
       console.log('✅ Platform settings updated:', settings.id)
       
       return NextResponse.json({
@@ -178,6 +177,8 @@ export async function PUT(request) {
         )
       }
       
+      await invalidatePlatformSettings(settings)
+      
       console.log('✅ Platform settings created:', settings.id)
       
       return NextResponse.json({
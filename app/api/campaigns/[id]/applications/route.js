@@ -1,9 +1,12 @@
 import { NextResponse } from 'next/server'
 import { getCampaignApplications } from '../../../../../lib/supabase'
+import { recordPayload } from '../../../../../lib/projections'
 
 export async function GET(request, { params }) {
   try {
     const { id } = params
+    const { searchParams } = new URL(request.url)
+    const view = searchParams.get('view') === 'card' ? 'card' : 'detail'
     console.log(`📡 API: GET /api/campaigns/${id}/applications called`)
     
     if (!id) {
@@ -14,7 +17,7 @@ export async function GET(request, { params }) {
     }
     
     // Get applications for the specific campaign
-    const { data: applications, error } = await getCampaignApplications(id)
+    const { data: applications, error } = await getCampaignApplications(id, view)
     
     if (error) {
       console.error(`❌ API: Error fetching applications for campaign ${id}:`, error)
@@ -24,6 +27,7 @@ export async function GET(request, { params }) {
       )
     }
     
+    recordPayload(`api:campaign_applications:${view}`, applications || [])
     console.log(`✅ API: Found ${applications?.length || 0} applications for campaign ${id}`)
     return NextResponse.json({ 
       applications: applications || [],
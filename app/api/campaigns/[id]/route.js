@@ -1,5 +1,49 @@
 import { NextResponse } from 'next/server'
+import { createClient } from '@supabase/supabase-js'
 import { getCampaignById } from '../../../../lib/supabase'
+import { verifyUserAccess } from '../../../../lib/auth-helpers'
+import { bumpResourceVersion } from '../../../../lib/http-cache'
+
+// Fields a brand may change on its own campaign
+const EDITABLE_FIELDS = ['title', 'description', 'category', 'budget_range', 'creator_requirements', 'deadline', 'status']
+
+function getSupabaseClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for campaigns')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
+// Only the owning brand or an admin may change a campaign
+const authorizeCampaignWrite = async (request, supabase, id) => {
+  const access = await verifyUserAccess(request)
+  if (!access.success) {
+    return { error: NextResponse.json({ error: access.error || 'Authentication required' }, { status: 401 }) }
+  }
+
+  const { data: campaign, error } = await supabase
+    .from('campaigns')
+    .select('id, brand_id')
+    .eq('id', id)
+    .maybeSingle()
+
+  if (error) {
+    return { error: NextResponse.json({ error: 'Failed to load campaign', details: error.message }, { status: 500 }) }
+  }
+  if (!campaign) {
+    return { error: NextResponse.json({ error: 'Campaign not found' }, { status: 404 }) }
+  }
+  if (campaign.brand_id !== access.user.id && access.profile.role !== 'admin') {
+    return { error: NextResponse.json({ error: 'Not allowed to modify this campaign' }, { status: 403 }) }
+  }
+
+  return { campaign }
+}
 
 export async function GET(request, { params }) {
   try {
@@ -42,4 +86,94 @@ export async function GET(request, { params }) {
       { status: 500 }
     )
   }
-}
\ No newline at end of file
+}
+
+export async function PUT(request, { params }) {
+  try {
+    const { id } = params
+    console.log(`📡 API: PUT /api/campaigns/${id} called`)
+
+    const supabase = getSupabaseClient()
+    if (!supabase) {
+      return NextResponse.json(
+        { error: 'Database service unavailable - Supabase not configured' },
+        { status: 503 }
+      )
+    }
+
+    const { error: accessError } = await authorizeCampaignWrite(request, supabase, id)
+    if (accessError) return accessError
+
+    const body = await request.json()
+    const updates = Object.fromEntries(
+      Object.entries(body).filter(([field]) => EDITABLE_FIELDS.includes(field))
+    )
+
+    const { data, error } = await supabase
+      .from('campaigns')
+      .update({ ...updates, updated_at: new Date().toISOString() })
+      .eq('id', id)
+      .select()
+
+    if (error) {
+      console.error(`❌ API: Error updating campaign ${id}:`, error)
+      return NextResponse.json(
+        { error: 'Failed to update campaign', details: error.message },
+        { status: 500 }
+      )
+    }
+
+    bumpResourceVersion('campaigns')
+    console.log(`✅ API: Campaign ${id} updated`)
+    return NextResponse.json({ campaign: data?.[0] })
+
+  } catch (error) {
+    console.error(`❌ API: Exception in PUT /api/campaigns/${params?.id}:`, error)
+    return NextResponse.json(
+      { error: 'Internal server error', details: error.message },
+      { status: 500 }
+    )
+  }
+}
+
+export async function DELETE(request, { params }) {
+  try {
+    const { id } = params
+    console.log(`📡 API: DELETE /api/campaigns/${id} called`)
+
+    const supabase = getSupabaseClient()
+    if (!supabase) {
+      return NextResponse.json(
+        { error: 'Database service unavailable - Supabase not configured' },
+        { status: 503 }
+      )
+    }
+
+    const { error: accessError } = await authorizeCampaignWrite(request, supabase, id)
+    if (accessError) return accessError
+
+    const { error } = await supabase
+      .from('campaigns')
+      .delete()
+      .eq('id', id)
+
+    if (error) {
+      console.error(`❌ API: Error deleting campaign ${id}:`, error)
+      return NextResponse.json(
+        { error: 'Failed to delete campaign', details: error.message },
+        { status: 500 }
+      )
+    }
+
+    bumpResourceVersion('campaigns')
+    console.log(`✅ API: Campaign ${id} deleted`)
+    return NextResponse.json({ success: true })
+
+  } catch (error) {
+    console.error(`❌ API: Exception in DELETE /api/campaigns/${params?.id}:`, error)
+    return NextResponse.json(
+      { error: 'Internal server error', details: error.message },
+      { status: 500 }
+    )
+  }
+}
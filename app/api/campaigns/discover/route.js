@@ -0,0 +1,61 @@
+import { NextResponse } from 'next/server'
+import { supabase } from '@/lib/supabase'
+import { discoverCampaigns, parseDiscoveryParams } from '@/lib/marketplace/campaign-discovery'
+import {
+  CACHE_PROFILES,
+  getResourceVersion,
+  fetchTableVersion,
+  buildETag,
+  cacheHeaders,
+  notModifiedResponse
+} from '@/lib/http-cache'
+
+const activeOnly = (query) => query.eq('status', 'active')
+const brandProfiles = (query) => query.eq('role', 'brand')
+
+// GET /api/campaigns/discover?q=&category=&budget_range=&cursor=&limit=&facets=
+export async function GET(request) {
+  try {
+    const { searchParams } = new URL(request.url)
+    const params = parseDiscoveryParams(searchParams)
+
+    console.log('🔎 API: Campaign discovery', { query: params.query, category: params.category, budgetRange: params.budgetRange, paged: !!params.cursor })
+
+    // Same catalog fingerprint as /api/campaigns, scoped to this exact query
+    const [campaignVersion, brandVersion] = await Promise.all([
+      fetchTableVersion(supabase, 'campaigns', activeOnly),
+      // Rows embed the brand's name, so a brand profile edit must change the ETag too
+      fetchTableVersion(supabase, 'profiles', brandProfiles)
+    ])
+    const version = `${campaignVersion.data}|${brandVersion.data}`
+    const versionError = campaignVersion.error || brandVersion.error
+
+    let etag = null
+    if (!versionError) {
+      etag = buildETag('campaigns:discover', version, getResourceVersion('campaigns'), searchParams.toString())
+      const notModified = notModifiedResponse(request, etag, CACHE_PROFILES.CATALOG)
+      if (notModified) return notModified
+    }
+
+    const { data, error } = await discoverCampaigns(supabase, params)
+
+    if (error) {
+      console.error('❌ API: Campaign discovery failed:', error)
+      return NextResponse.json(
+        { error: error.status === 400 ? error.message : 'Failed to discover campaigns' },
+        { status: error.status || 500 }
+      )
+    }
+
+    console.log('✅ API: Discovery page returned', data.campaigns.length, 'campaigns')
+    return NextResponse.json(data, {
+      headers: etag ? cacheHeaders(etag, CACHE_PROFILES.CATALOG) : undefined
+    })
+  } catch (error) {
+    console.error('❌ API: Exception in GET /api/campaigns/discover:', error)
+    return NextResponse.json(
+      { error: 'Internal server error', details: error.message },
+      { status: 500 }
+    )
+  }
+}
@@ -1,6 +1,18 @@
 import { NextResponse } from 'next/server'
 import { getCampaigns, createCampaign } from '../../../lib/supabase'
 import { supabase } from '../../../lib/supabase'
+import {
+  CACHE_PROFILES,
+  bumpResourceVersion,
+  getResourceVersion,
+  fetchTableVersion,
+  buildETag,
+  cacheHeaders,
+  notModifiedResponse
+} from '../../../lib/http-cache'
+
+const activeOnly = (query) => query.eq('status', 'active')
+const brandProfiles = (query) => query.eq('role', 'brand')
 
 // Define getCurrentUser locally to avoid import issues
 const getCurrentUser = async () => {
@@ -12,6 +24,25 @@ export async function GET(request) {
   try {
     console.log('📡 API: GET /api/campaigns called')
     
+    // Cheap version check so unchanged catalogs cost a 304 instead of a full query
+    const [campaignVersion, brandVersion] = await Promise.all([
+      fetchTableVersion(supabase, 'campaigns', activeOnly),
+      // Rows embed the brand's name, so a brand profile edit must change the ETag too
+      fetchTableVersion(supabase, 'profiles', brandProfiles)
+    ])
+    const version = `${campaignVersion.data}|${brandVersion.data}`
+    const versionError = campaignVersion.error || brandVersion.error
+    
+    let etag = null
+    if (!versionError) {
+      etag = buildETag('campaigns:active', version, getResourceVersion('campaigns'))
+      const notModified = notModifiedResponse(request, etag, CACHE_PROFILES.CATALOG)
+      if (notModified) {
+        console.log('✅ API: Campaigns not modified')
+        return notModified
+      }
+    }
+    
     // Get real campaigns from database instead of hardcoded data
     const { data: campaigns, error } = await getCampaigns()
     
@@ -24,7 +55,9 @@ export async function GET(request) {
     }
     
     console.log('✅ API: Real campaigns returned from database:', campaigns?.length || 0)
-    return NextResponse.json({ campaigns: campaigns || [] })
+    return NextResponse.json({ campaigns: campaigns || [] }, {
+      headers: etag ? cacheHeaders(etag, CACHE_PROFILES.CATALOG) : undefined
+    })
 
   } catch (error) {
     console.error('❌ API: Exception in GET /api/campaigns:', error)
@@ -69,6 +102,7 @@ export async function POST(request) {
       )
     }
 
+    bumpResourceVersion('campaigns')
     console.log('✅ API: Campaign created successfully:', data?.[0]?.id)
     return NextResponse.json({ campaign: data?.[0] }, { status: 201 })
 
@@ -1,9 +1,11 @@
 import { NextResponse } from 'next/server'
+import { getPayloadStats } from '@/lib/projections'
 
 export async function GET() {
   return NextResponse.json({ 
     status: 'healthy',
     timestamp: new Date().toISOString(),
-    message: 'API routing is working correctly'
+    message: 'API routing is working correctly',
+    payloads: getPayloadStats()
   })
 }
\ No newline at end of file
@@ -0,0 +1,56 @@
+// app/api/offers/bulk/route.js
+import { NextResponse } from 'next/server'
+import { createClient } from '@supabase/supabase-js'
+import { createBulkOffers, parseBulkOfferRequest } from '@/lib/marketplace/bulk-offers'
+
+// Create Supabase client with environment variable checks
+function getSupabaseClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for bulk offers')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
+// POST /api/offers/bulk - create offers for many creators in one request
+export async function POST(request) {
+  try {
+    const supabase = getSupabaseClient()
+    if (!supabase) {
+      return NextResponse.json({
+        error: 'Database service unavailable - Supabase not configured'
+      }, { status: 503 })
+    }
+
+    const bulkRequest = parseBulkOfferRequest(await request.json())
+    if (bulkRequest.error) {
+      return NextResponse.json({ error: bulkRequest.error }, { status: 400 })
+    }
+
+    console.log(`📦 Bulk offers: ${bulkRequest.selections.length} selections for campaign ${bulkRequest.campaignId}`)
+
+    const { data, error } = await createBulkOffers(supabase, bulkRequest)
+
+    if (error) {
+      console.error('❌ Error creating bulk offers:', error.message)
+      return NextResponse.json(
+        { error: error.message, ...(data || {}) },
+        { status: error.status || 500 }
+      )
+    }
+
+    console.log(`✅ Bulk offers: ${data.created} created, ${data.failed} failed`)
+    return NextResponse.json({
+      ...data,
+      message: `${data.created} offers created successfully`
+    }, { status: 201 })
+
+  } catch (error) {
+    console.error('❌ Bulk offer creation API error:', error)
+    return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
+  }
+}
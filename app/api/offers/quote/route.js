@@ -0,0 +1,50 @@
+// app/api/offers/quote/route.js
+import { NextResponse } from 'next/server'
+import { createClient } from '@supabase/supabase-js'
+import { createQuote, parseQuoteRequest } from '@/lib/marketplace/quotes'
+
+// Create Supabase client with environment variable checks
+function getSupabaseClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for offer quotes')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
+// POST /api/offers/quote - price items against the creator's rate cards and return a signed quote
+export async function POST(request) {
+  try {
+    const supabase = getSupabaseClient()
+    if (!supabase) {
+      return NextResponse.json({
+        error: 'Database service unavailable - Supabase not configured'
+      }, { status: 503 })
+    }
+
+    const quoteRequest = parseQuoteRequest(await request.json())
+    if (quoteRequest.error) {
+      return NextResponse.json({ error: quoteRequest.error }, { status: 400 })
+    }
+
+    const { data, error } = await createQuote(supabase, quoteRequest)
+    if (error) {
+      console.error('❌ Error creating quote:', error.message)
+      return NextResponse.json({ error: error.message }, { status: error.status || 500 })
+    }
+
+    return NextResponse.json({
+      quote: data.quote,
+      quote_token: data.token,
+      expires_at: data.quote.expires_at
+    })
+
+  } catch (error) {
+    console.error('❌ Quote API error:', error)
+    return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
+  }
+}
@@ -2,6 +2,11 @@
 import { NextResponse } from 'next/server'
 import { createClient } from '@supabase/supabase-js'
 import { clearCampaignCache } from '@/lib/campaign-cache'
+import { recordPayload } from '@/lib/projections'
+import { listOffers, parseOfferListParams } from '@/lib/marketplace/offer-listing'
+import { parseQuoteRequest, priceQuote, verifyQuoteToken } from '@/lib/marketplace/quotes'
+import { applyRushPricing, calculatePricing, validateOfferPricing } from '@/lib/marketplace/pricing'
+import { getPlatformFeePct } from '@/lib/marketplace/platform-settings'
 
 // Create Supabase client with environment variable checks  
 function getSupabaseClient() {
@@ -26,33 +31,21 @@ export async function GET(request) {
     }
 
     const { searchParams } = new URL(request.url)
-    const campaignId = searchParams.get('campaign_id')
-    const creatorId = searchParams.get('creator_id')
-    const brandId = searchParams.get('brand_id')
-
-    let query = supabase
-      .from('offers')
-      .select(`
-        *,
-        campaign:campaigns(id, title, brand_id),
-        creator_profile:profiles!creator_id(id, full_name, email),
-        brand_profile:profiles!brand_id(id, full_name, company_name)
-      `)
-
-    if (campaignId) query = query.eq('campaign_id', campaignId)
-    if (creatorId) query = query.eq('creator_id', creatorId)  
-    if (brandId) query = query.eq('brand_id', brandId)
+    const params = parseOfferListParams(searchParams)
+    if (params.error) {
+      return NextResponse.json({ error: params.error }, { status: 400 })
+    }
 
-    const { data: offers, error } = await query
-      .neq('status', 'cancelled')  // Filter out deleted offers
-      .order('created_at', { ascending: false })
+    const { data, error } = await listOffers(supabase, params)
 
     if (error) {
       console.error('❌ Error fetching offers:', error)
-      return NextResponse.json({ error: error.message }, { status: 500 })
+      return NextResponse.json({ error: error.message }, { status: error.status || 500 })
     }
 
-    return NextResponse.json({ offers })
+    const { offers, nextCursor, counts } = data
+    recordPayload('api:offers', offers)
+    return NextResponse.json({ offers, nextCursor, counts })
 
   } catch (error) {
     console.error('❌ Offers API error:', error)
@@ -84,7 +77,8 @@ export async function POST(request) {
       currency,
       deadline,
       description,
-      status
+      status,
+      quote_token
     } = body
 
     // Validation
@@ -94,13 +88,110 @@ export async function POST(request) {
       }, { status: 400 })
     }
 
-    // Create the items array for the JSONB column
-    const items = [{
-      deliverable_type: deliverable_type || 'IG_Reel',
-      quantity: quantity || 1,
-      base_price_cents: base_price_cents || 0,
-      rush_fee_pct: rush_fee_pct || 0
-    }]
+    let pricing
+    if (quote_token) {
+      // A signed quote from /api/offers/quote is trusted as-is - no rate card re-fetch or recompute
+      const { data: quote, error: quoteError } = verifyQuoteToken(quote_token)
+      if (quoteError) {
+        return NextResponse.json({ error: quoteError.message }, { status: quoteError.status || 400 })
+      }
+      if (quote.creator_id !== creator_id || quote.campaign_id !== campaign_id || quote.brand_id !== brand_id) {
+        return NextResponse.json({ error: 'Quote was issued for a different creator, campaign or brand' }, { status: 400 })
+      }
+
+      pricing = {
+        items: quote.items.map(line => ({
+          deliverable_type: line.deliverable_type,
+          quantity: line.qty,
+          base_price_cents: line.base_price_cents,
+          rush_fee_pct: line.rush_pct || 0
+        })),
+        subtotal_cents: quote.subtotal_cents,
+        platform_fee_pct: quote.platform_fee_pct,
+        platform_fee_cents: quote.platform_fee_cents,
+        total_cents: quote.total_cents,
+        currency: quote.currency
+      }
+    } else {
+      // The fee always comes from platform settings; a client-sent fee must match it
+      const feePct = await getPlatformFeePct(supabase)
+      if (platform_fee_pct !== undefined && platform_fee_pct !== null && Number(platform_fee_pct) !== feePct) {
+        return NextResponse.json({
+          error: `platform_fee_pct must match the current platform fee (${feePct}%)`
+        }, { status: 400 })
+      }
+
+      // Without a quote the client must state its totals so they can be checked against the server's
+      if (!Number.isInteger(subtotal_cents) || !Number.isInteger(total_cents)) {
+        return NextResponse.json({
+          error: 'subtotal_cents and total_cents are required integers when no quote_token is sent'
+        }, { status: 400 })
+      }
+
+      const quoteRequest = parseQuoteRequest({
+        creator_id,
+        campaign_id,
+        brand_id,
+        currency,
+        items: [{ deliverable_type: deliverable_type || 'IG_Reel', qty: quantity || 1, rush_pct: rush_fee_pct || 0 }]
+      })
+      if (quoteRequest.error) {
+        return NextResponse.json({ error: quoteRequest.error }, { status: 400 })
+      }
+
+      let priced
+      if (base_price_cents !== undefined && base_price_cents !== null) {
+        // Custom price: the brand names the base price, rush and fee are still applied server-side
+        const basePriceCents = Number(base_price_cents)
+        if (!Number.isInteger(basePriceCents) || basePriceCents <= 0) {
+          return NextResponse.json({ error: 'base_price_cents must be a positive integer' }, { status: 400 })
+        }
+        const items = quoteRequest.selections.map(selection => ({
+          deliverable_type: selection.deliverableType,
+          qty: selection.qty,
+          base_price_cents: basePriceCents,
+          unit_price_cents: applyRushPricing(basePriceCents, selection.rushPct),
+          rush_pct: selection.rushPct,
+          currency: quoteRequest.currency || 'USD'
+        }))
+        priced = { items, pricing: calculatePricing(items, feePct) }
+      } else {
+        // Otherwise the line is priced from the creator's rate card
+        const { data, error: priceError } = await priceQuote(supabase, quoteRequest)
+        if (priceError) {
+          return NextResponse.json({ error: priceError.message }, { status: priceError.status || 500 })
+        }
+        priced = data
+      }
+
+      const validation = validateOfferPricing({
+        items: priced.items,
+        subtotal_cents,
+        platform_fee_pct: feePct,
+        total_cents
+      })
+      if (!validation.isValid) {
+        return NextResponse.json({
+          error: 'Offer pricing does not match the server-side price',
+          details: validation.errors
+        }, { status: 400 })
+      }
+
+      pricing = {
+        // Create the items array for the JSONB column
+        items: priced.items.map(item => ({
+          deliverable_type: item.deliverable_type,
+          quantity: item.qty,
+          base_price_cents: item.base_price_cents,
+          rush_fee_pct: item.rush_pct
+        })),
+        subtotal_cents: priced.pricing.subtotalCents,
+        platform_fee_pct: feePct,
+        platform_fee_cents: priced.pricing.platformFeeCents,
+        total_cents: priced.pricing.totalCents,
+        currency: priced.pricing.currency
+      }
+    }
 
     const { data: offer, error } = await supabase
       .from('offers')
@@ -108,12 +199,8 @@ export async function POST(request) {
         campaign_id,
         creator_id,
         brand_id,
-        items: JSON.stringify(items),
-        subtotal_cents: subtotal_cents || 0,
-        platform_fee_pct: platform_fee_pct || 20,
-        platform_fee_cents: Math.round((subtotal_cents || 0) * ((platform_fee_pct || 20) / 100)),
-        total_cents: total_cents || 0,
-        currency: currency || 'USD',
+        ...pricing,
+        items: JSON.stringify(pricing.items),
         expires_at: deadline,
         notes: description,
         status: status || 'drafted'
@@ -0,0 +1,48 @@
+// app/api/payments/auto-release/route.js
+import { NextResponse } from 'next/server'
+import { createClient } from '@supabase/supabase-js'
+import { runEscrowAutoRelease } from '@/lib/marketplace/escrow-release'
+
+// Force dynamic rendering for this API route
+export const dynamic = 'force-dynamic'
+
+function getSupabaseServiceClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for escrow auto-release')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
+// GET /api/payments/auto-release - release escrow past auto_release_days (Vercel Cron)
+// Vercel sends "Authorization: Bearer $CRON_SECRET" on scheduled invocations
+export async function GET(request) {
+  try {
+    const cronSecret = process.env.CRON_SECRET
+    if (!cronSecret || request.headers.get('authorization') !== `Bearer ${cronSecret}`) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
+    }
+
+    const supabase = getSupabaseServiceClient()
+    if (!supabase) {
+      return NextResponse.json({ error: 'Database service unavailable' }, { status: 503 })
+    }
+
+    const { data: metrics, error } = await runEscrowAutoRelease(supabase)
+
+    if (error) {
+      console.error('❌ Escrow auto-release failed:', error)
+      return NextResponse.json({ error: 'Escrow auto-release failed', metrics }, { status: 500 })
+    }
+
+    return NextResponse.json({ metrics })
+
+  } catch (error) {
+    console.error('❌ Escrow auto-release error:', error)
+    return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
+  }
+}
@@ -1,7 +1,8 @@
 // app/api/payments/create-checkout-session/route.js
 import { NextResponse } from 'next/server'
-import { createPayment } from '@/lib/supabase'
+import { createClient } from '@supabase/supabase-js'
 import { getOffer } from '@/lib/supabase'
+import { getOrCreateCheckoutSession } from '@/lib/marketplace/checkout-sessions'
 
 // Initialize Stripe only when needed to avoid build-time errors
 let stripe = null
@@ -16,6 +17,19 @@ function getStripe() {
   return stripe
 }
 
+// Create Supabase client with environment variable checks
+function getSupabaseAdminClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for checkout sessions')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
 export async function POST(request) {
   try {
     const body = await request.json()
@@ -31,6 +45,11 @@ export async function POST(request) {
         { status: 503 }
       )
     }
+
+    const supabase = getSupabaseAdminClient()
+    if (!supabase) {
+      return NextResponse.json({ error: 'Database service unavailable' }, { status: 503 })
+    }
     
     // Validate required fields
     if (!offer_id || !origin_url) {
@@ -61,93 +80,31 @@ export async function POST(request) {
     
     // Security: Get payment amount from server-side offer data only
     // NEVER accept payment amounts from frontend
-    const paymentAmount = offer.total_cents
-    const currency = offer.currency.toLowerCase()
-    
-    // Build dynamic success/cancel URLs from frontend origin
-    const successUrl = `${origin_url}/marketplace/${offer_id}/payment-success?session_id={CHECKOUT_SESSION_ID}`
-    const cancelUrl = `${origin_url}/marketplace/${offer_id}/payment-cancelled`
-    
-    console.log('💰 Payment details:', {
-      amount: paymentAmount,
-      currency,
-      successUrl,
-      cancelUrl
-    })
-    
-    // Create Stripe checkout session
-    const session = await stripeInstance.checkout.sessions.create({
-      payment_method_types: ['card'],
-      line_items: [
-        {
-          price_data: {
-            currency: currency,
-            product_data: {
-              name: `Marketplace Offer #${offer_id.slice(0, 8)}`,
-              description: `Payment for offer from ${offer.creator?.full_name || 'Creator'} for campaign: ${offer.campaign?.title || 'N/A'}`,
-              metadata: {
-                offer_id: offer_id,
-                brand_id: offer.brand_id,
-                creator_id: offer.creator_id,
-                campaign_id: offer.campaign_id
-              }
-            },
-            unit_amount: paymentAmount, // Amount in cents
-          },
-          quantity: 1,
-        },
-      ],
-      mode: 'payment',
-      success_url: successUrl,
-      cancel_url: cancelUrl,
-      metadata: {
-        offer_id: offer_id,
-        brand_id: offer.brand_id,
-        creator_id: offer.creator_id,
-        campaign_id: offer.campaign_id,
-        platform_fee_cents: offer.platform_fee_cents.toString(),
-        subtotal_cents: offer.subtotal_cents.toString()
-      },
-      expires_at: Math.floor(Date.now() / 1000) + (24 * 60 * 60), // 24 hours
-    })
-    
-    // Create payment record in database BEFORE redirecting user
-    const paymentData = {
-      offer_id: offer_id,
-      stripe_session_id: session.id,
-      amount_cents: paymentAmount,
-      currency: currency.toUpperCase(),
-      status: 'pending'
-    }
-    
-    const { data: payment, error: paymentError } = await createPayment(paymentData)
-    
-    if (paymentError) {
-      console.error('❌ Error creating payment record:', paymentError)
-      
-      // Cancel the Stripe session if database creation failed
-      try {
-        await stripeInstance.checkout.sessions.expire(session.id)
-      } catch (expireError) {
-        console.error('❌ Error expiring Stripe session:', expireError)
-      }
-      
+    // Double-clicks and reloads get the offer's open session back; a new session is only
+    // created (with an idempotency key derived from offer and amount) when none is usable
+    const { data: checkout, error: checkoutError } = await getOrCreateCheckoutSession(
+      supabase,
+      stripeInstance,
+      offer,
+      { originUrl: origin_url }
+    )
+
+    if (checkoutError) {
+      console.error('❌ Error creating checkout session:', checkoutError)
       return NextResponse.json(
-        { error: 'Failed to create payment record' },
-        { status: 500 }
+        { error: checkoutError.status ? checkoutError.message : 'Failed to create payment record' },
+        { status: checkoutError.status || 500 }
       )
     }
-    
-    console.log('✅ Checkout session created:', session.id)
-    console.log('✅ Payment record created:', payment.id)
-    
-    // Update offer status to paid_escrow (payment initiated)
-    // This will be updated to 'paid_escrow' by webhook once payment confirms
+
+    console.log(checkout.reused ? '♻️ Reusing checkout session:' : '✅ Checkout session created:', checkout.session_id)
     
     return NextResponse.json({
-      session_id: session.id,
-      checkout_url: session.url,
-      payment_id: payment.id,
+      session_id: checkout.session_id,
+      checkout_url: checkout.checkout_url,
+      payment_id: checkout.payment_id,
+      expires_at: checkout.expires_at,
+      reused: checkout.reused,
       success: true
     })
     
@@ -0,0 +1,60 @@
+// app/api/payments/earnings/route.js
+import { NextResponse } from 'next/server'
+import { createClient } from '@supabase/supabase-js'
+import { verifyAdminAccess } from '@/lib/auth-helpers'
+import { getCreatorEarnings } from '@/lib/marketplace/creator-earnings'
+
+// Force dynamic rendering for this API route
+export const dynamic = 'force-dynamic'
+
+// Create Supabase client with environment variable checks
+function getSupabaseAdminClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for creator earnings')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
+// GET /api/payments/earnings?creator_id= - a creator's balances per currency from the earnings ledger
+// Creators read their own earnings (creator_id defaults to the caller); admins can read anyone's
+export async function GET(request) {
+  try {
+    // verifyAdminAccess resolves the caller for any valid token, admin or not
+    const access = await verifyAdminAccess(request)
+    if (!access.user) {
+      return NextResponse.json({ error: 'Authentication required' }, { status: 401 })
+    }
+
+    const { searchParams } = new URL(request.url)
+    const creatorId = searchParams.get('creator_id') || access.user.id
+
+    if (creatorId !== access.user.id && !access.isAdmin) {
+      return NextResponse.json({ error: 'Not allowed to view these earnings' }, { status: 403 })
+    }
+
+    const supabase = getSupabaseAdminClient()
+    if (!supabase) {
+      return NextResponse.json({ error: 'Database service unavailable' }, { status: 503 })
+    }
+
+    const { data: balances, error } = await getCreatorEarnings(supabase, creatorId)
+
+    if (error) {
+      console.error('❌ Error fetching creator earnings:', error)
+      return NextResponse.json({ error: 'Failed to fetch earnings' }, { status: 500 })
+    }
+
+    return NextResponse.json({ creator_id: creatorId, balances, success: true }, {
+      headers: { 'Cache-Control': 'private, no-store' }
+    })
+
+  } catch (error) {
+    console.error('❌ Creator earnings API error:', error)
+    return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
+  }
+}
@@ -1,6 +1,10 @@
 // app/api/payments/status/[session_id]/route.js
 import { NextResponse } from 'next/server'
-import { getPaymentBySessionId, updatePayment, updateOffer } from '@/lib/supabase'
+import { createClient } from '@supabase/supabase-js'
+import { getCheckoutPaymentStatus, MAX_STATUS_WAIT_MS } from '@/lib/marketplace/payment-status'
+
+// Force dynamic rendering for this API route
+export const dynamic = 'force-dynamic'
 
 // Initialize Stripe only when needed to avoid build-time errors
 let stripe = null
@@ -15,115 +19,64 @@ function getStripe() {
   return stripe
 }
 
+// Create Supabase client with environment variable checks
+function getSupabaseAdminClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for payment status')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
+// GET /api/payments/status/[session_id]?wait=<seconds>
+// Settled payments are answered from the database. With ?wait the request long-polls and returns
+// as soon as the webhook settles the payment (or after at most MAX_STATUS_WAIT_MS)
 export async function GET(request, { params }) {
   try {
     const { session_id } = params
-    
-    console.log('🔍 Checking payment status for session:', session_id)
-    
+
     if (!session_id) {
       return NextResponse.json(
         { error: 'session_id is required' },
         { status: 400 }
       )
     }
-    
-    // Check if Stripe is available
-    const stripeInstance = getStripe()
-    if (!stripeInstance) {
-      return NextResponse.json(
-        { error: 'Payment system is not configured. Please contact support.' },
-        { status: 503 }
-      )
-    }
-    
-    // Get payment record from database
-    const { data: payment, error: paymentError } = await getPaymentBySessionId(session_id)
-    
-    if (paymentError || !payment) {
-      console.error('❌ Payment not found in database:', paymentError)
-      return NextResponse.json(
-        { error: 'Payment not found' },
-        { status: 404 }
-      )
+
+    const supabase = getSupabaseAdminClient()
+    if (!supabase) {
+      return NextResponse.json({ error: 'Database service unavailable' }, { status: 503 })
     }
-    
-    // Get current status from Stripe
-    const session = await stripeInstance.checkout.sessions.retrieve(session_id)
-    
-    console.log('📊 Stripe session status:', {
-      id: session.id,
-      payment_status: session.payment_status,
-      status: session.status
+
+    const { searchParams } = new URL(request.url)
+    const waitSeconds = parseInt(searchParams.get('wait') || '0', 10)
+    const waitMs = Number.isFinite(waitSeconds) && waitSeconds > 0
+      ? Math.min(waitSeconds * 1000, MAX_STATUS_WAIT_MS)
+      : 0
+
+    const { data, error } = await getCheckoutPaymentStatus(supabase, session_id, {
+      stripe: getStripe(),
+      waitMs,
+      signal: request.signal
     })
-    
-    // Determine final status
-    let finalStatus = payment.status
-    let paymentStatus = session.payment_status
-    let shouldUpdate = false
-    
-    if (session.payment_status === 'paid' && payment.status !== 'paid_escrow') {
-      finalStatus = 'paid_escrow'
-      shouldUpdate = true
-    } else if (session.status === 'expired' && payment.status !== 'failed') {
-      finalStatus = 'failed'
-      shouldUpdate = true
-    }
-    
-    // Update database if status changed and avoid duplicate processing
-    if (shouldUpdate) {
-      console.log(`🔄 Updating payment status: ${payment.status} → ${finalStatus}`)
-      
-      const { error: updateError } = await updatePayment(payment.id, {
-        status: finalStatus,
-        stripe_payment_intent: session.payment_intent,
-        last_error: session.status === 'expired' ? 'Session expired' : null
-      })
-      
-      if (updateError) {
-        console.error('❌ Error updating payment:', updateError)
-      } else {
-        // Update offer status if payment successful
-        if (finalStatus === 'paid_escrow') {
-          const { error: offerUpdateError } = await updateOffer(payment.offer_id, {
-            status: 'paid_escrow'
-          })
-          
-          if (offerUpdateError) {
-            console.error('❌ Error updating offer status:', offerUpdateError)
-          } else {
-            console.log('✅ Offer status updated to paid_escrow')
-          }
-        }
-      }
+
+    if (error) {
+      console.error('❌ Payment status check failed:', error.message)
+      return NextResponse.json({ error: error.message }, { status: error.status || 500 })
     }
-    
-    return NextResponse.json({
-      session_id: session_id,
-      payment_id: payment.id,
-      offer_id: payment.offer_id,
-      status: session.status,
-      payment_status: paymentStatus,
-      amount_total: session.amount_total,
-      currency: session.currency,
-      database_status: finalStatus,
-      metadata: session.metadata,
-      success: true
+
+    return NextResponse.json(data, {
+      headers: { 'Cache-Control': 'no-store' }
     })
-    
+
   } catch (error) {
     console.error('❌ Payment status check error:', error)
-    
-    if (error.code === 'resource_missing') {
-      return NextResponse.json(
-        { error: 'Stripe session not found' },
-        { status: 404 }
-      )
-    }
-    
     return NextResponse.json(
       { error: 'Internal server error' },
       { status: 500 }
     )
   }
-}
\ No newline at end of file
+}
@@ -0,0 +1,51 @@
+// app/api/payments/webhooks/process/route.js
+import { NextResponse } from 'next/server'
+import { createClient } from '@supabase/supabase-js'
+import { processStripeEvents } from '@/lib/stripe/webhook-queue'
+
+// Force dynamic rendering for this API route
+export const dynamic = 'force-dynamic'
+
+function getSupabaseServiceClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for webhook worker')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
+// GET /api/payments/webhooks/process - drain the Stripe event queue (Vercel Cron)
+// Backstop for the webhook routes' post-response drain: retries failed events and catches any the
+// drain missed. The every-minute schedule in vercel.json needs a Vercel Pro plan (see DEPLOYMENT.md)
+// Vercel sends "Authorization: Bearer $CRON_SECRET" on scheduled invocations
+export async function GET(request) {
+  try {
+    const cronSecret = process.env.CRON_SECRET
+    if (!cronSecret || request.headers.get('authorization') !== `Bearer ${cronSecret}`) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
+    }
+
+    const supabase = getSupabaseServiceClient()
+    if (!supabase) {
+      return NextResponse.json({ error: 'Database service unavailable' }, { status: 503 })
+    }
+
+    const { data: summary, error } = await processStripeEvents(supabase)
+
+    if (error) {
+      console.error('❌ Webhook worker failed:', error)
+      return NextResponse.json({ error: 'Webhook worker failed', summary }, { status: 500 })
+    }
+
+    console.log('✅ Webhook worker run:', summary)
+    return NextResponse.json({ summary })
+
+  } catch (error) {
+    console.error('❌ Webhook worker error:', error)
+    return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
+  }
+}
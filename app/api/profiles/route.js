@@ -1,42 +1,47 @@
 import { NextResponse } from 'next/server'
 import { supabase } from '../../../lib/supabase'
+import { recordPayload } from '../../../lib/projections'
+import { verifyUserAccess } from '../../../lib/auth-helpers'
+import { isPrivilegedView, listProfiles, parseDirectoryParams, scopeDirectoryParams } from '../../../lib/profile-directory'
 
 // Force dynamic rendering for this API route
 export const dynamic = 'force-dynamic'
 
+// GET /api/profiles?role=&category=&q=&view=&cursor=&limit=
 export async function GET(request) {
   try {
     const { searchParams } = new URL(request.url)
-    const role = searchParams.get('role')
-    
-    console.log(`📡 API: GET /api/profiles called with role filter: ${role}`)
-    
-    let query = supabase
-      .from('profiles')
-      .select('*')
-    
-    // Apply role filter if provided
-    if (role) {
-      query = query.eq('role', role)
+    const requested = parseDirectoryParams(searchParams)
+
+    if (requested.error) {
+      return NextResponse.json({ error: requested.error }, { status: 400 })
     }
-    
-    const { data: profiles, error } = await query.order('created_at', { ascending: false })
-    
+
+    // detail/admin expose email and moderation fields, so they need an admin or the profile owner
+    const access = isPrivilegedView(requested.view) ? await verifyUserAccess(request) : null
+    const params = scopeDirectoryParams(requested, access)
+
+    console.log(`📡 API: GET /api/profiles called with role filter: ${params.role}, view: ${params.view}, prefix: ${params.namePrefix || '-'}`)
+
+    const { data, error } = await listProfiles(supabase, params)
+
     if (error) {
       console.error('❌ API: Error fetching profiles:', error)
       return NextResponse.json(
-        { error: 'Failed to fetch profiles', details: error.message },
-        { status: 500 }
+        { error: error.status === 400 ? error.message : 'Failed to fetch profiles', details: error.message },
+        { status: error.status || 500 }
       )
     }
-    
-    const filteredProfiles = profiles || []
-    console.log(`✅ API: Found ${filteredProfiles.length} profiles${role ? ` with role '${role}'` : ''}`)
-    
-    return NextResponse.json({ 
-      profiles: filteredProfiles,
-      count: filteredProfiles.length,
-      role_filter: role
+
+    const { profiles, nextCursor } = data
+    recordPayload(`api:profiles:${params.view}`, profiles)
+    console.log(`✅ API: Found ${profiles.length} profiles${params.role ? ` with role '${params.role}'` : ''}`)
+
+    return NextResponse.json({
+      profiles,
+      count: profiles.length,
+      nextCursor,
+      role_filter: params.role
     })
 
   } catch (error) {
@@ -46,4 +51,4 @@ export async function GET(request) {
       { status: 500 }
     )
   }
-}
\ No newline at end of file
+}
@@ -1,6 +1,8 @@
 // app/api/rate-cards/[id]/route.js
 import { NextResponse } from 'next/server'
 import { updateRateCard, deleteRateCard } from '@/lib/supabase'
+import { bumpResourceVersion } from '@/lib/http-cache'
+import { invalidateCreatorRateCards } from '@/lib/marketplace/rate-cards'
 
 export async function PATCH(request, { params }) {
   try {
@@ -40,6 +42,8 @@ export async function PATCH(request, { params }) {
     }
     
     console.log('✅ Rate card updated:', rateCard.id)
+    await invalidateCreatorRateCards(rateCard.creator_id)
+    bumpResourceVersion('rate_cards', 'rate_cards:public', `rate_cards:creator:${rateCard.creator_id}`)
     
     return NextResponse.json({ 
       rateCard,
@@ -72,6 +76,8 @@ export async function DELETE(request, { params }) {
     }
     
     console.log('✅ Rate card deactivated:', rateCard.id)
+    await invalidateCreatorRateCards(rateCard.creator_id)
+    bumpResourceVersion('rate_cards', 'rate_cards:public', `rate_cards:creator:${rateCard.creator_id}`)
     
     return NextResponse.json({ 
       rateCard,
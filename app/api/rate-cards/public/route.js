@@ -1,10 +1,33 @@
 import { NextResponse } from 'next/server'
 import { supabase } from '@/lib/supabase'
+import {
+  CACHE_PROFILES,
+  getResourceVersion,
+  fetchTableVersion,
+  buildETag,
+  cacheHeaders,
+  notModifiedResponse
+} from '@/lib/http-cache'
+
+const activeOnly = (query) => query.eq('active', true)
 
 export async function GET(request) {
   try {
     console.log('📋 Fetching public rate cards...')
     
+    // Answer conditional requests from the version fingerprint alone
+    const { data: version, error: versionError } = await fetchTableVersion(supabase, 'rate_cards', activeOnly)
+    
+    let etag = null
+    if (!versionError) {
+      etag = buildETag('rate_cards:public', version, getResourceVersion('rate_cards:public'))
+      const notModified = notModifiedResponse(request, etag, CACHE_PROFILES.CATALOG)
+      if (notModified) {
+        console.log('✅ Public rate cards not modified')
+        return notModified
+      }
+    }
+    
     // Get all active rate cards with creator profiles (public data only)
     const { data: rateCards, error } = await supabase
       .from('rate_cards')
@@ -54,6 +77,8 @@ export async function GET(request) {
     return NextResponse.json({
       rateCards: formattedRateCards,
       success: true
+    }, {
+      headers: etag ? cacheHeaders(etag, CACHE_PROFILES.CATALOG) : undefined
     })
     
   } catch (err) {
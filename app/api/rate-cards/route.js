@@ -1,7 +1,22 @@
 // app/api/rate-cards/route.js  
 import { NextResponse } from 'next/server'
 import { createClient } from '@supabase/supabase-js'
-import { clearRateCardCache } from '@/lib/rate-card-cache'
+import {
+  getCreatorRateCards,
+  getRateCardCacheStats,
+  invalidateCreatorRateCards,
+  parsePriceSearchParams,
+  searchRateCardsByPrice
+} from '@/lib/marketplace/rate-cards'
+import {
+  CACHE_PROFILES,
+  bumpResourceVersion,
+  getResourceVersion,
+  fetchTableVersion,
+  buildETag,
+  cacheHeaders,
+  notModifiedResponse
+} from '@/lib/http-cache'
 
 // Create Supabase client with environment variable checks
 function getSupabaseClient() {
@@ -31,23 +46,71 @@ export async function GET(request) {
     const { searchParams } = new URL(request.url)
     const creatorId = searchParams.get('creator_id')
 
-    let query = supabase
-      .from('rate_cards')
-      .select('*')
-      .eq('active', true)
-
     if (creatorId) {
-      query = query.eq('creator_id', creatorId)
+      // Per-creator lists are served through the server read-through cache
+      const resource = `rate_cards:creator:${creatorId}`
+      const { data: cached, error, cacheHit } = await getCreatorRateCards(supabase, creatorId)
+
+      if (error) {
+        console.error('❌ Error fetching rate cards:', error)
+        return NextResponse.json({ error: error.message }, { status: 500 })
+      }
+
+      const etag = buildETag(resource, cached.version, getResourceVersion(resource))
+      const notModified = notModifiedResponse(request, etag, CACHE_PROFILES.CREATOR_SCOPED)
+      if (notModified) return notModified
+
+      return NextResponse.json({ rateCards: cached.rateCards }, {
+        headers: {
+          ...cacheHeaders(etag, CACHE_PROFILES.CREATOR_SCOPED),
+          'X-Cache': cacheHit ? 'HIT' : 'MISS',
+          // Hit ratio of the cache serving this route in this instance
+          'X-Cache-Hit-Ratio': getRateCardCacheStats().hitRatio.toFixed(3)
+        }
+      })
+    }
+
+    // Budget search across all creators: ?deliverable_type=&min_usd_cents=&max_usd_cents=&cursor=
+    const priceSearch = parsePriceSearchParams(searchParams)
+    if (priceSearch?.error) {
+      return NextResponse.json({ error: priceSearch.error }, { status: 400 })
+    }
+    if (priceSearch) {
+      const { data, error } = await searchRateCardsByPrice(supabase, priceSearch)
+
+      if (error) {
+        console.error('❌ Error searching rate cards by price:', error)
+        return NextResponse.json({ error: error.message }, { status: error.status || 500 })
+      }
+
+      return NextResponse.json({ rateCards: data.rateCards, nextCursor: data.nextCursor })
+    }
+
+    const applyFilters = (query) => query.eq('active', true)
+
+    // Cheap version check first so repeat loads can be answered with a 304
+    const resource = 'rate_cards'
+    const cacheProfile = CACHE_PROFILES.CATALOG
+    const { data: version, error: versionError } = await fetchTableVersion(supabase, 'rate_cards', applyFilters)
+
+    let etag = null
+    if (!versionError) {
+      etag = buildETag(resource, version, getResourceVersion(resource))
+      const notModified = notModifiedResponse(request, etag, cacheProfile)
+      if (notModified) return notModified
     }
 
-    const { data: rateCards, error } = await query.order('created_at', { ascending: false })
+    const { data: rateCards, error } = await applyFilters(supabase.from('rate_cards').select('*'))
+      .order('created_at', { ascending: false })
 
     if (error) {
       console.error('❌ Error fetching rate cards:', error)
       return NextResponse.json({ error: error.message }, { status: 500 })
     }
 
-    return NextResponse.json({ rateCards })
+    return NextResponse.json({ rateCards }, {
+      headers: etag ? cacheHeaders(etag, cacheProfile) : undefined
+    })
 
   } catch (error) {
     console.error('❌ Rate cards API error:', error)
@@ -92,7 +155,8 @@ export async function POST(request) {
     }
 
     // Clear cache for this creator
-    clearRateCardCache(creator_id)
+    await invalidateCreatorRateCards(creator_id)
+    bumpResourceVersion('rate_cards', 'rate_cards:public', `rate_cards:creator:${creator_id}`)
 
     return NextResponse.json({ 
       rateCard,
@@ -0,0 +1,62 @@
+// app/api/recommendations/refresh/route.js
+import { NextResponse } from 'next/server'
+import { createClient } from '@supabase/supabase-js'
+
+// Force dynamic rendering for this API route
+export const dynamic = 'force-dynamic'
+
+const REFRESH_BATCH_SIZE = 50
+// Leave headroom under the 30s function maxDuration in vercel.json
+const TIME_BUDGET_MS = 25 * 1000
+
+function getSupabaseServiceClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for recommendation refresh')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
+// GET /api/recommendations/refresh - drain the recommendation refresh queue (Vercel Cron)
+// Vercel sends "Authorization: Bearer $CRON_SECRET" on scheduled invocations
+export async function GET(request) {
+  try {
+    const cronSecret = process.env.CRON_SECRET
+    if (!cronSecret || request.headers.get('authorization') !== `Bearer ${cronSecret}`) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 })
+    }
+
+    const supabase = getSupabaseServiceClient()
+    if (!supabase) {
+      return NextResponse.json({ error: 'Database service unavailable' }, { status: 503 })
+    }
+
+    const startedAt = Date.now()
+    let processed = 0
+
+    while (Date.now() - startedAt < TIME_BUDGET_MS) {
+      const { data: count, error } = await supabase.rpc('process_recommendation_refresh_queue', {
+        p_limit: REFRESH_BATCH_SIZE
+      })
+
+      if (error) {
+        console.error('❌ Recommendation refresh failed:', error)
+        return NextResponse.json({ error: 'Recommendation refresh failed', processed }, { status: 500 })
+      }
+
+      processed += count || 0
+      if (!count || count < REFRESH_BATCH_SIZE) break
+    }
+
+    console.log('✅ Recommendation refresh run:', { processed, durationMs: Date.now() - startedAt })
+    return NextResponse.json({ processed })
+
+  } catch (error) {
+    console.error('❌ Recommendation refresh error:', error)
+    return NextResponse.json({ error: 'Internal server error' }, { status: 500 })
+  }
+}
@@ -1,6 +1,7 @@
 // app/api/webhooks/stripe/route.js
 import { NextResponse } from 'next/server'
-import { getPaymentBySessionId, updatePayment, updateOffer } from '@/lib/supabase'
+import { createClient } from '@supabase/supabase-js'
+import { drainAfterResponse, enqueueStripeEvent } from '@/lib/stripe/webhook-queue'
 
 // Initialize Stripe only when needed to avoid build-time errors
 let stripe = null
@@ -17,6 +18,18 @@ function getStripe() {
 
 const endpointSecret = process.env.STRIPE_WEBHOOK_SECRET
 
+function getSupabaseServiceClient() {
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
+  const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY
+
+  if (!supabaseUrl || !supabaseServiceKey) {
+    console.warn('Supabase environment variables not configured for Stripe webhooks')
+    return null
+  }
+
+  return createClient(supabaseUrl, supabaseServiceKey)
+}
+
 export async function POST(request) {
   try {
     const body = await request.text()
@@ -51,139 +64,40 @@ export async function POST(request) {
     }
     
     console.log('📨 Webhook event type:', event.type)
-    
-    // Handle the event
-    switch (event.type) {
-      case 'checkout.session.completed':
-        await handleCheckoutSessionCompleted(event.data.object)
-        break
-        
-      case 'checkout.session.expired':
-        await handleCheckoutSessionExpired(event.data.object)
-        break
-        
-      case 'payment_intent.succeeded':
-        await handlePaymentIntentSucceeded(event.data.object)
-        break
-        
-      case 'payment_intent.payment_failed':
-        await handlePaymentIntentFailed(event.data.object)
-        break
-        
-      default:
-        console.log(`🤷 Unhandled event type: ${event.type}`)
-    }
-    
-    return NextResponse.json({ received: true })
-    
-  } catch (error) {
-    console.error('❌ Webhook processing error:', error)
-    return NextResponse.json(
-      { error: 'Webhook processing failed' },
-      { status: 500 }
-    )
-  }
-}
 
-async function handleCheckoutSessionCompleted(session) {
-  console.log('✅ Processing checkout.session.completed:', session.id)
-  
-  try {
-    // Get payment record
-    const { data: payment, error: paymentError } = await getPaymentBySessionId(session.id)
-    
-    if (paymentError || !payment) {
-      console.error('❌ Payment not found for session:', session.id)
-      return
-    }
-    
-    // Update payment status
-    const { error: updateError } = await updatePayment(payment.id, {
-      status: 'paid_escrow',
-      stripe_payment_intent: session.payment_intent,
-      webhook_events: [...(payment.webhook_events || []), {
-        type: 'checkout.session.completed',
-        timestamp: new Date().toISOString(),
-        session_id: session.id
-      }]
-    })
-    
-    if (updateError) {
-      console.error('❌ Error updating payment:', updateError)
-      return
-    }
-    
-    // Update offer status
-    const { error: offerUpdateError } = await updateOffer(payment.offer_id, {
-      status: 'paid_escrow'
-    })
-    
-    if (offerUpdateError) {
-      console.error('❌ Error updating offer status:', offerUpdateError)
-    } else {
-      console.log('✅ Payment and offer updated successfully')
+    const supabase = getSupabaseServiceClient()
+    if (!supabase) {
+      return NextResponse.json(
+        { error: 'Database service unavailable' },
+        { status: 503 }
+      )
     }
-    
-  } catch (error) {
-    console.error('❌ Error handling checkout session completed:', error)
-  }
-}
 
-async function handleCheckoutSessionExpired(session) {
-  console.log('⏰ Processing checkout.session.expired:', session.id)
-  
-  try {
-    // Get payment record
-    const { data: payment, error: paymentError } = await getPaymentBySessionId(session.id)
-    
-    if (paymentError || !payment) {
-      console.error('❌ Payment not found for session:', session.id)
-      return
+    // Enqueue and acknowledge; this payment's events are processed right after the response, and the
+    // worker cron (/api/payments/webhooks/process) retries failures and picks up anything left over
+    const { duplicate, error } = await enqueueStripeEvent(supabase, event, 'webhooks/stripe')
+    if (error) {
+      console.error('❌ Error enqueuing webhook event:', error)
+      // Non-2xx makes Stripe redeliver later
+      return NextResponse.json(
+        { error: 'Webhook processing failed' },
+        { status: 500 }
+      )
     }
-    
-    // Update payment status to failed
-    const { error: updateError } = await updatePayment(payment.id, {
-      status: 'failed',
-      last_error: 'Session expired',
-      webhook_events: [...(payment.webhook_events || []), {
-        type: 'checkout.session.expired',
-        timestamp: new Date().toISOString(),
-        session_id: session.id
-      }]
-    })
-    
-    if (updateError) {
-      console.error('❌ Error updating payment:', updateError)
-    } else {
-      console.log('✅ Payment marked as failed due to expiration')
+
+    if (duplicate) {
+      console.log('🔁 Duplicate webhook event ignored:', event.id)
     }
-    
-  } catch (error) {
-    console.error('❌ Error handling checkout session expired:', error)
-  }
-}
 
-async function handlePaymentIntentSucceeded(paymentIntent) {
-  console.log('💰 Processing payment_intent.succeeded:', paymentIntent.id)
-  
-  try {
-    // Find payment by payment intent
-    // This is additional confirmation of successful payment
-    console.log('✅ Payment intent succeeded confirmation received')
-    
-  } catch (error) {
-    console.error('❌ Error handling payment intent succeeded:', error)
-  }
-}
+    drainAfterResponse(supabase, event)
 
-async function handlePaymentIntentFailed(paymentIntent) {
-  console.log('💸 Processing payment_intent.payment_failed:', paymentIntent.id)
-  
-  try {
-    // Handle failed payment intent
-    console.log('❌ Payment intent failed:', paymentIntent.last_payment_error?.message)
+    return NextResponse.json({ received: true, duplicate })
     
   } catch (error) {
-    console.error('❌ Error handling payment intent failed:', error)
+    console.error('❌ Webhook processing error:', error)
+    return NextResponse.json(
+      { error: 'Webhook processing failed' },
+      { status: 500 }
+    )
   }
-}
\ No newline at end of file
+}
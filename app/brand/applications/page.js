@@ -57,7 +57,7 @@ export default function ReviewApplicationsPage() {
             const allApplications = []
             
             for (const campaign of campaignsData) {
-              const { data: campaignApplications, error } = await getCampaignApplications(campaign.id)
+              const { data: campaignApplications, error } = await getCampaignApplications(campaign.id, 'card')
               if (campaignApplications) {
                 const applicationsWithCampaign = campaignApplications.map(app => ({
                   ...app,
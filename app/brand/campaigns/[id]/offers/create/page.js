@@ -14,6 +14,7 @@ import { ArrowLeft, Users, Target, DollarSign, AlertCircle } from 'lucide-react'
 import OfferSheet from '@/components/marketplace/OfferSheet'
 import CostEstimator from '@/components/marketplace/CostEstimator'
 import { formatPrice, formatDate } from '@/lib/formatters'
+import { DELIVERABLE_TYPES, DELIVERABLE_LABELS } from '@/lib/marketplace/pricing'
 
 const CreateOfferPage = () => {
   const params = useParams()
@@ -23,6 +24,9 @@ const CreateOfferPage = () => {
 
   const [campaign, setCampaign] = useState(null)
   const [creators, setCreators] = useState([])
+  const [creatorsCursor, setCreatorsCursor] = useState(null)
+  const [creatorSearch, setCreatorSearch] = useState('')
+  const [loadingMoreCreators, setLoadingMoreCreators] = useState(false)
   const [selectedCreator, setSelectedCreator] = useState(null)
   const [showOfferSheet, setShowOfferSheet] = useState(false)
   const [showCostEstimator, setShowCostEstimator] = useState(false)
@@ -31,6 +35,14 @@ const CreateOfferPage = () => {
   const [dataLoaded, setDataLoaded] = useState(false)
   const [error, setError] = useState('')
 
+  // Bulk mode: one deliverable sent to many creators through /api/offers/bulk
+  const [bulkCreators, setBulkCreators] = useState({})
+  const [bulkDeliverable, setBulkDeliverable] = useState(DELIVERABLE_TYPES.IG_REEL)
+  const [bulkQuantity, setBulkQuantity] = useState(1)
+  const [bulkRushPct, setBulkRushPct] = useState(0)
+  const [bulkSubmitting, setBulkSubmitting] = useState(false)
+  const [bulkResult, setBulkResult] = useState(null)
+
   useEffect(() => {
     let mounted = true
     
@@ -117,19 +129,23 @@ const CreateOfferPage = () => {
     }
   }
 
-  const loadAvailableCreators = async (mounted = true) => {
+  // Creators come from the paginated directory: one page up front, search and "load more" on demand
+  const fetchCreatorsPage = async ({ search = '', cursor = null } = {}) => {
+    const query = new URLSearchParams({ role: 'creator', limit: '24' })
+    if (search.trim()) query.set('q', search.trim())
+    if (cursor) query.set('cursor', cursor)
+
+    const response = await fetch(`/api/profiles?${query.toString()}`)
+    if (!response.ok) throw new Error('Failed to load creators')
+    return response.json()
+  }
+
+  const loadAvailableCreators = async (mounted = true, search = '') => {
     try {
-      // Load all creators - brands should be able to create offers for any creator
-      const creatorsResponse = await fetch('/api/profiles?role=creator')
-      if (creatorsResponse.ok) {
-        const creatorsData = await creatorsResponse.json()
-        if (mounted) {
-          setCreators(creatorsData.profiles || [])
-        }
-      } else {
-        if (mounted) {
-          setError('Failed to load creators')
-        }
+      const creatorsData = await fetchCreatorsPage({ search })
+      if (mounted) {
+        setCreators(creatorsData.profiles || [])
+        setCreatorsCursor(creatorsData.nextCursor || null)
       }
     } catch (err) {
       console.error('Failed to load creators:', err)
@@ -139,6 +155,32 @@ const CreateOfferPage = () => {
     }
   }
 
+  const loadMoreCreators = async () => {
+    if (!creatorsCursor || loadingMoreCreators) return
+
+    setLoadingMoreCreators(true)
+    try {
+      const creatorsData = await fetchCreatorsPage({ search: creatorSearch, cursor: creatorsCursor })
+      setCreators(prev => [...prev, ...(creatorsData.profiles || [])])
+      setCreatorsCursor(creatorsData.nextCursor || null)
+    } catch (err) {
+      console.error('Failed to load more creators:', err)
+    } finally {
+      setLoadingMoreCreators(false)
+    }
+  }
+
+  // Name prefix search runs on the server once typing pauses
+  useEffect(() => {
+    if (!dataLoaded) return
+    let mounted = true
+    const timeoutId = setTimeout(() => loadAvailableCreators(mounted, creatorSearch), 300)
+    return () => {
+      mounted = false
+      clearTimeout(timeoutId)
+    }
+  }, [creatorSearch])
+
   const handleCreateOffer = async (offerData) => {
     try {
       const response = await fetch('/api/offers', {
@@ -146,8 +188,10 @@ const CreateOfferPage = () => {
         headers: {
           'Content-Type': 'application/json',
         },
+        // OfferSheet submits without data; the estimator's quote (and its token) carries the pricing
         body: JSON.stringify({
-          ...offerData,
+          ...(offerData || estimatedOfferData || {}),
+          brand_id: profile?.id,
           campaign_id: campaignId,
           creator_id: selectedCreator.id,
           status: 'drafted'
@@ -166,6 +210,68 @@ const CreateOfferPage = () => {
     }
   }
 
+  const toggleBulkCreator = (creator) => {
+    setBulkResult(null)
+    setBulkCreators(prev => {
+      const next = { ...prev }
+      if (next[creator.id]) {
+        delete next[creator.id]
+      } else {
+        next[creator.id] = creator
+      }
+      return next
+    })
+  }
+
+  const handleCreateBulkOffers = async () => {
+    const creatorIds = Object.keys(bulkCreators)
+    if (creatorIds.length === 0 || bulkSubmitting) return
+
+    setBulkSubmitting(true)
+    setBulkResult(null)
+    try {
+      const response = await fetch('/api/offers/bulk', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+          campaign_id: campaignId,
+          brand_id: profile?.id,
+          status: 'drafted',
+          selections: creatorIds.map(creatorId => ({
+            creator_id: creatorId,
+            deliverable_type: bulkDeliverable,
+            quantity: Number(bulkQuantity) || 1,
+            rush_pct: Number(bulkRushPct) || 0
+          }))
+        }),
+      })
+
+      const data = await response.json()
+      if (response.ok) {
+        router.push(`/brand/campaigns/${campaignId}/offers`)
+        return
+      }
+
+      // Keep the selection so failed creators can be removed and the batch retried
+      setBulkResult({
+        error: data.error || 'Failed to create offers',
+        failures: (data.results || [])
+          .filter(result => result.error)
+          .map(result => ({
+            index: result.index,
+            name: bulkCreators[result.creator_id]?.full_name || result.creator_id,
+            error: result.error
+          }))
+      })
+    } catch (err) {
+      setBulkResult({ error: 'Failed to create offers', failures: [] })
+    } finally {
+      setBulkSubmitting(false)
+    }
+  }
+
   if (loading) {
     return (
       <ProtectedRoute requiredRole="brand">
@@ -258,7 +364,20 @@ const CreateOfferPage = () => {
                 <Heading level={2} size="lg">Select Creator</Heading>
               </div>
               
-              {creators.length === 0 ? (
+              <input
+                type="text"
+                value={creatorSearch}
+                onChange={(e) => setCreatorSearch(e.target.value)}
+                placeholder="Search creators by name..."
+                className="w-full mb-6 px-4 py-2 bg-[#1A1A2A] border border-white/10 rounded-lg text-white placeholder-gray-500 focus:outline-none focus:border-purple-500/50"
+              />
+
+              {creators.length === 0 && creatorSearch ? (
+                <div className="text-center py-12">
+                  <Users className="w-16 h-16 mx-auto text-gray-500 mb-4" />
+                  <Text color="secondary">No creators match "{creatorSearch}"</Text>
+                </div>
+              ) : creators.length === 0 ? (
                 <div className="text-center py-12">
                   <Users className="w-16 h-16 mx-auto text-gray-500 mb-4" />
                   <Heading level={3} size="lg" className="mb-2">No Creators Found</Heading>
@@ -300,18 +419,124 @@ const CreateOfferPage = () => {
                         <div className="flex justify-between">
                           <Text size="sm" color="secondary">Category:</Text>
                           <Text size="sm" weight="medium">
-                            {creator.categories?.join(', ') || 'General'}
+                            {creator.category_tags?.join(', ') || 'General'}
                           </Text>
                         </div>
                       </div>
                       
-                      <Button className="w-full bg-gradient-to-r from-purple-600 to-pink-600 hover:from-purple-700 hover:to-pink-700">
-                        Select Creator
-                      </Button>
+                      <div className="flex gap-3">
+                        <Button className="flex-1 bg-gradient-to-r from-purple-600 to-pink-600 hover:from-purple-700 hover:to-pink-700">
+                          Select Creator
+                        </Button>
+                        <Button
+                          variant="secondary"
+                          onClick={(e) => {
+                            e.stopPropagation()
+                            toggleBulkCreator(creator)
+                          }}
+                        >
+                          {bulkCreators[creator.id] ? 'Remove' : 'Add to Bulk'}
+                        </Button>
+                      </div>
                     </Card>
                   ))}
                 </div>
               )}
+
+              {creatorsCursor && (
+                <div className="flex justify-center mt-6">
+                  <Button variant="secondary" onClick={loadMoreCreators} disabled={loadingMoreCreators}>
+                    {loadingMoreCreators ? 'Loading...' : 'Load More Creators'}
+                  </Button>
+                </div>
+              )}
+            </Card>
+          )}
+
+          {/* Bulk Offers */}
+          {!selectedCreator && Object.keys(bulkCreators).length > 0 && (
+            <Card className="p-6">
+              <div className="flex items-center justify-between mb-6">
+                <Heading level={2} size="lg">
+                  Bulk Offer ({Object.keys(bulkCreators).length} creators)
+                </Heading>
+                <Button
+                  variant="ghost"
+                  size="sm"
+                  onClick={() => {
+                    setBulkCreators({})
+                    setBulkResult(null)
+                  }}
+                  className="text-gray-400 hover:text-white"
+                >
+                  Clear
+                </Button>
+              </div>
+
+              <div className="flex flex-wrap gap-2 mb-6">
+                {Object.values(bulkCreators).map(creator => (
+                  <Badge key={creator.id} variant="secondary">{creator.full_name}</Badge>
+                ))}
+              </div>
+
+              <div className="grid grid-cols-1 md:grid-cols-3 gap-4 mb-6">
+                <div>
+                  <Text size="sm" color="secondary" className="mb-1">Deliverable</Text>
+                  <select
+                    value={bulkDeliverable}
+                    onChange={(e) => setBulkDeliverable(e.target.value)}
+                    className="w-full px-4 py-2 bg-[#1A1A2A] border border-white/10 rounded-lg text-white focus:outline-none focus:border-purple-500/50"
+                  >
+                    {Object.values(DELIVERABLE_TYPES).map(type => (
+                      <option key={type} value={type}>{DELIVERABLE_LABELS[type]}</option>
+                    ))}
+                  </select>
+                </div>
+                <div>
+                  <Text size="sm" color="secondary" className="mb-1">Quantity</Text>
+                  <input
+                    type="number"
+                    min="1"
+                    value={bulkQuantity}
+                    onChange={(e) => setBulkQuantity(e.target.value)}
+                    className="w-full px-4 py-2 bg-[#1A1A2A] border border-white/10 rounded-lg text-white focus:outline-none focus:border-purple-500/50"
+                  />
+                </div>
+                <div>
+                  <Text size="sm" color="secondary" className="mb-1">Rush Fee (%)</Text>
+                  <input
+                    type="number"
+                    min="0"
+                    max="200"
+                    value={bulkRushPct}
+                    onChange={(e) => setBulkRushPct(e.target.value)}
+                    className="w-full px-4 py-2 bg-[#1A1A2A] border border-white/10 rounded-lg text-white focus:outline-none focus:border-purple-500/50"
+                  />
+                </div>
+              </div>
+
+              <Text size="sm" color="secondary" className="mb-6">
+                Each offer is priced from the creator's rate card for the selected deliverable.
+              </Text>
+
+              {bulkResult && (
+                <div className="mb-6 p-4 rounded-lg border border-red-500/20 bg-red-900/20">
+                  <Text className="text-red-400 mb-2">{bulkResult.error}</Text>
+                  {bulkResult.failures.map(failure => (
+                    <Text key={failure.index} size="sm" className="text-red-300">
+                      {failure.name}: {failure.error}
+                    </Text>
+                  ))}
+                </div>
+              )}
+
+              <Button
+                onClick={handleCreateBulkOffers}
+                disabled={bulkSubmitting}
+                className="bg-gradient-to-r from-purple-600 to-pink-600 hover:from-purple-700 hover:to-pink-700"
+              >
+                {bulkSubmitting ? 'Creating Offers...' : `Create ${Object.keys(bulkCreators).length} Offers`}
+              </Button>
             </Card>
           )}
 
@@ -384,6 +609,8 @@ const CreateOfferPage = () => {
                   </div>
                   <CostEstimator
                     creatorId={selectedCreator.id}
+                    campaignId={campaignId}
+                    brandId={profile?.id}
                     onOfferCreate={(estimatedData) => {
                       setEstimatedOfferData(estimatedData)
                       setShowCostEstimator(false)
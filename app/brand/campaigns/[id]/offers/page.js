@@ -13,6 +13,9 @@ const OffersPage = () => {
 
   const [isMounted, setIsMounted] = useState(false)
   const [offers, setOffers] = useState([])
+  const [counts, setCounts] = useState(null)
+  const [nextCursor, setNextCursor] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState('')
 
@@ -27,16 +30,22 @@ const OffersPage = () => {
     }
   }, [isMounted, campaignId, user, authLoading])
 
+  // One page per request; status counts come back with the first page only
+  const fetchOffersPage = async (cursor = null) => {
+    const query = new URLSearchParams({ campaign_id: campaignId, limit: '20' })
+    if (cursor) query.set('cursor', cursor)
+
+    const response = await fetch(`/api/offers?${query.toString()}`)
+    if (!response.ok) throw new Error('Failed to load offers')
+    return response.json()
+  }
+
   const loadOffers = async () => {
     try {
-      const response = await fetch(`/api/offers?campaign_id=${campaignId}`)
-      if (response.ok) {
-        const data = await response.json()
-        const offersData = Array.isArray(data.offers) ? data.offers : []
-        setOffers(offersData)
-      } else {
-        setError('Failed to load offers')
-      }
+      const data = await fetchOffersPage()
+      setOffers(Array.isArray(data.offers) ? data.offers : [])
+      setNextCursor(data.nextCursor || null)
+      setCounts(data.counts || null)
     } catch (err) {
       console.error('Error loading offers:', err)
       setError('Failed to load offers')
@@ -45,6 +54,24 @@ const OffersPage = () => {
     }
   }
 
+  const loadMoreOffers = async () => {
+    if (!nextCursor || loadingMore) return
+    setLoadingMore(true)
+    try {
+      const data = await fetchOffersPage(nextCursor)
+      setOffers(prev => [...prev, ...(Array.isArray(data.offers) ? data.offers : [])])
+      setNextCursor(data.nextCursor || null)
+    } catch (err) {
+      console.error('Error loading more offers:', err)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
+  const statusSummary = counts
+    ? Object.entries(counts.by_status).filter(([, count]) => count > 0)
+    : []
+
   return (
     <ProtectedRoute requiredRole="brand">
       {!isMounted || loading ? (
@@ -68,7 +95,12 @@ const OffersPage = () => {
               )}
               
               <div className="space-y-4">
-                <p className="text-white">Found {offers.length} offers</p>
+                <p className="text-white">Found {counts ? counts.total : offers.length} offers</p>
+                {statusSummary.length > 0 && (
+                  <p className="text-gray-400 text-sm">
+                    {statusSummary.map(([status, count]) => `${status}: ${count}`).join(' · ')}
+                  </p>
+                )}
                 
                 {offers.length > 0 ? (
                   <div className="space-y-3">
@@ -83,6 +115,18 @@ const OffersPage = () => {
                 ) : (
                   <p className="text-gray-400">No offers found for this campaign</p>
                 )}
+
+                {nextCursor && (
+                  <div className="text-center">
+                    <button
+                      onClick={loadMoreOffers}
+                      disabled={loadingMore}
+                      className="bg-gray-700 hover:bg-gray-600 disabled:opacity-50 text-white px-6 py-2 rounded-lg"
+                    >
+                      {loadingMore ? 'Loading...' : 'Load More Offers'}
+                    </button>
+                  </div>
+                )}
                 
                 <div className="flex gap-3 mt-6">
                   <button
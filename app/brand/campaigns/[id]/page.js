@@ -107,7 +107,7 @@ export default function ViewCampaignPage() {
           }
 
           // Load applications
-          const applicationsData = await getCampaignApplications(campaignId).catch(err => {
+          const applicationsData = await getCampaignApplications(campaignId, 'card').catch(err => {
             console.warn('Failed to load applications:', err)
             return [] // Fallback to empty array
           })
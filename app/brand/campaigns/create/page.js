@@ -202,11 +202,11 @@ export default function CreateCampaignPage() {
       if (data && data.length > 0) {
         const newCampaign = data[0] // createCampaign returns array with the new campaign
         console.log('💾 Adding new campaign to cache:', newCampaign.title)
-        addCampaignToCache(newCampaign)
+        addCampaignToCache(profile.id, newCampaign)
       } else if (data && !Array.isArray(data)) {
         // Handle case where createCampaign returns single object instead of array
         console.log('💾 Adding new campaign to cache (single object):', data.title)
-        addCampaignToCache(data)
+        addCampaignToCache(profile.id, data)
       } else {
         // CRITICAL FIX: Don't clear cache on unexpected data structure - just skip cache update
         console.warn('⚠️ Unexpected data structure from createCampaign, skipping cache update')
@@ -269,11 +269,11 @@ export default function CreateCampaignPage() {
       if (data && data.length > 0) {
         const newCampaign = data[0]
         console.log('💾 Adding new draft campaign to cache:', newCampaign.title)
-        addCampaignToCache(newCampaign)
+        addCampaignToCache(profile.id, newCampaign)
       } else if (data && !Array.isArray(data)) {
         // Handle case where createCampaign returns single object instead of array
         console.log('💾 Adding new draft campaign to cache (single object):', data.title)
-        addCampaignToCache(data)
+        addCampaignToCache(profile.id, data)
       } else {
         // CRITICAL FIX: Don't clear cache on unexpected data structure - just skip cache update
         console.warn('⚠️ Unexpected data structure from draft save, skipping cache update')
@@ -9,11 +9,13 @@ import Button from '@/components/ui/Button'
 import { Card } from '@/components/ui/Card'
 import { Badge } from '@/components/ui/Badge'
 import { Heading, Text } from '@/components/ui/Typography'
-import { getBrandCampaigns, getCampaignApplications, deleteCampaign } from '@/lib/supabase'
+import { getBrandCampaigns, getBrandApplicationCounts, deleteCampaign } from '@/lib/supabase'
 import { 
   getCachedCampaigns, 
   updateCampaignsCache, 
-  removeCampaignFromCache 
+  removeCampaignFromCache,
+  isCacheFresh,
+  loadCampaignCache
 } from '@/lib/campaign-cache'
 import { 
   Plus,
@@ -35,7 +37,7 @@ export default function ManageCampaignsPage() {
   const { profile } = useAuth()
   const [campaigns, setCampaigns] = useState(() => {
     // Initialize from cache using utility function
-    return getCachedCampaigns() || []
+    return getCachedCampaigns(profile?.id) || []
   })
   const [filteredCampaigns, setFilteredCampaigns] = useState([])
   const [loading, setLoading] = useState(false)
@@ -44,7 +46,7 @@ export default function ManageCampaignsPage() {
   const [statusFilter, setStatusFilter] = useState('all')
   const [dataFetched, setDataFetched] = useState(() => {
     // Check if we have cached data
-    const cached = getCachedCampaigns()
+    const cached = getCachedCampaigns(profile?.id)
     return cached ? cached.length > 0 : false
   }) // Track if data has been fetched
   
@@ -80,7 +82,7 @@ export default function ManageCampaignsPage() {
       console.log('✅ Campaign deleted successfully')
       
       // Remove from cache using utility function - this syncs across all pages
-      const updatedCampaigns = removeCampaignFromCache(campaignId)
+      const updatedCampaigns = removeCampaignFromCache(profile?.id, campaignId)
       
       if (updatedCampaigns !== null) {
         // Update local state to match cache
@@ -118,23 +120,24 @@ export default function ManageCampaignsPage() {
         return
       }
 
-      // Don't reload if we already have campaigns and profile hasn't changed
-      // Also check if cache is recent (less than 5 minutes old)
-      const cacheTime = localStorage.getItem('brand_campaigns_cache_time')
-      const cacheAge = cacheTime ? Date.now() - parseInt(cacheTime) : Infinity
-      const cacheIsRecent = cacheAge < 5 * 60 * 1000 // 5 minutes
+      // Render persisted campaigns immediately, even if stale
+      await loadCampaignCache()
+      const cachedCampaigns = getCachedCampaigns(profile?.id)
+      if (cachedCampaigns) {
+        setCampaigns(cachedCampaigns)
+        setFilteredCampaigns(cachedCampaigns)
+        setDataFetched(true)
+      }
       
-      if (campaigns.length > 0 && dataFetched && profile?.id && cacheIsRecent) {
-        console.log('✅ Using cached campaign data from campaigns page, no reload needed (cache age:', Math.round(cacheAge / 1000), 'seconds)')
+      if (cachedCampaigns && profile?.id && isCacheFresh(profile.id)) {
+        console.log('✅ Using cached campaign data from campaigns page, no reload needed')
         setLoading(false)
-        // Make sure filtered campaigns are set
-        setFilteredCampaigns(campaigns)
         return
       }
 
-      // If cache is old, mark as needing refresh
-      if (!cacheIsRecent && campaigns.length > 0) {
-        console.log('⏰ Cache is old (', Math.round(cacheAge / 1000), 'seconds), will refresh campaigns data')
+      // Stale cache stays on screen while the refresh runs in the background
+      if (cachedCampaigns) {
+        console.log('⏰ Cache is stale, refreshing campaigns data in the background')
       }
 
       try {
@@ -165,24 +168,14 @@ export default function ManageCampaignsPage() {
           console.log('✅ Campaigns found:', campaignsData.length)
           
           // Get application counts for each campaign
-          const campaignsWithStats = await Promise.all(
-            campaignsData.map(async (campaign) => {
-              try {
-                const { data: applications } = await getCampaignApplications(campaign.id)
-                console.log(`📋 Applications for ${campaign.title}:`, applications?.length || 0)
-                return {
-                  ...campaign,
-                  applicationCount: applications ? applications.length : 0
-                }
-              } catch (appError) {
-                console.error('❌ Error fetching applications for campaign:', campaign.id, appError)
-                return {
-                  ...campaign,
-                  applicationCount: 0
-                }
-              }
-            })
-          )
+          const { data: applicationCounts, error: countsError } = await getBrandApplicationCounts(profile.id)
+          if (countsError) {
+            console.error('❌ Error fetching application counts:', countsError)
+          }
+          const campaignsWithStats = campaignsData.map(campaign => ({
+            ...campaign,
+            applicationCount: applicationCounts?.byCampaign[campaign.id]?.total || 0
+          }))
           
           console.log('✅ Final campaigns with stats:', campaignsWithStats)
           setCampaigns(campaignsWithStats)
@@ -190,7 +183,7 @@ export default function ManageCampaignsPage() {
           setDataFetched(true)
           
           // Update cache using utility function
-          updateCampaignsCache(campaignsWithStats)
+          updateCampaignsCache(profile.id, campaignsWithStats)
           console.log('💾 Campaigns cache updated from campaigns page')
         } else {
           console.log('⚠️ No campaigns found for user')
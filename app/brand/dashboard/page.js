@@ -13,13 +13,16 @@ import { Avatar } from '@/components/ui/Avatar'
 import { Heading, Text } from '@/components/ui/Typography'
 import OnboardingProgress from '@/components/onboarding/OnboardingProgress'
 import { useOnboarding } from '@/components/onboarding/OnboardingProvider'
-import { getBrandCampaigns, getCampaignApplications, getApplications } from '@/lib/supabase'
+import { getBrandCampaigns, getBrandApplicationCounts, getApplications } from '@/lib/supabase'
 import { formatDate } from '@/lib/formatters'
 import { 
   getCachedCampaigns, 
   getCachedStats,
   updateCampaignsCache, 
-  updateStatsCache 
+  updateStatsCache,
+  isCacheFresh,
+  loadCampaignCache,
+  subscribeToCampaignCache
 } from '@/lib/campaign-cache'
 import { 
   Briefcase, 
@@ -47,11 +50,11 @@ function BrandDashboardContent() {
   
   const [campaigns, setCampaigns] = useState(() => {
     // Initialize from cache using utility function
-    return getCachedCampaigns() || []
+    return getCachedCampaigns(profile?.id) || []
   })
   const [stats, setStats] = useState(() => {
     // Initialize stats from cache using utility function
-    return getCachedStats() || {
+    return getCachedStats(profile?.id) || {
       totalCampaigns: 0,
       activeCampaigns: 0,
       totalApplications: 0,
@@ -61,10 +64,20 @@ function BrandDashboardContent() {
   const [loading, setLoading] = useState(false)
   const [dataFetched, setDataFetched] = useState(() => {
     // Check if we have cached data
-    const cached = getCachedCampaigns()
+    const cached = getCachedCampaigns(profile?.id)
     return cached ? cached.length > 0 : false
   }) // Track if data has been fetched
 
+  // Keep state in sync with cache updates from other pages and tabs
+  useEffect(() => {
+    return subscribeToCampaignCache(profile?.id, () => {
+      const cachedCampaigns = getCachedCampaigns(profile?.id)
+      const cachedStats = getCachedStats(profile?.id)
+      if (cachedCampaigns) setCampaigns(cachedCampaigns)
+      if (cachedStats) setStats(cachedStats)
+    })
+  }, [profile?.id])
+
   useEffect(() => {
     const loadData = async () => {
       // Prevent multiple simultaneous loads
@@ -73,24 +86,29 @@ function BrandDashboardContent() {
         return
       }
 
-      // Don't reload if we already have campaigns and profile hasn't changed
-      // Also check if cache is recent (less than 5 minutes old)
-      const cacheTime = localStorage.getItem('brand_campaigns_cache_time')
-      const cacheAge = cacheTime ? Date.now() - parseInt(cacheTime) : Infinity
-      const cacheIsRecent = cacheAge < 5 * 60 * 1000 // 5 minutes
+      // Render persisted data immediately, then decide whether to refresh
+      await loadCampaignCache()
+      const cachedCampaigns = getCachedCampaigns(profile?.id)
+      const cachedStats = getCachedStats(profile?.id)
+      if (cachedCampaigns) {
+        setCampaigns(cachedCampaigns)
+        setDataFetched(true)
+      }
+      if (cachedStats) setStats(cachedStats)
       
-      if (campaigns.length > 0 && dataFetched && profile?.id && cacheIsRecent) {
-        console.log('✅ Using cached campaign data, no reload needed (cache age:', Math.round(cacheAge / 1000), 'seconds)')
+      if (cachedCampaigns && profile?.id && isCacheFresh(profile.id)) {
+        console.log('✅ Using cached campaign data, no reload needed')
         setLoading(false)
         return
       }
 
-      // If cache is old, mark as needing refresh
-      if (!cacheIsRecent && campaigns.length > 0) {
-        console.log('⏰ Cache is old (', Math.round(cacheAge / 1000), 'seconds), will refresh data')
+      // Stale cache stays on screen while the refresh runs in the background
+      if (cachedCampaigns) {
+        console.log('⏰ Cache is stale, refreshing dashboard data in the background')
       }
 
-      setLoading(true)
+      // Only block on a spinner when there is nothing cached to show
+      if (!cachedCampaigns) setLoading(true)
 
       // Set a timeout to prevent infinite loading
       const timeoutId = setTimeout(() => {
@@ -122,24 +140,17 @@ function BrandDashboardContent() {
             setDataFetched(true)
             
             // Update cache using utility function
-            updateCampaignsCache(campaignsData)
+            updateCampaignsCache(profile.id, campaignsData)
             console.log('💾 Campaigns cache updated from dashboard')
             
-            let totalApplications = 0
-            let acceptedApplications = 0
-            
-            for (const campaign of campaignsData) {
-              try {
-                const { data: applications } = await getCampaignApplications(campaign.id)
-                if (applications) {
-                  totalApplications += applications.length
-                  acceptedApplications += applications.filter(app => app.status === 'accepted').length
-                }
-              } catch (appError) {
-                console.error('❌ Error fetching applications for campaign:', campaign.id, appError)
-                // Continue with other campaigns even if one fails
-              }
+            // One aggregate query for every campaign instead of a request per campaign
+            const { data: applicationCounts, error: countsError } = await getBrandApplicationCounts(profile.id)
+            if (countsError) {
+              console.error('❌ Error fetching application counts:', countsError)
             }
+            // Keep the last known counts rather than showing zeros when the count query fails
+            const totalApplications = applicationCounts ? applicationCounts.totals.total : stats.totalApplications
+            const acceptedApplications = applicationCounts ? applicationCounts.totals.accepted : stats.acceptedApplications
             
             const newStats = {
               totalCampaigns: campaignsData.length,
@@ -151,7 +162,7 @@ function BrandDashboardContent() {
             setStats(newStats)
             
             // Update stats cache using utility function
-            updateStatsCache(newStats)
+            updateStatsCache(profile.id, newStats)
             console.log('💾 Stats cache updated from dashboard')
             
             console.log('✅ Stats calculated and cached:', newStats)
@@ -1,6 +1,6 @@
 'use client'
 
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { useAuth } from '@/components/AuthProvider'
 import ProtectedRoute from '@/components/ProtectedRoute'
 import Layout from '@/components/shared/Layout'
@@ -11,7 +11,6 @@ import { Card } from '@/components/ui/Card'
 import { Badge } from '@/components/ui/Badge'
 import { Heading, Text } from '@/components/ui/Typography'
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select.jsx'
-import { getCampaigns } from '@/lib/supabase'
 import { formatDate } from '@/lib/formatters'
 import { 
   Search, 
@@ -30,12 +29,17 @@ import Link from 'next/link'
 export default function CreatorCampaigns() {
   const { profile } = useAuth()
   const [campaigns, setCampaigns] = useState([])
-  const [filteredCampaigns, setFilteredCampaigns] = useState([])
+  const [totalCount, setTotalCount] = useState(0)
+  const [facets, setFacets] = useState(null)
+  const [nextCursor, setNextCursor] = useState(null)
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [searchTerm, setSearchTerm] = useState('')
+  const [debouncedSearch, setDebouncedSearch] = useState('')
   const [selectedCategory, setSelectedCategory] = useState('all')
   const [selectedBudget, setSelectedBudget] = useState('all')
-  const [dataLoaded, setDataLoaded] = useState(false) // Track if data has been loaded
+  // Bumped whenever the query changes; load-more responses for an older query are dropped
+  const queryVersion = useRef(0)
 
   const categories = [
     'Fashion & Beauty', 'Technology', 'Food & Beverage', 'Travel & Lifestyle',
@@ -49,110 +53,52 @@ export default function CreatorCampaigns() {
     '$5,000 - $10,000', '$10,000+'
   ]
 
+  const hasFilters = !!(searchTerm || selectedCategory !== 'all' || selectedBudget !== 'all')
+
+  // Facet count for an option, shown next to it in the filter dropdowns
+  const facetCount = (facet, value) => facets?.[facet]?.find(option => option.value === value)?.count || 0
+
+  const buildDiscoveryUrl = (cursor) => {
+    const params = new URLSearchParams()
+    if (debouncedSearch.trim()) params.set('q', debouncedSearch.trim())
+    if (selectedCategory !== 'all') params.set('category', selectedCategory)
+    if (selectedBudget !== 'all') params.set('budget_range', selectedBudget)
+    if (cursor) params.set('cursor', cursor)
+    return `/api/campaigns/discover?${params.toString()}`
+  }
+
+  // Search runs on the server, so wait for typing to pause before querying
   useEffect(() => {
-    let isMounted = true; // Flag to prevent state updates if component unmounts
+    const timeoutId = setTimeout(() => setDebouncedSearch(searchTerm), 300)
+    return () => clearTimeout(timeoutId)
+  }, [searchTerm])
+
+  useEffect(() => {
+    // Abort superseded requests so a slow earlier search can't overwrite newer results
+    const controller = new AbortController()
+    queryVersion.current++
     
     const loadCampaigns = async () => {
-      // Don't start loading if already loading, data already loaded, or component unmounted
-      if (!isMounted || dataLoaded) return;
-      
       try {
-        console.log('🔄 Loading campaigns from Supabase...')
+        console.log('🔄 Loading campaign discovery feed...')
         
-        // Set shorter timeout to prevent infinite loading
-        const timeoutId = setTimeout(() => {
-          if (isMounted && !dataLoaded) {
-            console.log('⚠️ Campaign loading timeout, using fallback data')
-            const sampleCampaigns = [
-              {
-                id: '1',
-                title: 'Fashion Photography Campaign',  
-                description: 'Looking for fashion influencers to showcase our new summer collection',
-                category: 'Fashion & Beauty',
-                budget_range: '$2,500 - $5,000',
-                application_deadline: '2025-09-15',
-                created_at: '2025-08-15',
-                profiles: { company_name: 'Sample Fashion Brand' }
-              },
-              {
-                id: '2',
-                title: 'Tech Review Campaign',
-                description: 'Need tech reviewers for our latest smartphone release', 
-                category: 'Technology',
-                budget_range: '$1,000 - $2,500',
-                application_deadline: '2025-09-30',
-                created_at: '2025-08-16',
-                profiles: { company_name: 'TechCorp' }
-              }
-            ]
-            setCampaigns(sampleCampaigns)
-            setFilteredCampaigns(sampleCampaigns)
-            setDataLoaded(true)
-            setLoading(false)
-          }
-        }, 5000) // 5 second timeout (shorter)
-        
-        // Get real campaigns data from Supabase
-        const { data: campaignsData, error } = await getCampaigns()
-        
-        // Clear timeout if request completes
-        clearTimeout(timeoutId)
-        
-        // Only update state if component is still mounted
-        if (!isMounted) return;
-        
-        if (error) {
-          console.error('❌ Error loading campaigns:', error)
-          // Fallback to sample data if Supabase fails
-          const sampleCampaigns = [
-            {
-              id: '1',
-              title: 'Fashion Photography Campaign',
-              description: 'Looking for fashion influencers to showcase our new summer collection',
-              category: 'Fashion & Beauty',
-              budget_range: '$2,500 - $5,000',
-              application_deadline: '2025-09-15',
-              created_at: '2025-08-15',
-              profiles: {
-                company_name: 'Sample Fashion Brand',
-              }
-            },
-            {
-              id: '2', 
-              title: 'Tech Review Campaign',
-              description: 'Need tech reviewers for our latest smartphone release',
-              category: 'Technology',
-              budget_range: '$1,000 - $2,500',
-              application_deadline: '2025-09-30',
-              created_at: '2025-08-16',
-              profiles: {
-                company_name: 'TechCorp',
-              }
-            }
-          ]
-          console.log('⚠️ Using fallback sample data')
-          setCampaigns(sampleCampaigns)
-          setFilteredCampaigns(sampleCampaigns)
-        } else {
-          console.log('✅ Real campaigns loaded:', campaignsData?.length || 0)
-          setCampaigns(campaignsData || [])
-          setFilteredCampaigns(campaignsData || [])
+        const response = await fetch(buildDiscoveryUrl(), { signal: controller.signal })
+        if (!response.ok) {
+          throw new Error(`Discovery request failed: ${response.status}`)
         }
         
-        // Mark data as loaded
-        setDataLoaded(true)
-        
+        const result = await response.json()
+        console.log('✅ Campaigns loaded:', result.campaigns?.length || 0, 'of', result.facets?.total || 0)
+        setCampaigns(result.campaigns || [])
+        setNextCursor(result.nextCursor)
+        setFacets(result.facets)
+        setTotalCount(result.facets?.total ?? result.campaigns?.length ?? 0)
       } catch (error) {
-        console.error('❌ Exception loading campaigns:', error)
-        // Only update state if component is still mounted
-        if (isMounted) {
-          setCampaigns([])
-          setFilteredCampaigns([])
-          setDataLoaded(true) // Mark as loaded even on error
-        }
+        if (error.name === 'AbortError') return
+        console.error('❌ Error loading campaigns:', error)
+        // Keep whatever is already on screen rather than clearing it
       } finally {
-        // Only update loading state if component is still mounted
-        if (isMounted) {
+        if (!controller.signal.aborted) {
           console.log('🏁 Setting loading to false')
           setLoading(false)
         }
@@ -163,41 +109,31 @@ export default function CreatorCampaigns() {
     
     // Cleanup function to prevent memory leaks
     return () => {
-      isMounted = false
+      controller.abort()
     }
-  }, [dataLoaded]) // Add dataLoaded to dependencies
+  }, [debouncedSearch, selectedCategory, selectedBudget])
 
-  useEffect(() => {
-    let filtered = campaigns || []
-
-    // Filter by search term (with null checks)
-    if (searchTerm && searchTerm.trim()) {
-      filtered = filtered.filter(campaign => {
-        if (!campaign) return false
-        const title = campaign.title || ''
-        const description = campaign.description || ''
-        const searchLower = searchTerm.toLowerCase()
-        return title.toLowerCase().includes(searchLower) ||
-               description.toLowerCase().includes(searchLower)
-      })
-    }
+  const loadMore = async () => {
+    if (!nextCursor || loadingMore) return
 
-    // Filter by category (with null checks)
-    if (selectedCategory && selectedCategory !== 'all') {
-      filtered = filtered.filter(campaign => 
-        campaign && campaign.category === selectedCategory
-      )
-    }
-
-    // Filter by budget range (with null checks)
-    if (selectedBudget && selectedBudget !== 'all') {
-      filtered = filtered.filter(campaign => 
-        campaign && campaign.budget_range === selectedBudget
-      )
+    const version = queryVersion.current
+    setLoadingMore(true)
+    try {
+      const response = await fetch(buildDiscoveryUrl(nextCursor))
+      if (!response.ok) {
+        throw new Error(`Discovery request failed: ${response.status}`)
+      }
+      
+      const result = await response.json()
+      if (version !== queryVersion.current) return
+      setCampaigns(prev => [...prev, ...(result.campaigns || [])])
+      setNextCursor(result.nextCursor)
+    } catch (error) {
+      console.error('❌ Error loading more campaigns:', error)
+    } finally {
+      setLoadingMore(false)
     }
-
-    setFilteredCampaigns(filtered)
-  }, [campaigns, searchTerm, selectedCategory, selectedBudget])
+  }
 
   const clearFilters = () => {
     setSearchTerm('')
@@ -238,7 +174,7 @@ export default function CreatorCampaigns() {
                   <Text size="sm" color="secondary">Available Campaigns</Text>
                   <Heading level={3} size="2xl">
                     <span className="text-transparent bg-clip-text bg-gradient-to-r from-[#8A2BE2] to-[#FF1493]">
-                      {filteredCampaigns.length}
+                      {totalCount}
                     </span>
                   </Heading>
                 </div>
@@ -272,7 +208,7 @@ export default function CreatorCampaigns() {
                     <SelectItem value="all">All Categories</SelectItem>
                     {categories.map((category) => (
                       <SelectItem key={category} value={category}>
-                        {category}
+                        {category}{facets ? ` (${facetCount('category', category)})` : ''}
                       </SelectItem>
                     ))}
                   </SelectContent>
@@ -286,7 +222,7 @@ export default function CreatorCampaigns() {
                     <SelectItem value="all">All Budgets</SelectItem>
                     {budgetRanges.map((range) => (
                       <SelectItem key={range} value={range}>
-                        {range}
+                        {range}{facets ? ` (${facetCount('budget_range', range)})` : ''}
                       </SelectItem>
                     ))}
                   </SelectContent>
@@ -301,9 +237,9 @@ export default function CreatorCampaigns() {
             {/* Results Summary */}
             <div className="flex items-center justify-between mb-6">
               <Text color="secondary">
-                Showing {filteredCampaigns.length} of {campaigns.length} campaigns
+                Showing {campaigns.length} of {totalCount} campaigns
               </Text>
-              {(searchTerm || selectedCategory !== 'all' || selectedBudget !== 'all') && (
+              {hasFilters && (
                 <Badge variant="secondary" className="flex items-center gap-1">
                   <Filter className="w-3 h-3" />
                   Filters applied
@@ -312,7 +248,7 @@ export default function CreatorCampaigns() {
             </div>
 
             {/* Campaigns Grid */}
-            {filteredCampaigns.length === 0 ? (
+            {campaigns.length === 0 ? (
               <Card className="p-12">
                 <div className="text-center">
                   <div className="w-16 h-16 bg-[#2A2A3A] rounded-2xl flex items-center justify-center mx-auto mb-4">
@@ -320,12 +256,12 @@ export default function CreatorCampaigns() {
                   </div>
                   <Heading level={4} size="lg" className="mb-2">No campaigns found</Heading>
                   <Text size="sm" color="secondary" className="mb-6">
-                    {campaigns.length === 0 
+                    {!hasFilters 
                       ? 'Check back later for new opportunities!'
                       : 'Try adjusting your filters to see more campaigns.'
                     }
                   </Text>
-                  {(searchTerm || selectedCategory !== 'all' || selectedBudget !== 'all') && (
+                  {hasFilters && (
                     <Button variant="secondary" onClick={clearFilters}>
                       Clear Filters
                     </Button>
@@ -334,7 +270,7 @@ export default function CreatorCampaigns() {
               </Card>
             ) : (
               <div className="grid gap-6">
-                {filteredCampaigns.map((campaign) => {
+                {campaigns.map((campaign) => {
                   // Add null checks to prevent crashes
                   if (!campaign || !campaign.id) return null
                   
@@ -403,6 +339,14 @@ export default function CreatorCampaigns() {
                 }).filter(Boolean)}
               </div>
             )}
+
+            {nextCursor && (
+              <div className="flex justify-center mt-8">
+                <Button variant="secondary" onClick={loadMore} disabled={loadingMore}>
+                  {loadingMore ? 'Loading...' : 'Load More Campaigns'}
+                </Button>
+              </div>
+            )}
           </Container>
         </Section>
       </Layout>
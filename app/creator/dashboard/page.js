@@ -13,7 +13,7 @@ import { Avatar } from '@/components/ui/Avatar'
 import { Heading, Text } from '@/components/ui/Typography'
 import OnboardingProgress from '@/components/onboarding/OnboardingProgress'
 import { useOnboarding } from '@/components/onboarding/OnboardingProvider'
-import { getCampaigns, getCreatorApplications } from '@/lib/supabase'
+import { getCreatorApplications, getCreatorRecommendations } from '@/lib/supabase'
 import { formatDate } from '@/lib/formatters'
 import { 
   User, 
@@ -59,14 +59,24 @@ function CreatorDashboardContent() {
           setTimeout(() => reject(new Error('Dashboard data loading timed out after 8 seconds')), 8000)
         )
         
-        // Load campaigns with faster timeout protection
-        const campaignsPromise = getCampaigns().then(result => {
-          if (mounted && result?.data) {
-            setCampaigns(result.data.slice(0, 6))
-            console.log('✅ Campaigns loaded successfully')
-          }
-          return result
-        })
+        // Precomputed recommendations first; new creators without any fall back to the newest campaigns
+        const loadLatestCampaigns = () => fetch('/api/campaigns/discover?limit=6&facets=false')
+          .then(response => response.ok ? response.json() : null)
+          .then(result => result?.campaigns || null)
+        
+        const recommendationsPromise = profile?.id
+          ? getCreatorRecommendations(profile.id, 6)
+          : Promise.resolve({ data: null })
+        
+        const campaignsPromise = recommendationsPromise
+          .then(({ data }) => (data && data.length > 0 ? data : loadLatestCampaigns()))
+          .then(result => {
+            if (mounted && result) {
+              setCampaigns(result)
+              console.log('✅ Campaigns loaded successfully')
+            }
+            return result
+          })
         
         // Load applications with faster timeout protection (only if profile exists)
         let applicationsPromise = Promise.resolve({ data: [] })
@@ -28,6 +28,14 @@ const STATUS_CONFIG = {
   'paid': { color: 'bg-purple-500', text: 'Paid', icon: DollarSign }
 }
 
+// Tabs map to offer statuses; 'pending' offers are the ones sent and awaiting a response
+const OFFER_TABS = [
+  { key: 'all', label: 'All', statuses: [] },
+  { key: 'pending', label: 'Pending', statuses: ['sent'] },
+  { key: 'accepted', label: 'Accepted', statuses: ['accepted'] },
+  { key: 'completed', label: 'Completed', statuses: ['completed'] }
+]
+
 export default function CreatorOffersPage() {
   const { profile } = useAuth()
   const [offers, setOffers] = useState([])
@@ -37,6 +45,24 @@ export default function CreatorOffersPage() {
   const [error, setError] = useState('')
   const [activeTab, setActiveTab] = useState('all')
   const [dataLoaded, setDataLoaded] = useState(false)
+  const [counts, setCounts] = useState(null)
+  const [nextCursor, setNextCursor] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
+
+  const tabStatuses = (tabKey) => OFFER_TABS.find(tab => tab.key === tabKey)?.statuses || []
+
+  // One page per request; status counts come back with the first page of the initial load
+  const fetchOffersPage = async ({ tab = activeTab, cursor = null, withCounts = false } = {}) => {
+    const query = new URLSearchParams({ creator_id: profile.id, limit: '20' })
+    const statuses = tabStatuses(tab)
+    if (statuses.length > 0) query.set('status', statuses.join(','))
+    if (cursor) query.set('cursor', cursor)
+    if (!withCounts) query.set('counts', 'false')
+
+    const response = await fetch(`/api/offers?${query.toString()}`)
+    if (!response.ok) throw new Error('Failed to load offers')
+    return response.json()
+  }
 
   useEffect(() => {
     let isMounted = true;
@@ -57,20 +83,16 @@ export default function CreatorOffersPage() {
           }
         }, 5000)
         
-        const response = await fetch(`/api/offers?creator_id=${profile.id}`)
+        const data = await fetchOffersPage({ tab: 'all', withCounts: true })
         
         clearTimeout(timeoutId)
         
         if (!isMounted) return
         
-        if (response.ok) {
-          const data = await response.json()
-          console.log('✅ Offers loaded:', data.offers?.length || 0)
-          setOffers(data.offers || [])
-        } else {
-          setError('Failed to load offers')
-          setOffers([])
-        }
+        console.log('✅ Offers loaded:', data.offers?.length || 0, 'of', data.counts?.total ?? '?')
+        setOffers(data.offers || [])
+        setNextCursor(data.nextCursor || null)
+        setCounts(data.counts || null)
         
         setDataLoaded(true)
         
@@ -95,9 +117,44 @@ export default function CreatorOffersPage() {
     }
   }, [profile?.id, dataLoaded])
 
+  // Switching tabs fetches that status from the server instead of filtering a full history
+  const selectTab = async (tabKey) => {
+    if (tabKey === activeTab) return
+    setActiveTab(tabKey)
+    try {
+      const data = await fetchOffersPage({ tab: tabKey })
+      setOffers(data.offers || [])
+      setNextCursor(data.nextCursor || null)
+    } catch (err) {
+      console.error('❌ Error loading offers for tab:', tabKey, err)
+      setError('Failed to load offers')
+    }
+  }
+
+  const loadMoreOffers = async () => {
+    if (!nextCursor || loadingMore) return
+    setLoadingMore(true)
+    try {
+      const data = await fetchOffersPage({ cursor: nextCursor })
+      setOffers(prev => [...prev, ...(data.offers || [])])
+      setNextCursor(data.nextCursor || null)
+    } catch (err) {
+      console.error('❌ Error loading more offers:', err)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const getFilteredOffers = () => {
-    if (activeTab === 'all') return offers
-    return offers.filter(offer => offer.status === activeTab)
+    const statuses = tabStatuses(activeTab)
+    if (statuses.length === 0) return offers
+    return offers.filter(offer => statuses.includes(offer.status))
+  }
+
+  const tabCount = (tab) => {
+    if (!counts) return getFilteredOffers().length
+    if (tab.statuses.length === 0) return counts.total
+    return tab.statuses.reduce((sum, status) => sum + (counts.by_status[status] || 0), 0)
   }
 
   const getStatusBadge = (status) => {
@@ -180,22 +237,17 @@ export default function CreatorOffersPage() {
 
         {/* Filter Tabs */}
         <div className="flex space-x-4 mb-6">
-          {[
-            { key: 'all', label: 'All', count: offers.length },
-            { key: 'pending', label: 'Pending', count: offers.filter(o => o.status === 'pending').length },
-            { key: 'accepted', label: 'Accepted', count: offers.filter(o => o.status === 'accepted').length },
-            { key: 'completed', label: 'Completed', count: offers.filter(o => o.status === 'completed').length }
-          ].map((tab) => (
+          {OFFER_TABS.map((tab) => (
             <button
               key={tab.key}
-              onClick={() => setActiveTab(tab.key)}
+              onClick={() => selectTab(tab.key)}
               className={`px-4 py-2 rounded-lg font-medium transition-colors ${
                 activeTab === tab.key
                   ? 'bg-purple-600 text-white'
                   : 'bg-gray-200 text-gray-700 hover:bg-gray-300 dark:bg-gray-700 dark:text-gray-300 dark:hover:bg-gray-600'
               }`}
             >
-              {tab.label} ({tab.count})
+              {tab.label} ({tabCount(tab)})
             </button>
           ))}
         </div>
@@ -318,6 +370,14 @@ export default function CreatorOffersPage() {
             ))
           )}
         </div>
+
+        {nextCursor && (
+          <div className="flex justify-center mt-8">
+            <Button variant="secondary" onClick={loadMoreOffers} disabled={loadingMore}>
+              {loadingMore ? 'Loading...' : 'Load More Offers'}
+            </Button>
+          </div>
+        )}
       </Container>
     </ProtectedRoute>
   )
@@ -31,7 +31,9 @@ import {
   removeRateCardFromCache,
   addRateCardToCache,
   updateRateCardInCache,
-  clearRateCardCache
+  clearRateCardCache,
+  loadRateCardCache,
+  readRateCardsSWR
 } from '@/lib/rate-card-cache'
 
 const DELIVERABLE_TYPES = {
@@ -98,36 +100,37 @@ export default function RateCardsPage() {
         setLoading(true)
         setError('')
         
-        // First, try to get from cache
-        const cachedRateCards = getCachedRateCards(profile.id)
-        if (cachedRateCards && cachedRateCards.length > 0) {
-          console.log('💾 Using cached rate cards:', cachedRateCards.length)
-          if (isMounted) {
-            setRateCards(cachedRateCards)
-            setDataLoaded(true)
-            setLoading(false)
+        // Serve cached rate cards immediately (even if stale) and revalidate in the background
+        await loadRateCardCache()
+        const { items: cachedRateCards, isStale, revalidation } = readRateCardsSWR(profile.id, async () => {
+          const response = await fetch(`/api/rate-cards?creator_id=${profile.id}`)
+          const data = await response.json()
+          
+          if (!response.ok) {
+            throw new Error(data.error || `Failed to load rate cards (${response.status})`)
           }
-          return
-        }
-        
-        console.log('🌐 Cache miss, fetching from API...')
-        const response = await fetch(`/api/rate-cards?creator_id=${profile.id}`)
+          
+          return data.rateCards || []
+        })
         
-        if (!isMounted) return
+        if (cachedRateCards && isMounted) {
+          console.log('💾 Using cached rate cards:', cachedRateCards.length)
+          setRateCards(cachedRateCards)
+          setDataLoaded(true)
+          setLoading(false)
+        }
         
-        const data = await response.json()
+        if (!isStale) return
         
-        if (!response.ok) {
-          throw new Error(data.error || `Failed to load rate cards (${response.status})`)
-        }
+        console.log('🌐 Revalidating rate cards from API...')
+        const rateCardsData = await revalidation
         
-        console.log('✅ Personal rate cards loaded from API:', data.rateCards?.length || 0)
+        if (!isMounted) return
         
-        const rateCardsData = data.rateCards || []
+        console.log('✅ Personal rate cards loaded from API:', rateCardsData.length)
         
-        // Update both state and cache
+        // Cache was updated by the revalidation, sync state
         setRateCards(rateCardsData)
-        updateRateCardsCache(profile.id, rateCardsData)
         
         setDataLoaded(true)
         setLoading(false) // Success - stop loading immediately
@@ -136,8 +139,8 @@ export default function RateCardsPage() {
         console.error('❌ Error loading rate cards:', error)
         if (isMounted) {
           // Show error but don't disrupt the page - just show an error message
+          // Keep any cached rate cards on screen if the background refresh failed
           setError(`Failed to load rate cards: ${error.message}`)
-          setRateCards([])
           setDataLoaded(true)
           setLoading(false) // Error - stop loading, show the page anyway
         }
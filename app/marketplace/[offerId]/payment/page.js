@@ -9,7 +9,7 @@ import PaymentCheckout from '@/components/marketplace/PaymentCheckout'
 import PaymentStatus from '@/components/marketplace/PaymentStatus'
 import { Card } from '@/components/ui/Card'
 import { Loader2, AlertCircle } from 'lucide-react'
-import { formatPrice } from '@/lib/marketplace/pricing'
+import { formatPrice, parseOfferItems } from '@/lib/marketplace/pricing'
 
 export default function MarketplacePaymentPage() {
   const params = useParams()
@@ -60,6 +60,8 @@ export default function MarketplacePaymentPage() {
     }
   }
 
+  const offerItems = parseOfferItems(offer)
+
   if (loading) {
     return (
       <Layout>
@@ -162,15 +164,15 @@ export default function MarketplacePaymentPage() {
                     </Text>
                   </div>
                   
-                  {offer.items && offer.items.length > 0 && (
+                  {offerItems.length > 0 && (
                     <div>
                       <Text size="sm" color="secondary" className="mb-2">Deliverables</Text>
                       <div className="space-y-2">
-                        {offer.items.map((item, index) => (
+                        {offerItems.map((item, index) => (
                           <div key={index} className="flex justify-between text-sm">
-                            <Text>{item.deliverable_type} × {item.qty}</Text>
+                            <Text>{item.deliverable_type} × {item.quantity}</Text>
                             <Text className="text-green-400">
-                              {formatPrice(item.unit_price_cents * item.qty, offer.currency)}
+                              {formatPrice(item.unit_price_cents * item.quantity, offer.currency)}
                             </Text>
                           </div>
                         ))}
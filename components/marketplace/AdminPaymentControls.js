@@ -48,23 +48,25 @@ export default function AdminPaymentControls({ className = '' }) {
       setError('')
 
       // Load payments and payouts data
-      const [paymentsRes, payoutsRes] = await Promise.all([
+      const [paymentsRes, payoutsRes, analyticsRes] = await Promise.all([
         fetch('/api/admin/payments'),
-        fetch('/api/admin/payouts')
+        fetch('/api/admin/payouts'),
+        fetch('/api/admin/payments/analytics?timeframe=all')
       ])
 
-      if (!paymentsRes.ok || !payoutsRes.ok) {
+      if (!paymentsRes.ok || !payoutsRes.ok || !analyticsRes.ok) {
         throw new Error('Failed to load admin data')
       }
 
       const paymentsData = await paymentsRes.json()
       const payoutsData = await payoutsRes.json()
+      const analyticsData = await analyticsRes.json()
 
       setPayments(paymentsData.payments || [])
       setPayouts(payoutsData.payouts || [])
 
       // Calculate stats
-      calculateStats(paymentsData.payments || [], payoutsData.payouts || [])
+      calculateStats(analyticsData.analytics, payoutsData.payouts || [])
 
     } catch (err) {
       console.error('❌ Error loading admin data:', err)
@@ -74,11 +76,15 @@ export default function AdminPaymentControls({ className = '' }) {
     }
   }
 
-  const calculateStats = (paymentsData, payoutsData) => {
-    const totalPayments = paymentsData.length
-    const totalVolume = paymentsData.reduce((sum, p) => sum + (p.amount_cents || 0), 0)
+  const calculateStats = (analytics, payoutsData) => {
+    // Platform totals come from the analytics endpoint; the payments list is only one page
+    const usd = analytics?.by_currency?.find(row => row.currency === 'USD')
+    const totalPayments = usd
+      ? usd.completed_count + usd.escrow_count + usd.pending_count + usd.refunded_count + usd.failed_count
+      : 0
+    const totalVolume = usd?.volume_cents || 0
     const pendingPayouts = payoutsData.filter(p => p.status === 'pending').length
-    const activeEscrow = paymentsData.filter(p => p.status === 'paid_escrow').reduce((sum, p) => sum + (p.amount_cents || 0), 0)
+    const activeEscrow = usd?.escrow_cents || 0
 
     setStats({
       total_payments: totalPayments,
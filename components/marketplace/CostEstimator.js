@@ -13,7 +13,7 @@ import {
   AlertCircle,
   DollarSign
 } from 'lucide-react'
-import { calculatePricing, formatPrice, DELIVERABLE_LABELS } from '@/lib/marketplace/pricing'
+import { formatPrice, DELIVERABLE_LABELS } from '@/lib/marketplace/pricing'
 
 const DELIVERABLE_TYPES = {
   'IG_Reel': { label: 'Instagram Reel', color: 'text-purple-400' },
@@ -31,6 +31,8 @@ const CURRENCIES = [
 
 export default function CostEstimator({ 
   creatorId, 
+  campaignId,
+  brandId,
   onOfferCreate, 
   initialItems = [],
   className = '' 
@@ -39,7 +41,8 @@ export default function CostEstimator({
   const [rateCards, setRateCards] = useState([])
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState('')
-  const [platformFeePct, setPlatformFeePct] = useState(20)
+  const [quote, setQuote] = useState(null)
+  const [quoting, setQuoting] = useState(false)
 
   // Load creator's rate cards
   useEffect(() => {
@@ -140,36 +143,85 @@ export default function CostEstimator({
       }))
   }
 
-  const calculateTotal = () => {
-    if (items.length === 0) return null
-    
-    const validItems = items.filter(item => 
-      item.deliverable_type && 
-      item.unit_price_cents > 0 && 
-      item.qty > 0
-    )
-    
-    if (validItems.length === 0) return null
-    
-    return calculatePricing(validItems, platformFeePct)
-  }
+  const getValidItems = () => items.filter(item => 
+    item.deliverable_type && 
+    item.unit_price_cents > 0 && 
+    item.qty > 0
+  )
+
+  // Totals come from a signed server quote (rate cards and platform fee as the server sees them)
+  useEffect(() => {
+    const validItems = getValidItems()
+    if (!creatorId || !campaignId || !brandId || validItems.length === 0) {
+      setQuote(null)
+      setQuoting(false)
+      return
+    }
+
+    // The current token no longer matches the selection; block submit until the new quote lands
+    setQuoting(true)
+    const controller = new AbortController()
+    const timeoutId = setTimeout(async () => {
+      try {
+        const response = await fetch('/api/offers/quote', {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          signal: controller.signal,
+          body: JSON.stringify({
+            creator_id: creatorId,
+            campaign_id: campaignId,
+            brand_id: brandId,
+            items: validItems.map(item => ({
+              deliverable_type: item.deliverable_type,
+              qty: Number(item.qty),
+              rush_pct: Number(item.rush_pct) || 0,
+              currency: item.currency
+            }))
+          })
+        })
+        const data = await response.json()
+        if (response.ok) {
+          setQuote(data)
+        } else {
+          console.error('Quote API error:', data.error)
+          setQuote(null)
+        }
+      } catch (err) {
+        if (err.name !== 'AbortError') {
+          console.error('❌ Cost Estimator quote error:', err)
+          setQuote(null)
+        }
+      } finally {
+        if (!controller.signal.aborted) setQuoting(false)
+      }
+    }, 300)
+
+    return () => {
+      controller.abort()
+      clearTimeout(timeoutId)
+    }
+  }, [creatorId, campaignId, brandId, items])
 
-  const pricing = calculateTotal()
+  const pricing = quote ? {
+    subtotalCents: quote.quote.subtotal_cents,
+    platformFeePct: quote.quote.platform_fee_pct,
+    platformFeeCents: quote.quote.platform_fee_cents,
+    totalCents: quote.quote.total_cents,
+    creatorEarningsCents: quote.quote.subtotal_cents,
+    currency: quote.quote.currency
+  } : null
 
   const handleCreateOffer = () => {
-    if (!pricing || !onOfferCreate) return
+    if (!pricing || !onOfferCreate || quoting) return
     
     const offerData = {
-      items: items.filter(item => 
-        item.deliverable_type && 
-        item.unit_price_cents > 0 && 
-        item.qty > 0
-      ),
+      items: getValidItems(),
       subtotal_cents: pricing.subtotalCents,
-      platform_fee_pct: platformFeePct,
+      platform_fee_pct: pricing.platformFeePct,
       platform_fee_cents: pricing.platformFeeCents,
       total_cents: pricing.totalCents,
-      currency: pricing.currency
+      currency: pricing.currency,
+      quote_token: quote.quote_token
     }
     
     onOfferCreate(offerData)
@@ -379,8 +431,8 @@ export default function CostEstimator({
 
           {onOfferCreate && (
             <div className="mt-4">
-              <Button onClick={handleCreateOffer} className="w-full">
-                Create Offer
+              <Button onClick={handleCreateOffer} disabled={quoting} className="w-full">
+                {quoting ? 'Updating Quote...' : 'Create Offer'}
               </Button>
             </div>
           )}
@@ -3,6 +3,7 @@
 import React, { useState, useEffect } from 'react'
 import { Button } from '@/components/ui/button'
 import { X, DollarSign, Calendar, FileText, Package } from 'lucide-react'
+import { parseOfferItems } from '@/lib/marketplace/pricing'
 
 const OfferSheet = ({ 
   offer = null, 
@@ -18,19 +19,8 @@ const OfferSheet = ({
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState('')
 
-  // Parse offer items from JSONB
-  const parseOfferItems = () => {
-    if (!offer) return null
-    try {
-      const items = typeof offer.items === 'string' ? JSON.parse(offer.items) : offer.items
-      return Array.isArray(items) && items.length > 0 ? items[0] : null
-    } catch (err) {
-      console.error('Error parsing offer items:', err)
-      return null
-    }
-  }
-
-  const offerItem = parseOfferItems()
+  // Offers carry one deliverable; items is the serialized JSONB array
+  const offerItem = parseOfferItems(offer)[0] || null
 
   const formatPrice = (cents) => {
     if (typeof cents !== 'number') return '$0.00'
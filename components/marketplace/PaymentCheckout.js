@@ -13,7 +13,7 @@ import {
   CheckCircle,
   XCircle
 } from 'lucide-react'
-import { formatPrice } from '@/lib/marketplace/pricing'
+import { formatPrice, parseOfferItems } from '@/lib/marketplace/pricing'
 
 export default function PaymentCheckout({ 
   offer, 
@@ -145,7 +145,7 @@ export default function PaymentCheckout({
             
             <div className="flex justify-between">
               <Text color="secondary">Items</Text>
-              <Text>{offer.items?.length || 0} deliverable(s)</Text>
+              <Text>{parseOfferItems(offer).length} deliverable(s)</Text>
             </div>
           </div>
         </div>
@@ -21,6 +21,8 @@ export default function PaymentStatus({
   onStatusUpdate,
   maxAttempts = 5,
   pollInterval = 3000,
+  // Each check long-polls the server, which returns early once the webhook settles the payment
+  longPollSeconds = 20,
   className = '' 
 }) {
   const [status, setStatus] = useState('checking')
@@ -46,7 +48,8 @@ export default function PaymentStatus({
       
       console.log(`🔍 Checking payment status (attempt ${attempts + 1}/${maxAttempts})`)
       
-      const response = await fetch(`/api/payments/status/${sessionId}`)
+      const wait = manualCheck ? 0 : longPollSeconds
+      const response = await fetch(`/api/payments/status/${sessionId}?wait=${wait}`)
       
       if (!response.ok) {
         const errorData = await response.json()
@@ -60,7 +63,7 @@ export default function PaymentStatus({
       console.log('📊 Payment status data:', data)
       
       // Determine status based on Stripe and database status
-      if (data.payment_status === 'paid' && data.database_status === 'paid_escrow') {
+      if (data.payment_status === 'paid' && ['paid_escrow', 'released'].includes(data.database_status)) {
         setStatus('success')
         if (onStatusUpdate) {
           onStatusUpdate('success', data)
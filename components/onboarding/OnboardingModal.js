@@ -6,7 +6,7 @@ import Button from '@/components/ui/Button'
 import { Card } from '@/components/ui/Card'
 import { Heading, Text } from '@/components/ui/Typography'
 import { updateProfile } from '@/lib/supabase'
-import { getBrandCampaigns, getCampaignApplications } from '@/lib/supabase'
+import { getBrandCampaigns, getBrandApplicationCounts } from '@/lib/supabase'
 import { 
   X, 
   CheckCircle, 
@@ -126,21 +126,10 @@ export default function OnboardingModal({ isOpen, onClose, stats: propStats = nu
           const { data: campaignsData, error: campaignsError } = await getBrandCampaigns(profile.id)
           
           if (!campaignsError && campaignsData) {
-            let totalApplications = 0
-            let acceptedApplications = 0
-            
-            // Count applications across all campaigns
-            for (const campaign of campaignsData) {
-              try {
-                const { data: applications } = await getCampaignApplications(campaign.id)
-                if (applications) {
-                  totalApplications += applications.length
-                  acceptedApplications += applications.filter(app => app.status === 'accepted').length
-                }
-              } catch (appError) {
-                console.error('Error fetching applications for campaign:', campaign.id, appError)
-              }
-            }
+            // Count applications across all campaigns in one aggregate query
+            const { data: applicationCounts } = await getBrandApplicationCounts(profile.id)
+            const totalApplications = applicationCounts?.totals.total || 0
+            const acceptedApplications = applicationCounts?.totals.accepted || 0
             
             setStats({
               totalCampaigns: campaignsData.length,
@@ -14,14 +14,14 @@ function getSupabaseClient() {
   return createClient(supabaseUrl, supabaseServiceKey)
 }
 
-export async function verifyAdminAccess(request) {
+// Resolve the signed-in user and their profile role from the request's Bearer token
+export async function verifyUserAccess(request) {
   try {
     const supabase = getSupabaseClient()
     
     if (!supabase) {
       return { 
         success: false, 
-        isAdmin: false, 
         error: 'Supabase not configured - authentication unavailable during build' 
       }
     }
@@ -30,7 +30,7 @@ export async function verifyAdminAccess(request) {
     const authHeader = request.headers.get('authorization')
     
     if (!authHeader || !authHeader.startsWith('Bearer ')) {
-      return { success: false, isAdmin: false, error: 'No authorization token provided' }
+      return { success: false, error: 'No authorization token provided' }
     }
     
     const token = authHeader.replace('Bearer ', '')
@@ -39,7 +39,7 @@ export async function verifyAdminAccess(request) {
     const { data: { user }, error: authError } = await supabase.auth.getUser(token)
     
     if (authError || !user) {
-      return { success: false, isAdmin: false, error: 'Invalid or expired token' }
+      return { success: false, error: 'Invalid or expired token' }
     }
     
     // Get user profile to check role
@@ -50,21 +50,31 @@ export async function verifyAdminAccess(request) {
       .single()
     
     if (profileError || !profile) {
-      return { success: false, isAdmin: false, error: 'User profile not found' }
+      return { success: false, error: 'User profile not found' }
     }
     
-    const isAdmin = profile.role === 'admin'
-    
-    return {
-      success: isAdmin,
-      isAdmin,
-      user,
-      profile,
-      error: isAdmin ? null : 'Admin role required'
-    }
+    return { success: true, user, profile, error: null }
     
   } catch (error) {
-    console.error('❌ Admin verification error:', error)
-    return { success: false, isAdmin: false, error: 'Failed to verify admin access' }
+    console.error('❌ User verification error:', error)
+    return { success: false, error: 'Failed to verify user access' }
   }
-}
\ No newline at end of file
+}
+
+export async function verifyAdminAccess(request) {
+  const access = await verifyUserAccess(request)
+  
+  if (!access.success) {
+    return { success: false, isAdmin: false, error: access.error }
+  }
+  
+  const isAdmin = access.profile.role === 'admin'
+  
+  return {
+    success: isAdmin,
+    isAdmin,
+    user: access.user,
+    profile: access.profile,
+    error: isAdmin ? null : 'Admin role required'
+  }
+}
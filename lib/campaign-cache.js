@@ -1,185 +1,204 @@
 /**
  * Campaign Cache Management Utility
- * Handles localStorage caching for campaign data across the platform
+ * Handles client-side caching for campaign data across the platform
+ * Backed by the normalized client cache (IndexedDB + in-memory hot copy)
  */
 
+import {
+  getList,
+  setList,
+  upsertRecord,
+  patchRecord,
+  removeRecord,
+  deleteList,
+  getValue,
+  setValue,
+  deleteValue,
+  subscribe,
+  clearByPrefix,
+  hydrateClientCache,
+  readListSWR,
+  retireStaleVersions
+} from '@/lib/client-cache'
+
 const CACHE_KEYS = {
-  CAMPAIGNS: 'brand_campaigns_cache',
-  STATS: 'brand_stats_cache', 
-  TIMESTAMP: 'brand_campaigns_cache_time'
+  CAMPAIGNS: 'brand_campaigns',
+  STATS: 'brand_stats'
 }
 
+// Bump when the cached campaign/stats shape changes so old entries are discarded, not rendered
+const CACHE_VERSION = 'v2'
+
+// Pre-IndexedDB localStorage keys, removed once on load
+const LEGACY_STORAGE_KEYS = ['brand_campaigns_cache', 'brand_stats_cache', 'brand_campaigns_cache_time']
+
+const COLLECTION = 'campaigns'
+
 const CACHE_DURATION = 5 * 60 * 1000 // 5 minutes
 
+const campaignsKey = (brandId) => `${CACHE_KEYS.CAMPAIGNS}:${CACHE_VERSION}:${brandId}`
+const statsKey = (brandId) => `${CACHE_KEYS.STATS}:${CACHE_VERSION}:${brandId}`
+
 /**
  * Get campaigns from cache
+ * Stale entries are still returned so pages can render while a refresh runs
  */
-export const getCachedCampaigns = () => {
-  if (typeof window === 'undefined') return null
-  
-  try {
-    const cached = localStorage.getItem(CACHE_KEYS.CAMPAIGNS)
-    const timestamp = localStorage.getItem(CACHE_KEYS.TIMESTAMP)
-    
-    if (!cached || !timestamp) return null
-    
-    const cacheAge = Date.now() - parseInt(timestamp)
-    if (cacheAge > CACHE_DURATION) {
-      console.log('🕒 Campaign cache expired, needs refresh')
-      return null
-    }
-    
-    console.log('✅ Using cached campaigns (age:', Math.round(cacheAge / 1000), 'seconds)')
-    return JSON.parse(cached)
-  } catch (e) {
-    console.warn('Failed to get cached campaigns:', e)
-    return null
-  }
+export const getCachedCampaigns = (brandId) => {
+  if (typeof window === 'undefined' || !brandId) return null
+
+  const cached = getList(campaignsKey(brandId), CACHE_DURATION)
+  if (!cached) return null
+
+  const cacheAge = Date.now() - cached.fetchedAt
+  console.log(cached.isStale ? '🕒 Serving stale campaigns while refreshing' : '✅ Using cached campaigns', '(age:', Math.round(cacheAge / 1000), 'seconds)')
+  return cached.items
 }
 
 /**
  * Get stats from cache
  */
-export const getCachedStats = () => {
-  if (typeof window === 'undefined') return null
-  
-  try {
-    const cached = localStorage.getItem(CACHE_KEYS.STATS)
-    return cached ? JSON.parse(cached) : null
-  } catch (e) {
-    console.warn('Failed to get cached stats:', e)
-    return null
-  }
+export const getCachedStats = (brandId) => {
+  if (typeof window === 'undefined' || !brandId) return null
+  return getValue(statsKey(brandId))?.value || null
 }
 
 /**
  * Update campaigns cache
  */
-export const updateCampaignsCache = (campaigns) => {
-  if (typeof window === 'undefined') return
-  
-  try {
-    localStorage.setItem(CACHE_KEYS.CAMPAIGNS, JSON.stringify(campaigns))
-    localStorage.setItem(CACHE_KEYS.TIMESTAMP, Date.now().toString())
-    console.log('💾 Campaigns cache updated with', campaigns.length, 'campaigns')
-  } catch (e) {
-    console.warn('Failed to update campaigns cache:', e)
-  }
+export const updateCampaignsCache = (brandId, campaigns) => {
+  if (typeof window === 'undefined' || !brandId) return
+
+  setList(campaignsKey(brandId), COLLECTION, campaigns)
+  console.log('💾 Campaigns cache updated with', campaigns.length, 'campaigns for brand', brandId)
 }
 
 /**
  * Update stats cache
  */
-export const updateStatsCache = (stats) => {
-  if (typeof window === 'undefined') return
-  
-  try {
-    localStorage.setItem(CACHE_KEYS.STATS, JSON.stringify(stats))
-    console.log('💾 Stats cache updated')
-  } catch (e) {
-    console.warn('Failed to update stats cache:', e)
-  }
+export const updateStatsCache = (brandId, stats) => {
+  if (typeof window === 'undefined' || !brandId) return
+
+  setValue(statsKey(brandId), stats)
+  console.log('💾 Stats cache updated for brand', brandId)
 }
 
 /**
  * Remove campaign from cache (for deletions)
  */
-export const removeCampaignFromCache = (campaignId) => {
-  if (typeof window === 'undefined') return
-  
-  try {
-    const cached = getCachedCampaigns()
-    if (!cached) return
-    
-    const updatedCampaigns = cached.filter(c => c.id !== campaignId)
-    updateCampaignsCache(updatedCampaigns)
-    
-    console.log('🗑️ Campaign', campaignId, 'removed from cache')
-    return updatedCampaigns
-  } catch (e) {
-    console.warn('Failed to remove campaign from cache:', e)
-    return null
-  }
+export const removeCampaignFromCache = (brandId, campaignId) => {
+  if (typeof window === 'undefined' || !brandId) return
+
+  if (!getList(campaignsKey(brandId))) return null
+
+  removeRecord(COLLECTION, campaignId)
+  console.log('🗑️ Campaign', campaignId, 'removed from cache for brand', brandId)
+  return getList(campaignsKey(brandId))?.items || []
 }
 
 /**
  * Add campaign to cache (for new campaigns)
  */
-export const addCampaignToCache = (campaign) => {
-  if (typeof window === 'undefined') return
-  
-  try {
-    const cached = getCachedCampaigns() || []
-    const updatedCampaigns = [campaign, ...cached]
-    updateCampaignsCache(updatedCampaigns)
-    
-    console.log('➕ Campaign', campaign.id, 'added to cache')
-    return updatedCampaigns
-  } catch (e) {
-    console.warn('Failed to add campaign to cache:', e)
-    return null
-  }
+export const addCampaignToCache = (brandId, campaign) => {
+  if (typeof window === 'undefined' || !brandId) return
+
+  upsertRecord(COLLECTION, campaign, { listKey: campaignsKey(brandId), position: 'start' })
+  console.log('➕ Campaign', campaign.id, 'added to cache for brand', brandId)
+  return getList(campaignsKey(brandId))?.items || []
 }
 
 /**
  * Update existing campaign in cache (for edits)
+ * Records are normalized, so the patch shows up in every brand list that holds the campaign
  */
 export const updateCampaignInCache = (campaignId, updatedCampaign) => {
   if (typeof window === 'undefined') return
-  
-  try {
-    const cached = getCachedCampaigns()
-    if (!cached) return null
-    
-    const campaignIndex = cached.findIndex(c => c.id === campaignId)
-    if (campaignIndex === -1) {
-      console.warn('Campaign not found in cache for update:', campaignId)
-      return null
-    }
-    
-    // Update the campaign in the cache array
-    const updatedCampaigns = [...cached]
-    updatedCampaigns[campaignIndex] = { ...cached[campaignIndex], ...updatedCampaign }
-    
-    updateCampaignsCache(updatedCampaigns)
-    
-    console.log('✏️ Campaign', campaignId, 'updated in cache with:', Object.keys(updatedCampaign))
-    return updatedCampaigns
-  } catch (e) {
-    console.warn('Failed to update campaign in cache:', e)
+
+  const record = patchRecord(COLLECTION, campaignId, updatedCampaign)
+  if (!record) {
+    console.warn('Campaign not found in cache for update:', campaignId)
     return null
   }
+
+  console.log('✏️ Campaign', campaignId, 'updated in cache with:', Object.keys(updatedCampaign))
+  return record.brand_id ? getList(campaignsKey(record.brand_id))?.items || null : null
 }
 
 /**
- * Clear all campaign cache
+ * Clear campaign cache for a brand, or for every brand when no ID is given
  */
-export const clearCampaignCache = () => {
+export const clearCampaignCache = (brandId) => {
   if (typeof window === 'undefined') return
-  
-  try {
-    localStorage.removeItem(CACHE_KEYS.CAMPAIGNS)
-    localStorage.removeItem(CACHE_KEYS.STATS)
-    localStorage.removeItem(CACHE_KEYS.TIMESTAMP)
-    console.log('🧹 Campaign cache cleared')
-  } catch (e) {
-    console.warn('Failed to clear campaign cache:', e)
+
+  if (!brandId) {
+    clearByPrefix(`${CACHE_KEYS.CAMPAIGNS}:`)
+    clearByPrefix(`${CACHE_KEYS.STATS}:`)
+    console.log('🧹 Campaign cache cleared for all brands')
+    return
   }
+
+  deleteList(campaignsKey(brandId))
+  deleteValue(statsKey(brandId))
+  console.log('🧹 Campaign cache cleared for brand', brandId)
+}
+
+/**
+ * Check if cache is fresh for a brand
+ */
+export const isCacheFresh = (brandId) => {
+  if (typeof window === 'undefined' || !brandId) return false
+
+  const cached = getList(campaignsKey(brandId), CACHE_DURATION)
+  return !!cached && !cached.isStale
 }
 
 /**
- * Check if cache is fresh
+ * Drop entries from older cache versions and the legacy localStorage cache
  */
-export const isCacheFresh = () => {
-  if (typeof window === 'undefined') return false
-  
+const retireLegacyEntries = async () => {
   try {
-    const timestamp = localStorage.getItem(CACHE_KEYS.TIMESTAMP)
-    if (!timestamp) return false
-    
-    const cacheAge = Date.now() - parseInt(timestamp)
-    return cacheAge < CACHE_DURATION
+    LEGACY_STORAGE_KEYS.forEach(key => localStorage.removeItem(key))
   } catch (e) {
-    return false
+    // localStorage may be unavailable (private mode); nothing to clean up
   }
-}
\ No newline at end of file
+
+  await Promise.all([
+    retireStaleVersions(CACHE_KEYS.CAMPAIGNS, `${CACHE_KEYS.CAMPAIGNS}:${CACHE_VERSION}:`),
+    retireStaleVersions(CACHE_KEYS.STATS, `${CACHE_KEYS.STATS}:${CACHE_VERSION}:`)
+  ])
+}
+
+let legacyCleanup = null
+
+/**
+ * Wait for persisted campaigns to load into memory (IndexedDB hydration)
+ */
+export const loadCampaignCache = async () => {
+  await hydrateClientCache()
+  if (!legacyCleanup) legacyCleanup = retireLegacyEntries()
+  return legacyCleanup
+}
+
+/**
+ * Subscribe to a brand's campaign cache changes, including updates made in other tabs
+ * @returns {Function} Unsubscribe function
+ */
+export const subscribeToCampaignCache = (brandId, callback) => {
+  if (!brandId) return () => {}
+
+  const unsubscribeCampaigns = subscribe(campaignsKey(brandId), callback)
+  const unsubscribeStats = subscribe(statsKey(brandId), callback)
+  return () => {
+    unsubscribeCampaigns()
+    unsubscribeStats()
+  }
+}
+
+/**
+ * Stale-while-revalidate read: cached campaigns now, fresh ones via revalidation
+ * @param {String} brandId - Brand profile ID
+ * @param {Function} fetcher - async () => campaigns array
+ * @param {Object} options - { force }
+ */
+export const readCampaignsSWR = (brandId, fetcher, options = {}) => {
+  return readListSWR(campaignsKey(brandId), COLLECTION, fetcher, { maxAgeMs: CACHE_DURATION, ...options })
+}
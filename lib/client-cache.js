@@ -0,0 +1,638 @@
+/**
+ * Client Data Cache
+ * Normalized, IndexedDB-backed cache with in-memory hot copies, stale-while-revalidate
+ * reads, request deduplication and cross-tab sync over BroadcastChannel.
+ *
+ * Records are stored once per (collection, id); lists only hold ids, so a single-item
+ * add, edit or remove writes one record and one small id list instead of the whole array.
+ */
+
+const DB_NAME = 'spark_client_cache'
+const DB_VERSION = 1
+const STORES = {
+  RECORDS: 'records',
+  LISTS: 'lists',
+  VALUES: 'values'
+}
+const CHANNEL_NAME = 'spark_client_cache'
+const MAX_CACHE_BYTES = 4 * 1024 * 1024 // Approximate budget across all lists and values
+
+const isBrowser = () => typeof window !== 'undefined'
+
+// In-memory hot copies - all reads are served from here synchronously
+const memory = {
+  records: new Map(), // `${collection}:${id}` -> record
+  lists: new Map(), // listKey -> { collection, ids, fetchedAt }
+  values: new Map() // key -> { value, fetchedAt }
+}
+const listItemsMemo = new Map() // listKey -> materialized items array
+const entryBytes = new Map() // record/value key -> approximate serialized size
+const recordRefs = new Map() // record key -> number of lists referencing it
+const lastAccess = new Map() // list/value key -> last read or write time (LRU order)
+const listeners = new Map() // key -> Set(callback)
+const inflight = new Map() // key -> Promise
+
+let dbPromise = null
+let hydratePromise = null
+let channel = null
+let cachedBytes = 0 // Sum of entryBytes, kept in step with every set and delete
+
+const recordKey = (collection, id) => `${collection}:${id}`
+
+// Sizes are measured once per written record, never by re-serializing whole lists
+const estimateBytes = (value) => {
+  try {
+    return (JSON.stringify(value) || '').length * 2
+  } catch (e) {
+    return 0
+  }
+}
+
+const touch = (key) => lastAccess.set(key, Date.now())
+
+const setEntryBytes = (key, bytes) => {
+  cachedBytes += bytes - (entryBytes.get(key) || 0)
+  entryBytes.set(key, bytes)
+}
+
+const deleteEntryBytes = (key) => {
+  cachedBytes -= entryBytes.get(key) || 0
+  entryBytes.delete(key)
+}
+
+// Count list references per record so unreferenced records can be dropped
+const addListRefs = (entry, delta) => {
+  entry?.ids.forEach(id => {
+    const key = recordKey(entry.collection, id)
+    const count = (recordRefs.get(key) || 0) + delta
+    if (count > 0) recordRefs.set(key, count)
+    else recordRefs.delete(key)
+  })
+}
+
+// ====================================
+// INDEXEDDB PERSISTENCE
+// ====================================
+
+const requestToPromise = (request) => new Promise((resolve, reject) => {
+  request.onsuccess = () => resolve(request.result)
+  request.onerror = () => reject(request.error)
+})
+
+const openDatabase = () => {
+  if (!isBrowser() || !window.indexedDB) return Promise.resolve(null)
+  if (dbPromise) return dbPromise
+
+  dbPromise = new Promise((resolve) => {
+    try {
+      const request = window.indexedDB.open(DB_NAME, DB_VERSION)
+      request.onupgradeneeded = () => {
+        const db = request.result
+        Object.values(STORES).forEach(store => {
+          if (!db.objectStoreNames.contains(store)) db.createObjectStore(store)
+        })
+      }
+      request.onsuccess = () => resolve(request.result)
+      request.onerror = () => {
+        console.warn('Client cache: IndexedDB unavailable, using memory only:', request.error)
+        resolve(null)
+      }
+    } catch (e) {
+      console.warn('Client cache: IndexedDB unavailable, using memory only:', e)
+      resolve(null)
+    }
+  })
+
+  return dbPromise
+}
+
+/**
+ * Apply a batch of puts/deletes in a single IndexedDB transaction
+ * @param {Array} ops - Array of { store, key, value } (value undefined => delete)
+ */
+const persist = async (ops) => {
+  if (ops.length === 0) return
+  const db = await openDatabase()
+  if (!db) return
+
+  try {
+    const storeNames = [...new Set(ops.map(op => op.store))]
+    const tx = db.transaction(storeNames, 'readwrite')
+    ops.forEach(({ store, key, value }) => {
+      if (value === undefined) {
+        tx.objectStore(store).delete(key)
+      } else {
+        tx.objectStore(store).put(value, key)
+      }
+    })
+    await new Promise((resolve, reject) => {
+      tx.oncomplete = resolve
+      tx.onerror = () => reject(tx.error)
+      tx.onabort = () => reject(tx.error)
+    })
+  } catch (e) {
+    console.warn('Client cache: failed to persist changes:', e)
+  }
+}
+
+const readStore = async (db, store) => {
+  const tx = db.transaction(store, 'readonly')
+  const objectStore = tx.objectStore(store)
+  const [keys, values] = await Promise.all([
+    requestToPromise(objectStore.getAllKeys()),
+    requestToPromise(objectStore.getAll())
+  ])
+  return keys.map((key, index) => [key, values[index]])
+}
+
+/**
+ * Load persisted entries into memory once per page load
+ * Entries written in memory before hydration finishes take precedence
+ */
+export const hydrateClientCache = () => {
+  if (!isBrowser()) return Promise.resolve()
+  if (hydratePromise) return hydratePromise
+
+  hydratePromise = (async () => {
+    setupChannel()
+    const db = await openDatabase()
+    if (!db) return
+
+    try {
+      const [records, lists, values] = await Promise.all([
+        readStore(db, STORES.RECORDS),
+        readStore(db, STORES.LISTS),
+        readStore(db, STORES.VALUES)
+      ])
+
+      records.forEach(([key, record]) => {
+        if (memory.records.has(key)) return
+        memory.records.set(key, record)
+        setEntryBytes(key, estimateBytes(record))
+      })
+      lists.forEach(([key, entry]) => {
+        if (memory.lists.has(key)) return
+        memory.lists.set(key, entry)
+        addListRefs(entry, 1)
+        if (!lastAccess.has(key)) lastAccess.set(key, entry.fetchedAt || 0)
+      })
+      values.forEach(([key, entry]) => {
+        if (memory.values.has(key)) return
+        memory.values.set(key, entry)
+        setEntryBytes(`value:${key}`, estimateBytes(entry.value))
+        if (!lastAccess.has(key)) lastAccess.set(key, entry.fetchedAt || 0)
+      })
+
+      // Records left behind by lists replaced or evicted in earlier sessions
+      const orphanKeys = [...memory.records.keys()].filter(key => !recordRefs.has(key))
+      orphanKeys.forEach(key => {
+        memory.records.delete(key)
+        deleteEntryBytes(key)
+      })
+      persist(orphanKeys.map(key => ({ store: STORES.RECORDS, key, value: undefined })))
+
+      listItemsMemo.clear()
+      enforceBudget()
+      notifyAll()
+      console.log('💾 Client cache hydrated:', lists.length, 'lists,', records.length, 'records')
+    } catch (e) {
+      console.warn('Client cache: hydration failed:', e)
+    }
+  })()
+
+  return hydratePromise
+}
+
+// ====================================
+// CROSS-TAB SYNC
+// ====================================
+
+const setupChannel = () => {
+  if (channel || !isBrowser() || typeof BroadcastChannel === 'undefined') return
+
+  channel = new BroadcastChannel(CHANNEL_NAME)
+  channel.onmessage = ({ data: message }) => {
+    // Other tabs already persisted the change - only refresh hot copies here
+    applyChange(message)
+  }
+}
+
+const broadcast = (message) => {
+  setupChannel()
+  try {
+    channel?.postMessage(message)
+  } catch (e) {
+    console.warn('Client cache: broadcast failed:', e)
+  }
+}
+
+/**
+ * Apply a change to the in-memory copies and notify subscribers
+ */
+const applyChange = (change) => {
+  switch (change.op) {
+    case 'putRecords':
+      change.records.forEach(record => {
+        const key = recordKey(change.collection, record.id)
+        memory.records.set(key, record)
+        setEntryBytes(key, estimateBytes(record))
+      })
+      invalidateCollectionMemo(change.collection)
+      break
+    case 'deleteRecords':
+      change.ids.forEach(id => {
+        const key = recordKey(change.collection, id)
+        memory.records.delete(key)
+        deleteEntryBytes(key)
+      })
+      invalidateCollectionMemo(change.collection)
+      break
+    case 'putList':
+      addListRefs(memory.lists.get(change.listKey), -1)
+      addListRefs(change.entry, 1)
+      memory.lists.set(change.listKey, change.entry)
+      listItemsMemo.delete(change.listKey)
+      touch(change.listKey)
+      notify(change.listKey)
+      break
+    case 'deleteList':
+      addListRefs(memory.lists.get(change.listKey), -1)
+      memory.lists.delete(change.listKey)
+      listItemsMemo.delete(change.listKey)
+      lastAccess.delete(change.listKey)
+      notify(change.listKey)
+      break
+    case 'putValue':
+      memory.values.set(change.key, change.entry)
+      setEntryBytes(`value:${change.key}`, estimateBytes(change.entry.value))
+      touch(change.key)
+      notify(change.key)
+      break
+    case 'deleteValue':
+      memory.values.delete(change.key)
+      deleteEntryBytes(`value:${change.key}`)
+      lastAccess.delete(change.key)
+      notify(change.key)
+      break
+    default:
+      break
+  }
+}
+
+/**
+ * Drop records a list change left without any list referencing them
+ * @param {Object} released - Previous list entry ({ collection, ids }) whose records may be orphaned
+ * @returns {Object|null} { change, ops } to apply, or null when nothing is orphaned
+ */
+const collectOrphans = (released) => {
+  if (!released) return null
+  const orphanIds = [...new Set(released.ids)].filter(id => {
+    const key = recordKey(released.collection, id)
+    return !recordRefs.has(key) && memory.records.has(key)
+  })
+  if (orphanIds.length === 0) return null
+
+  return {
+    change: { op: 'deleteRecords', collection: released.collection, ids: orphanIds },
+    ops: orphanIds.map(id => ({ store: STORES.RECORDS, key: recordKey(released.collection, id), value: undefined }))
+  }
+}
+
+/**
+ * Apply changes locally, mirror them to other tabs and persist the matching store ops
+ * @param {Object} released - Previous list entry replaced or removed by these changes
+ */
+const commit = (changes, ops, released = null) => {
+  changes.forEach(change => {
+    applyChange(change)
+    broadcast(change)
+  })
+  const orphans = collectOrphans(released)
+  if (orphans) {
+    applyChange(orphans.change)
+    broadcast(orphans.change)
+    ops.push(...orphans.ops)
+  }
+  const persisted = persist(ops)
+  enforceBudget()
+  return persisted
+}
+
+// ====================================
+// SIZE BOUNDS (LRU ACROSS KEYS)
+// ====================================
+
+/**
+ * Evict least recently used lists and values until the cache fits MAX_CACHE_BYTES
+ * Records are dropped once no remaining list references them
+ */
+const enforceBudget = () => {
+  if (cachedBytes <= MAX_CACHE_BYTES) return
+
+  const candidates = [
+    ...[...memory.lists.keys()].map(key => ({ key, kind: 'list' })),
+    ...[...memory.values.keys()].map(key => ({ key, kind: 'value' }))
+  ].sort((a, b) => (lastAccess.get(a.key) || 0) - (lastAccess.get(b.key) || 0))
+
+  const changes = []
+  const ops = []
+
+  for (const { key, kind } of candidates) {
+    if (cachedBytes <= MAX_CACHE_BYTES) break
+
+    if (kind === 'value') {
+      changes.push({ op: 'deleteValue', key })
+      ops.push({ store: STORES.VALUES, key, value: undefined })
+      applyChange({ op: 'deleteValue', key })
+      continue
+    }
+
+    const entry = memory.lists.get(key)
+    applyChange({ op: 'deleteList', listKey: key })
+    changes.push({ op: 'deleteList', listKey: key })
+    ops.push({ store: STORES.LISTS, key, value: undefined })
+
+    const orphans = collectOrphans(entry)
+    if (orphans) {
+      applyChange(orphans.change)
+      changes.push(orphans.change)
+      ops.push(...orphans.ops)
+    }
+
+    console.log('🧹 Client cache evicted', key, 'to stay under', MAX_CACHE_BYTES, 'bytes')
+  }
+
+  changes.forEach(broadcast)
+  persist(ops)
+}
+
+// ====================================
+// SUBSCRIPTIONS
+// ====================================
+
+const notify = (key) => {
+  listeners.get(key)?.forEach(callback => {
+    try {
+      callback()
+    } catch (e) {
+      console.warn('Client cache: subscriber failed:', e)
+    }
+  })
+}
+
+const notifyAll = () => {
+  listeners.forEach((_, key) => notify(key))
+}
+
+const invalidateCollectionMemo = (collection) => {
+  memory.lists.forEach((entry, listKey) => {
+    if (entry.collection === collection) {
+      listItemsMemo.delete(listKey)
+      notify(listKey)
+    }
+  })
+}
+
+/**
+ * Subscribe to changes of a list or value key (including changes from other tabs)
+ * @returns {Function} Unsubscribe function
+ */
+export const subscribe = (key, callback) => {
+  if (!listeners.has(key)) listeners.set(key, new Set())
+  listeners.get(key).add(callback)
+  return () => listeners.get(key)?.delete(callback)
+}
+
+// ====================================
+// LISTS OF NORMALIZED RECORDS
+// ====================================
+
+/**
+ * Read a cached list (stale entries are returned - check isStale before trusting it)
+ * @param {String} listKey - List key
+ * @param {Number} maxAgeMs - Freshness window used for isStale
+ * @returns {Object|null} { items, fetchedAt, isStale }
+ */
+export const getList = (listKey, maxAgeMs = Infinity) => {
+  const entry = memory.lists.get(listKey)
+  if (!entry) return null
+  touch(listKey)
+
+  let items = listItemsMemo.get(listKey)
+  if (!items) {
+    items = entry.ids
+      .map(id => memory.records.get(recordKey(entry.collection, id)))
+      .filter(Boolean)
+    listItemsMemo.set(listKey, items)
+  }
+
+  return {
+    items,
+    fetchedAt: entry.fetchedAt,
+    isStale: Date.now() - entry.fetchedAt > maxAgeMs
+  }
+}
+
+/**
+ * Replace a list with freshly fetched records
+ */
+export const setList = (listKey, collection, items = []) => {
+  if (!isBrowser()) return Promise.resolve()
+
+  const entry = { collection, ids: items.map(item => item.id), fetchedAt: Date.now() }
+  const ops = items.map(item => ({
+    store: STORES.RECORDS,
+    key: recordKey(collection, item.id),
+    value: item
+  }))
+  ops.push({ store: STORES.LISTS, key: listKey, value: entry })
+
+  return commit([
+    { op: 'putRecords', collection, records: items },
+    { op: 'putList', listKey, entry }
+  ], ops, memory.lists.get(listKey))
+}
+
+/**
+ * Insert or replace one record, optionally adding it to a list
+ * @param {Object} options - { listKey, position: 'start' | 'end' }
+ */
+export const upsertRecord = (collection, record, { listKey, position = 'start' } = {}) => {
+  if (!isBrowser() || !record?.id) return Promise.resolve()
+
+  const changes = [{ op: 'putRecords', collection, records: [record] }]
+  const ops = [{ store: STORES.RECORDS, key: recordKey(collection, record.id), value: record }]
+
+  if (listKey) {
+    const entry = memory.lists.get(listKey)
+    const ids = (entry?.ids || []).filter(id => id !== record.id)
+    const nextEntry = {
+      collection,
+      ids: position === 'end' ? [...ids, record.id] : [record.id, ...ids],
+      fetchedAt: entry?.fetchedAt || 0 // A local insert doesn't make an unfetched list fresh
+    }
+    changes.push({ op: 'putList', listKey, entry: nextEntry })
+    ops.push({ store: STORES.LISTS, key: listKey, value: nextEntry })
+  }
+
+  return commit(changes, ops)
+}
+
+/**
+ * Merge changes into an existing record - every list holding it sees the update
+ * @returns {Object|null} Updated record, or null if it isn't cached
+ */
+export const patchRecord = (collection, id, changes) => {
+  if (!isBrowser()) return null
+
+  const existing = memory.records.get(recordKey(collection, id))
+  if (!existing) return null
+
+  const record = { ...existing, ...changes }
+  commit(
+    [{ op: 'putRecords', collection, records: [record] }],
+    [{ store: STORES.RECORDS, key: recordKey(collection, id), value: record }]
+  )
+  return record
+}
+
+/**
+ * Remove a record and drop it from any lists referencing it
+ */
+export const removeRecord = (collection, id) => {
+  if (!isBrowser()) return Promise.resolve()
+
+  const changes = [{ op: 'deleteRecords', collection, ids: [id] }]
+  const ops = [{ store: STORES.RECORDS, key: recordKey(collection, id), value: undefined }]
+  memory.lists.forEach((entry, listKey) => {
+    if (entry.collection === collection && entry.ids.includes(id)) {
+      const nextEntry = { ...entry, ids: entry.ids.filter(listId => listId !== id) }
+      changes.push({ op: 'putList', listKey, entry: nextEntry })
+      ops.push({ store: STORES.LISTS, key: listKey, value: nextEntry })
+    }
+  })
+
+  return commit(changes, ops)
+}
+
+/**
+ * Drop a list so the next read refetches (records no other list references are dropped too)
+ */
+export const deleteList = (listKey) => {
+  if (!isBrowser()) return Promise.resolve()
+  return commit(
+    [{ op: 'deleteList', listKey }],
+    [{ store: STORES.LISTS, key: listKey, value: undefined }],
+    memory.lists.get(listKey)
+  )
+}
+
+// ====================================
+// SMALL STANDALONE VALUES
+// ====================================
+
+export const getValue = (key, maxAgeMs = Infinity) => {
+  const entry = memory.values.get(key)
+  if (!entry) return null
+  touch(key)
+  return { value: entry.value, fetchedAt: entry.fetchedAt, isStale: Date.now() - entry.fetchedAt > maxAgeMs }
+}
+
+export const setValue = (key, value) => {
+  if (!isBrowser()) return Promise.resolve()
+  const entry = { value, fetchedAt: Date.now() }
+  return commit([{ op: 'putValue', key, entry }], [{ store: STORES.VALUES, key, value: entry }])
+}
+
+export const deleteValue = (key) => {
+  if (!isBrowser()) return Promise.resolve()
+  return commit([{ op: 'deleteValue', key }], [{ store: STORES.VALUES, key, value: undefined }])
+}
+
+// ====================================
+// STALE-WHILE-REVALIDATE
+// ====================================
+
+/**
+ * Run a fetch once per key - concurrent callers share the same promise
+ */
+export const dedupe = (key, fetcher) => {
+  if (inflight.has(key)) return inflight.get(key)
+
+  const promise = Promise.resolve()
+    .then(fetcher)
+    .finally(() => inflight.delete(key))
+  inflight.set(key, promise)
+  return promise
+}
+
+/**
+ * Return cached list items immediately and refresh in the background when stale or missing
+ * @param {String} listKey - List key
+ * @param {String} collection - Record collection
+ * @param {Function} fetcher - async () => items array (throw on failure)
+ * @param {Object} options - { maxAgeMs, force }
+ * @returns {Object} { items, isStale, revalidation } - revalidation resolves to fresh items or null
+ */
+export const readListSWR = (listKey, collection, fetcher, { maxAgeMs = 5 * 60 * 1000, force = false } = {}) => {
+  const cached = getList(listKey, maxAgeMs)
+  const needsRefresh = force || !cached || cached.isStale
+
+  const revalidation = needsRefresh
+    ? dedupe(listKey, async () => {
+        const items = await fetcher()
+        await setList(listKey, collection, items || [])
+        return getList(listKey)?.items || []
+      })
+    : Promise.resolve(null)
+
+  return {
+    items: cached?.items || null,
+    isStale: needsRefresh,
+    revalidation
+  }
+}
+
+/**
+ * Drop every list and value whose key starts with prefix
+ */
+export const clearByPrefix = (prefix) => {
+  if (!isBrowser()) return Promise.resolve()
+
+  const tasks = []
+  memory.lists.forEach((_, key) => {
+    if (key.startsWith(prefix)) tasks.push(deleteList(key))
+  })
+  memory.values.forEach((_, key) => {
+    if (key.startsWith(prefix)) tasks.push(deleteValue(key))
+  })
+  return Promise.all(tasks)
+}
+
+/**
+ * Drop lists and values under a namespace that don't belong to its current schema version
+ * Lets a module change its record shape without parsing or rendering old entries
+ * @param {String} namespace - Key namespace (e.g. 'brand_campaigns')
+ * @param {String} currentPrefix - Prefix of keys written by the current version
+ */
+export const retireStaleVersions = async (namespace, currentPrefix) => {
+  if (!isBrowser()) return
+  await hydrateClientCache()
+
+  // The bare namespace key is the unversioned layout that preceded prefixed keys
+  const isRetired = (key) =>
+    key === namespace || (key.startsWith(`${namespace}:`) && !key.startsWith(currentPrefix))
+  const tasks = []
+  memory.lists.forEach((_, key) => {
+    if (isRetired(key)) tasks.push(deleteList(key))
+  })
+  memory.values.forEach((_, key) => {
+    if (isRetired(key)) tasks.push(deleteValue(key))
+  })
+  await Promise.all(tasks)
+}
+
+// Start hydrating as soon as the module loads in the browser
+if (isBrowser()) {
+  hydrateClientCache()
+}
@@ -0,0 +1,109 @@
+// lib/http-cache.js
+// HTTP validator helpers for read-mostly API routes (ETag / If-None-Match / Cache-Control)
+
+import { createHash } from 'crypto'
+import { NextResponse } from 'next/server'
+
+// CDN caching profiles - browsers always revalidate, shared caches hold briefly
+export const CACHE_PROFILES = {
+  CATALOG: { sMaxAge: 60, staleWhileRevalidate: 300 },
+  CREATOR_SCOPED: { sMaxAge: 15, staleWhileRevalidate: 60 }
+}
+
+// Per-resource mutation counters, bumped by write handlers on this instance
+const resourceVersions = new Map()
+
+/**
+ * Bump the version counter for a resource after a mutation
+ * @param {...String} resources - Resource names (e.g. 'rate_cards', 'rate_cards:creator:<id>')
+ */
+export const bumpResourceVersion = (...resources) => {
+  resources.filter(Boolean).forEach(resource => {
+    resourceVersions.set(resource, (resourceVersions.get(resource) || 0) + 1)
+  })
+}
+
+/**
+ * Get the local version counter for a resource
+ * @param {String} resource - Resource name
+ * @returns {Number} Version counter (0 if never bumped)
+ */
+export const getResourceVersion = (resource) => resourceVersions.get(resource) || 0
+
+/**
+ * Read a cheap version fingerprint for a table: row count plus max(updated_at)
+ * Runs a HEAD count and a single-row select instead of fetching the full result set
+ * @param {Object} client - Supabase client
+ * @param {String} table - Table name
+ * @param {Function} applyFilters - Optional (query) => query applying the same filters as the list query
+ * @returns {Object} { data: String|null, error }
+ */
+export const fetchTableVersion = async (client, table, applyFilters = (query) => query) => {
+  const [countResult, latestResult] = await Promise.all([
+    applyFilters(client.from(table).select('id', { count: 'exact', head: true })),
+    applyFilters(client.from(table).select('updated_at'))
+      .order('updated_at', { ascending: false, nullsFirst: false })
+      .limit(1)
+  ])
+
+  const error = countResult.error || latestResult.error
+  if (error) {
+    return { data: null, error }
+  }
+
+  const latest = latestResult.data?.[0]?.updated_at || '0'
+  return { data: `${countResult.count || 0}:${latest}`, error: null }
+}
+
+/**
+ * Build a strong ETag from version parts
+ * @param {...any} parts - Values identifying the representation (resource, filters, versions)
+ * @returns {String} Quoted ETag value
+ */
+export const buildETag = (...parts) => {
+  const hash = createHash('sha1')
+    .update(parts.map(part => String(part ?? '')).join('|'))
+    .digest('base64url')
+  return `"${hash}"`
+}
+
+/**
+ * Check whether the request's If-None-Match header matches the current ETag
+ * @param {Request} request - Incoming request
+ * @param {String} etag - Current ETag
+ * @returns {Boolean} True when the client's copy is still current
+ */
+export const isNotModified = (request, etag) => {
+  const header = request.headers.get('if-none-match')
+  if (!header || !etag) return false
+  if (header.trim() === '*') return true
+
+  // If-None-Match uses weak comparison, so ignore any W/ prefix
+  return header
+    .split(',')
+    .map(tag => tag.trim().replace(/^W\//, ''))
+    .includes(etag)
+}
+
+/**
+ * Build caching headers for a validated response
+ * @param {String} etag - Current ETag
+ * @param {Object} profile - { sMaxAge, staleWhileRevalidate } in seconds
+ * @returns {Object} Header map
+ */
+export const cacheHeaders = (etag, profile = CACHE_PROFILES.CATALOG) => ({
+  ETag: etag,
+  'Cache-Control': `public, max-age=0, s-maxage=${profile.sMaxAge}, stale-while-revalidate=${profile.staleWhileRevalidate}`
+})
+
+/**
+ * Return a 304 response if the request is conditional and still current, otherwise null
+ * @param {Request} request - Incoming request
+ * @param {String} etag - Current ETag
+ * @param {Object} profile - Caching profile
+ * @returns {NextResponse|null} 304 response or null
+ */
+export const notModifiedResponse = (request, etag, profile = CACHE_PROFILES.CATALOG) => {
+  if (!isNotModified(request, etag)) return null
+  return new NextResponse(null, { status: 304, headers: cacheHeaders(etag, profile) })
+}
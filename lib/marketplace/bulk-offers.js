@@ -0,0 +1,207 @@
+// lib/marketplace/bulk-offers.js
+// Bulk offer creation: price many creator/deliverable selections from rate cards in one pass
+// and insert them with a single multi-row statement
+
+import { calculatePricing, createRateCardIndex, findRateCard, generateOfferItems, DELIVERABLE_TYPES } from '@/lib/marketplace/pricing'
+import { getPlatformFeePct } from '@/lib/marketplace/platform-settings'
+
+export const MAX_BULK_OFFERS = 100
+
+const BULK_STATUSES = ['drafted', 'sent']
+
+/**
+ * Normalize a bulk offer request body
+ * @param {Object} body - { campaign_id, brand_id, selections: [{ creator_id, deliverable_type, quantity, rush_pct }],
+ *                          platform_fee_pct, deadline, description, status, allow_partial }
+ * @returns {Object} Request, or { error } when the envelope itself is invalid
+ */
+export const parseBulkOfferRequest = (body = {}) => {
+  const { campaign_id, brand_id, selections } = body
+
+  if (!campaign_id || !brand_id) {
+    return { error: 'campaign_id and brand_id are required' }
+  }
+  if (!Array.isArray(selections) || selections.length === 0) {
+    return { error: 'selections must be a non-empty array' }
+  }
+  if (selections.length > MAX_BULK_OFFERS) {
+    return { error: `At most ${MAX_BULK_OFFERS} offers can be created per request` }
+  }
+
+  const status = body.status || 'drafted'
+  if (!BULK_STATUSES.includes(status)) {
+    return { error: `Invalid status: ${status}` }
+  }
+
+  // The fee comes from platform settings; a fee sent by the client is only checked against it
+  const platformFeePct = body.platform_fee_pct ?? null
+  if (platformFeePct !== null && (isNaN(platformFeePct) || platformFeePct < 0 || platformFeePct > 50)) {
+    return { error: 'platform_fee_pct must be between 0 and 50' }
+  }
+
+  return {
+    campaignId: campaign_id,
+    brandId: brand_id,
+    platformFeePct: platformFeePct === null ? null : Number(platformFeePct),
+    expiresAt: body.deadline || null,
+    notes: body.description || null,
+    status,
+    allowPartial: body.allow_partial === true,
+    selections: selections.map((selection, index) => ({
+      index,
+      creatorId: selection.creator_id,
+      deliverableType: selection.deliverable_type,
+      qty: Number(selection.quantity ?? 1),
+      rushPct: Number(selection.rush_pct ?? 0)
+    }))
+  }
+}
+
+// Selection-level checks that don't need rate cards
+const validateSelection = (selection, seen) => {
+  if (!selection.creatorId) return 'creator_id is required'
+  if (!Object.values(DELIVERABLE_TYPES).includes(selection.deliverableType)) {
+    return `Invalid deliverable type: ${selection.deliverableType}`
+  }
+  if (!Number.isInteger(selection.qty) || selection.qty <= 0) return 'quantity must be a positive integer'
+  if (isNaN(selection.rushPct) || selection.rushPct < 0 || selection.rushPct > 200) {
+    return 'rush_pct must be between 0 and 200'
+  }
+
+  const key = `${selection.creatorId}:${selection.deliverableType}`
+  if (seen.has(key)) return 'Duplicate creator and deliverable in this request'
+  seen.add(key)
+  return null
+}
+
+/**
+ * Price every selection against the creators' rate cards
+ * @param {Array} selections - Output of parseBulkOfferRequest().selections
+ * @param {Array} rateCards - Active rate cards for all creators in the request
+ * @param {Object} options - { campaignId, brandId, platformFeePct, expiresAt, notes, status }
+ * @returns {Array} One result per selection: { index, creator_id, row } or { index, creator_id, error }
+ */
+export const priceBulkOffers = (selections, rateCards, options) => {
+  const seen = new Set()
+  const rateCardIndex = createRateCardIndex(rateCards)
+
+  return selections.map(selection => {
+    const result = { index: selection.index, creator_id: selection.creatorId || null }
+
+    const invalid = validateSelection(selection, seen)
+    if (invalid) return { ...result, error: invalid }
+
+    let item
+    try {
+      [item] = generateOfferItems([selection], rateCardIndex)
+    } catch (err) {
+      return { ...result, error: err.message }
+    }
+
+    // Stored like single offers: the rate card's pre-rush price plus the rush generateOfferItems applied
+    const rateCard = findRateCard(rateCardIndex, selection.creatorId, selection.deliverableType, selection.currency)
+    const rushPct = selection.rushPct || rateCard.rush_pct || 0
+
+    const pricing = calculatePricing([item], options.platformFeePct)
+    if (pricing.totalCents <= 0) {
+      return { ...result, error: 'Total amount must be greater than zero' }
+    }
+
+    return {
+      ...result,
+      row: {
+        campaign_id: options.campaignId,
+        brand_id: options.brandId,
+        creator_id: selection.creatorId,
+        // Same items column as POST /api/offers (read back with parseOfferItems)
+        items: JSON.stringify([{
+          deliverable_type: item.deliverable_type,
+          quantity: item.qty,
+          base_price_cents: rateCard.base_price_cents,
+          rush_fee_pct: rushPct
+        }]),
+        subtotal_cents: pricing.subtotalCents,
+        platform_fee_pct: pricing.platformFeePct,
+        platform_fee_cents: pricing.platformFeeCents,
+        total_cents: pricing.totalCents,
+        currency: pricing.currency,
+        expires_at: options.expiresAt,
+        notes: options.notes,
+        status: options.status
+      }
+    }
+  })
+}
+
+/**
+ * Validate, price and insert a bulk offer request
+ * Nothing is inserted when any selection fails unless allowPartial is set; the insert itself is
+ * one multi-row statement, so it commits or rolls back as a whole
+ * @param {Object} client - Supabase client (service role)
+ * @param {Object} request - Output of parseBulkOfferRequest
+ * @returns {Object} { data: { results, created, failed }, error }
+ */
+export const createBulkOffers = async (client, request) => {
+  const creatorIds = [...new Set(request.selections.map(s => s.creatorId).filter(Boolean))]
+
+  const [campaignResult, rateCardResult, platformFeePct] = await Promise.all([
+    client.from('campaigns').select('id, brand_id').eq('id', request.campaignId).single(),
+    client
+      .from('rate_cards')
+      .select('creator_id, deliverable_type, base_price_cents, currency, rush_pct')
+      .in('creator_id', creatorIds)
+      .eq('active', true),
+    getPlatformFeePct(client)
+  ])
+
+  if (request.platformFeePct !== null && request.platformFeePct !== platformFeePct) {
+    return {
+      data: null,
+      error: { message: `platform_fee_pct must match the current platform fee (${platformFeePct}%)`, status: 400 }
+    }
+  }
+
+  if (campaignResult.error || !campaignResult.data) {
+    return { data: null, error: { message: 'Campaign not found', status: 404 } }
+  }
+  if (campaignResult.data.brand_id !== request.brandId) {
+    return { data: null, error: { message: 'Campaign does not belong to this brand', status: 403 } }
+  }
+  if (rateCardResult.error) return { data: null, error: rateCardResult.error }
+
+  const priced = priceBulkOffers(request.selections, rateCardResult.data || [], { ...request, platformFeePct })
+  const valid = priced.filter(result => result.row)
+  const failed = priced.length - valid.length
+
+  const summarize = (results) => ({
+    results,
+    created: results.filter(result => result.offer_id).length,
+    failed: results.filter(result => result.error).length
+  })
+
+  if (valid.length === 0 || (failed > 0 && !request.allowPartial)) {
+    return {
+      data: summarize(priced.map(({ row, ...result }) => result)),
+      error: { message: `${failed} of ${priced.length} offers failed validation`, status: 422 }
+    }
+  }
+
+  const { data: inserted, error } = await client
+    .from('offers')
+    .insert(valid.map(result => result.row))
+    .select('id, creator_id, status, total_cents, currency')
+
+  if (error) return { data: null, error }
+
+  // PostgREST returns inserted rows in input order
+  const offerByIndex = new Map(valid.map((result, i) => [result.index, inserted[i]]))
+
+  const results = priced.map(({ row, ...result }) => {
+    const offer = offerByIndex.get(result.index)
+    return offer
+      ? { ...result, offer_id: offer.id, status: offer.status, total_cents: offer.total_cents, currency: offer.currency }
+      : result
+  })
+
+  return { data: summarize(results), error: null }
+}
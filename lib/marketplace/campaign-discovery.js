@@ -0,0 +1,105 @@
+// lib/marketplace/campaign-discovery.js
+// Campaign discovery feed: ranked full-text search, facet counts and cursor pagination
+
+import { decodeCursor, isTimestamp, isUuid, parseLimit, toPage } from '@/lib/pagination'
+
+export const DISCOVERY_PAGE_SIZE = 20
+
+const sortKey = (row) => [row.rank, row.created_at, row.id]
+
+/**
+ * Decode a (rank, created_at, id) cursor, rejecting values that are not a number, a timestamp and a UUID
+ * Malformed values would otherwise reach search_campaigns and fail there as a 500
+ */
+const decodeDiscoveryCursor = (cursor) => {
+  const values = decodeCursor(cursor, 3)
+  if (!values) return null
+  const [rank, createdAt, id] = values
+  return Number.isFinite(rank) && isTimestamp(createdAt) && isUuid(id)
+    ? { rank, createdAt, id }
+    : null
+}
+
+/**
+ * Normalize discovery query params ('all' and blanks mean no filter)
+ */
+export const parseDiscoveryParams = (searchParams) => {
+  const clean = (value) => {
+    const trimmed = (value || '').trim()
+    return trimmed && trimmed !== 'all' ? trimmed : null
+  }
+
+  return {
+    query: clean(searchParams.get('q')),
+    category: clean(searchParams.get('category')),
+    budgetRange: clean(searchParams.get('budget_range')),
+    cursor: searchParams.get('cursor') || null,
+    limit: parseLimit(searchParams.get('limit'), DISCOVERY_PAGE_SIZE),
+    includeFacets: searchParams.get('facets') !== 'false'
+  }
+}
+
+/**
+ * Group facet rows into { total, category: [{ value, count }], budget_range: [...] }, largest first
+ */
+const groupFacets = (rows) => {
+  const facets = { total: 0, category: [], budget_range: [] }
+  for (const row of rows || []) {
+    if (row.facet === 'total') {
+      facets.total = Number(row.campaign_count) || 0
+      continue
+    }
+    if (!facets[row.facet]) continue
+    facets[row.facet].push({ value: row.value, count: Number(row.campaign_count) || 0 })
+  }
+  [facets.category, facets.budget_range].forEach(values => values.sort((a, b) => b.count - a.count || a.value.localeCompare(b.value)))
+  return facets
+}
+
+/**
+ * Fetch one page of the discovery feed (and facets for the first page)
+ * @param {Object} client - Supabase client
+ * @param {Object} params - Output of parseDiscoveryParams
+ * @returns {Object} { data: { campaigns, nextCursor, facets }, error }
+ */
+export const discoverCampaigns = async (client, params) => {
+  const cursor = decodeDiscoveryCursor(params.cursor)
+  if (params.cursor && !cursor) {
+    return { data: null, error: { message: 'Invalid cursor', status: 400 } }
+  }
+
+  const filters = {
+    p_query: params.query,
+    p_category: params.category,
+    p_budget_range: params.budgetRange
+  }
+
+  // Fetch one extra row to know whether another page exists without a count query
+  const pagePromise = client.rpc('search_campaigns', {
+    ...filters,
+    p_cursor_rank: cursor?.rank ?? null,
+    p_cursor_created_at: cursor?.createdAt ?? null,
+    p_cursor_id: cursor?.id ?? null,
+    p_limit: params.limit + 1
+  })
+
+  // Facets only change with the filters, so later pages skip them
+  const facetsPromise = params.includeFacets && !cursor
+    ? client.rpc('campaign_discovery_facets', filters)
+    : Promise.resolve({ data: null, error: null })
+
+  const [pageResult, facetsResult] = await Promise.all([pagePromise, facetsPromise])
+  const error = pageResult.error || facetsResult.error
+  if (error) return { data: null, error }
+
+  const { items, nextCursor } = toPage(pageResult.data, params.limit, sortKey)
+
+  return {
+    data: {
+      campaigns: items.map(row => row.campaign),
+      nextCursor,
+      facets: facetsResult.data ? groupFacets(facetsResult.data) : null
+    },
+    error: null
+  }
+}
@@ -0,0 +1,244 @@
+// lib/marketplace/checkout-sessions.js
+// Checkout session reuse: an offer has at most one pending payment (unique index), which carries its
+// open Stripe session; repeat requests get that session back instead of a new one
+
+import crypto from 'crypto'
+import { recordPaymentEvents } from '@/lib/marketplace/payment-events'
+
+// Don't hand out a session that would expire while the brand is still filling in card details
+const REUSE_MARGIN_MS = 10 * 60 * 1000
+
+const PENDING_PAYMENT_SELECT = 'id, stripe_session_id, checkout_url, checkout_expires_at, amount_cents, currency'
+
+// Newest payment for the offer in any status; a failed attempt moves the idempotency key on
+const loadLatestPaymentId = async (client, offerId) => {
+  const { data, error } = await client
+    .from('payments')
+    .select('id')
+    .eq('offer_id', offerId)
+    .order('created_at', { ascending: false })
+    .order('id', { ascending: false })
+    .limit(1)
+    .maybeSingle()
+  return { data: data?.id || null, error }
+}
+
+const loadPendingPayment = async (client, offerId) =>
+  client
+    .from('payments')
+    .select(PENDING_PAYMENT_SELECT)
+    .eq('offer_id', offerId)
+    .eq('status', 'pending')
+    .maybeSingle()
+
+const isReusable = (payment, offer) =>
+  Boolean(payment.checkout_url) &&
+  payment.amount_cents === offer.total_cents &&
+  payment.currency === offer.currency.toUpperCase() &&
+  new Date(payment.checkout_expires_at).getTime() - Date.now() > REUSE_MARGIN_MS
+
+/**
+ * Stripe idempotency key for an offer's checkout session
+ * Derived from the offer, amount and redirect origin, plus the newest payment already recorded for
+ * the offer (if any), so retries of the same request share a session while any later attempt -
+ * after expiry, supersession or a failed payment - gets a fresh one
+ */
+export const checkoutIdempotencyKey = (offer, latestPaymentId = null, originUrl = '') => {
+  const origin = crypto.createHash('sha256').update(originUrl).digest('hex').slice(0, 16)
+  return `checkout_${offer.id}_${offer.total_cents}_${offer.currency.toUpperCase()}_${origin}_${latestPaymentId || 'initial'}`
+}
+
+const toCheckoutResult = (payment, reused) => ({
+  payment_id: payment.id,
+  session_id: payment.stripe_session_id,
+  checkout_url: payment.checkout_url,
+  expires_at: payment.checkout_expires_at,
+  reused
+})
+
+// Close the old session and retire its pending payment so a new one can be created
+const supersedePendingPayment = async (client, stripe, payment) => {
+  const mayBeOpen = !payment.checkout_expires_at || new Date(payment.checkout_expires_at).getTime() > Date.now()
+  if (payment.stripe_session_id && mayBeOpen) {
+    try {
+      await stripe.checkout.sessions.expire(payment.stripe_session_id)
+    } catch (err) {
+      // Expiring fails for sessions that are already expired (fine) or already paid (not fine)
+      const session = await stripe.checkout.sessions.retrieve(payment.stripe_session_id).catch(() => null)
+      if (session?.status !== 'expired') {
+        return { error: { message: 'A payment for this offer is already in progress', status: 409 } }
+      }
+    }
+  }
+
+  const { data: retired, error } = await client
+    .from('payments')
+    .update({ status: 'failed', last_error: 'Superseded checkout session', updated_at: new Date().toISOString() })
+    .eq('id', payment.id)
+    .eq('status', 'pending')
+    .select('id')
+  if (error) return { error }
+
+  if (retired && retired.length > 0) {
+    const { error: logError } = await recordPaymentEvents(client, [{
+      payment_id: payment.id,
+      type: 'checkout.session.superseded',
+      from_status: 'pending',
+      to_status: 'failed',
+      stripe_session_id: payment.stripe_session_id
+    }])
+    if (logError) console.error('❌ Failed to log superseded checkout session:', logError.message)
+  }
+  return { error: null }
+}
+
+// A replayed session whose payment was marked failed (e.g. a declined card) is still open, so its
+// row goes back to pending; a paid one means there is nothing left to check out
+const reviveSessionPayment = async (client, session) => {
+  const { data: existing, error } = await client
+    .from('payments')
+    .select('id, status')
+    .eq('stripe_session_id', session.id)
+    .maybeSingle()
+  if (error) return { data: null, error }
+  if (!existing) return { data: null, error: null }
+
+  if (existing.status !== 'failed' && existing.status !== 'pending') {
+    return { data: null, error: { message: 'This offer has already been paid', status: 409 } }
+  }
+  if (session.status !== 'open') return { data: null, error: null }
+
+  const { data: reopened, error: reviveError } = await client
+    .from('payments')
+    .update({
+      status: 'pending',
+      checkout_url: session.url,
+      checkout_expires_at: new Date(session.expires_at * 1000).toISOString(),
+      last_error: null,
+      updated_at: new Date().toISOString()
+    })
+    .eq('id', existing.id)
+    .in('status', ['failed', 'pending'])
+    .select(PENDING_PAYMENT_SELECT)
+  if (reviveError) return { data: null, error: reviveError }
+  if (!reopened || reopened.length === 0) return { data: null, error: null }
+
+  if (existing.status === 'failed') {
+    const { error: logError } = await recordPaymentEvents(client, [{
+      payment_id: existing.id,
+      type: 'checkout.session.revived',
+      from_status: 'failed',
+      to_status: 'pending',
+      stripe_session_id: session.id
+    }])
+    if (logError) console.error('❌ Failed to log revived checkout session:', logError.message)
+  }
+  return { data: toCheckoutResult(reopened[0], true), error: null }
+}
+
+const buildSessionParams = (offer, originUrl) => {
+  const currency = offer.currency.toLowerCase()
+  return {
+    payment_method_types: ['card'],
+    line_items: [
+      {
+        price_data: {
+          currency,
+          product_data: {
+            name: `Marketplace Offer #${offer.id.slice(0, 8)}`,
+            description: `Payment for offer from ${offer.creator?.full_name || 'Creator'} for campaign: ${offer.campaign?.title || 'N/A'}`,
+            metadata: {
+              offer_id: offer.id,
+              brand_id: offer.brand_id,
+              creator_id: offer.creator_id,
+              campaign_id: offer.campaign_id
+            }
+          },
+          unit_amount: offer.total_cents, // Amount in cents
+        },
+        quantity: 1,
+      },
+    ],
+    mode: 'payment',
+    success_url: `${originUrl}/marketplace/${offer.id}/payment-success?session_id={CHECKOUT_SESSION_ID}`,
+    cancel_url: `${originUrl}/marketplace/${offer.id}/payment-cancelled`,
+    metadata: {
+      offer_id: offer.id,
+      brand_id: offer.brand_id,
+      creator_id: offer.creator_id,
+      campaign_id: offer.campaign_id,
+      platform_fee_cents: offer.platform_fee_cents.toString(),
+      subtotal_cents: offer.subtotal_cents.toString()
+    }
+    // No expires_at: Stripe's default is 24 hours, and a fixed parameter set keeps the
+    // idempotency key valid across retries
+  }
+}
+
+/**
+ * Return the offer's open checkout session, or create one with its pending payment
+ * @param {Object} client - Supabase client (service role)
+ * @param {Object} stripe - Stripe instance
+ * @param {Object} offer - Accepted offer (with creator and campaign embeds)
+ * @param {Object} options - { originUrl }
+ * @returns {Object} { data: { payment_id, session_id, checkout_url, expires_at, reused }, error }
+ */
+export const getOrCreateCheckoutSession = async (client, stripe, offer, { originUrl }) => {
+  const { data: pending, error: pendingError } = await loadPendingPayment(client, offer.id)
+  if (pendingError) return { data: null, error: pendingError }
+
+  if (pending && isReusable(pending, offer)) {
+    return { data: toCheckoutResult(pending, true), error: null }
+  }
+
+  if (pending) {
+    const { error } = await supersedePendingPayment(client, stripe, pending)
+    if (error) return { data: null, error }
+  }
+
+  const { data: latestPaymentId, error: latestError } = await loadLatestPaymentId(client, offer.id)
+  if (latestError) return { data: null, error: latestError }
+
+  const session = await stripe.checkout.sessions.create(buildSessionParams(offer, originUrl), {
+    idempotencyKey: checkoutIdempotencyKey(offer, latestPaymentId, originUrl)
+  })
+
+  const { data: inserted, error: insertError } = await client
+    .from('payments')
+    .insert({
+      offer_id: offer.id,
+      stripe_session_id: session.id,
+      checkout_url: session.url,
+      checkout_expires_at: new Date(session.expires_at * 1000).toISOString(),
+      amount_cents: offer.total_cents,
+      currency: offer.currency.toUpperCase(),
+      status: 'pending'
+    })
+    .select(PENDING_PAYMENT_SELECT)
+
+  if (!insertError) {
+    return { data: toCheckoutResult(inserted[0], false), error: null }
+  }
+
+  // Unique violation: a concurrent request recorded the pending payment first. With the same
+  // idempotency key it holds this very session; otherwise close ours and return theirs
+  if (insertError.code === '23505') {
+    const { data: winner } = await loadPendingPayment(client, offer.id)
+    if (winner) {
+      if (winner.stripe_session_id !== session.id) {
+        await stripe.checkout.sessions.expire(session.id).catch(() => {})
+      }
+      return { data: toCheckoutResult(winner, true), error: null }
+    }
+
+    // Stripe replayed a session that already has a payment row: reopen it rather than failing
+    const revived = await reviveSessionPayment(client, session)
+    if (revived.data || revived.error) return revived
+  }
+
+  // Cancel the Stripe session if database creation failed
+  await stripe.checkout.sessions.expire(session.id).catch(expireError => {
+    console.error('❌ Error expiring Stripe session:', expireError)
+  })
+  return { data: null, error: insertError }
+}
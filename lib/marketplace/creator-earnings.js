@@ -0,0 +1,43 @@
+// lib/marketplace/creator-earnings.js
+// Creator earnings from the creator_earnings ledger (one row per creator and currency, kept
+// current by triggers on payments and payouts)
+
+const EARNINGS_SELECT = 'currency, escrow_cents, released_cents, refunded_cents, paid_out_cents, payment_count, updated_at'
+
+/**
+ * Earnings balances for a creator, one entry per currency
+ * released_cents not yet covered by a released payout is reported as awaiting_payout_cents
+ * @param {Object} client - Supabase client
+ * @param {String} creatorId - Creator profile ID
+ * @returns {Object} { data: [{ currency, escrow_cents, released_cents, refunded_cents, paid_out_cents,
+ *                              awaiting_payout_cents, total_earned_cents, payment_count, updated_at }], error }
+ */
+export const getCreatorEarnings = async (client, creatorId) => {
+  const { data, error } = await client
+    .from('creator_earnings')
+    .select(EARNINGS_SELECT)
+    .eq('creator_id', creatorId)
+    .order('currency')
+
+  if (error) return { data: null, error }
+
+  // BIGINT columns can arrive as strings
+  const balances = (data || []).map(row => {
+    const escrowCents = Number(row.escrow_cents)
+    const releasedCents = Number(row.released_cents)
+    const paidOutCents = Number(row.paid_out_cents)
+    return {
+      currency: row.currency,
+      escrow_cents: escrowCents,
+      released_cents: releasedCents,
+      refunded_cents: Number(row.refunded_cents),
+      paid_out_cents: paidOutCents,
+      awaiting_payout_cents: Math.max(releasedCents - paidOutCents, 0),
+      total_earned_cents: escrowCents + releasedCents,
+      payment_count: row.payment_count,
+      updated_at: row.updated_at
+    }
+  })
+
+  return { data: balances, error: null }
+}
@@ -0,0 +1,103 @@
+// lib/marketplace/escrow-release.js
+// Scheduled escrow release: claims due paid_escrow payments in batches (claim_escrow_releases),
+// then pays the resulting stripe payouts through the transfer runner. Each run is recorded in
+// escrow_release_runs
+
+import crypto from 'crypto'
+import { runPayoutTransfers } from '@/lib/marketplace/payout-transfers'
+
+const RELEASE_BATCH_SIZE = 100
+const MAX_BATCHES_PER_RUN = 20
+// Leave headroom under the 30s function maxDuration in vercel.json
+const DEFAULT_TIME_BUDGET_MS = 25 * 1000
+
+const recordRun = async (client, metrics) => {
+  const { error } = await client.from('escrow_release_runs').insert({
+    id: metrics.runId,
+    started_at: metrics.startedAt,
+    finished_at: new Date().toISOString(),
+    duration_ms: metrics.durationMs,
+    batches: metrics.batches,
+    released: metrics.released,
+    stripe_payouts: metrics.stripePayouts,
+    manual_payouts: metrics.manualPayouts,
+    transferred: metrics.transferred,
+    transfer_failed: metrics.transferFailed,
+    transfer_requeued: metrics.transferRequeued,
+    error: metrics.error
+  })
+  if (error) console.error(`❌ Failed to record escrow release run ${metrics.runId}:`, error.message)
+}
+
+/**
+ * Release every escrowed payment past platform_settings.auto_release_days, within a time budget
+ * Safe to run concurrently: batches are claimed with SKIP LOCKED, and payouts carry idempotency keys
+ * @param {Object} client - Supabase client (service role)
+ * @param {Object} options - { batchSize, timeBudgetMs, concurrency }
+ * @returns {Object} { data: metrics, error }
+ */
+export const runEscrowAutoRelease = async (client, options = {}) => {
+  const started = Date.now()
+  const deadline = started + (options.timeBudgetMs || DEFAULT_TIME_BUDGET_MS)
+  const metrics = {
+    runId: crypto.randomUUID(),
+    startedAt: new Date(started).toISOString(),
+    batches: 0,
+    released: 0,
+    stripePayouts: 0,
+    manualPayouts: 0,
+    transferred: 0,
+    transferFailed: 0,
+    transferRequeued: 0,
+    error: null
+  }
+
+  let runError = null
+
+  while (metrics.batches < MAX_BATCHES_PER_RUN && Date.now() < deadline) {
+    const { data: released, error } = await client.rpc('claim_escrow_releases', {
+      p_run_id: metrics.runId,
+      p_limit: options.batchSize || RELEASE_BATCH_SIZE
+    })
+    if (error) {
+      runError = error
+      break
+    }
+    if (!released || released.length === 0) break
+
+    metrics.batches++
+    metrics.released += released.length
+
+    const stripePayoutIds = []
+    for (const row of released) {
+      if (row.method === 'stripe') stripePayoutIds.push(row.payout_id)
+      if (row.method === 'manual') metrics.manualPayouts++
+    }
+    metrics.stripePayouts += stripePayoutIds.length
+    if (stripePayoutIds.length === 0) continue
+
+    // Payouts are committed before transferring, so anything left pending here is picked up by
+    // the next transfer run with the same idempotency key
+    const { data: transfers, error: transferError } = await runPayoutTransfers(client, {
+      payoutIds: stripePayoutIds,
+      limit: stripePayoutIds.length,
+      timeBudgetMs: Math.max(deadline - Date.now(), 1),
+      concurrency: options.concurrency
+    })
+    if (transferError) {
+      runError = transferError
+      break
+    }
+
+    metrics.transferred += transfers.released
+    metrics.transferFailed += transfers.failed
+    metrics.transferRequeued += transfers.requeued
+  }
+
+  metrics.durationMs = Date.now() - started
+  metrics.error = runError?.message || null
+  await recordRun(client, metrics)
+
+  console.log('⏱️ Escrow auto-release run:', metrics)
+  return { data: metrics, error: runError }
+}
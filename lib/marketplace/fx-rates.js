@@ -0,0 +1,131 @@
+// lib/marketplace/fx-rates.js
+// Server-side FX rates: fx_rates table reads through the server cache, refreshed from a pluggable provider
+
+import { createServerCache } from '@/lib/server-cache'
+import { CURRENCIES, DEFAULT_FX_RATES } from '@/lib/marketplace/pricing'
+
+const FX_RATES_KEY = 'current'
+
+const fxRateCache = createServerCache('fx_rates', {
+  maxEntries: 1,
+  ttlMs: 15 * 60 * 1000
+})
+
+// ====================================
+// PROVIDERS
+// ====================================
+// A provider is { name, fetchRates() } resolving to units per USD, e.g. { MYR: 4.7, SGD: 1.35 }
+
+/**
+ * Rates from a local JSON file ({ "rates": { ... } }) - used in tests and offline development
+ */
+export const createFixtureProvider = (filePath) => ({
+  name: 'fixture',
+  fetchRates: async () => {
+    const { readFile } = await import('fs/promises')
+    const fixture = JSON.parse(await readFile(filePath, 'utf8'))
+    return fixture.rates || fixture
+  }
+})
+
+/**
+ * Rates from an HTTP endpoint returning USD-based rates ({ "rates": { ... } })
+ */
+export const createHttpProvider = (url) => ({
+  name: 'http',
+  fetchRates: async () => {
+    const response = await fetch(url, { cache: 'no-store' })
+    if (!response.ok) {
+      throw new Error(`FX provider request failed: ${response.status}`)
+    }
+    const payload = await response.json()
+    return payload.rates || {}
+  }
+})
+
+/**
+ * Provider configured by environment: FX_RATES_URL, else FX_RATES_FIXTURE, else none
+ */
+export const getDefaultFxProvider = () => {
+  if (process.env.FX_RATES_URL) return createHttpProvider(process.env.FX_RATES_URL)
+  if (process.env.FX_RATES_FIXTURE) return createFixtureProvider(process.env.FX_RATES_FIXTURE)
+  return null
+}
+
+// Keep only supported currencies with usable rates
+const sanitizeRates = (rates = {}) => {
+  const sanitized = { USD: 1 }
+  for (const currency of Object.values(CURRENCIES)) {
+    const rate = Number(rates[currency])
+    if (currency !== 'USD' && Number.isFinite(rate) && rate > 0) {
+      sanitized[currency] = rate
+    }
+  }
+  return sanitized
+}
+
+// ====================================
+// LOADING AND REFRESH
+// ====================================
+
+/**
+ * Current rates (units per USD) from fx_rates, cached in-process with a TTL
+ * Pass the result to the pricing functions' rates parameter
+ * Falls back to the default rates when the table can't be read
+ * @param {Object} client - Supabase client
+ * @returns {Object} { data: rates, error, cacheHit }
+ */
+export const loadFxRates = async (client) => {
+  const result = await fxRateCache.wrap(FX_RATES_KEY, async () => {
+    const { data, error } = await client.from('fx_rates').select('currency, units_per_usd')
+    if (error) return { data: undefined, error }
+
+    const rates = sanitizeRates(Object.fromEntries(
+      (data || []).map(row => [row.currency, row.units_per_usd])
+    ))
+    return { data: rates, error: null }
+  })
+
+  if (result.error || !result.data) {
+    console.warn('FX rates unavailable, using default rates:', result.error?.message)
+    return { data: DEFAULT_FX_RATES, error: result.error, cacheHit: false }
+  }
+
+  return result
+}
+
+/**
+ * Pull fresh rates from the provider, store them in fx_rates and reset the cache
+ * @param {Object} client - Supabase client (service role)
+ * @param {Object} provider - { name, fetchRates }, defaults to the environment's provider
+ * @returns {Object} { data: rates, error }
+ */
+export const refreshFxRates = async (client, provider = getDefaultFxProvider()) => {
+  if (!provider) {
+    return { data: null, error: { message: 'No FX rate provider configured', status: 503 } }
+  }
+
+  let rates
+  try {
+    rates = sanitizeRates(await provider.fetchRates())
+  } catch (err) {
+    return { data: null, error: { message: err.message, status: 502 } }
+  }
+
+  const fetchedAt = new Date().toISOString()
+  const rows = Object.entries(rates).map(([currency, unitsPerUsd]) => ({
+    currency,
+    units_per_usd: unitsPerUsd,
+    source: provider.name,
+    fetched_at: fetchedAt,
+    updated_at: fetchedAt
+  }))
+
+  const { error } = await client.from('fx_rates').upsert(rows, { onConflict: 'currency' })
+  if (error) return { data: null, error }
+
+  await fxRateCache.invalidate(FX_RATES_KEY)
+  return { data: rates, error: null }
+}
+
+export const getFxRateCacheStats = () => fxRateCache.stats()
@@ -0,0 +1,119 @@
+// lib/marketplace/offer-listing.js
+// Paginated offer lists scoped by brand, creator or campaign, with per-status counts
+
+import { decodeCreatedAtCursor, parseLimit, toPage, createdAtKeysetFilter } from '@/lib/pagination'
+
+const OFFER_PAGE_SIZE = 20
+
+export const OFFER_STATUSES = [
+  'drafted', 'sent', 'accepted', 'paid_escrow', 'in_progress',
+  'submitted', 'approved', 'released', 'completed', 'cancelled', 'refunded'
+]
+
+// Lean list embeds; the detail route (/api/offers/[id]) loads the rest
+const OFFER_LIST_SELECT = `
+  *,
+  campaign:campaigns(id, title, brand_id),
+  creator_profile:profiles!creator_id(id, full_name, email),
+  brand_profile:profiles!brand_id(id, full_name, company_name)
+`
+
+/**
+ * Normalize offer list query params
+ * status accepts a single value or a comma-separated list ('sent,accepted')
+ * @returns {Object} Params, or { error } for unknown statuses
+ */
+export const parseOfferListParams = (searchParams) => {
+  const statuses = (searchParams.get('status') || '')
+    .split(',')
+    .map(status => status.trim())
+    .filter(status => status && status !== 'all')
+
+  const invalid = statuses.find(status => !OFFER_STATUSES.includes(status))
+  if (invalid) {
+    return { error: `Invalid status: ${invalid}` }
+  }
+
+  return {
+    campaignId: searchParams.get('campaign_id'),
+    creatorId: searchParams.get('creator_id'),
+    brandId: searchParams.get('brand_id'),
+    statuses,
+    cursor: searchParams.get('cursor') || null,
+    limit: parseLimit(searchParams.get('limit'), OFFER_PAGE_SIZE),
+    includeCounts: searchParams.get('counts') !== 'false'
+  }
+}
+
+/**
+ * Summarize offer_status_counts rows; cancelled offers are reported but not in the total,
+ * matching the default list which hides them
+ */
+const summarizeCounts = (rows) => {
+  const byStatus = Object.fromEntries(OFFER_STATUSES.map(status => [status, 0]))
+  for (const row of rows || []) {
+    byStatus[row.status] = Number(row.offer_count) || 0
+  }
+  const total = Object.entries(byStatus)
+    .filter(([status]) => status !== 'cancelled')
+    .reduce((sum, [, count]) => sum + count, 0)
+  return { total, by_status: byStatus }
+}
+
+/**
+ * Fetch one page of offers (and status counts for the first page)
+ * @param {Object} client - Supabase client
+ * @param {Object} params - Output of parseOfferListParams
+ * @returns {Object} { data: { offers, nextCursor, counts }, error }
+ */
+export const listOffers = async (client, params) => {
+  const cursor = decodeCreatedAtCursor(params.cursor)
+  if (params.cursor && !cursor) {
+    return { data: null, error: { message: 'Invalid cursor', status: 400 } }
+  }
+
+  let query = client.from('offers').select(OFFER_LIST_SELECT)
+
+  if (params.campaignId) query = query.eq('campaign_id', params.campaignId)
+  if (params.creatorId) query = query.eq('creator_id', params.creatorId)
+  if (params.brandId) query = query.eq('brand_id', params.brandId)
+
+  if (params.statuses.length === 1) {
+    query = query.eq('status', params.statuses[0])
+  } else if (params.statuses.length > 1) {
+    query = query.in('status', params.statuses)
+  } else {
+    query = query.neq('status', 'cancelled') // Filter out deleted offers
+  }
+
+  if (cursor) query = query.or(createdAtKeysetFilter(cursor))
+
+  const pagePromise = query
+    .order('created_at', { ascending: false })
+    .order('id', { ascending: false })
+    .limit(params.limit + 1)
+
+  // Counts don't depend on the status filter or cursor, so later pages and tab switches can skip them
+  const countsPromise = params.includeCounts && !cursor
+    ? client.rpc('offer_status_counts', {
+        p_brand_id: params.brandId || null,
+        p_creator_id: params.creatorId || null,
+        p_campaign_id: params.campaignId || null
+      })
+    : Promise.resolve({ data: null, error: null })
+
+  const [pageResult, countsResult] = await Promise.all([pagePromise, countsPromise])
+  const error = pageResult.error || countsResult.error
+  if (error) return { data: null, error }
+
+  const { items, nextCursor } = toPage(pageResult.data, params.limit, row => [row.created_at, row.id])
+
+  return {
+    data: {
+      offers: items,
+      nextCursor,
+      counts: countsResult.data ? summarizeCounts(countsResult.data) : null
+    },
+    error: null
+  }
+}
@@ -0,0 +1,144 @@
+// lib/marketplace/payment-analytics.js
+// Platform payment analytics: per-currency totals and per-period series aggregated in SQL
+// (platform_payment_analytics), served from a snapshot that is reused only while the
+// payment_analytics_version counter (bumped by every payments write) is unchanged
+
+import { createServerCache } from '@/lib/server-cache'
+
+export const ANALYTICS_TIMEFRAMES = ['7d', '30d', '90d', '1y', 'all']
+export const ANALYTICS_BUCKETS = ['day', 'week', 'month']
+
+const DEFAULT_TIMEFRAME = '30d'
+const DEFAULT_BUCKETS = { '7d': 'day', '30d': 'day', '90d': 'week', '1y': 'month', all: 'month' }
+
+const TIMEFRAME_DAYS = { '7d': 7, '30d': 30, '90d': 90, '1y': 365 }
+
+// The version check catches every payments write; the TTL only bounds drift from offer fee edits
+const analyticsCache = createServerCache('payment_analytics', {
+  maxEntries: ANALYTICS_TIMEFRAMES.length * ANALYTICS_BUCKETS.length,
+  ttlMs: 5 * 60 * 1000
+})
+
+const cacheKey = (timeframe, bucket) => `${timeframe}:${bucket}`
+
+const emptyTotals = (currency) => ({
+  currency,
+  volume_cents: 0,
+  fees_cents: 0,
+  escrow_cents: 0,
+  refunded_cents: 0,
+  completed_count: 0,
+  escrow_count: 0,
+  pending_count: 0,
+  refunded_count: 0,
+  failed_count: 0
+})
+
+// BIGINT columns can arrive as strings
+const toTotals = (row) => ({
+  currency: row.currency,
+  volume_cents: Number(row.volume_cents),
+  fees_cents: Number(row.fees_cents),
+  escrow_cents: Number(row.escrow_cents),
+  refunded_cents: Number(row.refunded_cents),
+  completed_count: Number(row.completed_count),
+  escrow_count: Number(row.escrow_count),
+  pending_count: Number(row.pending_count),
+  refunded_count: Number(row.refunded_count),
+  failed_count: Number(row.failed_count)
+})
+
+/**
+ * Normalize analytics query params
+ * @returns {Object} { timeframe, bucket }, or { error }
+ */
+export const parsePaymentAnalyticsParams = (searchParams) => {
+  const timeframe = searchParams.get('timeframe') || DEFAULT_TIMEFRAME
+  if (!ANALYTICS_TIMEFRAMES.includes(timeframe)) {
+    return { error: `timeframe must be one of: ${ANALYTICS_TIMEFRAMES.join(', ')}` }
+  }
+
+  const bucket = searchParams.get('bucket') || DEFAULT_BUCKETS[timeframe]
+  if (!ANALYTICS_BUCKETS.includes(bucket)) {
+    return { error: `bucket must be one of: ${ANALYTICS_BUCKETS.join(', ')}` }
+  }
+
+  return { timeframe, bucket }
+}
+
+const loadVersion = async (client) => {
+  const { data, error } = await client
+    .from('payment_analytics_version')
+    .select('version')
+    .maybeSingle()
+  if (error) return { data: null, error }
+  return { data: String(data?.version ?? 0), error: null }
+}
+
+const loadPaymentAnalytics = async (client, timeframe, bucket, version) => {
+  const since = TIMEFRAME_DAYS[timeframe]
+    ? new Date(Date.now() - TIMEFRAME_DAYS[timeframe] * 24 * 60 * 60 * 1000).toISOString()
+    : null
+
+  const { data, error } = await client.rpc('platform_payment_analytics', {
+    p_since: since,
+    p_until: null,
+    p_bucket: bucket
+  })
+  if (error) return { data: undefined, error }
+
+  const byCurrency = []
+  const periods = []
+  for (const row of data || []) {
+    if (row.period === null) {
+      byCurrency.push(toTotals(row))
+    } else {
+      periods.push({ period: row.period, ...toTotals(row) })
+    }
+  }
+
+  return {
+    data: {
+      timeframe,
+      bucket,
+      since,
+      by_currency: byCurrency,
+      periods,
+      version,
+      generated_at: new Date().toISOString()
+    },
+    error: null
+  }
+}
+
+/**
+ * Platform payment analytics for a timeframe
+ * by_currency holds one totals entry per currency with payments; periods holds the same
+ * totals per currency per bucket, oldest first
+ * @param {Object} client - Supabase client (service role)
+ * @param {Object} params - Output of parsePaymentAnalyticsParams
+ * @returns {Object} { data: { timeframe, bucket, since, by_currency, periods, version, generated_at }, error, cacheHit }
+ */
+export const getPaymentAnalytics = async (client, params = {}) => {
+  const timeframe = params.timeframe || DEFAULT_TIMEFRAME
+  const bucket = params.bucket || DEFAULT_BUCKETS[timeframe]
+  const key = cacheKey(timeframe, bucket)
+
+  // Writes happen in other route bundles and instances, so the snapshot is checked on every read
+  const versionResult = await loadVersion(client)
+  if (versionResult.error) return { data: null, error: versionResult.error, cacheHit: false }
+  const version = versionResult.data
+
+  const load = () => loadPaymentAnalytics(client, timeframe, bucket, version)
+  const result = await analyticsCache.wrap(key, load)
+  if (!result.cacheHit || result.data.version === version) return result
+
+  await analyticsCache.invalidate(key)
+  return analyticsCache.wrap(key, load)
+}
+
+/**
+ * Totals for one currency from a getPaymentAnalytics result (zeroes when it has no payments)
+ */
+export const getCurrencyTotals = (analytics, currency) =>
+  analytics?.by_currency?.find(row => row.currency === currency) || emptyTotals(currency)
@@ -0,0 +1,65 @@
+// lib/marketplace/payment-events.js
+// Append-only payment history in payment_events, one row per status change
+
+import { decodeCreatedAtCursor, parseLimit, toPage, createdAtKeysetFilter } from '@/lib/pagination'
+
+const PAYMENT_EVENT_PAGE_SIZE = 50
+
+const PAYMENT_EVENT_SELECT = 'id, payment_id, stripe_event_id, type, from_status, to_status, stripe_session_id, data, created_at'
+
+/**
+ * Append events to payment_events with a single insert
+ * A single Stripe event already logged for its payment (handler retried after a partial failure) is not an error
+ * @param {Object} client - Supabase client (service role)
+ * @param {Array} events - [{ payment_id, type, stripe_event_id, from_status, to_status, stripe_session_id, data }]
+ * @returns {Object} { error }
+ */
+export const recordPaymentEvents = async (client, events) => {
+  if (!events || events.length === 0) return { error: null }
+
+  const { error } = await client.from('payment_events').insert(events)
+  // A unique violation only identifies the retried row when one Stripe event is logged;
+  // in a multi-row insert it would hide every other row
+  const retried = error?.code === '23505' && events.length === 1 && events[0].stripe_event_id
+  if (error && !retried) return { error }
+  return { error: null }
+}
+
+/**
+ * Normalize payment event list query params
+ */
+export const parsePaymentEventParams = (searchParams) => ({
+  cursor: searchParams.get('cursor') || null,
+  limit: parseLimit(searchParams.get('limit'), PAYMENT_EVENT_PAGE_SIZE)
+})
+
+/**
+ * One page of a payment's event history, newest first
+ * @param {Object} client - Supabase client
+ * @param {String} paymentId - Payment ID
+ * @param {Object} params - Output of parsePaymentEventParams
+ * @returns {Object} { data: { events, nextCursor }, error }
+ */
+export const listPaymentEvents = async (client, paymentId, params) => {
+  const cursor = decodeCreatedAtCursor(params.cursor)
+  if (params.cursor && !cursor) {
+    return { data: null, error: { message: 'Invalid cursor', status: 400 } }
+  }
+
+  let query = client
+    .from('payment_events')
+    .select(PAYMENT_EVENT_SELECT)
+    .eq('payment_id', paymentId)
+
+  if (cursor) query = query.or(createdAtKeysetFilter(cursor))
+
+  const { data, error } = await query
+    .order('created_at', { ascending: false })
+    .order('id', { ascending: false })
+    .limit(params.limit + 1)
+
+  if (error) return { data: null, error }
+
+  const { items, nextCursor } = toPage(data, params.limit, row => [row.created_at, row.id])
+  return { data: { events: items, nextCursor }, error: null }
+}
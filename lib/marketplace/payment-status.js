@@ -0,0 +1,155 @@
+// lib/marketplace/payment-status.js
+// Checkout payment status, webhook first: settled payments are answered from the database,
+// pending ones fall back to a briefly cached Stripe session lookup
+
+import { createServerCache } from '@/lib/server-cache'
+import { recordPaymentEvents } from '@/lib/marketplace/payment-events'
+
+export const TERMINAL_PAYMENT_STATUSES = ['paid_escrow', 'released', 'refunded', 'failed']
+export const MAX_STATUS_WAIT_MS = 20 * 1000
+
+// Long-poll re-reads the payment row at this interval; a single indexed lookup per tick
+const STATUS_POLL_INTERVAL_MS = 1000
+
+const PAYMENT_STATUS_SELECT = 'id, offer_id, status, amount_cents, currency, stripe_payment_intent, last_error'
+
+// Clients poll every few seconds; one Stripe read per session per window is plenty
+const stripeSessionCache = createServerCache('stripe_checkout_sessions', {
+  maxEntries: 1000,
+  ttlMs: 10 * 1000
+})
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms))
+
+const loadPayment = async (client, sessionId) => {
+  const { data, error } = await client
+    .from('payments')
+    .select(PAYMENT_STATUS_SELECT)
+    .eq('stripe_session_id', sessionId)
+    .maybeSingle()
+  if (error) throw new Error(error.message)
+  return data
+}
+
+const getStripeSession = (stripe, sessionId) =>
+  stripeSessionCache.wrap(sessionId, async () => {
+    try {
+      const session = await stripe.checkout.sessions.retrieve(sessionId)
+      return {
+        data: {
+          id: session.id,
+          status: session.status,
+          payment_status: session.payment_status,
+          payment_intent: session.payment_intent,
+          amount_total: session.amount_total,
+          currency: session.currency,
+          metadata: session.metadata
+        },
+        error: null
+      }
+    } catch (err) {
+      return {
+        data: undefined,
+        error: { message: err.message, status: err.code === 'resource_missing' ? 404 : 502 }
+      }
+    }
+  })
+
+// Settle a pending payment from the Stripe session when the webhook hasn't yet; conditional on
+// 'pending' so it never races the webhook worker into a double transition
+const reconcileFromSession = async (client, payment, session) => {
+  let toStatus = null
+  const updates = {}
+  if (session.payment_status === 'paid') {
+    toStatus = 'paid_escrow'
+    updates.stripe_payment_intent = session.payment_intent
+  } else if (session.status === 'expired') {
+    toStatus = 'failed'
+    updates.last_error = 'Session expired'
+  }
+  if (!toStatus) return payment
+
+  const { data: changed, error } = await client
+    .from('payments')
+    .update({ ...updates, status: toStatus, updated_at: new Date().toISOString() })
+    .eq('id', payment.id)
+    .eq('status', 'pending')
+    .select(PAYMENT_STATUS_SELECT)
+  if (error) throw new Error(error.message)
+
+  // The webhook got there first
+  if (!changed || changed.length === 0) return (await loadPayment(client, session.id)) || payment
+
+  const { error: logError } = await recordPaymentEvents(client, [{
+    payment_id: payment.id,
+    type: toStatus === 'paid_escrow' ? 'checkout.session.completed' : 'checkout.session.expired',
+    from_status: 'pending',
+    to_status: toStatus,
+    stripe_session_id: session.id,
+    data: { source: 'status_check' }
+  }])
+  if (logError) console.error('❌ Failed to log reconciled payment event:', logError.message)
+
+  if (toStatus === 'paid_escrow') {
+    const { error: offerError } = await client
+      .from('offers')
+      .update({ status: 'paid_escrow', updated_at: new Date().toISOString() })
+      .eq('id', payment.offer_id)
+      .in('status', ['drafted', 'sent', 'accepted'])
+    if (offerError) console.error('❌ Error updating offer status:', offerError.message)
+  }
+
+  return changed[0]
+}
+
+// Response shape kept compatible with the original Stripe-backed endpoint
+const toStatusResponse = (sessionId, payment, session) => ({
+  session_id: sessionId,
+  payment_id: payment.id,
+  offer_id: payment.offer_id,
+  status: session ? session.status : (payment.status === 'failed' ? 'expired' : 'complete'),
+  payment_status: session ? session.payment_status : (payment.status === 'failed' ? 'unpaid' : 'paid'),
+  amount_total: session?.amount_total ?? payment.amount_cents,
+  currency: session?.currency || payment.currency?.toLowerCase(),
+  database_status: payment.status,
+  metadata: session?.metadata || null,
+  source: session ? 'stripe' : 'database',
+  success: true
+})
+
+/**
+ * Status of a checkout session's payment
+ * With waitMs the call long-polls the payments row and returns as soon as the webhook settles it;
+ * Stripe is only consulted for payments still pending when the wait ends
+ * @param {Object} client - Supabase client (service role)
+ * @param {String} sessionId - Stripe checkout session ID
+ * @param {Object} options - { stripe, waitMs, signal }
+ * @returns {Object} { data, error }
+ */
+export const getCheckoutPaymentStatus = async (client, sessionId, options = {}) => {
+  const deadline = Date.now() + Math.min(options.waitMs || 0, MAX_STATUS_WAIT_MS)
+
+  let payment = await loadPayment(client, sessionId)
+  if (!payment) return { data: null, error: { message: 'Payment not found', status: 404 } }
+
+  while (payment.status === 'pending' && Date.now() < deadline && !options.signal?.aborted) {
+    await sleep(Math.min(STATUS_POLL_INTERVAL_MS, deadline - Date.now()))
+    payment = (await loadPayment(client, sessionId)) || payment
+  }
+
+  if (TERMINAL_PAYMENT_STATUSES.includes(payment.status)) {
+    return { data: toStatusResponse(sessionId, payment, null), error: null }
+  }
+
+  if (!options.stripe) {
+    return { data: null, error: { message: 'Payment system is not configured. Please contact support.', status: 503 } }
+  }
+
+  const { data: session, error } = await getStripeSession(options.stripe, sessionId)
+  if (error || !session) {
+    return { data: null, error: error || { message: 'Stripe session not found', status: 404 } }
+  }
+
+  payment = await reconcileFromSession(client, payment, session)
+  return { data: toStatusResponse(sessionId, payment, session), error: null }
+}
@@ -2,7 +2,10 @@
 // Handles payment lifecycle, escrow operations, and integration with Stripe
 
 import { createTransfer, releaseEscrowPayment, calculatePaymentSplit, createRefund } from '@/lib/stripe/transfers';
-import { updateOffer, updatePayment, getPayment, createPayment } from '@/lib/supabase';
+import { supabase, supabaseAdmin, updateOffer, updatePayment, getPayment, createPayment } from '@/lib/supabase';
+import { getCreatorEarnings } from '@/lib/marketplace/creator-earnings';
+import { getPaymentAnalytics, getCurrencyTotals } from '@/lib/marketplace/payment-analytics';
+import { getPlatformFeePct } from '@/lib/marketplace/platform-settings';
 
 /**
  * Process payment after offer acceptance
@@ -18,8 +21,9 @@ export async function processOfferPayment(offer, paymentData) {
       currency 
     } = paymentData;
 
-    // Calculate payment split
-    const paymentSplit = calculatePaymentSplit(amountCents, 20); // 20% platform fee
+    // Calculate payment split with the fee the offer was priced at, else the current platform fee
+    const platformFeePct = offer.platform_fee_pct ?? await getPlatformFeePct(supabase);
+    const paymentSplit = calculatePaymentSplit(amountCents, platformFeePct);
 
     // Create payment record
     const payment = {
@@ -29,7 +33,7 @@ export async function processOfferPayment(offer, paymentData) {
       amount_cents: amountCents,
       currency: currency,
       status: 'paid_escrow',
-      platform_fee_pct: 20,
+      platform_fee_pct: platformFeePct,
       platform_fee_cents: paymentSplit.platformFeeCents,
       creator_amount_cents: paymentSplit.creatorAmountCents,
       payment_method: 'card',
@@ -245,20 +249,36 @@ export async function getPaymentStatus(paymentId) {
  */
 export async function calculateCreatorEarnings(creatorId, filters = {}) {
   try {
-    // This would require a new Supabase function to get payments by creator
-    // For now, return a basic structure
-    
+    // The creator_earnings ledger is service role only, like the platform aggregates
+    if (!supabaseAdmin) {
+      throw new Error('Service role client not configured');
+    }
+
+    // Balances come from the creator_earnings ledger (one row per currency)
+    const { data: balances, error } = await getCreatorEarnings(supabaseAdmin, creatorId);
+    if (error) {
+      throw new Error(`Failed to load creator earnings: ${error.message}`);
+    }
+
+    const currency = filters.currency || 'USD';
+    const balance = balances.find(row => row.currency === currency);
+    const grossCents = balance
+      ? balance.escrow_cents + balance.released_cents + balance.refunded_cents
+      : 0;
+
     return {
       success: true,
       earnings: {
-        total_earned_cents: 0,
-        pending_escrow_cents: 0,
-        released_cents: 0,
-        currency: 'USD',
-        payment_count: 0,
-        average_payment_cents: 0
+        total_earned_cents: balance?.total_earned_cents || 0,
+        pending_escrow_cents: balance?.escrow_cents || 0,
+        released_cents: balance?.released_cents || 0,
+        refunded_cents: balance?.refunded_cents || 0,
+        paid_out_cents: balance?.paid_out_cents || 0,
+        currency,
+        payment_count: balance?.payment_count || 0,
+        average_payment_cents: balance?.payment_count ? Math.round(grossCents / balance.payment_count) : 0
       },
-      message: 'Creator earnings calculation requires additional Supabase functions'
+      balances
     };
   } catch (error) {
     console.error('Failed to calculate creator earnings:', error);
@@ -271,25 +291,45 @@ export async function calculateCreatorEarnings(creatorId, filters = {}) {
 
 /**
  * Get payment analytics for platform
- * @param {Object} filters - Optional filters (date range, etc.)
+ * @param {Object} filters - Optional filters ({ timeframe, bucket, currency })
  */
 export async function getPlatformPaymentAnalytics(filters = {}) {
   try {
-    // This would require analytics queries
-    // For now, return a basic structure
-    
+    // Platform-wide aggregates are service role only
+    if (!supabaseAdmin) {
+      throw new Error('Service role client not configured');
+    }
+
+    const { data, error } = await getPaymentAnalytics(supabaseAdmin, {
+      timeframe: filters.timeframe,
+      bucket: filters.bucket
+    });
+    if (error) {
+      throw new Error(`Failed to load payment analytics: ${error.message}`);
+    }
+
+    const currency = filters.currency || 'USD';
+    const totals = getCurrencyTotals(data, currency);
+
     return {
       success: true,
       analytics: {
-        total_volume_cents: 0,
-        total_fees_collected_cents: 0,
-        active_escrow_cents: 0,
-        completed_payments: 0,
-        pending_payments: 0,
-        refunded_payments: 0,
-        currency: 'USD'
+        total_volume_cents: totals.volume_cents,
+        total_fees_collected_cents: totals.fees_cents,
+        active_escrow_cents: totals.escrow_cents,
+        refunded_cents: totals.refunded_cents,
+        completed_payments: totals.completed_count,
+        escrow_payments: totals.escrow_count,
+        pending_payments: totals.pending_count,
+        refunded_payments: totals.refunded_count,
+        failed_payments: totals.failed_count,
+        currency
       },
-      message: 'Platform analytics requires additional database queries'
+      by_currency: data.by_currency,
+      periods: data.periods.filter(row => row.currency === currency),
+      timeframe: data.timeframe,
+      bucket: data.bucket,
+      generated_at: data.generated_at
     };
   } catch (error) {
     console.error('Failed to get platform analytics:', error);
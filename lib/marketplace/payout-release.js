@@ -0,0 +1,85 @@
+// lib/marketplace/payout-release.js
+// Bulk release of manual payouts: validated and updated set-based in release_manual_payouts
+
+export const MAX_BULK_RELEASE = 500
+
+const UUID_PATTERN = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i
+
+/**
+ * Normalize a bulk release request body
+ * @param {Object} body - { payout_ids } or { filter: { creator_id, created_before, limit } },
+ *                        plus optional reference_number and admin_notes applied to every payout
+ * @returns {Object} Request, or { error }
+ */
+export const parseBulkReleaseRequest = (body = {}) => {
+  const { payout_ids, filter } = body
+
+  if (!payout_ids && !filter) return { error: 'payout_ids or filter is required' }
+  if (payout_ids && filter) return { error: 'Send either payout_ids or filter, not both' }
+
+  const request = {
+    payoutIds: null,
+    creatorId: null,
+    createdBefore: null,
+    limit: MAX_BULK_RELEASE,
+    referenceNumber: body.reference_number || null,
+    adminNotes: body.admin_notes || null
+  }
+
+  if (payout_ids) {
+    if (!Array.isArray(payout_ids) || payout_ids.length === 0) {
+      return { error: 'payout_ids must be a non-empty array' }
+    }
+    if (payout_ids.length > MAX_BULK_RELEASE) {
+      return { error: `At most ${MAX_BULK_RELEASE} payouts can be released per request` }
+    }
+    const invalid = payout_ids.find(id => typeof id !== 'string' || !UUID_PATTERN.test(id))
+    if (invalid !== undefined) return { error: `Invalid payout id: ${invalid}` }
+
+    request.payoutIds = [...new Set(payout_ids)]
+    return request
+  }
+
+  if (filter.creator_id && !UUID_PATTERN.test(filter.creator_id)) {
+    return { error: 'filter.creator_id must be a UUID' }
+  }
+  if (filter.created_before && isNaN(Date.parse(filter.created_before))) {
+    return { error: 'filter.created_before must be a date' }
+  }
+  const limit = Number(filter.limit ?? MAX_BULK_RELEASE)
+  if (!Number.isInteger(limit) || limit <= 0 || limit > MAX_BULK_RELEASE) {
+    return { error: `filter.limit must be between 1 and ${MAX_BULK_RELEASE}` }
+  }
+
+  request.creatorId = filter.creator_id || null
+  request.createdBefore = filter.created_before ? new Date(filter.created_before).toISOString() : null
+  request.limit = limit
+  return request
+}
+
+/**
+ * Release pending manual payouts in one statement
+ * @param {Object} client - Supabase client (service role)
+ * @param {Object} request - Output of parseBulkReleaseRequest
+ * @returns {Object} { data: { results, released, failed }, error }
+ */
+export const releaseManualPayouts = async (client, request) => {
+  const { data, error } = await client.rpc('release_manual_payouts', {
+    p_payout_ids: request.payoutIds,
+    p_creator_id: request.creatorId,
+    p_created_before: request.createdBefore,
+    p_limit: request.limit,
+    p_reference_number: request.referenceNumber,
+    p_admin_notes: request.adminNotes
+  })
+  if (error) return { data: null, error }
+
+  const results = (data || []).map(row => ({
+    payout_id: row.payout_id,
+    outcome: row.outcome,
+    previous_status: row.previous_status
+  }))
+  const released = results.filter(result => result.outcome === 'released').length
+
+  return { data: { results, released, failed: results.length - released }, error: null }
+}
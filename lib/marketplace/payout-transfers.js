@@ -0,0 +1,132 @@
+// lib/marketplace/payout-transfers.js
+// Resumable Stripe transfer runs for stripe-method payouts
+// Progress is written to payouts as each transfer settles, so a run cut off by maxDuration
+// (or a crashed function) is picked up by the next run with the same idempotency keys
+
+import crypto from 'crypto'
+import { batchProcessTransfers } from '@/lib/stripe/transfers'
+
+const DEFAULT_RUN_LIMIT = 500
+// Leave headroom under the 30s function maxDuration in vercel.json
+const DEFAULT_TIME_BUDGET_MS = 25 * 1000
+// Claims older than this belong to a run that died and may be reclaimed
+const STALE_CLAIM_MS = 5 * 60 * 1000
+
+// Errors that will not succeed on retry (bad destination, insufficient platform balance, ...)
+const isPermanentFailure = (result) =>
+  result.statusCode !== undefined && result.statusCode >= 400 && result.statusCode < 500 && result.statusCode !== 429
+
+/**
+ * Claim pending stripe payouts and transfer them to creators' Connect accounts
+ * @param {Object} client - Supabase client (service role)
+ * @param {Object} options - { payoutIds, limit, timeBudgetMs, concurrency }
+ * @returns {Object} { data: { runId, claimed, released, failed, requeued }, error }
+ */
+export const runPayoutTransfers = async (client, options = {}) => {
+  const startedAt = Date.now()
+  const runId = crypto.randomUUID()
+
+  const { data: payouts, error: claimError } = await client.rpc('claim_payout_transfers', {
+    p_run_id: runId,
+    p_limit: options.limit || DEFAULT_RUN_LIMIT,
+    p_stale_before: new Date(startedAt - STALE_CLAIM_MS).toISOString(),
+    p_payout_ids: options.payoutIds?.length ? options.payoutIds : null
+  })
+  if (claimError) return { data: null, error: claimError }
+
+  const summary = { runId, claimed: payouts?.length || 0, released: 0, failed: 0, requeued: 0 }
+  if (!summary.claimed) return { data: summary, error: null }
+
+  const creatorIds = [...new Set(payouts.map(payout => payout.creator_id))]
+  const { data: creators, error: creatorError } = await client
+    .from('profiles')
+    .select('id, stripe_account_id')
+    .in('id', creatorIds)
+  if (creatorError) {
+    await requeueUnfinished(client, runId)
+    return { data: null, error: creatorError }
+  }
+
+  const accountByCreator = new Map((creators || []).map(creator => [creator.id, creator.stripe_account_id]))
+
+  const recordOutcome = async (payoutId, updates) => {
+    const { error } = await client
+      .from('payouts')
+      .update({ ...updates, updated_at: new Date().toISOString() })
+      .eq('id', payoutId)
+      .eq('transfer_run_id', runId)
+    if (error) console.error(`❌ Failed to record transfer outcome for payout ${payoutId}:`, error.message)
+  }
+
+  const transfers = []
+  for (const payout of payouts) {
+    const destination = accountByCreator.get(payout.creator_id)
+    if (!destination) {
+      summary.failed++
+      await recordOutcome(payout.id, { status: 'failed', last_error: 'Creator has no connected Stripe account' })
+      continue
+    }
+
+    transfers.push({
+      payoutId: payout.id,
+      amount: payout.amount_cents,
+      currency: payout.currency,
+      destination,
+      description: `Payout ${payout.id}`,
+      idempotencyKey: payout.idempotency_key,
+      metadata: {
+        payout_id: payout.id,
+        payment_id: payout.payment_id,
+        creator_id: payout.creator_id,
+        type: 'payout'
+      }
+    })
+  }
+
+  const batch = await batchProcessTransfers(transfers, {
+    concurrency: options.concurrency,
+    deadline: startedAt + (options.timeBudgetMs || DEFAULT_TIME_BUDGET_MS),
+    onResult: async (transferData, result) => {
+      if (result.success) {
+        summary.released++
+        await recordOutcome(transferData.payoutId, {
+          status: 'released',
+          stripe_transfer_id: result.transfer.id,
+          last_error: null
+        })
+      } else if (isPermanentFailure(result)) {
+        summary.failed++
+        await recordOutcome(transferData.payoutId, { status: 'failed', last_error: result.error })
+      } else {
+        // Transient failure that outlasted the retries; the next run tries again with the same key
+        summary.requeued++
+        await recordOutcome(transferData.payoutId, { status: 'pending', last_error: result.error })
+      }
+    }
+  })
+
+  // Claimed but never started (time budget ran out) - hand them back to the queue
+  summary.requeued += await requeueUnfinished(client, runId)
+  summary.rateLimitedResponses = batch.rateLimitedResponses
+  summary.durationMs = Date.now() - startedAt
+
+  console.log('💸 Payout transfer run:', summary)
+  return { data: summary, error: null }
+}
+
+// Release this run's remaining claims; returns how many were released
+const requeueUnfinished = async (client, runId) => {
+  const { data, error } = await client
+    .from('payouts')
+    .update({ status: 'pending', transfer_run_id: null, updated_at: new Date().toISOString() })
+    .eq('transfer_run_id', runId)
+    .eq('status', 'processing')
+    .select('id')
+
+  if (error) {
+    // Left as processing; they become reclaimable once the claim goes stale
+    console.error(`❌ Failed to requeue unfinished payouts for run ${runId}:`, error.message)
+    return 0
+  }
+  return data?.length || 0
+}
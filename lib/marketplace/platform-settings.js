@@ -0,0 +1,108 @@
+// lib/marketplace/platform-settings.js
+// Platform settings provider: the platform_settings row is served from a server cache, revalidated
+// against its version column at most every VERSION_CHECK_INTERVAL_MS, and invalidated directly
+// when an admin saves new settings
+
+import { createServerCache } from '@/lib/server-cache'
+
+export const DEFAULT_PLATFORM_SETTINGS = {
+  id: null,
+  platform_fee_pct: 20,
+  auto_release_days: 7,
+  relay_enabled: false,
+  fallback_manual_payouts: false,
+  version: 0,
+  updated_at: null
+}
+
+const SETTINGS_SELECT = 'id, platform_fee_pct, auto_release_days, relay_enabled, fallback_manual_payouts, version, updated_at'
+const CACHE_KEY = 'current'
+
+// Other instances pick up a change at the next version check; the TTL is only a backstop
+const VERSION_CHECK_INTERVAL_MS = 30 * 1000
+
+const settingsCache = createServerCache('platform_settings', {
+  maxEntries: 1,
+  ttlMs: 10 * 60 * 1000
+})
+
+let lastVersionCheck = 0
+let versionCheck = null
+
+// Newest row wins, matching the admin settings route
+const latestSettings = (client, columns) =>
+  client
+    .from('platform_settings')
+    .select(columns)
+    .order('updated_at', { ascending: false })
+    .limit(1)
+    .maybeSingle()
+
+const loadSettings = async (client) => {
+  const { data, error } = await latestSettings(client, SETTINGS_SELECT)
+  if (error) return { data: undefined, error }
+  lastVersionCheck = Date.now()
+  return { data: { ...DEFAULT_PLATFORM_SETTINGS, ...data }, error: null }
+}
+
+// Drop the cached row when the table has moved on; read errors keep serving the cached copy
+const revalidate = async (client, cached) => {
+  const { data, error } = await latestSettings(client, 'id, version')
+  if (error) {
+    console.warn('Platform settings version check failed:', error.message)
+    return
+  }
+  lastVersionCheck = Date.now()
+  if ((data?.id ?? null) !== cached.id || (data?.version ?? 0) !== cached.version) {
+    await settingsCache.invalidate(CACHE_KEY)
+  }
+}
+
+/**
+ * Current platform settings (cached)
+ * @param {Object} client - Supabase client
+ * @returns {Object} { data: settings, error } - data is null only when nothing could be loaded
+ */
+export const getPlatformSettings = async (client) => {
+  const result = await settingsCache.wrap(CACHE_KEY, () => loadSettings(client))
+  if (result.error) return { data: null, error: result.error }
+  if (!result.cacheHit || Date.now() - lastVersionCheck < VERSION_CHECK_INTERVAL_MS) {
+    return { data: result.data, error: null }
+  }
+
+  // Concurrent requests share one version check
+  if (!versionCheck) {
+    versionCheck = revalidate(client, result.data).finally(() => {
+      versionCheck = null
+    })
+  }
+  await versionCheck
+
+  const current = await settingsCache.wrap(CACHE_KEY, () => loadSettings(client))
+  if (current.error) return { data: result.data, error: null }
+  return { data: current.data, error: null }
+}
+
+/**
+ * Current platform fee percentage, falling back to the default fee
+ * @param {Object} client - Supabase client
+ * @returns {Number} Platform fee percentage
+ */
+export const getPlatformFeePct = async (client) => {
+  const { data } = await getPlatformSettings(client)
+  return typeof data?.platform_fee_pct === 'number'
+    ? data.platform_fee_pct
+    : DEFAULT_PLATFORM_SETTINGS.platform_fee_pct
+}
+
+/**
+ * Drop the cached settings after a write, optionally priming the cache with the saved row
+ * @param {Object} settings - Row returned by the write
+ */
+export const invalidatePlatformSettings = async (settings = null) => {
+  await settingsCache.invalidate(CACHE_KEY)
+  if (settings) {
+    await settingsCache.set(CACHE_KEY, { ...DEFAULT_PLATFORM_SETTINGS, ...settings })
+    lastVersionCheck = Date.now()
+  }
+}
@@ -7,33 +7,53 @@ import { formatPrice as utilFormatPrice, formatDate } from '@/lib/formatters'
  * Calculate pricing for marketplace offers
  * @param {Array} items - Array of {deliverable_type, qty, unit_price_cents, currency}
  * @param {Number} platformFeePct - Platform fee percentage (default 20)
+ * @param {String} targetCurrency - Price mixed-currency items in this currency instead of rejecting them
+ * @param {Object} rates - Units per USD for the conversion (server callers pass loadFxRates' rates)
  * @returns {Object} Pricing breakdown
  */
-export const calculatePricing = (items = [], platformFeePct = 20) => {
+export const calculatePricing = (items = [], platformFeePct = 20, targetCurrency = null, rates = DEFAULT_FX_RATES) => {
   if (!Array.isArray(items) || items.length === 0) {
     return {
       subtotalCents: 0,
       platformFeePct: platformFeePct,
       platformFeeCents: 0,
       totalCents: 0,
-      currency: 'USD',
-      breakdown: []
+      currency: targetCurrency || 'USD',
+      breakdown: [],
+      creatorEarningsCents: 0
     }
   }
 
-  // Validate all items have same currency
-  const currencies = [...new Set(items.map(item => item.currency || 'USD'))]
-  if (currencies.length > 1) {
-    throw new Error('All items must have the same currency')
+  // Validate all items have same currency, unless they are converted into a target currency
+  const currency = targetCurrency || items[0].currency || 'USD'
+  if (!targetCurrency) {
+    for (let i = 1; i < items.length; i++) {
+      if ((items[i].currency || 'USD') !== currency) {
+        throw new Error('All items must have the same currency')
+      }
+    }
+  }
+
+  // One pass: each unit price is converted once and reused for the line total and the subtotal
+  const breakdown = new Array(items.length)
+  let subtotalCents = 0
+  for (let i = 0; i < items.length; i++) {
+    const item = items[i]
+    const qty = item.qty || 1
+    const unitPriceCents = targetCurrency
+      ? convertCurrency(item.unit_price_cents || 0, item.currency || 'USD', currency, rates)
+      : item.unit_price_cents || 0
+    const lineTotalCents = unitPriceCents * qty
+
+    subtotalCents += lineTotalCents
+    breakdown[i] = {
+      deliverable_type: item.deliverable_type,
+      qty,
+      unit_price_cents: unitPriceCents,
+      line_total_cents: lineTotalCents,
+      currency
+    }
   }
-  
-  const currency = currencies[0] || 'USD'
-  
-  // Calculate subtotal
-  const subtotalCents = items.reduce((sum, item) => {
-    const itemTotal = (item.unit_price_cents || 0) * (item.qty || 1)
-    return sum + itemTotal
-  }, 0)
   
   // Calculate platform fee
   const platformFeeCents = Math.round(subtotalCents * (platformFeePct / 100))
@@ -41,15 +61,6 @@ export const calculatePricing = (items = [], platformFeePct = 20) => {
   // Calculate total (brand pays subtotal + platform fee)
   const totalCents = subtotalCents + platformFeeCents
   
-  // Generate breakdown
-  const breakdown = items.map(item => ({
-    deliverable_type: item.deliverable_type,
-    qty: item.qty || 1,
-    unit_price_cents: item.unit_price_cents || 0,
-    line_total_cents: (item.unit_price_cents || 0) * (item.qty || 1),
-    currency
-  }))
-  
   return {
     subtotalCents,
     platformFeePct,
@@ -80,35 +91,84 @@ export const applyRushPricing = (basePriceCents, rushPct = 0) => {
  */
 export const formatPrice = utilFormatPrice
 
+// ====================================
+// FX RATES
+// ====================================
+
+// Units of each currency per 1 USD; fallback when no rates are passed. Server-side pricing passes
+// the fx_rates table's rates from loadFxRates instead
+export const DEFAULT_FX_RATES = {
+  USD: 1,
+  MYR: 4.7,
+  SGD: 1.35
+}
+
+// Multiplier from one currency to another through USD, or null when either rate is unknown
+const fxFactor = (fromCurrency, toCurrency, rates) => {
+  const from = rates[fromCurrency]
+  const to = rates[toCurrency]
+  if (!from || !to) return null
+  return to / from
+}
+
 /**
- * Convert price between currencies (simplified - in production use live rates)
+ * Convert price between currencies
  * @param {Number} priceCents - Price in cents
  * @param {String} fromCurrency - Source currency
  * @param {String} toCurrency - Target currency
+ * @param {Object} rates - Units per USD (defaults to DEFAULT_FX_RATES)
  * @returns {Number} Converted price in cents
  */
-export const convertCurrency = (priceCents, fromCurrency, toCurrency) => {
+export const convertCurrency = (priceCents, fromCurrency, toCurrency, rates = DEFAULT_FX_RATES) => {
   if (fromCurrency === toCurrency) return priceCents
   
-  // Simplified conversion rates (in production, use live rates from API)
-  const rates = {
-    'USD_TO_MYR': 4.7,
-    'USD_TO_SGD': 1.35,
-    'MYR_TO_USD': 0.213,
-    'MYR_TO_SGD': 0.287,
-    'SGD_TO_USD': 0.741,
-    'SGD_TO_MYR': 3.48
-  }
-  
-  const rateKey = `${fromCurrency}_TO_${toCurrency}`
-  const rate = rates[rateKey]
-  
-  if (!rate) {
+  const factor = fxFactor(fromCurrency, toCurrency, rates)
+  if (factor === null) {
     console.warn(`No conversion rate found for ${fromCurrency} to ${toCurrency}`)
     return priceCents
   }
   
-  return Math.round(priceCents * rate)
+  return Math.round(priceCents * factor)
+}
+
+/**
+ * Convert a whole array of cents amounts from one currency to another
+ * The factor is resolved once for the batch
+ * @returns {Float64Array} Converted amounts in cents
+ */
+export const convertCurrencyMany = (amountsCents, fromCurrency, toCurrency, rates = DEFAULT_FX_RATES) => {
+  const count = amountsCents.length
+  const converted = new Float64Array(count)
+  const factor = fromCurrency === toCurrency ? 1 : fxFactor(fromCurrency, toCurrency, rates)
+
+  if (factor === null) {
+    console.warn(`No conversion rate found for ${fromCurrency} to ${toCurrency}`)
+  }
+
+  for (let i = 0; i < count; i++) {
+    converted[i] = factor === null ? amountsCents[i] : Math.round(amountsCents[i] * factor)
+  }
+  return converted
+}
+
+/**
+ * Normalize mixed-currency amounts to USD cents, e.g. to sort or filter listings by price
+ * @param {Array} amountsCents - Amounts in cents
+ * @param {Array|String} currencies - Currency per amount, or one currency for all
+ * @returns {Float64Array} USD cents (NaN where the currency has no rate)
+ */
+export const toUsdCentsMany = (amountsCents, currencies, rates = DEFAULT_FX_RATES) => {
+  if (typeof currencies === 'string') {
+    return convertCurrencyMany(amountsCents, currencies, 'USD', rates)
+  }
+
+  const count = amountsCents.length
+  const usdCents = new Float64Array(count)
+  for (let i = 0; i < count; i++) {
+    const unitsPerUsd = rates[currencies[i] || 'USD']
+    usdCents[i] = unitsPerUsd ? Math.round(amountsCents[i] / unitsPerUsd) : NaN
+  }
+  return usdCents
 }
 
 /**
@@ -175,15 +235,14 @@ export const validateOfferPricing = (offerData) => {
 /**
  * Generate offer items from rate cards and selections
  * @param {Array} selections - Array of {creatorId, deliverableType, qty, rushPct}
- * @param {Array} rateCards - Array of rate card data
+ * @param {Array|Map} rateCards - Array of rate card data, or an index from createRateCardIndex
  * @returns {Array} Formatted items array
  */
 export const generateOfferItems = (selections, rateCards) => {
+  const index = rateCards instanceof Map ? rateCards : createRateCardIndex(rateCards)
+
   return selections.map(selection => {
-    const rateCard = rateCards.find(rc => 
-      rc.creator_id === selection.creatorId && 
-      rc.deliverable_type === selection.deliverableType
-    )
+    const rateCard = findRateCard(index, selection.creatorId, selection.deliverableType, selection.currency)
     
     if (!rateCard) {
       throw new Error(`Rate card not found for ${selection.deliverableType}`)
@@ -205,6 +264,141 @@ export const generateOfferItems = (selections, rateCards) => {
   })
 }
 
+/**
+ * Items of a stored offer as an array
+ * offers.items holds the serialized array written by POST /api/offers and the bulk route:
+ * [{ deliverable_type, quantity, base_price_cents (pre-rush), rush_fee_pct }]
+ * @param {Object} offer - Offer row
+ * @returns {Array} Items, with unit_price_cents derived from base price and rush
+ */
+export const parseOfferItems = (offer) => {
+  let items = offer?.items
+  if (typeof items === 'string') {
+    try {
+      items = JSON.parse(items)
+    } catch (e) {
+      return []
+    }
+  }
+  if (!Array.isArray(items)) return []
+
+  return items.map(item => ({
+    ...item,
+    quantity: item.quantity ?? item.qty ?? 1,
+    unit_price_cents: item.unit_price_cents ?? applyRushPricing(item.base_price_cents || 0, item.rush_fee_pct || 0)
+  }))
+}
+
+// ====================================
+// BATCH QUOTING
+// ====================================
+
+// Currency slot used when a selection doesn't name one: the creator's first card for that deliverable
+const ANY_CURRENCY = '*'
+
+/**
+ * Index rate cards as creator_id -> deliverable_type -> currency -> card
+ * Build once per batch; lookups are three Map reads with no key strings allocated
+ * @param {Array} rateCards - Array of rate card data
+ * @returns {Map} Rate card index
+ */
+export const createRateCardIndex = (rateCards = []) => {
+  const index = new Map()
+
+  for (const card of rateCards) {
+    let byType = index.get(card.creator_id)
+    if (!byType) {
+      byType = new Map()
+      index.set(card.creator_id, byType)
+    }
+
+    let byCurrency = byType.get(card.deliverable_type)
+    if (!byCurrency) {
+      byCurrency = new Map()
+      byType.set(card.deliverable_type, byCurrency)
+    }
+
+    const currency = card.currency || 'USD'
+    if (!byCurrency.has(currency)) byCurrency.set(currency, card)
+    if (!byCurrency.has(ANY_CURRENCY)) byCurrency.set(ANY_CURRENCY, card)
+  }
+
+  return index
+}
+
+/**
+ * Look up a rate card in an index from createRateCardIndex
+ * @returns {Object|null} Rate card, or null when the creator has none for that deliverable/currency
+ */
+export const findRateCard = (index, creatorId, deliverableType, currency = null) => {
+  const byCurrency = index.get(creatorId)?.get(deliverableType)
+  if (!byCurrency) return null
+  return byCurrency.get(currency || ANY_CURRENCY) || null
+}
+
+/**
+ * Price a batch of selections against an indexed set of rate cards in one pass
+ * Lines are returned as typed arrays in selection order rather than one object per line
+ * @param {Array} selections - Array of {creatorId, deliverableType, qty, rushPct, currency?}
+ * @param {Array|Map} rateCards - Array of rate card data, or an index from createRateCardIndex
+ * @param {Number} platformFeePct - Platform fee percentage (default 20)
+ * @returns {Object} {
+ *   lineCount, unitPriceCents, lineTotalCents (Float64Array, 0 for missing lines),
+ *   missing (selection indexes without a rate card), subtotalCents, platformFeePct,
+ *   platformFeeCents, totalCents, creatorEarningsCents, currency
+ * }
+ */
+export const quoteBatch = (selections = [], rateCards = [], platformFeePct = 20) => {
+  const index = rateCards instanceof Map ? rateCards : createRateCardIndex(rateCards)
+  const lineCount = selections.length
+  const unitPriceCents = new Float64Array(lineCount)
+  const lineTotalCents = new Float64Array(lineCount)
+  const missing = []
+
+  let currency = null
+  let subtotalCents = 0
+
+  for (let i = 0; i < lineCount; i++) {
+    const selection = selections[i]
+    const rateCard = findRateCard(index, selection.creatorId, selection.deliverableType, selection.currency)
+
+    if (!rateCard) {
+      missing.push(i)
+      continue
+    }
+
+    const lineCurrency = rateCard.currency || 'USD'
+    if (currency === null) {
+      currency = lineCurrency
+    } else if (lineCurrency !== currency) {
+      throw new Error('All items must have the same currency')
+    }
+
+    const unit = applyRushPricing(rateCard.base_price_cents, selection.rushPct || rateCard.rush_pct || 0)
+    const lineTotal = unit * (selection.qty || 1)
+
+    unitPriceCents[i] = unit
+    lineTotalCents[i] = lineTotal
+    subtotalCents += lineTotal
+  }
+
+  // Same rounding as calculatePricing: the fee is taken once on the subtotal, not per line
+  const platformFeeCents = Math.round(subtotalCents * (platformFeePct / 100))
+
+  return {
+    lineCount,
+    unitPriceCents,
+    lineTotalCents,
+    missing,
+    subtotalCents,
+    platformFeePct,
+    platformFeeCents,
+    totalCents: subtotalCents + platformFeeCents,
+    creatorEarningsCents: subtotalCents,
+    currency: currency || 'USD'
+  }
+}
+
 // Constants for deliverable types
 export const DELIVERABLE_TYPES = {
   IG_REEL: 'IG_Reel',
@@ -6,8 +6,14 @@ import {
   applyRushPricing, 
   validateOfferPricing,
   generateOfferItems,
-  convertCurrency
+  convertCurrency,
+  createRateCardIndex,
+  findRateCard,
+  quoteBatch,
+  convertCurrencyMany,
+  toUsdCentsMany
 } from './pricing.js'
+import fxFixture from './fixtures/fx-rates.json'
 
 // Test Suite 1: Core Pricing Calculations
 describe('calculatePricing', () => {
@@ -274,5 +280,158 @@ describe('generateOfferItems', () => {
   })
 })
 
+// Test Suite 7: Batch Quoting
+describe('quoteBatch', () => {
+  const DELIVERABLES = ['IG_Reel', 'IG_Story', 'TikTok_Post', 'YouTube_Video', 'Bundle']
+
+  const buildRateCards = (creatorCount) => {
+    const rateCards = []
+    for (let c = 0; c < creatorCount; c++) {
+      DELIVERABLES.forEach((deliverableType, d) => {
+        rateCards.push({
+          creator_id: `creator-${c}`,
+          deliverable_type: deliverableType,
+          base_price_cents: 2500 + c * 10 + d * 1000,
+          currency: 'USD',
+          rush_pct: c % 3 === 0 ? 10 : 0
+        })
+      })
+    }
+    return rateCards
+  }
+
+  const buildSelections = (count, creatorCount) => {
+    const selections = []
+    for (let i = 0; i < count; i++) {
+      selections.push({
+        creatorId: `creator-${i % creatorCount}`,
+        deliverableType: DELIVERABLES[i % DELIVERABLES.length],
+        qty: (i % 4) + 1,
+        rushPct: i % 7 === 0 ? 25 : 0
+      })
+    }
+    return selections
+  }
+
+  test('should match generateOfferItems + calculatePricing', () => {
+    const rateCards = buildRateCards(20)
+    const selections = buildSelections(50, 20)
+
+    const expected = calculatePricing(generateOfferItems(selections, rateCards), 20)
+    const result = quoteBatch(selections, rateCards, 20)
+
+    expect(result.lineCount).toBe(50)
+    expect(result.missing).toHaveLength(0)
+    expect(result.subtotalCents).toBe(expected.subtotalCents)
+    expect(result.platformFeeCents).toBe(expected.platformFeeCents)
+    expect(result.totalCents).toBe(expected.totalCents)
+    expect(result.creatorEarningsCents).toBe(expected.creatorEarningsCents)
+    expected.breakdown.forEach((line, i) => {
+      expect(result.unitPriceCents[i]).toBe(line.unit_price_cents)
+      expect(result.lineTotalCents[i]).toBe(line.line_total_cents)
+    })
+  })
+
+  test('should report selections without a rate card instead of throwing', () => {
+    const rateCards = buildRateCards(2)
+    const selections = [
+      { creatorId: 'creator-0', deliverableType: 'IG_Reel', qty: 1 },
+      { creatorId: 'creator-99', deliverableType: 'IG_Reel', qty: 1 }
+    ]
+
+    const result = quoteBatch(selections, rateCards, 20)
+
+    expect(result.missing).toEqual([1])
+    expect(result.lineTotalCents[1]).toBe(0)
+    expect(result.subtotalCents).toBe(result.lineTotalCents[0])
+  })
+
+  test('should select rate cards by currency when requested', () => {
+    const index = createRateCardIndex([
+      { creator_id: 'creator-1', deliverable_type: 'IG_Reel', base_price_cents: 5000, currency: 'USD' },
+      { creator_id: 'creator-1', deliverable_type: 'IG_Reel', base_price_cents: 23500, currency: 'MYR' }
+    ])
+
+    expect(findRateCard(index, 'creator-1', 'IG_Reel').currency).toBe('USD')
+    expect(findRateCard(index, 'creator-1', 'IG_Reel', 'MYR').base_price_cents).toBe(23500)
+    expect(findRateCard(index, 'creator-1', 'IG_Reel', 'SGD')).toBeNull()
+  })
+
+  test('should reject mixed currencies', () => {
+    const rateCards = [
+      { creator_id: 'creator-1', deliverable_type: 'IG_Reel', base_price_cents: 5000, currency: 'USD' },
+      { creator_id: 'creator-2', deliverable_type: 'IG_Reel', base_price_cents: 23500, currency: 'MYR' }
+    ]
+    const selections = [
+      { creatorId: 'creator-1', deliverableType: 'IG_Reel' },
+      { creatorId: 'creator-2', deliverableType: 'IG_Reel' }
+    ]
+
+    expect(() => quoteBatch(selections, rateCards, 20)).toThrow('All items must have the same currency')
+  })
+
+  test('should quote 10k lines against 5k rate cards quickly', () => {
+    const rateCards = buildRateCards(1000)
+    const selections = buildSelections(10000, 1000)
+
+    // Reference total computed directly, without rate card lookups
+    let expectedSubtotal = 0
+    selections.forEach((selection, i) => {
+      const c = i % 1000
+      const d = i % DELIVERABLES.length
+      const base = 2500 + c * 10 + d * 1000
+      const unit = applyRushPricing(base, selection.rushPct || (c % 3 === 0 ? 10 : 0))
+      expectedSubtotal += unit * selection.qty
+    })
+
+    const start = performance.now()
+    const index = createRateCardIndex(rateCards)
+    const result = quoteBatch(selections, index, 20)
+    const elapsedMs = performance.now() - start
+
+    console.log(`quoteBatch: ${result.lineCount} lines in ${elapsedMs.toFixed(1)}ms`)
+
+    expect(result.lineCount).toBe(10000)
+    expect(result.missing).toHaveLength(0)
+    expect(result.subtotalCents).toBe(expectedSubtotal)
+    expect(result.totalCents).toBe(expectedSubtotal + Math.round(expectedSubtotal * 0.2))
+    expect(elapsedMs).toBeLessThan(250)
+  })
+})
+
+// Test Suite 8: FX Rates
+describe('FX conversion', () => {
+  const fixtureRates = fxFixture.rates
+
+  test('should convert whole arrays with one rate lookup', () => {
+    const result = convertCurrencyMany([1000, 2500, 0], 'USD', 'MYR', fixtureRates)
+
+    expect(Array.from(result)).toEqual([4500, 11250, 0])
+  })
+
+  test('should normalize mixed currencies to USD cents', () => {
+    const result = toUsdCentsMany([4500, 1250, 1000], ['MYR', 'SGD', 'USD'], fixtureRates)
+
+    expect(Array.from(result)).toEqual([1000, 1000, 1000])
+  })
+
+  test('should use explicit rates in convertCurrency', () => {
+    expect(convertCurrency(1000, 'USD', 'SGD', fixtureRates)).toBe(1250)
+  })
+
+  test('should price mixed-currency items in a target currency', () => {
+    const items = [
+      { deliverable_type: 'IG_Reel', qty: 1, unit_price_cents: 5000, currency: 'USD' },
+      { deliverable_type: 'IG_Story', qty: 1, unit_price_cents: 4700, currency: 'MYR' }
+    ]
+
+    const result = calculatePricing(items, 20, 'USD')
+
+    expect(result.currency).toBe('USD')
+    expect(result.subtotalCents).toBe(6000) // RM47 = $10 at the default 4.7 rate
+    expect(result.breakdown[1].unit_price_cents).toBe(1000)
+  })
+})
+
 // Run all tests
 console.log('Starting Cost Estimator Tests...')
\ No newline at end of file
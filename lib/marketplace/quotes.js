@@ -0,0 +1,176 @@
+// lib/marketplace/quotes.js
+// Server-priced offer quotes: items priced against cached rate cards and the current platform fee,
+// returned with a short-lived HMAC-signed token that offer creation can trust as-is
+
+import crypto from 'crypto'
+import { getCreatorRateCards } from '@/lib/marketplace/rate-cards'
+import { getPlatformFeePct } from '@/lib/marketplace/platform-settings'
+import { loadFxRates } from '@/lib/marketplace/fx-rates'
+import {
+  calculatePricing,
+  createRateCardIndex,
+  findRateCard,
+  applyRushPricing,
+  convertCurrency,
+  CURRENCIES,
+  DELIVERABLE_TYPES
+} from '@/lib/marketplace/pricing'
+
+export const QUOTE_TTL_MS = 15 * 60 * 1000
+const MAX_QUOTE_ITEMS = 20
+
+// QUOTE_SIGNING_SECRET should be set per environment; the service key is a server-only fallback
+const getSigningSecret = () => process.env.QUOTE_SIGNING_SECRET || process.env.SUPABASE_SERVICE_ROLE_KEY || null
+
+const sign = (encodedPayload, secret) =>
+  crypto.createHmac('sha256', secret).update(encodedPayload).digest('base64url')
+
+/**
+ * Normalize a quote request body
+ * @param {Object} body - { creator_id, campaign_id, brand_id, items: [{ deliverable_type, qty, rush_pct }], currency }
+ * @returns {Object} Request, or { error }
+ */
+export const parseQuoteRequest = (body = {}) => {
+  const { creator_id, campaign_id, brand_id, items, currency } = body
+
+  if (!creator_id) return { error: 'creator_id is required' }
+  if (!campaign_id || !brand_id) return { error: 'campaign_id and brand_id are required' }
+  if (!Array.isArray(items) || items.length === 0) return { error: 'items must be a non-empty array' }
+  if (items.length > MAX_QUOTE_ITEMS) return { error: `At most ${MAX_QUOTE_ITEMS} items per quote` }
+  if (currency && !Object.values(CURRENCIES).includes(currency)) return { error: `Invalid currency: ${currency}` }
+
+  const selections = []
+  for (const [index, item] of items.entries()) {
+    const qty = Number(item.qty ?? item.quantity ?? 1)
+    const rushPct = Number(item.rush_pct ?? 0)
+
+    if (!Object.values(DELIVERABLE_TYPES).includes(item.deliverable_type)) {
+      return { error: `Item ${index + 1}: invalid deliverable type` }
+    }
+    if (!Number.isInteger(qty) || qty <= 0) return { error: `Item ${index + 1}: quantity must be a positive integer` }
+    if (isNaN(rushPct) || rushPct < 0 || rushPct > 200) return { error: `Item ${index + 1}: rush_pct must be between 0 and 200` }
+
+    selections.push({ deliverableType: item.deliverable_type, qty, rushPct, currency: item.currency || null })
+  }
+
+  return { creatorId: creator_id, campaignId: campaign_id, brandId: brand_id, currency: currency || null, selections }
+}
+
+/**
+ * Price a quote request against the creator's rate cards, the platform fee and the fx_rates rates
+ * Rush applies only to lines that select it; each item keeps its pre-rush base price
+ * @param {Object} client - Supabase client
+ * @param {Object} request - Output of parseQuoteRequest
+ * @returns {Object} { data: { items, pricing }, error }
+ */
+export const priceQuote = async (client, request) => {
+  const [rateCardResult, platformFeePct, fxResult] = await Promise.all([
+    getCreatorRateCards(client, request.creatorId),
+    getPlatformFeePct(client),
+    loadFxRates(client)
+  ])
+  if (rateCardResult.error) return { data: null, error: rateCardResult.error }
+
+  const index = createRateCardIndex(rateCardResult.data.rateCards)
+  const items = []
+  for (const selection of request.selections) {
+    const rateCard = findRateCard(index, request.creatorId, selection.deliverableType, selection.currency)
+    if (!rateCard) {
+      return {
+        data: null,
+        error: { message: `Rate card not found for ${selection.deliverableType}`, status: 422 }
+      }
+    }
+
+    // Convert before rush so base_price_cents x (1 + rush) reproduces the unit price
+    const cardCurrency = rateCard.currency || 'USD'
+    const currency = request.currency || cardCurrency
+    const basePriceCents = convertCurrency(rateCard.base_price_cents, cardCurrency, currency, fxResult.data)
+    const rushPct = selection.rushPct > 0 ? selection.rushPct : 0
+
+    items.push({
+      deliverable_type: selection.deliverableType,
+      qty: selection.qty,
+      base_price_cents: basePriceCents,
+      unit_price_cents: applyRushPricing(basePriceCents, rushPct),
+      rush_pct: rushPct,
+      currency
+    })
+  }
+
+  try {
+    return { data: { items, pricing: calculatePricing(items, platformFeePct) }, error: null }
+  } catch (err) {
+    return { data: null, error: { message: err.message, status: 422 } }
+  }
+}
+
+/**
+ * Price a quote request and sign the result
+ * The signed quote is bound to the creator, campaign and brand it was requested for
+ * @param {Object} client - Supabase client
+ * @param {Object} request - Output of parseQuoteRequest
+ * @returns {Object} { data: { quote, token }, error }
+ */
+export const createQuote = async (client, request) => {
+  const secret = getSigningSecret()
+  if (!secret) {
+    return { data: null, error: { message: 'Quote signing is not configured', status: 503 } }
+  }
+
+  const { data: priced, error } = await priceQuote(client, request)
+  if (error) return { data: null, error }
+
+  const { items, pricing } = priced
+  const quote = {
+    creator_id: request.creatorId,
+    campaign_id: request.campaignId,
+    brand_id: request.brandId,
+    items: pricing.breakdown.map((line, i) => ({
+      ...line,
+      base_price_cents: items[i].base_price_cents,
+      rush_pct: items[i].rush_pct
+    })),
+    subtotal_cents: pricing.subtotalCents,
+    platform_fee_pct: pricing.platformFeePct,
+    platform_fee_cents: pricing.platformFeeCents,
+    total_cents: pricing.totalCents,
+    currency: pricing.currency,
+    expires_at: new Date(Date.now() + QUOTE_TTL_MS).toISOString()
+  }
+
+  const encoded = Buffer.from(JSON.stringify(quote)).toString('base64url')
+  return { data: { quote, token: `${encoded}.${sign(encoded, secret)}` }, error: null }
+}
+
+/**
+ * Verify a quote token's signature and expiry
+ * @param {String} token - Token from createQuote
+ * @returns {Object} { data: quote, error }
+ */
+export const verifyQuoteToken = (token) => {
+  const secret = getSigningSecret()
+  if (!secret) return { data: null, error: { message: 'Quote signing is not configured', status: 503 } }
+
+  const [encoded, signature] = String(token || '').split('.')
+  if (!encoded || !signature) return { data: null, error: { message: 'Malformed quote token', status: 400 } }
+
+  const expected = Buffer.from(sign(encoded, secret))
+  const provided = Buffer.from(signature)
+  if (expected.length !== provided.length || !crypto.timingSafeEqual(expected, provided)) {
+    return { data: null, error: { message: 'Invalid quote token', status: 400 } }
+  }
+
+  let quote
+  try {
+    quote = JSON.parse(Buffer.from(encoded, 'base64url').toString('utf8'))
+  } catch (e) {
+    return { data: null, error: { message: 'Malformed quote token', status: 400 } }
+  }
+
+  if (new Date(quote.expires_at).getTime() <= Date.now()) {
+    return { data: null, error: { message: 'Quote has expired', status: 410 } }
+  }
+
+  return { data: quote, error: null }
+}
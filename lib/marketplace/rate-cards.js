@@ -0,0 +1,146 @@
+// lib/marketplace/rate-cards.js
+// Server-side rate card reads backed by the shared read-through cache
+
+import { createServerCache } from '@/lib/server-cache'
+import { fetchTableVersion } from '@/lib/http-cache'
+import { DEFAULT_PAGE_SIZE, decodeCursor, isUuid, parseLimit, toPage } from '@/lib/pagination'
+import { DELIVERABLE_TYPES } from '@/lib/marketplace/pricing'
+
+const rateCardCache = createServerCache('rate_cards', {
+  maxEntries: 1000,
+  ttlMs: 5 * 60 * 1000
+})
+
+const creatorKey = (creatorId) => `creator:${creatorId}`
+
+/**
+ * Get a creator's active rate cards through the server cache
+ * Every read checks the table fingerprint first: writes handled by other route bundles or
+ * instances can't invalidate this process's LRU, so a cached list is served only while its
+ * version still matches
+ * @param {Object} client - Supabase client
+ * @param {String} creatorId - Creator profile ID
+ * @returns {Object} { data: { rateCards, version }, error, cacheHit }
+ */
+export const getCreatorRateCards = async (client, creatorId) => {
+  const key = creatorKey(creatorId)
+  const applyFilters = (query) => query.eq('active', true).eq('creator_id', creatorId)
+
+  const versionResult = await fetchTableVersion(client, 'rate_cards', applyFilters)
+  if (versionResult.error) {
+    return { data: null, error: versionResult.error, cacheHit: false }
+  }
+  const version = versionResult.data
+
+  const load = async () => {
+    const { data, error } = await applyFilters(client.from('rate_cards').select('*'))
+      .order('created_at', { ascending: false })
+    if (error) return { data: undefined, error }
+    return { data: { rateCards: data || [], version }, error: null }
+  }
+
+  const result = await rateCardCache.wrap(key, load)
+  if (!result.cacheHit || result.data.version === version) return result
+
+  await rateCardCache.invalidate(key)
+  return rateCardCache.wrap(key, load)
+}
+
+/**
+ * Drop a creator's cached rate cards after a write (local and shared backend)
+ * @param {String} creatorId - Creator profile ID
+ */
+export const invalidateCreatorRateCards = async (creatorId) => {
+  if (!creatorId) return
+  await rateCardCache.invalidate(creatorKey(creatorId))
+}
+
+/**
+ * Hit/miss stats for this instance's rate card cache (each route bundle has its own)
+ */
+export const getRateCardCacheStats = () => rateCardCache.stats()
+
+// ====================================
+// BUDGET SEARCH
+// ====================================
+
+const PRICE_SEARCH_SELECT = `
+  id, creator_id, deliverable_type, base_price_cents, currency, rush_pct, price_usd_cents,
+  creator:profiles!creator_id(id, full_name, profile_picture, category_tags)
+`
+
+const parseCents = (value) => {
+  if (value === null || value === undefined || value === '') return null
+  const cents = parseInt(value, 10)
+  return Number.isFinite(cents) && cents >= 0 ? cents : NaN
+}
+
+/**
+ * Normalize rate card budget search params (min_usd_cents, max_usd_cents, deliverable_type)
+ * @returns {Object|null} Params, { error } when invalid, or null when no price filter was given
+ */
+export const parsePriceSearchParams = (searchParams) => {
+  const minUsdCents = parseCents(searchParams.get('min_usd_cents'))
+  const maxUsdCents = parseCents(searchParams.get('max_usd_cents'))
+  if (minUsdCents === null && maxUsdCents === null) return null
+
+  if (Number.isNaN(minUsdCents) || Number.isNaN(maxUsdCents)) {
+    return { error: 'min_usd_cents and max_usd_cents must be non-negative integers' }
+  }
+
+  const deliverableType = searchParams.get('deliverable_type')
+  if (!Object.values(DELIVERABLE_TYPES).includes(deliverableType)) {
+    return { error: 'deliverable_type is required for price search' }
+  }
+
+  return {
+    deliverableType,
+    minUsdCents,
+    maxUsdCents,
+    cursor: searchParams.get('cursor') || null,
+    limit: parseLimit(searchParams.get('limit'), DEFAULT_PAGE_SIZE)
+  }
+}
+
+/**
+ * Active rate cards of one deliverable type within a USD budget, cheapest first, across all creators
+ * Served by idx_rate_cards_type_usd_price as a single range scan
+ * @param {Object} client - Supabase client
+ * @param {Object} params - Output of parsePriceSearchParams
+ * @returns {Object} { data: { rateCards, nextCursor }, error }
+ */
+export const searchRateCardsByPrice = async (client, params) => {
+  const cursor = decodeCursor(params.cursor, 2)
+  if (params.cursor && !cursor) {
+    return { data: null, error: { message: 'Invalid cursor', status: 400 } }
+  }
+
+  let query = client
+    .from('rate_cards')
+    .select(PRICE_SEARCH_SELECT)
+    .eq('active', true)
+    .eq('deliverable_type', params.deliverableType)
+    .not('price_usd_cents', 'is', null)
+
+  if (params.minUsdCents !== null) query = query.gte('price_usd_cents', params.minUsdCents)
+  if (params.maxUsdCents !== null) query = query.lte('price_usd_cents', params.maxUsdCents)
+
+  if (cursor) {
+    // Cursor values go into the or() filter string, so only an integer price and a UUID pass
+    const [price, id] = cursor
+    if (!Number.isInteger(price) || !isUuid(id)) {
+      return { data: null, error: { message: 'Invalid cursor', status: 400 } }
+    }
+    query = query.or(`price_usd_cents.gt.${price},and(price_usd_cents.eq.${price},id.gt."${id}")`)
+  }
+
+  const { data, error } = await query
+    .order('price_usd_cents', { ascending: true })
+    .order('id', { ascending: true })
+    .limit(params.limit + 1)
+
+  if (error) return { data: null, error }
+
+  const { items, nextCursor } = toPage(data, params.limit, row => [row.price_usd_cents, row.id])
+  return { data: { rateCards: items, nextCursor }, error: null }
+}
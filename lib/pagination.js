@@ -0,0 +1,84 @@
+// lib/pagination.js
+// Opaque keyset cursors shared by the paginated list APIs
+
+export const DEFAULT_PAGE_SIZE = 20
+export const MAX_PAGE_SIZE = 100
+
+const UUID_PATTERN = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i
+// ISO 8601 timestamps as PostgREST returns them, e.g. 2025-08-12T10:00:00.123456+00:00
+const TIMESTAMP_PATTERN = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{1,6})?(Z|[+-]\d{2}:?\d{2})?$/
+
+export const isUuid = (value) => typeof value === 'string' && UUID_PATTERN.test(value)
+
+export const isTimestamp = (value) =>
+  typeof value === 'string' && TIMESTAMP_PATTERN.test(value) && !isNaN(Date.parse(value))
+
+/**
+ * Encode a row's sort key values (e.g. [created_at, id]) as an opaque cursor
+ */
+export const encodeCursor = (values) => {
+  if (!values) return null
+  return Buffer.from(JSON.stringify(values)).toString('base64url')
+}
+
+/**
+ * Decode a cursor produced by encodeCursor
+ * @param {String} cursor - Cursor from the client
+ * @param {Number} length - Expected number of sort key values
+ * @returns {Array|null} Sort key values, or null when the cursor is missing or malformed
+ */
+export const decodeCursor = (cursor, length) => {
+  if (!cursor) return null
+  try {
+    const values = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'))
+    if (!Array.isArray(values) || values.length !== length) return null
+    if (values.some(value => value === null || value === undefined)) return null
+    return values
+  } catch (e) {
+    return null
+  }
+}
+
+/**
+ * Decode a (created_at, id) cursor, rejecting values that are not a timestamp and a UUID
+ * Cursors come from the client and end up in PostgREST filter strings, so they are validated here
+ * @returns {Array|null} [createdAt, id], or null when the cursor is missing or invalid
+ */
+export const decodeCreatedAtCursor = (cursor) => {
+  const values = decodeCursor(cursor, 2)
+  if (!values) return null
+  const [createdAt, id] = values
+  return isTimestamp(createdAt) && isUuid(id) ? values : null
+}
+
+/**
+ * Parse ?limit= with a default and an upper bound
+ */
+export const parseLimit = (value, fallback = DEFAULT_PAGE_SIZE, max = MAX_PAGE_SIZE) => {
+  const limit = parseInt(value, 10)
+  return Number.isFinite(limit) && limit > 0 ? Math.min(limit, max) : fallback
+}
+
+/**
+ * PostgREST filter for "rows after (created_at, id)" in created_at DESC, id DESC order
+ * Values are quoted so timestamps survive the or() syntax; only pass cursors from decodeCreatedAtCursor
+ */
+export const createdAtKeysetFilter = ([createdAt, id]) => {
+  if (!isTimestamp(createdAt) || !isUuid(id)) throw new Error('Invalid keyset cursor')
+  return `created_at.lt."${createdAt}",and(created_at.eq."${createdAt}",id.lt."${id}")`
+}
+
+/**
+ * Split a limit + 1 fetch into the page and the cursor for the next one
+ * @param {Array} rows - Rows fetched with limit + 1
+ * @param {Number} limit - Page size
+ * @param {Function} sortKey - row => sort key values for the cursor
+ */
+export const toPage = (rows, limit, sortKey) => {
+  const items = (rows || []).slice(0, limit)
+  const hasMore = (rows || []).length > limit
+  return {
+    items,
+    nextCursor: hasMore && items.length > 0 ? encodeCursor(sortKey(items[items.length - 1])) : null
+  }
+}
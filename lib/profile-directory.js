@@ -0,0 +1,88 @@
+// lib/profile-directory.js
+// Paginated profile directory: role/category filters, name prefix search, keyset cursors
+
+import { projection } from '@/lib/projections'
+import { decodeCreatedAtCursor, parseLimit, toPage, createdAtKeysetFilter } from '@/lib/pagination'
+
+const DIRECTORY_PAGE_SIZE = 24
+const DIRECTORY_VIEWS = ['card', 'detail', 'admin']
+// Views that expose email and moderation fields
+const PRIVILEGED_VIEWS = ['detail', 'admin']
+const ROLES = ['creator', 'brand', 'admin']
+
+// Escape LIKE wildcards so a search for '50%' matches literally
+const escapeLike = (value) => value.replace(/[\\%_]/g, match => `\\${match}`)
+
+/**
+ * Normalize directory query params
+ * @returns {Object} Params, or { error } when a filter value is not allowed
+ */
+export const parseDirectoryParams = (searchParams) => {
+  const role = searchParams.get('role') || null
+  if (role && !ROLES.includes(role)) {
+    return { error: `Invalid role: ${role}` }
+  }
+
+  const view = searchParams.get('view') || 'card'
+  if (!DIRECTORY_VIEWS.includes(view)) {
+    return { error: `Invalid view: ${view}` }
+  }
+
+  return {
+    role,
+    view,
+    category: searchParams.get('category') || null,
+    namePrefix: (searchParams.get('q') || '').trim().toLowerCase() || null,
+    cursor: searchParams.get('cursor') || null,
+    limit: parseLimit(searchParams.get('limit'), DIRECTORY_PAGE_SIZE)
+  }
+}
+
+export const isPrivilegedView = (view) => PRIVILEGED_VIEWS.includes(view)
+
+/**
+ * Scope a privileged view to the caller's session
+ * Admins see every row; other signed-in users only their own profile; anonymous callers fall back to card
+ * @param {Object} params - Output of parseDirectoryParams
+ * @param {Object} access - Output of verifyUserAccess
+ * @returns {Object} Params safe to pass to listProfiles
+ */
+export const scopeDirectoryParams = (params, access) => {
+  if (!isPrivilegedView(params.view)) return params
+  if (!access?.success) return { ...params, view: 'card' }
+  if (access.profile.role === 'admin') return params
+  return { ...params, ownerId: access.user.id }
+}
+
+/**
+ * Fetch one directory page, newest first
+ * @param {Object} client - Supabase client
+ * @param {Object} params - Output of parseDirectoryParams
+ * @returns {Object} { data: { profiles, nextCursor }, error }
+ */
+export const listProfiles = async (client, params) => {
+  const cursor = decodeCreatedAtCursor(params.cursor)
+  if (params.cursor && !cursor) {
+    return { data: null, error: { message: 'Invalid cursor', status: 400 } }
+  }
+
+  let query = client
+    .from('profiles')
+    .select(projection('profile', params.view))
+
+  if (params.ownerId) query = query.eq('id', params.ownerId)
+  if (params.role) query = query.eq('role', params.role)
+  if (params.category) query = query.contains('category_tags', [params.category])
+  if (params.namePrefix) query = query.like('full_name_lower', `${escapeLike(params.namePrefix)}%`)
+  if (cursor) query = query.or(createdAtKeysetFilter(cursor))
+
+  const { data, error } = await query
+    .order('created_at', { ascending: false })
+    .order('id', { ascending: false })
+    .limit(params.limit + 1)
+
+  if (error) return { data: null, error }
+
+  const { items, nextCursor } = toPage(data, params.limit, row => [row.created_at, row.id])
+  return { data: { profiles: items, nextCursor }, error: null }
+}
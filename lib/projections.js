@@ -0,0 +1,92 @@
+// lib/projections.js
+// Named column projections per view, plus payload-size instrumentation for list reads
+
+/**
+ * Column presets by entity and view:
+ *   card   - list rows and pickers (only what a card renders)
+ *   detail - a single record's full page
+ *   admin  - admin tables (identity and moderation fields)
+ * Only existing columns may appear here - PostgREST rejects unknown ones
+ */
+export const PROJECTIONS = {
+  profile: {
+    card: 'id, full_name, company_name, profile_picture, role, category_tags, created_at',
+    detail: 'id, full_name, company_name, email, role, profile_picture, bio, category_tags, website_url, social_links, media_kit_url, industry, created_at',
+    admin: 'id, full_name, company_name, email, role, is_suspended, warning_count, created_at'
+  },
+  // Applicant profile embedded in an application
+  applicant: {
+    card: 'full_name, profile_picture, category_tags, website_url, media_kit_url',
+    detail: 'full_name, bio, profile_picture, social_links, category_tags, website_url, media_kit_url'
+  },
+  // Campaign embedded in a creator's own applications
+  applicationCampaign: {
+    card: 'id, title, deadline, status, profiles!campaigns_brand_id_fkey (full_name, company_name)'
+  },
+  offer: {
+    card: `
+      *,
+      campaign:campaigns(id, title),
+      brand:brand_id(id, full_name, company_name),
+      creator:creator_id(id, full_name, profile_picture)
+    `,
+    detail: `
+      *,
+      campaign:campaigns(id, title, description),
+      brand:brand_id(id, full_name, company_name, email),
+      creator:creator_id(id, full_name, profile_picture, email),
+      payments(id, status, stripe_session_id, amount_cents, currency)
+    `
+  }
+}
+
+/**
+ * Resolve a preset, falling back to the entity's card view for unknown view names
+ */
+export const projection = (entity, view = 'card') => {
+  const presets = PROJECTIONS[entity]
+  if (!presets) throw new Error(`Unknown projection entity: ${entity}`)
+  return presets[view] || presets.card
+}
+
+// ====================================
+// PAYLOAD SIZE INSTRUMENTATION
+// ====================================
+
+const payloadStats = new Map() // label -> { count, rows, totalBytes, maxBytes, lastBytes }
+
+/**
+ * Record the serialized size of a read result under a label (e.g. 'api:profiles:card')
+ * @returns {Number} Size in bytes
+ */
+export const recordPayload = (label, data) => {
+  let bytes = 0
+  try {
+    bytes = new TextEncoder().encode(JSON.stringify(data ?? null)).length
+  } catch (e) {
+    return 0
+  }
+
+  const stats = payloadStats.get(label) || { count: 0, rows: 0, totalBytes: 0, maxBytes: 0, lastBytes: 0 }
+  stats.count++
+  stats.rows += Array.isArray(data) ? data.length : 1
+  stats.totalBytes += bytes
+  stats.maxBytes = Math.max(stats.maxBytes, bytes)
+  stats.lastBytes = bytes
+  payloadStats.set(label, stats)
+
+  if (process.env.NODE_ENV === 'development') {
+    console.log(`📦 Payload ${label}: ${bytes} bytes${Array.isArray(data) ? ` for ${data.length} rows` : ''}`)
+  }
+  return bytes
+}
+
+/**
+ * Payload stats per label, with average bytes per request and per row
+ */
+export const getPayloadStats = () => [...payloadStats.entries()].map(([label, stats]) => ({
+  label,
+  ...stats,
+  avgBytes: stats.count ? Math.round(stats.totalBytes / stats.count) : 0,
+  avgBytesPerRow: stats.rows ? Math.round(stats.totalBytes / stats.rows) : 0
+}))
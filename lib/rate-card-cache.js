@@ -1,40 +1,44 @@
 /**
  * Rate Card Cache Management Utility
- * Handles localStorage caching for rate card data with proper CRUD operations
+ * Handles client-side caching for rate card data with proper CRUD operations
+ * Backed by the normalized client cache (IndexedDB + in-memory hot copy)
  */
 
+import {
+  getList,
+  setList,
+  upsertRecord,
+  patchRecord,
+  removeRecord,
+  deleteList,
+  clearByPrefix,
+  hydrateClientCache,
+  readListSWR
+} from '@/lib/client-cache'
+
 const CACHE_KEYS = {
-  RATE_CARDS: 'creator_rate_cards_cache',
-  TIMESTAMP: 'creator_rate_cards_cache_time'
+  RATE_CARDS: 'creator_rate_cards'
 }
 
+const COLLECTION = 'rate_cards'
+
 const CACHE_DURATION = 2 * 60 * 1000 // 2 minutes (shorter for better consistency)
 
+const listKey = (creatorId) => `${CACHE_KEYS.RATE_CARDS}:${creatorId}`
+
 /**
  * Get rate cards from cache
+ * Stale entries are still returned so pages can render while a refresh runs
  */
 export const getCachedRateCards = (creatorId) => {
   if (typeof window === 'undefined') return null
-  
-  try {
-    const cached = localStorage.getItem(`${CACHE_KEYS.RATE_CARDS}_${creatorId}`)
-    const timestamp = localStorage.getItem(`${CACHE_KEYS.TIMESTAMP}_${creatorId}`)
-    
-    if (!cached || !timestamp) return null
-    
-    const cacheAge = Date.now() - parseInt(timestamp)
-    if (cacheAge > CACHE_DURATION) {
-      console.log('🕒 Rate card cache expired, needs refresh')
-      clearRateCardCache(creatorId)
-      return null
-    }
-    
-    console.log('✅ Using cached rate cards (age:', Math.round(cacheAge / 1000), 'seconds)')
-    return JSON.parse(cached)
-  } catch (e) {
-    console.warn('Failed to get cached rate cards:', e)
-    return null
-  }
+
+  const cached = getList(listKey(creatorId), CACHE_DURATION)
+  if (!cached) return null
+
+  const cacheAge = Date.now() - cached.fetchedAt
+  console.log(cached.isStale ? '🕒 Serving stale rate cards while refreshing' : '✅ Using cached rate cards', '(age:', Math.round(cacheAge / 1000), 'seconds)')
+  return cached.items
 }
 
 /**
@@ -42,14 +46,9 @@ export const getCachedRateCards = (creatorId) => {
  */
 export const updateRateCardsCache = (creatorId, rateCards) => {
   if (typeof window === 'undefined') return
-  
-  try {
-    localStorage.setItem(`${CACHE_KEYS.RATE_CARDS}_${creatorId}`, JSON.stringify(rateCards))
-    localStorage.setItem(`${CACHE_KEYS.TIMESTAMP}_${creatorId}`, Date.now().toString())
-    console.log('💾 Rate cards cache updated with', rateCards.length, 'rate cards for creator', creatorId)
-  } catch (e) {
-    console.warn('Failed to update rate cards cache:', e)
-  }
+
+  setList(listKey(creatorId), COLLECTION, rateCards)
+  console.log('💾 Rate cards cache updated with', rateCards.length, 'rate cards for creator', creatorId)
 }
 
 /**
@@ -57,20 +56,12 @@ export const updateRateCardsCache = (creatorId, rateCards) => {
  */
 export const removeRateCardFromCache = (creatorId, rateCardId) => {
   if (typeof window === 'undefined') return
-  
-  try {
-    const cached = getCachedRateCards(creatorId)
-    if (!cached) return null
-    
-    const updatedRateCards = cached.filter(card => card.id !== rateCardId)
-    updateRateCardsCache(creatorId, updatedRateCards)
-    
-    console.log('🗑️ Rate card', rateCardId, 'removed from cache for creator', creatorId)
-    return updatedRateCards
-  } catch (e) {
-    console.warn('Failed to remove rate card from cache:', e)
-    return null
-  }
+
+  if (!getList(listKey(creatorId))) return null
+
+  removeRecord(COLLECTION, rateCardId)
+  console.log('🗑️ Rate card', rateCardId, 'removed from cache for creator', creatorId)
+  return getList(listKey(creatorId))?.items || []
 }
 
 /**
@@ -78,18 +69,10 @@ export const removeRateCardFromCache = (creatorId, rateCardId) => {
  */
 export const addRateCardToCache = (creatorId, rateCard) => {
   if (typeof window === 'undefined') return
-  
-  try {
-    const cached = getCachedRateCards(creatorId) || []
-    const updatedRateCards = [...cached, rateCard]
-    updateRateCardsCache(creatorId, updatedRateCards)
-    
-    console.log('➕ Rate card', rateCard.id, 'added to cache for creator', creatorId)
-    return updatedRateCards
-  } catch (e) {
-    console.warn('Failed to add rate card to cache:', e)
-    return null
-  }
+
+  upsertRecord(COLLECTION, rateCard, { listKey: listKey(creatorId), position: 'end' })
+  console.log('➕ Rate card', rateCard.id, 'added to cache for creator', creatorId)
+  return getList(listKey(creatorId))?.items || []
 }
 
 /**
@@ -97,29 +80,15 @@ export const addRateCardToCache = (creatorId, rateCard) => {
  */
 export const updateRateCardInCache = (creatorId, rateCardId, updatedRateCard) => {
   if (typeof window === 'undefined') return
-  
-  try {
-    const cached = getCachedRateCards(creatorId)
-    if (!cached) return null
-    
-    const cardIndex = cached.findIndex(card => card.id === rateCardId)
-    if (cardIndex === -1) {
-      console.warn('Rate card not found in cache for update:', rateCardId)
-      return null
-    }
-    
-    // Update the rate card in the cache array
-    const updatedRateCards = [...cached]
-    updatedRateCards[cardIndex] = { ...cached[cardIndex], ...updatedRateCard }
-    
-    updateRateCardsCache(creatorId, updatedRateCards)
-    
-    console.log('✏️ Rate card', rateCardId, 'updated in cache for creator', creatorId)
-    return updatedRateCards
-  } catch (e) {
-    console.warn('Failed to update rate card in cache:', e)
+
+  const record = patchRecord(COLLECTION, rateCardId, updatedRateCard)
+  if (!record) {
+    console.warn('Rate card not found in cache for update:', rateCardId)
     return null
   }
+
+  console.log('✏️ Rate card', rateCardId, 'updated in cache for creator', creatorId)
+  return getList(listKey(creatorId))?.items || null
 }
 
 /**
@@ -127,14 +96,9 @@ export const updateRateCardInCache = (creatorId, rateCardId, updatedRateCard) =>
  */
 export const clearRateCardCache = (creatorId) => {
   if (typeof window === 'undefined') return
-  
-  try {
-    localStorage.removeItem(`${CACHE_KEYS.RATE_CARDS}_${creatorId}`)
-    localStorage.removeItem(`${CACHE_KEYS.TIMESTAMP}_${creatorId}`)
-    console.log('🧹 Rate card cache cleared for creator', creatorId)
-  } catch (e) {
-    console.warn('Failed to clear rate card cache:', e)
-  }
+
+  deleteList(listKey(creatorId))
+  console.log('🧹 Rate card cache cleared for creator', creatorId)
 }
 
 /**
@@ -142,22 +106,9 @@ export const clearRateCardCache = (creatorId) => {
  */
 export const clearAllRateCardCaches = () => {
   if (typeof window === 'undefined') return
-  
-  try {
-    // Get all localStorage keys and remove rate card cache keys
-    const keysToRemove = []
-    for (let i = 0; i < localStorage.length; i++) {
-      const key = localStorage.key(i)
-      if (key?.includes('creator_rate_cards_cache')) {
-        keysToRemove.push(key)
-      }
-    }
-    
-    keysToRemove.forEach(key => localStorage.removeItem(key))
-    console.log('🧹 All rate card caches cleared')
-  } catch (e) {
-    console.warn('Failed to clear all rate card caches:', e)
-  }
+
+  clearByPrefix(`${CACHE_KEYS.RATE_CARDS}:`)
+  console.log('🧹 All rate card caches cleared')
 }
 
 /**
@@ -165,14 +116,22 @@ export const clearAllRateCardCaches = () => {
  */
 export const isRateCardCacheFresh = (creatorId) => {
   if (typeof window === 'undefined') return false
-  
-  try {
-    const timestamp = localStorage.getItem(`${CACHE_KEYS.TIMESTAMP}_${creatorId}`)
-    if (!timestamp) return false
-    
-    const cacheAge = Date.now() - parseInt(timestamp)
-    return cacheAge < CACHE_DURATION
-  } catch (e) {
-    return false
-  }
-}
\ No newline at end of file
+
+  const cached = getList(listKey(creatorId), CACHE_DURATION)
+  return !!cached && !cached.isStale
+}
+
+/**
+ * Wait for persisted rate cards to load into memory (IndexedDB hydration)
+ */
+export const loadRateCardCache = () => hydrateClientCache()
+
+/**
+ * Stale-while-revalidate read for a creator's rate cards
+ * @param {String} creatorId - Creator profile ID
+ * @param {Function} fetcher - async () => rate cards array
+ * @param {Object} options - { force }
+ */
+export const readRateCardsSWR = (creatorId, fetcher, options = {}) => {
+  return readListSWR(listKey(creatorId), COLLECTION, fetcher, { maxAgeMs: CACHE_DURATION, ...options })
+}
@@ -0,0 +1,229 @@
+// lib/server-cache.js
+// Server-side read-through cache: in-process LRU with an optional shared Redis (Upstash REST) backend
+
+const DEFAULT_MAX_ENTRIES = 500
+const DEFAULT_TTL_MS = 60 * 1000
+
+// Registry of named caches so stats can be reported from one place
+const caches = new Map()
+
+/**
+ * Minimal LRU map with per-entry expiry (Map preserves insertion order)
+ */
+export class LRUCache {
+  constructor({ maxEntries = DEFAULT_MAX_ENTRIES, ttlMs = DEFAULT_TTL_MS } = {}) {
+    this.maxEntries = maxEntries
+    this.ttlMs = ttlMs
+    this.entries = new Map()
+  }
+
+  get(key) {
+    const entry = this.entries.get(key)
+    if (!entry) return undefined
+
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key)
+      return undefined
+    }
+
+    // Re-insert to mark as most recently used
+    this.entries.delete(key)
+    this.entries.set(key, entry)
+    return entry.value
+  }
+
+  set(key, value, ttlMs = this.ttlMs) {
+    this.entries.delete(key)
+    this.entries.set(key, { value, expiresAt: Date.now() + ttlMs })
+
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value)
+    }
+  }
+
+  delete(key) {
+    return this.entries.delete(key)
+  }
+
+  clear() {
+    this.entries.clear()
+  }
+
+  get size() {
+    return this.entries.size
+  }
+}
+
+/**
+ * Shared backend over the Upstash Redis REST API - enabled when UPSTASH_REDIS_REST_URL/TOKEN are set
+ * Failures are logged and treated as misses so the database stays the source of truth
+ */
+const getSharedBackend = () => {
+  const url = process.env.UPSTASH_REDIS_REST_URL
+  const token = process.env.UPSTASH_REDIS_REST_TOKEN
+
+  if (!url || !token) return null
+
+  const command = async (args) => {
+    const response = await fetch(url, {
+      method: 'POST',
+      headers: { Authorization: `Bearer ${token}`, 'Content-Type': 'application/json' },
+      body: JSON.stringify(args),
+      cache: 'no-store'
+    })
+    if (!response.ok) {
+      throw new Error(`Shared cache request failed: ${response.status}`)
+    }
+    const { result } = await response.json()
+    return result
+  }
+
+  return {
+    get: async (key) => {
+      const raw = await command(['GET', key])
+      return raw ? JSON.parse(raw) : undefined
+    },
+    set: (key, value, ttlMs) => command(['SET', key, JSON.stringify(value), 'PX', String(ttlMs)]),
+    delete: (key) => command(['DEL', key])
+  }
+}
+
+/**
+ * Create (or reuse) a named server cache
+ * @param {String} namespace - Cache name, also used as the shared key prefix
+ * @param {Object} options - { maxEntries, ttlMs }
+ * @returns {Object} Cache API: wrap, get, set, invalidate, stats
+ */
+export const createServerCache = (namespace, options = {}) => {
+  if (caches.has(namespace)) return caches.get(namespace)
+
+  const local = new LRUCache(options)
+  const ttlMs = options.ttlMs || DEFAULT_TTL_MS
+  const shared = getSharedBackend()
+  const inflight = new Map()
+  const generations = new Map()
+  const metrics = {
+    hits: 0,
+    sharedHits: 0,
+    misses: 0,
+    errors: 0,
+    invalidations: 0,
+    loadCount: 0,
+    loadTotalMs: 0,
+    loadMaxMs: 0
+  }
+
+  const sharedKey = (key) => `spark:${namespace}:${key}`
+
+  const get = async (key) => {
+    const value = local.get(key)
+    if (value !== undefined) {
+      metrics.hits++
+      return value
+    }
+
+    if (shared) {
+      try {
+        const sharedValue = await shared.get(sharedKey(key))
+        if (sharedValue !== undefined) {
+          metrics.sharedHits++
+          local.set(key, sharedValue)
+          return sharedValue
+        }
+      } catch (e) {
+        metrics.errors++
+        console.warn(`Shared cache read failed for ${namespace}:`, e.message)
+      }
+    }
+
+    metrics.misses++
+    return undefined
+  }
+
+  const set = async (key, value) => {
+    local.set(key, value)
+    if (shared) {
+      try {
+        await shared.set(sharedKey(key), value, ttlMs)
+      } catch (e) {
+        metrics.errors++
+        console.warn(`Shared cache write failed for ${namespace}:`, e.message)
+      }
+    }
+  }
+
+  const invalidate = async (key) => {
+    metrics.invalidations++
+    generations.set(key, (generations.get(key) || 0) + 1)
+    local.delete(key)
+    inflight.delete(key)
+    if (shared) {
+      try {
+        await shared.delete(sharedKey(key))
+      } catch (e) {
+        metrics.errors++
+        console.warn(`Shared cache invalidation failed for ${namespace}:`, e.message)
+      }
+    }
+  }
+
+  /**
+   * Read-through: return the cached value or run the loader once (concurrent callers share it)
+   * Loaders return { data, error }; errors are passed through and never cached
+   */
+  const wrap = async (key, loader) => {
+    const cached = await get(key)
+    if (cached !== undefined) {
+      return { data: cached, error: null, cacheHit: true }
+    }
+
+    if (inflight.has(key)) return inflight.get(key)
+
+    // Loads started before an invalidation must not repopulate the cache
+    const generation = generations.get(key) || 0
+    const load = (async () => {
+      const startedAt = Date.now()
+      try {
+        const { data, error } = await loader()
+        if (!error && data !== undefined && (generations.get(key) || 0) === generation) {
+          await set(key, data)
+        }
+        return { data, error, cacheHit: false }
+      } finally {
+        const elapsed = Date.now() - startedAt
+        metrics.loadCount++
+        metrics.loadTotalMs += elapsed
+        metrics.loadMaxMs = Math.max(metrics.loadMaxMs, elapsed)
+      }
+    })()
+
+    const release = () => {
+      if (inflight.get(key) === load) inflight.delete(key)
+    }
+    load.then(release, release)
+    inflight.set(key, load)
+    return load
+  }
+
+  const stats = () => {
+    const lookups = metrics.hits + metrics.sharedHits + metrics.misses
+    return {
+      namespace,
+      size: local.size,
+      sharedBackend: !!shared,
+      ...metrics,
+      hitRatio: lookups ? (metrics.hits + metrics.sharedHits) / lookups : 0,
+      avgLoadMs: metrics.loadCount ? Math.round(metrics.loadTotalMs / metrics.loadCount) : 0
+    }
+  }
+
+  const cache = { get, set, invalidate, wrap, stats }
+  caches.set(namespace, cache)
+  return cache
+}
+
+/**
+ * Collect stats for every server cache created by this module instance
+ * Each route bundle gets its own instance, so call it from the route that uses the caches
+ */
+export const getServerCacheStats = () => [...caches.values()].map(cache => cache.stats())
@@ -25,10 +25,14 @@ const getStripe = () => {
  * @param {string} transferData.destination - Stripe Connect account ID
  * @param {string} transferData.description - Transfer description
  * @param {Object} transferData.metadata - Additional metadata
+ * @param {string} transferData.idempotencyKey - Stripe idempotency key (replays return the original transfer)
  */
 export async function createTransfer(transferData) {
   try {
     const stripeInstance = getStripe();
+    const requestOptions = transferData.idempotencyKey
+      ? { idempotencyKey: transferData.idempotencyKey }
+      : undefined;
     
     const transfer = await stripeInstance.transfers.create({
       amount: transferData.amount,
@@ -41,7 +45,7 @@ export async function createTransfer(transferData) {
         payment_id: transferData.metadata?.payment_id,
         ...transferData.metadata
       }
-    });
+    }, requestOptions);
 
     return {
       success: true,
@@ -59,7 +63,10 @@ export async function createTransfer(transferData) {
     return {
       success: false,
       error: error.message,
-      code: error.code
+      code: error.code,
+      type: error.type,
+      statusCode: error.statusCode,
+      retryAfterMs: parseRetryAfter(error.headers?.['retry-after'])
     };
   }
 }
@@ -252,29 +259,153 @@ export function calculatePaymentSplit(totalAmount, platformFeePercentage = 20) {
   };
 }
 
+// ====================================
+// BATCH TRANSFER EXECUTOR
+// ====================================
+
+// Stripe allows 100 requests/second in live mode and 25 in test mode; stay a little under
+const DEFAULT_RATE_PER_SECOND = () => (process.env.STRIPE_SECRET_KEY || '').startsWith('sk_live') ? 80 : 20;
+const DEFAULT_CONCURRENCY = 10;
+const DEFAULT_MAX_RETRIES = 5;
+const BASE_BACKOFF_MS = 500;
+const MAX_BACKOFF_MS = 8000;
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+function parseRetryAfter(value) {
+  const seconds = Number(value);
+  return Number.isFinite(seconds) && seconds > 0 ? seconds * 1000 : null;
+}
+
+// 429s, lock timeouts, connection errors and 5xx are safe to retry with the same idempotency key
+function isRetryable(result) {
+  return result.statusCode === 429 ||
+    result.code === 'rate_limit' ||
+    result.code === 'lock_timeout' ||
+    result.type === 'StripeConnectionError' ||
+    result.statusCode >= 500;
+}
+
 /**
- * Batch process multiple transfers
+ * Token bucket shared by all workers of a batch
+ * The rate halves on 429s (at most once a second) and recovers gradually as requests succeed
+ */
+export function createTokenBucket(ratePerSecond, burst = ratePerSecond) {
+  const maxRate = ratePerSecond;
+  let rate = ratePerSecond;
+  let tokens = burst;
+  let last = Date.now();
+  let lastThrottle = 0;
+
+  const refill = () => {
+    const now = Date.now();
+    tokens = Math.min(burst, tokens + ((now - last) / 1000) * rate);
+    last = now;
+  };
+
+  return {
+    async take() {
+      for (;;) {
+        refill();
+        if (tokens >= 1) {
+          tokens -= 1;
+          return;
+        }
+        await sleep(Math.ceil(((1 - tokens) / rate) * 1000));
+      }
+    },
+    throttle() {
+      // One burst of 429s from concurrent workers counts as a single signal
+      const now = Date.now();
+      if (now - lastThrottle < 1000) return;
+      lastThrottle = now;
+      rate = Math.max(1, rate / 2);
+      tokens = Math.min(tokens, 0);
+    },
+    recover() {
+      rate = Math.min(maxRate, rate + maxRate * 0.1);
+    },
+    get rate() {
+      return rate;
+    }
+  };
+}
+
+/**
+ * Batch process multiple transfers with bounded concurrency and rate limiting
+ * Each transfer should carry an idempotencyKey so retries and replays after a restart never pay twice
  * @param {Array} transfers - Array of transfer data objects
+ * @param {Object} options
+ * @param {number} options.concurrency - Transfers in flight at once (default 10)
+ * @param {number} options.ratePerSecond - Request budget (default tuned to the Stripe key's mode)
+ * @param {number} options.maxRetries - Retries per transfer for rate limits and transient errors (default 5)
+ * @param {number} options.deadline - Epoch ms after which no new transfers are started
+ * @param {Function} options.onResult - async (transferData, result, index) called as each transfer settles
  */
-export async function batchProcessTransfers(transfers) {
-  const results = [];
-  
-  for (const transferData of transfers) {
-    const result = await createTransfer(transferData);
-    results.push({
-      transferData: transferData,
-      result: result
-    });
-    
-    // Small delay between transfers to avoid rate limits
-    await new Promise(resolve => setTimeout(resolve, 100));
-  }
-  
+export async function batchProcessTransfers(transfers, options = {}) {
+  const {
+    concurrency = DEFAULT_CONCURRENCY,
+    ratePerSecond = DEFAULT_RATE_PER_SECOND(),
+    maxRetries = DEFAULT_MAX_RETRIES,
+    deadline = null,
+    onResult = null
+  } = options;
+
+  const bucket = createTokenBucket(ratePerSecond, Math.min(ratePerSecond, concurrency * 2));
+  const results = new Array(transfers.length);
+  let next = 0;
+  let rateLimited = 0;
+
+  const runOne = async (transferData) => {
+    for (let attempt = 0; ; attempt++) {
+      await bucket.take();
+      const result = await createTransfer(transferData);
+
+      if (result.success) {
+        bucket.recover();
+        return { ...result, attempts: attempt + 1 };
+      }
+      if (attempt >= maxRetries || !isRetryable(result)) {
+        return { ...result, attempts: attempt + 1 };
+      }
+
+      if (result.statusCode === 429) {
+        rateLimited++;
+        bucket.throttle();
+      }
+      const backoff = Math.min(MAX_BACKOFF_MS, BASE_BACKOFF_MS * 2 ** attempt);
+      await sleep(result.retryAfterMs || backoff / 2 + Math.random() * (backoff / 2));
+    }
+  };
+
+  const worker = async () => {
+    while (next < transfers.length) {
+      if (deadline && Date.now() >= deadline) return;
+
+      const index = next++;
+      const transferData = transfers[index];
+      const result = await runOne(transferData);
+      results[index] = { transferData, result };
+
+      if (onResult) {
+        await onResult(transferData, result, index);
+      }
+    }
+  };
+
+  await Promise.all(
+    Array.from({ length: Math.min(concurrency, transfers.length) }, worker)
+  );
+
+  const settled = results.filter(Boolean);
   return {
     totalTransfers: transfers.length,
-    successfulTransfers: results.filter(r => r.result.success).length,
-    failedTransfers: results.filter(r => !r.result.success).length,
-    results: results
+    successfulTransfers: settled.filter(r => r.result.success).length,
+    failedTransfers: settled.filter(r => !r.result.success).length,
+    // Not started because the deadline passed; safe to hand to a later run
+    remainingTransfers: transfers.length - settled.length,
+    rateLimitedResponses: rateLimited,
+    results: settled
   };
 }
 
@@ -0,0 +1,261 @@
+// Durable Stripe webhook queue
+// Webhook routes verify and enqueue events into stripe_events, acknowledge immediately, then drain
+// that event's payment after the response; the worker cron retries and catches anything left over.
+// processStripeEvents drains the queue in Stripe order per payment with idempotent handlers
+
+import { waitUntil } from '@vercel/functions';
+import { recordPaymentEvents } from '@/lib/marketplace/payment-events';
+
+const DEFAULT_BATCH_SIZE = 50;
+const DEFAULT_TIME_BUDGET_MS = 20 * 1000;
+// Post-response drain from a webhook route; well inside the function's maxDuration
+const INLINE_DRAIN_BUDGET_MS = 10 * 1000;
+const EVENT_CONCURRENCY = 5;
+const MAX_ATTEMPTS = 5;
+const RETRY_BASE_DELAY_MS = 30 * 1000;
+const RETRY_MAX_DELAY_MS = 15 * 60 * 1000;
+// Claims older than this belong to a worker that died
+const STALE_CLAIM_MS = 2 * 60 * 1000;
+
+/**
+ * Ordering key for an event: the offer when Stripe metadata carries one, else the Stripe object id
+ */
+export function paymentKeyFor(event) {
+  const object = event.data?.object || {};
+  if (object.metadata?.offer_id) return `offer:${object.metadata.offer_id}`;
+  return `${object.object || 'object'}:${object.id}`;
+}
+
+/**
+ * Store a verified Stripe event; redeliveries of the same event id are ignored
+ * @param {Object} client - Supabase client (service role)
+ * @param {Object} event - Verified Stripe event
+ * @param {string} source - Receiving route, for diagnostics
+ * @returns {Object} { duplicate, error }
+ */
+export async function enqueueStripeEvent(client, event, source) {
+  const { data, error } = await client
+    .from('stripe_events')
+    .upsert({
+      id: event.id,
+      type: event.type,
+      payment_key: paymentKeyFor(event),
+      payload: event.data?.object || {},
+      source,
+      stripe_created_at: new Date((event.created || Date.now() / 1000) * 1000).toISOString()
+    }, { onConflict: 'id', ignoreDuplicates: true })
+    .select('id');
+
+  if (error) return { duplicate: false, error };
+  return { duplicate: !data || data.length === 0, error: null };
+}
+
+// ====================================
+// HANDLERS
+// ====================================
+// Every handler is safe to run twice: status changes are conditional on the current status,
+// and each change is logged to payment_events in the same pass, without reading the payment first
+
+/**
+ * Move matching pending payments to a new status and log one payment_events row per payment moved
+ * Both happen in one statement (transition_pending_payments), so neither can land without the other
+ * @param {Object} match - { sessionId } or { paymentIntent }
+ * @param {Object} updates - Optional { stripe_payment_intent, last_error } to write with the status
+ * @returns {Array} Payments that changed ({ id, offer_id })
+ */
+async function transitionPendingPayments(client, event, match, toStatus, updates = {}) {
+  const { data: payments, error } = await client.rpc('transition_pending_payments', {
+    p_to_status: toStatus,
+    p_stripe_event_id: event.id,
+    p_event_type: event.type,
+    p_session_id: match.sessionId || null,
+    p_payment_intent: match.paymentIntent || null,
+    p_set_payment_intent: updates.stripe_payment_intent || null,
+    p_last_error: updates.last_error || null
+  });
+  if (error) throw new Error(error.message);
+  return payments || [];
+}
+
+async function handleCheckoutSessionCompleted(client, session, event) {
+  const settled = await transitionPendingPayments(
+    client,
+    event,
+    { sessionId: session.id },
+    'paid_escrow',
+    { stripe_payment_intent: session.payment_intent }
+  );
+  if (settled.length > 0) {
+    await markOfferPaid(client, settled[0].offer_id);
+    return 'processed';
+  }
+
+  // No pending payment: already settled, or the session was created outside
+  // /api/payments/create-checkout-session and only the metadata knows the offer
+  const offerId = session.metadata?.offer_id;
+  if (!offerId) return 'ignored';
+
+  const { data: created, error } = await client
+    .from('payments')
+    .upsert({
+      offer_id: offerId,
+      stripe_session_id: session.id,
+      stripe_payment_intent: session.payment_intent,
+      amount_cents: session.amount_total,
+      currency: session.currency.toUpperCase(),
+      status: 'paid_escrow'
+    }, { onConflict: 'stripe_session_id', ignoreDuplicates: true })
+    .select('id');
+  if (error) throw new Error(error.message);
+
+  if (created && created.length > 0) {
+    const { error: logError } = await recordPaymentEvents(client, [{
+      payment_id: created[0].id,
+      stripe_event_id: event.id,
+      type: event.type,
+      from_status: null,
+      to_status: 'paid_escrow',
+      stripe_session_id: session.id
+    }]);
+    if (logError) throw new Error(logError.message);
+  }
+
+  // Conditional, so a retry after a partial failure still finishes the offer update
+  await markOfferPaid(client, offerId);
+  return 'processed';
+}
+
+async function markOfferPaid(client, offerId) {
+  const { error } = await client
+    .from('offers')
+    .update({ status: 'paid_escrow', updated_at: new Date().toISOString() })
+    .eq('id', offerId)
+    .in('status', ['drafted', 'sent', 'accepted']);
+  if (error) throw new Error(error.message);
+}
+
+async function handleCheckoutSessionExpired(client, session, event) {
+  const expired = await transitionPendingPayments(
+    client,
+    event,
+    { sessionId: session.id },
+    'failed',
+    { last_error: 'Session expired' }
+  );
+  return expired.length > 0 ? 'processed' : 'ignored';
+}
+
+// Payment intent events confirm or fail a payment that checkout has not settled yet
+const paymentIntentHandler = (status, errorFor) => async (client, paymentIntent, event) => {
+  const updates = errorFor ? { last_error: errorFor(paymentIntent) } : {};
+  const changed = await transitionPendingPayments(
+    client,
+    event,
+    { paymentIntent: paymentIntent.id },
+    status,
+    updates
+  );
+  return changed.length > 0 ? 'processed' : 'ignored';
+};
+
+const HANDLERS = {
+  'checkout.session.completed': handleCheckoutSessionCompleted,
+  'checkout.session.expired': handleCheckoutSessionExpired,
+  'payment_intent.succeeded': paymentIntentHandler('paid_escrow'),
+  'payment_intent.payment_failed': paymentIntentHandler(
+    'failed',
+    paymentIntent => paymentIntent.last_payment_error?.message || 'Payment failed'
+  ),
+  'payment_intent.canceled': paymentIntentHandler('failed', () => 'Payment canceled')
+};
+
+// ====================================
+// WORKER
+// ====================================
+
+async function settleEvent(client, event, updates) {
+  const { error } = await client
+    .from('stripe_events')
+    .update(updates)
+    .eq('id', event.id)
+    .eq('status', 'processing');
+  if (error) console.error(`❌ Failed to settle Stripe event ${event.id}:`, error.message);
+}
+
+async function processEvent(client, event, summary) {
+  const handler = HANDLERS[event.type];
+
+  try {
+    const outcome = handler ? await handler(client, event.payload, event) : 'ignored';
+    await settleEvent(client, event, {
+      status: outcome,
+      last_error: null,
+      processed_at: new Date().toISOString()
+    });
+    summary[outcome]++;
+  } catch (error) {
+    console.error(`❌ Stripe event ${event.id} (${event.type}) failed:`, error.message);
+    const exhausted = event.attempts >= MAX_ATTEMPTS;
+    // Back off before the retry; later events for the same payment wait behind this one
+    const retryDelayMs = Math.min(RETRY_MAX_DELAY_MS, RETRY_BASE_DELAY_MS * 2 ** (event.attempts - 1));
+    await settleEvent(client, event, {
+      status: exhausted ? 'failed' : 'pending',
+      last_error: error.message,
+      locked_at: null,
+      available_at: new Date(Date.now() + retryDelayMs).toISOString()
+    });
+    summary[exhausted ? 'failed' : 'retried']++;
+  }
+}
+
+/**
+ * Drain pending Stripe events until the queue is empty or the time budget is spent
+ * Webhook routes pass paymentKey to drain only the payment they just enqueued for
+ * @param {Object} client - Supabase client (service role)
+ * @param {Object} options - { batchSize, timeBudgetMs, paymentKey }
+ * @returns {Object} { data: summary, error }
+ */
+export async function processStripeEvents(client, options = {}) {
+  const startedAt = Date.now();
+  const deadline = startedAt + (options.timeBudgetMs || DEFAULT_TIME_BUDGET_MS);
+  const summary = { claimed: 0, processed: 0, ignored: 0, retried: 0, failed: 0 };
+
+  while (Date.now() < deadline) {
+    const { data: events, error } = await client.rpc('claim_stripe_events', {
+      p_limit: options.batchSize || DEFAULT_BATCH_SIZE,
+      p_stale_before: new Date(Date.now() - STALE_CLAIM_MS).toISOString(),
+      p_payment_key: options.paymentKey || null
+    });
+    if (error) return { data: summary, error };
+    if (!events || events.length === 0) break;
+
+    summary.claimed += events.length;
+
+    // At most one event per payment per claim, so the batch can run in parallel
+    const queue = [...events];
+    await Promise.all(Array.from({ length: Math.min(EVENT_CONCURRENCY, queue.length) }, async () => {
+      while (queue.length > 0) {
+        await processEvent(client, queue.shift(), summary);
+      }
+    }));
+  }
+
+  summary.durationMs = Date.now() - startedAt;
+  return { data: summary, error: null };
+}
+
+/**
+ * Process the payment an event was just enqueued for, after the webhook response is sent
+ * waitUntil keeps the function alive until the drain settles; failures stay queued for the worker cron
+ * @param {Object} client - Supabase client (service role)
+ * @param {Object} event - Verified Stripe event that was enqueued
+ */
+export function drainAfterResponse(client, event) {
+  waitUntil(
+    processStripeEvents(client, { paymentKey: paymentKeyFor(event), timeBudgetMs: INLINE_DRAIN_BUDGET_MS })
+      .then(({ error }) => {
+        if (error) console.error(`❌ Post-response drain for ${event.id} failed:`, error.message);
+      })
+      .catch(err => console.error(`❌ Post-response drain for ${event.id} failed:`, err.message))
+  );
+}
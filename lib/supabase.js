@@ -1,4 +1,10 @@
 import { createClient } from '@supabase/supabase-js'
+import { projection, recordPayload } from '@/lib/projections'
+
+// These helpers also run in the browser; payload stats are only collected server-side
+const recordServerPayload = (label, data) => {
+  if (typeof window === 'undefined') recordPayload(label, data)
+}
 
 // Validate environment variables
 const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL
@@ -235,26 +241,35 @@ export const createCampaign = async (campaignData) => {
   return { data, error }
 }
 
-export const updateCampaign = async (campaignId, campaignData) => {
-  const updatedData = {
-    ...campaignData,
-    updated_at: new Date().toISOString()
+// Campaign writes go through /api/campaigns/[id] so the server can check ownership and bump the catalog version
+const campaignRequest = async (campaignId, method, body) => {
+  try {
+    const { data: { session } } = await supabase.auth.getSession()
+    const response = await fetch(`/api/campaigns/${campaignId}`, {
+      method,
+      headers: {
+        'Content-Type': 'application/json',
+        ...(session?.access_token ? { Authorization: `Bearer ${session.access_token}` } : {})
+      },
+      body: body ? JSON.stringify(body) : undefined
+    })
+    const result = await response.json()
+    if (!response.ok) {
+      return { data: null, error: { message: result.error || `Campaign ${method} failed`, details: result.details } }
+    }
+    return { data: result, error: null }
+  } catch (error) {
+    return { data: null, error: { message: error.message } }
   }
-  
-  const { data, error } = await supabase
-    .from('campaigns')
-    .update(updatedData)
-    .eq('id', campaignId)
-    .select()
-  return { data, error }
+}
+
+export const updateCampaign = async (campaignId, campaignData) => {
+  const { data, error } = await campaignRequest(campaignId, 'PUT', campaignData)
+  return { data: data?.campaign ? [data.campaign] : null, error }
 }
 
 export const deleteCampaign = async (campaignId) => {
-  const { data, error } = await supabase
-    .from('campaigns')
-    .delete()
-    .eq('id', campaignId)
-    .select()
+  const { data, error } = await campaignRequest(campaignId, 'DELETE')
   return { data, error }
 }
 
@@ -369,12 +384,7 @@ export const deleteRateCard = async (rateCardId) => {
 export const getOffers = async (filters = {}) => {
   let query = supabase
     .from('offers')
-    .select(`
-      *,
-      campaign:campaigns(id, title, description),
-      brand:brand_id(id, full_name, company_name),
-      creator:creator_id(id, full_name, profile_picture)
-    `)
+    .select(projection('offer', 'card'))
     .order('created_at', { ascending: false })
   
   if (filters.brandId) query = query.eq('brand_id', filters.brandId)
@@ -383,19 +393,14 @@ export const getOffers = async (filters = {}) => {
   if (filters.status) query = query.eq('status', filters.status)
   
   const { data, error } = await query
+  recordServerPayload('offers:list', data)
   return { data, error }
 }
 
 export const getOffer = async (offerId) => {
   const { data, error } = await supabase
     .from('offers')
-    .select(`
-      *,
-      campaign:campaigns(id, title, description),
-      brand:brand_id(id, full_name, company_name, email),
-      creator:creator_id(id, full_name, profile_picture, email),
-      payments(id, status, stripe_session_id, amount_cents, currency)
-    `)
+    .select(projection('offer', 'detail'))
     .eq('id', offerId)
     .single()
   
@@ -443,14 +448,19 @@ export const getPayments = async (filters = {}) => {
         creator:creator_id(id, full_name),
         campaign:campaigns(id, title)
       )
-    `)
+    `, filters.limit ? { count: 'exact' } : undefined)
     .order('created_at', { ascending: false })
   
   if (filters.status) query = query.eq('status', filters.status)
   if (filters.offerId) query = query.eq('offer_id', filters.offerId)
+  // Page in the database rather than fetching every payment
+  if (filters.limit) {
+    const offset = filters.offset || 0
+    query = query.range(offset, offset + filters.limit - 1)
+  }
   
-  const { data, error } = await query
-  return { data, error }
+  const { data, error, count } = await query
+  return { data, error, count }
 }
 
 export const createPayment = async (paymentData) => {
@@ -597,6 +607,35 @@ export const getCampaigns = async (filters = {}) => {
   return { data, error }
 }
 
+/**
+ * Precomputed top campaigns for a creator (kept current by database triggers)
+ * Returns campaigns in recommendation order, each with its score
+ */
+export const getCreatorRecommendations = async (creatorId, limit = 6) => {
+  const { data, error } = await supabase
+    .from('creator_campaign_recommendations')
+    .select(`
+      score,
+      campaigns!inner (
+        *,
+        profiles!campaigns_brand_id_fkey (
+          full_name,
+          company_name
+        )
+      )
+    `)
+    .eq('creator_id', creatorId)
+    .eq('campaigns.status', 'active')
+    .order('score', { ascending: false })
+    .limit(limit)
+
+  if (error) return { data: null, error }
+  return {
+    data: (data || []).map(row => ({ ...row.campaigns, recommendation_score: row.score })),
+    error: null
+  }
+}
+
 export const getBrandCampaigns = async (brandId) => {
   const { data, error } = await supabase
     .from('campaigns')
@@ -634,43 +673,51 @@ export const createApplication = async (application) => {
 export const getCreatorApplications = async (creatorId) => {
   const { data, error } = await supabase
     .from('applications')
-    .select(`
-      *,
-      campaigns (
-        title,
-        deadline,
-        status,
-        profiles!campaigns_brand_id_fkey (
-          full_name,
-          company_name
-        )
-      )
-    `)
+    .select(`*, campaigns (${projection('applicationCampaign', 'card')})`)
     .eq('creator_id', creatorId)
     .order('applied_at', { ascending: false })
+  recordServerPayload('applications:creator', data)
   return { data, error }
 }
 
-export const getCampaignApplications = async (campaignId) => {
+/**
+ * Applications for a campaign with the applicant profile embedded
+ * @param {String} view - 'card' for lists, 'detail' when the page shows bios and social links
+ */
+export const getCampaignApplications = async (campaignId, view = 'detail') => {
   const { data, error } = await supabase
     .from('applications')
-    .select(`
-      *,
-      profiles!applications_creator_id_fkey (
-        full_name,
-        bio,
-        profile_picture,
-        social_links,
-        category_tags,
-        website_url,
-        media_kit_url
-      )
-    `)
+    .select(`*, profiles!applications_creator_id_fkey (${projection('applicant', view)})`)
     .eq('campaign_id', campaignId)
     .order('applied_at', { ascending: false })
+  recordServerPayload(`applications:campaign:${view}`, data)
   return { data, error }
 }
 
+/**
+ * Application counts for all of a brand's campaigns in one round-trip
+ * @returns {Object} { data: { byCampaign: { [campaignId]: { total, pending, accepted, rejected } }, totals }, error }
+ */
+export const getBrandApplicationCounts = async (brandId) => {
+  const { data, error } = await supabase.rpc('get_brand_application_counts', { p_brand_id: brandId })
+  if (error) return { data: null, error }
+
+  const emptyCounts = () => ({ total: 0, pending: 0, accepted: 0, rejected: 0 })
+  const byCampaign = {}
+  const totals = emptyCounts()
+
+  for (const row of data || []) {
+    const count = Number(row.application_count) || 0
+    const campaignCounts = byCampaign[row.campaign_id] || (byCampaign[row.campaign_id] = emptyCounts())
+    campaignCounts.total += count
+    campaignCounts[row.status] = (campaignCounts[row.status] || 0) + count
+    totals.total += count
+    totals[row.status] = (totals[row.status] || 0) + count
+  }
+
+  return { data: { byCampaign, totals }, error: null }
+}
+
 export const updateApplicationStatus = async (applicationId, status) => {
   const { data, error } = await supabase
     .from('applications')
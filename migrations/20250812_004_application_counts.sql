@@ -0,0 +1,22 @@
+-- Migration: 20250812_004_application_counts.sql
+-- Per-campaign application counts for the brand dashboard in a single query
+
+-- Counting by status reads only this index (no heap access for visible pages)
+CREATE INDEX IF NOT EXISTS idx_applications_campaign_status ON applications(campaign_id, status);
+
+-- Application counts per campaign and status for one brand
+-- SECURITY INVOKER keeps the existing applications/campaigns RLS policies in force
+CREATE OR REPLACE FUNCTION get_brand_application_counts(p_brand_id UUID)
+RETURNS TABLE (
+  campaign_id UUID,
+  status TEXT,
+  application_count BIGINT
+) AS $$
+  SELECT a.campaign_id, a.status, COUNT(*)::BIGINT AS application_count
+  FROM campaigns c
+  JOIN applications a ON a.campaign_id = c.id
+  WHERE c.brand_id = p_brand_id
+  GROUP BY a.campaign_id, a.status;
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+GRANT EXECUTE ON FUNCTION get_brand_application_counts(UUID) TO authenticated;
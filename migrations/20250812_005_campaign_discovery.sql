@@ -0,0 +1,105 @@
+-- Migration: 20250812_005_campaign_discovery.sql
+-- Server-side campaign discovery: full-text search, facet counts and keyset pagination
+
+-- Weighted search document (title ranks above description), maintained by Postgres
+ALTER TABLE campaigns
+ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+  setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+  setweight(to_tsvector('english', coalesce(description, '')), 'B')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_campaigns_search_vector ON campaigns USING GIN (search_vector);
+
+-- Discovery only ever reads active campaigns; partial indexes keep the feed and facets small
+CREATE INDEX IF NOT EXISTS idx_campaigns_active_feed ON campaigns(created_at DESC, id DESC) WHERE status = 'active';
+CREATE INDEX IF NOT EXISTS idx_campaigns_active_category ON campaigns(category) WHERE status = 'active';
+CREATE INDEX IF NOT EXISTS idx_campaigns_active_budget_range ON campaigns(budget_range) WHERE status = 'active';
+
+-- One page of active campaigns ordered by (rank, created_at, id), all descending
+-- Pass the last row's sort key as the cursor to get the next page; rank is 0 without a query
+CREATE OR REPLACE FUNCTION search_campaigns(
+  p_query TEXT DEFAULT NULL,
+  p_category TEXT DEFAULT NULL,
+  p_budget_range TEXT DEFAULT NULL,
+  p_cursor_rank REAL DEFAULT NULL,
+  p_cursor_created_at TIMESTAMPTZ DEFAULT NULL,
+  p_cursor_id UUID DEFAULT NULL,
+  p_limit INTEGER DEFAULT 20
+)
+RETURNS TABLE (
+  campaign JSONB,
+  rank REAL,
+  created_at TIMESTAMPTZ,
+  id UUID
+) AS $$
+  WITH search AS (
+    SELECT CASE WHEN nullif(trim(p_query), '') IS NULL THEN NULL
+                ELSE websearch_to_tsquery('english', p_query) END AS tsq
+  ),
+  ranked AS (
+    SELECT
+      c.*,
+      CASE WHEN s.tsq IS NULL THEN 0::REAL ELSE ts_rank(c.search_vector, s.tsq) END AS search_rank
+    FROM campaigns c, search s
+    WHERE c.status = 'active'
+      AND (s.tsq IS NULL OR c.search_vector @@ s.tsq)
+      AND (p_category IS NULL OR c.category = p_category)
+      AND (p_budget_range IS NULL OR c.budget_range = p_budget_range)
+  )
+  SELECT
+    (to_jsonb(r) - 'search_vector' - 'search_rank') || jsonb_build_object(
+      'profiles', jsonb_build_object('full_name', p.full_name, 'company_name', p.company_name)
+    ) AS campaign,
+    r.search_rank AS rank,
+    r.created_at,
+    r.id
+  FROM ranked r
+  LEFT JOIN profiles p ON p.id = r.brand_id
+  WHERE p_cursor_id IS NULL
+     OR (r.search_rank, r.created_at, r.id) < (p_cursor_rank, p_cursor_created_at, p_cursor_id)
+  ORDER BY r.search_rank DESC, r.created_at DESC, r.id DESC
+  LIMIT LEAST(GREATEST(p_limit, 1), 100);
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+-- Total match count plus facet counts for the current search
+-- Each facet ignores its own filter so every option shows how many campaigns it would return
+CREATE OR REPLACE FUNCTION campaign_discovery_facets(
+  p_query TEXT DEFAULT NULL,
+  p_category TEXT DEFAULT NULL,
+  p_budget_range TEXT DEFAULT NULL
+)
+RETURNS TABLE (
+  facet TEXT,
+  value TEXT,
+  campaign_count BIGINT
+) AS $$
+  WITH search AS (
+    SELECT CASE WHEN nullif(trim(p_query), '') IS NULL THEN NULL
+                ELSE websearch_to_tsquery('english', p_query) END AS tsq
+  ),
+  matching AS (
+    SELECT c.category, c.budget_range
+    FROM campaigns c, search s
+    WHERE c.status = 'active'
+      AND (s.tsq IS NULL OR c.search_vector @@ s.tsq)
+  )
+  SELECT 'total', NULL::TEXT, COUNT(*)::BIGINT
+  FROM matching m
+  WHERE (p_category IS NULL OR m.category = p_category)
+    AND (p_budget_range IS NULL OR m.budget_range = p_budget_range)
+  UNION ALL
+  SELECT 'category', m.category, COUNT(*)::BIGINT
+  FROM matching m
+  WHERE m.category IS NOT NULL
+    AND (p_budget_range IS NULL OR m.budget_range = p_budget_range)
+  GROUP BY m.category
+  UNION ALL
+  SELECT 'budget_range', m.budget_range, COUNT(*)::BIGINT
+  FROM matching m
+  WHERE m.budget_range IS NOT NULL
+    AND (p_category IS NULL OR m.category = p_category)
+  GROUP BY m.budget_range;
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+GRANT EXECUTE ON FUNCTION search_campaigns(TEXT, TEXT, TEXT, REAL, TIMESTAMPTZ, UUID, INTEGER) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION campaign_discovery_facets(TEXT, TEXT, TEXT) TO anon, authenticated;
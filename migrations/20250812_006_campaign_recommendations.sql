@@ -0,0 +1,234 @@
+-- Migration: 20250812_006_campaign_recommendations.sql
+-- Precomputed top-K campaign recommendations per creator, kept current by triggers
+
+-- Top-K active campaigns per creator; the creator dashboard reads this with one index lookup
+CREATE TABLE IF NOT EXISTS creator_campaign_recommendations (
+  creator_id UUID NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+  campaign_id UUID NOT NULL REFERENCES campaigns(id) ON DELETE CASCADE,
+  score NUMERIC(8,2) NOT NULL,
+  computed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  PRIMARY KEY (creator_id, campaign_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_recommendations_creator_score ON creator_campaign_recommendations(creator_id, score DESC);
+CREATE INDEX IF NOT EXISTS idx_recommendations_campaign_id ON creator_campaign_recommendations(campaign_id);
+
+-- Scoring reads a creator's application history; the existing unique index leads with campaign_id
+CREATE INDEX IF NOT EXISTS idx_applications_creator_id ON applications(creator_id);
+
+ALTER TABLE creator_campaign_recommendations ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Creators can view own recommendations" ON creator_campaign_recommendations
+  FOR SELECT USING (creator_id = auth.uid());
+
+CREATE POLICY "Admins can view all recommendations" ON creator_campaign_recommendations
+  FOR SELECT USING (
+    EXISTS (SELECT 1 FROM profiles WHERE id = auth.uid() AND role = 'admin')
+  );
+
+-- Upper bound of a budget_range label in cents ('$1,000 - $2,500' -> 250000, '$10,000+' -> 1000000)
+CREATE OR REPLACE FUNCTION campaign_budget_ceiling_cents(p_budget_range TEXT)
+RETURNS INTEGER AS $$
+  SELECT ((regexp_match(replace(p_budget_range, ',', ''), '(\d+)\D*$'))[1])::INTEGER * 100;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Score open, unapplied active campaigns for one creator (optionally a single campaign,
+-- optionally excluding one that is being deleted):
+--   category tag match 50, application history in the category up to 30 (accepted counts double),
+--   cheapest active rate card within the budget 20 (5 when the budget is unknown), recency up to 10
+CREATE OR REPLACE FUNCTION recommendation_candidates(
+  p_creator_id UUID,
+  p_campaign_id UUID DEFAULT NULL,
+  p_exclude_campaign_id UUID DEFAULT NULL
+)
+RETURNS TABLE (
+  campaign_id UUID,
+  score NUMERIC
+) AS $$
+  WITH creator AS (
+    SELECT coalesce(category_tags, '{}') AS tags
+    FROM profiles
+    WHERE id = p_creator_id AND role = 'creator'
+  ),
+  history AS (
+    SELECT c.category, SUM(CASE WHEN a.status = 'accepted' THEN 2 ELSE 1 END) AS weight
+    FROM applications a
+    JOIN campaigns c ON c.id = a.campaign_id
+    WHERE a.creator_id = p_creator_id AND c.category IS NOT NULL
+    GROUP BY c.category
+  ),
+  pricing AS (
+    SELECT MIN(base_price_cents) AS min_price_cents
+    FROM rate_cards
+    WHERE creator_id = p_creator_id AND active = true
+  )
+  SELECT
+    c.id,
+    round((
+      CASE WHEN c.category = ANY(cr.tags) THEN 50 ELSE 0 END
+      + LEAST(coalesce(h.weight, 0) * 10, 30)
+      + CASE
+          WHEN pr.min_price_cents IS NULL THEN 0
+          WHEN campaign_budget_ceiling_cents(c.budget_range) IS NULL THEN 5
+          WHEN pr.min_price_cents <= campaign_budget_ceiling_cents(c.budget_range) THEN 20
+          ELSE 0
+        END
+      + GREATEST(0, 10 - EXTRACT(EPOCH FROM (now() - c.created_at)) / 259200)
+    )::NUMERIC, 2)
+  FROM campaigns c
+  CROSS JOIN creator cr
+  CROSS JOIN pricing pr
+  LEFT JOIN history h ON h.category = c.category
+  WHERE c.status = 'active'
+    AND (c.deadline IS NULL OR c.deadline >= CURRENT_DATE)
+    AND (p_campaign_id IS NULL OR c.id = p_campaign_id)
+    AND c.id IS DISTINCT FROM p_exclude_campaign_id
+    AND NOT EXISTS (
+      SELECT 1 FROM applications a WHERE a.creator_id = p_creator_id AND a.campaign_id = c.id
+    );
+$$ LANGUAGE sql STABLE;
+
+-- Recompute one creator's list (profile, rate card or application changes)
+CREATE OR REPLACE FUNCTION refresh_creator_recommendations(
+  p_creator_id UUID,
+  p_top_k INTEGER DEFAULT 20,
+  p_exclude_campaign_id UUID DEFAULT NULL
+)
+RETURNS VOID AS $$
+BEGIN
+  DELETE FROM creator_campaign_recommendations WHERE creator_id = p_creator_id;
+
+  INSERT INTO creator_campaign_recommendations (creator_id, campaign_id, score)
+  SELECT p_creator_id, rc.campaign_id, rc.score
+  FROM recommendation_candidates(p_creator_id, NULL, p_exclude_campaign_id) rc
+  ORDER BY rc.score DESC
+  LIMIT p_top_k;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Apply one campaign change incrementally instead of recomputing every creator's list
+-- p_removed is set while the campaign is being deleted so it is not scored again
+CREATE OR REPLACE FUNCTION refresh_campaign_recommendations(
+  p_campaign_id UUID,
+  p_top_k INTEGER DEFAULT 20,
+  p_removed BOOLEAN DEFAULT false
+)
+RETURNS VOID AS $$
+DECLARE
+  affected UUID[];
+BEGIN
+  -- Creators holding this campaign get a full recompute so a freed slot is backfilled
+  affected := ARRAY(
+    SELECT creator_id FROM creator_campaign_recommendations WHERE campaign_id = p_campaign_id
+  );
+  DELETE FROM creator_campaign_recommendations WHERE campaign_id = p_campaign_id;
+  PERFORM refresh_creator_recommendations(
+    creator_id, p_top_k, CASE WHEN p_removed THEN p_campaign_id END
+  ) FROM unnest(affected) AS creator_id;
+
+  IF p_removed THEN
+    RETURN;
+  END IF;
+
+  -- Everyone else only gains the campaign where it beats their current K-th entry
+  INSERT INTO creator_campaign_recommendations (creator_id, campaign_id, score)
+  SELECT p.id, rc.campaign_id, rc.score
+  FROM profiles p
+  CROSS JOIN LATERAL recommendation_candidates(p.id, p_campaign_id) rc
+  WHERE p.role = 'creator'
+    AND NOT (p.id = ANY(affected))
+    AND rc.score > coalesce((
+      SELECT MIN(r.score)
+      FROM creator_campaign_recommendations r
+      WHERE r.creator_id = p.id
+      HAVING COUNT(*) >= p_top_k
+    ), -1)
+  ON CONFLICT (creator_id, campaign_id) DO NOTHING;
+
+  -- Trim lists that just grew past K
+  DELETE FROM creator_campaign_recommendations r
+  USING (
+    SELECT creator_id, campaign_id,
+           row_number() OVER (PARTITION BY creator_id ORDER BY score DESC, computed_at DESC) AS position
+    FROM creator_campaign_recommendations
+    WHERE creator_id IN (
+      SELECT creator_id FROM creator_campaign_recommendations WHERE campaign_id = p_campaign_id
+    )
+  ) ranked
+  WHERE r.creator_id = ranked.creator_id
+    AND r.campaign_id = ranked.campaign_id
+    AND ranked.position > p_top_k;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Full rebuild, for backfills and a periodic job (recency and deadlines drift between writes)
+CREATE OR REPLACE FUNCTION refresh_all_recommendations(p_top_k INTEGER DEFAULT 20)
+RETURNS INTEGER AS $$
+DECLARE
+  creator_count INTEGER := 0;
+  creator RECORD;
+BEGIN
+  FOR creator IN SELECT id FROM profiles WHERE role = 'creator' LOOP
+    PERFORM refresh_creator_recommendations(creator.id, p_top_k);
+    creator_count := creator_count + 1;
+  END LOOP;
+  RETURN creator_count;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Trigger functions
+-- Deletes run BEFORE so affected creators are backfilled while their rows still exist
+CREATE OR REPLACE FUNCTION recommendations_on_campaign_change()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'DELETE' THEN
+    PERFORM refresh_campaign_recommendations(OLD.id, 20, true);
+    RETURN OLD;
+  END IF;
+
+  PERFORM refresh_campaign_recommendations(NEW.id);
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE OR REPLACE FUNCTION recommendations_on_creator_change()
+RETURNS TRIGGER AS $$
+DECLARE
+  changed_creator UUID;
+BEGIN
+  IF TG_TABLE_NAME = 'profiles' THEN
+    changed_creator := NEW.id;
+  ELSIF TG_OP = 'DELETE' THEN
+    changed_creator := OLD.creator_id;
+  ELSE
+    changed_creator := NEW.creator_id;
+  END IF;
+
+  PERFORM refresh_creator_recommendations(changed_creator);
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER refresh_recommendations_on_campaign
+  AFTER INSERT OR UPDATE OF status, category, budget_range, deadline ON campaigns
+  FOR EACH ROW EXECUTE PROCEDURE recommendations_on_campaign_change();
+
+CREATE TRIGGER refresh_recommendations_on_campaign_delete
+  BEFORE DELETE ON campaigns
+  FOR EACH ROW EXECUTE PROCEDURE recommendations_on_campaign_change();
+
+CREATE TRIGGER refresh_recommendations_on_profile
+  AFTER INSERT OR UPDATE OF category_tags, role ON profiles
+  FOR EACH ROW WHEN (NEW.role = 'creator')
+  EXECUTE PROCEDURE recommendations_on_creator_change();
+
+CREATE TRIGGER refresh_recommendations_on_rate_card
+  AFTER INSERT OR DELETE OR UPDATE OF base_price_cents, active ON rate_cards
+  FOR EACH ROW EXECUTE PROCEDURE recommendations_on_creator_change();
+
+CREATE TRIGGER refresh_recommendations_on_application
+  AFTER INSERT OR DELETE OR UPDATE OF status ON applications
+  FOR EACH ROW EXECUTE PROCEDURE recommendations_on_creator_change();
+
+-- Backfill existing creators
+SELECT refresh_all_recommendations();
@@ -0,0 +1,14 @@
+-- Migration: 20250812_007_profile_directory.sql
+-- Indexes for the paginated /api/profiles directory
+
+-- Role-filtered, newest-first pages with (created_at, id) keyset cursors
+CREATE INDEX IF NOT EXISTS idx_profiles_role_created_at ON profiles(role, created_at DESC, id DESC);
+
+-- Case-insensitive name prefix search ('LIKE abc%' on the lowered name uses this index)
+ALTER TABLE profiles
+ADD COLUMN IF NOT EXISTS full_name_lower TEXT GENERATED ALWAYS AS (lower(full_name)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_profiles_role_name_prefix ON profiles(role, full_name_lower text_pattern_ops);
+
+-- Category filter (category_tags @> '{Music}')
+CREATE INDEX IF NOT EXISTS idx_profiles_category_tags ON profiles USING GIN (category_tags);
@@ -0,0 +1,32 @@
+-- Migration: 20250812_008_offer_listing.sql
+-- Paginated offer lists with per-status counts
+
+-- Each list is scoped by brand, creator or campaign, optionally filtered by status,
+-- newest first with (created_at, id) keyset cursors
+CREATE INDEX IF NOT EXISTS idx_offers_brand_status_created ON offers(brand_id, status, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_offers_creator_status_created ON offers(creator_id, status, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_offers_campaign_status_created ON offers(campaign_id, status, created_at DESC, id DESC);
+
+-- Unfiltered "all" tab per owner (status excluded so the scan stays in created_at order)
+CREATE INDEX IF NOT EXISTS idx_offers_brand_created ON offers(brand_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_offers_creator_created ON offers(creator_id, created_at DESC, id DESC);
+
+-- Offer counts per status for one scope; answered from the (owner, status, ...) indexes
+CREATE OR REPLACE FUNCTION offer_status_counts(
+  p_brand_id UUID DEFAULT NULL,
+  p_creator_id UUID DEFAULT NULL,
+  p_campaign_id UUID DEFAULT NULL
+)
+RETURNS TABLE (
+  status TEXT,
+  offer_count BIGINT
+) AS $$
+  SELECT o.status, COUNT(*)::BIGINT
+  FROM offers o
+  WHERE (p_brand_id IS NULL OR o.brand_id = p_brand_id)
+    AND (p_creator_id IS NULL OR o.creator_id = p_creator_id)
+    AND (p_campaign_id IS NULL OR o.campaign_id = p_campaign_id)
+  GROUP BY o.status;
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+GRANT EXECUTE ON FUNCTION offer_status_counts(UUID, UUID, UUID) TO authenticated, service_role;
@@ -0,0 +1,35 @@
+-- Migration: 20250812_009_fx_rates.sql
+-- Live FX rates for cross-currency pricing (replaces the hardcoded rate map in pricing.js)
+
+-- One row per currency, quoted as units of that currency per 1 USD; cross rates go through USD
+CREATE TABLE IF NOT EXISTS fx_rates (
+  currency TEXT PRIMARY KEY CHECK (currency IN ('USD', 'MYR', 'SGD')),
+  units_per_usd NUMERIC(18, 8) NOT NULL CHECK (units_per_usd > 0),
+  source TEXT NOT NULL DEFAULT 'seed',
+  fetched_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Seed with the rates pricing.js used until now; the loader replaces them from the provider
+INSERT INTO fx_rates (currency, units_per_usd, source) VALUES
+  ('USD', 1, 'seed'),
+  ('MYR', 4.7, 'seed'),
+  ('SGD', 1.35, 'seed')
+ON CONFLICT (currency) DO NOTHING;
+
+ALTER TABLE fx_rates ENABLE ROW LEVEL SECURITY;
+
+-- Rates are public reference data; only the service role refreshes them
+DROP POLICY IF EXISTS "Anyone can view fx rates" ON fx_rates;
+CREATE POLICY "Anyone can view fx rates" ON fx_rates
+  FOR SELECT USING (true);
+
+-- Convert an amount in cents into USD cents at the stored rate
+CREATE OR REPLACE FUNCTION fx_to_usd_cents(p_amount_cents BIGINT, p_currency TEXT)
+RETURNS BIGINT AS $$
+  SELECT ROUND(p_amount_cents / r.units_per_usd)::BIGINT
+  FROM fx_rates r
+  WHERE r.currency = p_currency;
+$$ LANGUAGE sql STABLE;
+
+GRANT EXECUTE ON FUNCTION fx_to_usd_cents(BIGINT, TEXT) TO anon, authenticated, service_role;
@@ -0,0 +1,52 @@
+-- Migration: 20250812_010_rate_card_usd_price.sql
+-- Normalized USD price on rate cards for cross-currency budget search
+
+ALTER TABLE rate_cards ADD COLUMN IF NOT EXISTS price_usd_cents BIGINT;
+
+-- Keep price_usd_cents in step with the card's own price and currency
+CREATE OR REPLACE FUNCTION set_rate_card_usd_price()
+RETURNS TRIGGER AS $$
+BEGIN
+  NEW.price_usd_cents := fx_to_usd_cents(NEW.base_price_cents, NEW.currency);
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_rate_cards_usd_price ON rate_cards;
+CREATE TRIGGER trg_rate_cards_usd_price
+  BEFORE INSERT OR UPDATE OF base_price_cents, currency ON rate_cards
+  FOR EACH ROW EXECUTE FUNCTION set_rate_card_usd_price();
+
+-- Reprice every card in a currency when its rate changes
+CREATE OR REPLACE FUNCTION reprice_rate_cards_for_currency()
+RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE rate_cards
+  SET price_usd_cents = ROUND(base_price_cents / NEW.units_per_usd)::BIGINT
+  WHERE currency = NEW.currency;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS trg_fx_rates_reprice_insert ON fx_rates;
+CREATE TRIGGER trg_fx_rates_reprice_insert
+  AFTER INSERT ON fx_rates
+  FOR EACH ROW EXECUTE FUNCTION reprice_rate_cards_for_currency();
+
+DROP TRIGGER IF EXISTS trg_fx_rates_reprice_update ON fx_rates;
+CREATE TRIGGER trg_fx_rates_reprice_update
+  AFTER UPDATE OF units_per_usd ON fx_rates
+  FOR EACH ROW
+  WHEN (OLD.units_per_usd IS DISTINCT FROM NEW.units_per_usd)
+  EXECUTE FUNCTION reprice_rate_cards_for_currency();
+
+-- Backfill existing cards
+UPDATE rate_cards r
+SET price_usd_cents = ROUND(r.base_price_cents / f.units_per_usd)::BIGINT
+FROM fx_rates f
+WHERE f.currency = r.currency;
+
+-- Budget search is a range scan within one deliverable type; id breaks ties for keyset paging
+CREATE INDEX IF NOT EXISTS idx_rate_cards_type_usd_price
+  ON rate_cards(deliverable_type, price_usd_cents, id)
+  WHERE active = true;
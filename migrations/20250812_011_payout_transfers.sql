@@ -0,0 +1,59 @@
+-- Migration: 20250812_011_payout_transfers.sql
+-- Resumable Stripe transfer runs for stripe-method payouts
+
+-- Creators' Stripe Connect accounts (transfer destination)
+ALTER TABLE profiles ADD COLUMN IF NOT EXISTS stripe_account_id TEXT;
+
+-- Per-payout transfer progress: a stable idempotency key makes replays after a restart safe
+ALTER TABLE payouts ADD COLUMN IF NOT EXISTS idempotency_key TEXT;
+ALTER TABLE payouts ADD COLUMN IF NOT EXISTS transfer_run_id UUID;
+ALTER TABLE payouts ADD COLUMN IF NOT EXISTS attempt_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE payouts ADD COLUMN IF NOT EXISTS last_error TEXT;
+ALTER TABLE payouts ADD COLUMN IF NOT EXISTS last_attempt_at TIMESTAMPTZ;
+
+UPDATE payouts SET idempotency_key = 'payout_' || id WHERE idempotency_key IS NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_payouts_idempotency_key ON payouts(idempotency_key);
+
+-- 'processing' marks payouts claimed by a transfer run
+ALTER TABLE payouts DROP CONSTRAINT IF EXISTS payouts_status_check;
+ALTER TABLE payouts ADD CONSTRAINT payouts_status_check CHECK (status IN (
+  'pending', 'processing', 'released', 'failed', 'refunded'
+));
+
+-- Runs pick up pending payouts and reclaim stale processing ones
+CREATE INDEX IF NOT EXISTS idx_payouts_transfer_queue
+  ON payouts(status, last_attempt_at)
+  WHERE method = 'stripe' AND status IN ('pending', 'processing');
+
+-- Claim up to p_limit stripe payouts for a run: pending ones, plus processing ones whose run
+-- stopped before p_stale_before. SKIP LOCKED lets concurrent runs split the queue
+CREATE OR REPLACE FUNCTION claim_payout_transfers(
+  p_run_id UUID,
+  p_limit INTEGER DEFAULT 100,
+  p_stale_before TIMESTAMPTZ DEFAULT now() - INTERVAL '5 minutes',
+  p_payout_ids UUID[] DEFAULT NULL
+)
+RETURNS SETOF payouts AS $$
+  UPDATE payouts p
+  SET status = 'processing',
+      transfer_run_id = p_run_id,
+      idempotency_key = COALESCE(p.idempotency_key, 'payout_' || p.id),
+      attempt_count = p.attempt_count + 1,
+      last_attempt_at = now(),
+      updated_at = now()
+  WHERE p.id IN (
+    SELECT q.id
+    FROM payouts q
+    WHERE q.method = 'stripe'
+      AND (q.status = 'pending'
+           OR (q.status = 'processing' AND q.last_attempt_at < p_stale_before))
+      AND (p_payout_ids IS NULL OR q.id = ANY(p_payout_ids))
+    ORDER BY q.created_at
+    LIMIT p_limit
+    FOR UPDATE SKIP LOCKED
+  )
+  RETURNING p.*;
+$$ LANGUAGE sql VOLATILE SECURITY DEFINER;
+
+REVOKE ALL ON FUNCTION claim_payout_transfers(UUID, INTEGER, TIMESTAMPTZ, UUID[]) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION claim_payout_transfers(UUID, INTEGER, TIMESTAMPTZ, UUID[]) TO service_role;
@@ -0,0 +1,74 @@
+-- Migration: 20250812_012_stripe_events.sql
+-- Durable Stripe webhook queue: routes insert and acknowledge, a worker processes
+
+-- One row per Stripe event id, so redeliveries are dropped at insert time
+CREATE TABLE IF NOT EXISTS stripe_events (
+  id TEXT PRIMARY KEY,
+  type TEXT NOT NULL,
+  -- Events sharing a key (an offer, else the Stripe object) are processed in Stripe order
+  payment_key TEXT NOT NULL,
+  payload JSONB NOT NULL,
+  source TEXT,
+  status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN (
+    'pending', 'processing', 'processed', 'ignored', 'failed'
+  )),
+  attempts INTEGER NOT NULL DEFAULT 0,
+  last_error TEXT,
+  -- Retries are pushed back by setting this into the future
+  available_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  stripe_created_at TIMESTAMPTZ NOT NULL,
+  received_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  locked_at TIMESTAMPTZ,
+  processed_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_stripe_events_queue
+  ON stripe_events(stripe_created_at)
+  WHERE status IN ('pending', 'processing');
+CREATE INDEX IF NOT EXISTS idx_stripe_events_unfinished_by_key
+  ON stripe_events(payment_key, stripe_created_at, id)
+  WHERE status IN ('pending', 'processing');
+
+ALTER TABLE stripe_events ENABLE ROW LEVEL SECURITY;
+-- No policies: only the service role reads or writes the queue
+
+-- Claim the next event of each payment key: only a key's oldest unfinished event is eligible, so a
+-- payment's events run strictly in Stripe order and a retrying event holds back the ones after it.
+-- Claims are serialized by an advisory lock, so concurrent workers never take the same event
+CREATE OR REPLACE FUNCTION claim_stripe_events(
+  p_limit INTEGER DEFAULT 50,
+  p_stale_before TIMESTAMPTZ DEFAULT now() - INTERVAL '2 minutes'
+)
+RETURNS SETOF stripe_events AS $$
+BEGIN
+  PERFORM pg_advisory_xact_lock(hashtext('claim_stripe_events'));
+
+  RETURN QUERY
+  UPDATE stripe_events e
+  SET status = 'processing',
+      locked_at = now(),
+      attempts = e.attempts + 1
+  WHERE e.id IN (
+    SELECT head.id
+    FROM (
+      SELECT DISTINCT ON (u.payment_key)
+        u.id, u.status, u.locked_at, u.available_at, u.stripe_created_at
+      FROM stripe_events u
+      WHERE u.status IN ('pending', 'processing')
+      ORDER BY u.payment_key, u.stripe_created_at, u.id
+    ) head
+    WHERE (head.status = 'pending' AND head.available_at <= now())
+       OR (head.status = 'processing' AND head.locked_at < p_stale_before)
+    ORDER BY head.stripe_created_at
+    LIMIT p_limit
+  )
+  RETURNING e.*;
+END;
+$$ LANGUAGE plpgsql VOLATILE SECURITY DEFINER;
+
+REVOKE ALL ON FUNCTION claim_stripe_events(INTEGER, TIMESTAMPTZ) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION claim_stripe_events(INTEGER, TIMESTAMPTZ) TO service_role;
+
+-- Handlers look payments up by Stripe ids
+CREATE INDEX IF NOT EXISTS idx_payments_stripe_session_id ON payments(stripe_session_id);
+CREATE INDEX IF NOT EXISTS idx_payments_stripe_payment_intent ON payments(stripe_payment_intent);
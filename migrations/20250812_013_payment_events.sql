@@ -0,0 +1,53 @@
+-- Migration: 20250812_013_payment_events.sql
+-- Append-only payment event log, replacing the payments.webhook_events JSONB array
+
+CREATE TABLE IF NOT EXISTS payment_events (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  payment_id UUID NOT NULL REFERENCES payments(id) ON DELETE CASCADE,
+  -- Stripe event that caused the change; NULL for backfilled and non-Stripe events
+  stripe_event_id TEXT,
+  type TEXT NOT NULL,
+  from_status TEXT,
+  to_status TEXT,
+  stripe_session_id TEXT,
+  data JSONB NOT NULL DEFAULT '{}'::jsonb,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Event history per payment, newest first with (created_at, id) keyset pagination
+CREATE INDEX IF NOT EXISTS idx_payment_events_payment_created
+  ON payment_events(payment_id, created_at DESC, id DESC);
+
+-- A Stripe event is logged at most once even if a handler is retried
+CREATE UNIQUE INDEX IF NOT EXISTS idx_payment_events_stripe_event
+  ON payment_events(payment_id, stripe_event_id)
+  WHERE stripe_event_id IS NOT NULL;
+
+ALTER TABLE payment_events ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Participants can view their payment events" ON payment_events
+  FOR SELECT USING (
+    EXISTS (
+      SELECT 1 FROM payments p
+      JOIN offers o ON o.id = p.offer_id
+      WHERE p.id = payment_id AND (o.brand_id = auth.uid() OR o.creator_id = auth.uid())
+    ) OR
+    EXISTS (SELECT 1 FROM profiles WHERE id = auth.uid() AND role = 'admin')
+  );
+
+-- Webhook handlers create missing payments with an upsert on the session id
+DROP INDEX IF EXISTS idx_payments_stripe_session_id;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_payments_stripe_session_id ON payments(stripe_session_id);
+
+-- Backfill the existing JSONB history, then drop the column
+INSERT INTO payment_events (payment_id, type, stripe_session_id, created_at)
+SELECT
+  p.id,
+  event->>'type',
+  event->>'session_id',
+  COALESCE((event->>'timestamp')::timestamptz, p.updated_at, now())
+FROM payments p
+CROSS JOIN LATERAL jsonb_array_elements(COALESCE(p.webhook_events, '[]'::jsonb)) AS event
+WHERE event->>'type' IS NOT NULL;
+
+ALTER TABLE payments DROP COLUMN IF EXISTS webhook_events;
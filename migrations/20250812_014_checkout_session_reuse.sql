@@ -0,0 +1,23 @@
+-- Migration: 20250812_014_checkout_session_reuse.sql
+-- One pending payment per offer, carrying its open checkout session so repeat requests reuse it
+
+ALTER TABLE payments
+  ADD COLUMN IF NOT EXISTS checkout_url TEXT,
+  ADD COLUMN IF NOT EXISTS checkout_expires_at TIMESTAMPTZ;
+
+-- Keep the newest pending payment per offer before the unique index goes on
+WITH ranked AS (
+  SELECT id, row_number() OVER (PARTITION BY offer_id ORDER BY created_at DESC, id DESC) AS position
+  FROM payments
+  WHERE status = 'pending'
+)
+UPDATE payments p
+SET status = 'failed',
+    last_error = 'Superseded checkout session',
+    updated_at = now()
+FROM ranked
+WHERE p.id = ranked.id AND ranked.position > 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_payments_one_pending_per_offer
+  ON payments(offer_id)
+  WHERE status = 'pending';
@@ -0,0 +1,115 @@
+-- Migration: 20250812_015_escrow_auto_release.sql
+-- Scheduled escrow release: paid_escrow payments older than platform_settings.auto_release_days
+-- are released in claimed batches, each creating the creator's payout for the transfer runner
+
+ALTER TABLE payments ADD COLUMN IF NOT EXISTS released_at TIMESTAMPTZ;
+ALTER TABLE payments ADD COLUMN IF NOT EXISTS release_run_id UUID;
+
+-- Release scan: only escrowed rows, oldest first
+CREATE INDEX IF NOT EXISTS idx_payments_escrow_release
+  ON payments(status, updated_at)
+  WHERE status = 'paid_escrow';
+
+-- One row per engine run, for monitoring throughput and failures
+CREATE TABLE IF NOT EXISTS escrow_release_runs (
+  id UUID PRIMARY KEY,
+  started_at TIMESTAMPTZ NOT NULL,
+  finished_at TIMESTAMPTZ,
+  duration_ms INTEGER,
+  batches INTEGER NOT NULL DEFAULT 0,
+  released INTEGER NOT NULL DEFAULT 0,
+  stripe_payouts INTEGER NOT NULL DEFAULT 0,
+  manual_payouts INTEGER NOT NULL DEFAULT 0,
+  transferred INTEGER NOT NULL DEFAULT 0,
+  transfer_failed INTEGER NOT NULL DEFAULT 0,
+  transfer_requeued INTEGER NOT NULL DEFAULT 0,
+  error TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_escrow_release_runs_started ON escrow_release_runs(started_at DESC);
+
+ALTER TABLE escrow_release_runs ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Admins can view escrow release runs" ON escrow_release_runs
+  FOR SELECT USING (
+    EXISTS (SELECT 1 FROM profiles WHERE id = auth.uid() AND role = 'admin')
+  );
+
+-- Release up to p_limit due payments in one statement: mark them released, complete their offers,
+-- log the change and create one pending payout each (stripe when the creator has a Connect account
+-- and manual payouts aren't forced, manual otherwise). SKIP LOCKED lets concurrent runs split the
+-- backlog, and the 'release_<payment>' idempotency key stops a payment from being paid out twice.
+-- Only offers whose work was submitted or approved are eligible. Returns one row per released
+-- payment; payout_id is NULL when no payout was created
+CREATE OR REPLACE FUNCTION claim_escrow_releases(
+  p_run_id UUID,
+  p_limit INTEGER DEFAULT 100
+)
+RETURNS TABLE (payment_id UUID, payout_id UUID, method TEXT) AS $$
+  WITH settings AS (
+    SELECT
+      COALESCE(auto_release_days, 7) AS auto_release_days,
+      COALESCE(fallback_manual_payouts, false) AS manual_only
+    FROM platform_settings
+    ORDER BY updated_at DESC
+    LIMIT 1
+  ),
+  due AS (
+    SELECT p.id
+    FROM payments p
+    JOIN offers o ON o.id = p.offer_id
+    WHERE p.status = 'paid_escrow'
+      AND p.updated_at < now() - make_interval(days => COALESCE((SELECT auto_release_days FROM settings), 7))
+      AND o.status IN ('submitted', 'approved')
+    ORDER BY p.updated_at
+    LIMIT p_limit
+    FOR UPDATE OF p SKIP LOCKED
+  ),
+  released AS (
+    UPDATE payments p
+    SET status = 'released',
+        released_at = now(),
+        release_run_id = p_run_id
+    FROM due
+    WHERE p.id = due.id
+    RETURNING p.id, p.offer_id, p.amount_cents, p.currency
+  ),
+  completed_offers AS (
+    UPDATE offers o
+    SET status = 'completed'
+    FROM released r
+    WHERE o.id = r.offer_id
+    RETURNING o.id, o.creator_id, o.platform_fee_cents
+  ),
+  logged AS (
+    INSERT INTO payment_events (payment_id, type, from_status, to_status, data)
+    SELECT r.id, 'escrow.auto_released', 'paid_escrow', 'released', jsonb_build_object('run_id', p_run_id)
+    FROM released r
+  ),
+  created_payouts AS (
+    INSERT INTO payouts (payment_id, creator_id, amount_cents, currency, method, status, idempotency_key)
+    SELECT
+      r.id,
+      o.creator_id,
+      r.amount_cents - COALESCE(o.platform_fee_cents, 0),
+      r.currency,
+      CASE
+        WHEN COALESCE((SELECT manual_only FROM settings), false) OR pr.stripe_account_id IS NULL THEN 'manual'
+        ELSE 'stripe'
+      END,
+      'pending',
+      'release_' || r.id
+    FROM released r
+    JOIN completed_offers o ON o.id = r.offer_id
+    JOIN profiles pr ON pr.id = o.creator_id
+    WHERE r.amount_cents - COALESCE(o.platform_fee_cents, 0) > 0
+    ON CONFLICT (idempotency_key) DO NOTHING
+    RETURNING payouts.payment_id, payouts.id, payouts.method
+  )
+  SELECT r.id, cp.id, cp.method
+  FROM released r
+  LEFT JOIN created_payouts cp ON cp.payment_id = r.id;
+$$ LANGUAGE sql VOLATILE SECURITY DEFINER;
+
+REVOKE ALL ON FUNCTION claim_escrow_releases(UUID, INTEGER) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION claim_escrow_releases(UUID, INTEGER) TO service_role;
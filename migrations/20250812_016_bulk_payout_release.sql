@@ -0,0 +1,66 @@
+-- Migration: 20250812_016_bulk_payout_release.sql
+-- Set-based release of manual payouts for the admin payouts console
+
+-- Pending manual payouts in queue order, for filter-based releases
+CREATE INDEX IF NOT EXISTS idx_payouts_manual_pending
+  ON payouts(created_at)
+  WHERE method = 'manual' AND status = 'pending';
+
+-- Release the given payouts (or, when p_payout_ids is NULL, up to p_limit pending manual payouts
+-- matching the filters) in one statement, returning an outcome per payout:
+-- released, not_found, not_manual (stripe payouts go through the transfer runner) or invalid_status.
+-- previous_status is the status before this call. The UPDATE re-checks its conditions on locked
+-- rows, so concurrent releases of the same payout report it released only once
+CREATE OR REPLACE FUNCTION release_manual_payouts(
+  p_payout_ids UUID[] DEFAULT NULL,
+  p_creator_id UUID DEFAULT NULL,
+  p_created_before TIMESTAMPTZ DEFAULT NULL,
+  p_limit INTEGER DEFAULT 500,
+  p_reference_number TEXT DEFAULT NULL,
+  p_admin_notes TEXT DEFAULT NULL
+)
+RETURNS TABLE (payout_id UUID, outcome TEXT, previous_status TEXT) AS $$
+  WITH requested AS (
+    SELECT DISTINCT unnest(p_payout_ids) AS id
+    WHERE p_payout_ids IS NOT NULL
+    UNION ALL
+    SELECT q.id
+    FROM (
+      SELECT f.id
+      FROM payouts f
+      WHERE p_payout_ids IS NULL
+        AND f.method = 'manual'
+        AND f.status = 'pending'
+        AND (p_creator_id IS NULL OR f.creator_id = p_creator_id)
+        AND (p_created_before IS NULL OR f.created_at < p_created_before)
+      ORDER BY f.created_at
+      LIMIT p_limit
+    ) q
+  ),
+  released AS (
+    UPDATE payouts p
+    SET status = 'released',
+        reference_number = COALESCE(p_reference_number, p.reference_number),
+        admin_notes = COALESCE(p_admin_notes, p.admin_notes)
+    FROM requested r
+    WHERE p.id = r.id
+      AND p.method = 'manual'
+      AND p.status = 'pending'
+    RETURNING p.id
+  )
+  SELECT
+    r.id,
+    CASE
+      WHEN rel.id IS NOT NULL THEN 'released'
+      WHEN p.id IS NULL THEN 'not_found'
+      WHEN p.method <> 'manual' THEN 'not_manual'
+      ELSE 'invalid_status'
+    END,
+    p.status
+  FROM requested r
+  LEFT JOIN released rel ON rel.id = r.id
+  LEFT JOIN payouts p ON p.id = r.id;
+$$ LANGUAGE sql VOLATILE SECURITY DEFINER;
+
+REVOKE ALL ON FUNCTION release_manual_payouts(UUID[], UUID, TIMESTAMPTZ, INTEGER, TEXT, TEXT) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION release_manual_payouts(UUID[], UUID, TIMESTAMPTZ, INTEGER, TEXT, TEXT) TO service_role;
@@ -0,0 +1,203 @@
+-- Migration: 20250812_017_creator_earnings_ledger.sql
+-- Per-creator, per-currency earnings balances, maintained incrementally by triggers on payments
+-- and payouts so earnings views read one row per currency instead of scanning both tables
+
+-- Balances are the creator's share (payment amount less the offer's platform fee):
+--   escrow_cents   - paid_escrow payments
+--   released_cents - released payments
+--   refunded_cents - refunded payments
+--   paid_out_cents - released payouts
+CREATE TABLE IF NOT EXISTS creator_earnings (
+  creator_id UUID NOT NULL REFERENCES profiles(id) ON DELETE CASCADE,
+  currency TEXT NOT NULL CHECK (currency IN ('USD', 'MYR', 'SGD')),
+  escrow_cents BIGINT NOT NULL DEFAULT 0,
+  released_cents BIGINT NOT NULL DEFAULT 0,
+  refunded_cents BIGINT NOT NULL DEFAULT 0,
+  paid_out_cents BIGINT NOT NULL DEFAULT 0,
+  -- Payments that reached escrow (paid_escrow, released or refunded)
+  payment_count INTEGER NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  PRIMARY KEY (creator_id, currency)
+);
+
+ALTER TABLE creator_earnings ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Creators can view their earnings" ON creator_earnings
+  FOR SELECT USING (
+    creator_id = auth.uid() OR
+    EXISTS (SELECT 1 FROM profiles WHERE id = auth.uid() AND role = 'admin')
+  );
+
+-- Add signed deltas to a creator's balance row, creating it on first use
+CREATE OR REPLACE FUNCTION apply_creator_earnings_delta(
+  p_creator_id UUID,
+  p_currency TEXT,
+  p_escrow_cents BIGINT DEFAULT 0,
+  p_released_cents BIGINT DEFAULT 0,
+  p_refunded_cents BIGINT DEFAULT 0,
+  p_paid_out_cents BIGINT DEFAULT 0,
+  p_payment_count INTEGER DEFAULT 0
+)
+RETURNS VOID AS $$
+BEGIN
+  IF p_creator_id IS NULL THEN
+    RETURN;
+  END IF;
+
+  INSERT INTO creator_earnings AS ce (
+    creator_id, currency, escrow_cents, released_cents, refunded_cents, paid_out_cents, payment_count
+  )
+  VALUES (
+    p_creator_id, p_currency, p_escrow_cents, p_released_cents, p_refunded_cents, p_paid_out_cents, p_payment_count
+  )
+  ON CONFLICT (creator_id, currency) DO UPDATE
+  SET escrow_cents = ce.escrow_cents + EXCLUDED.escrow_cents,
+      released_cents = ce.released_cents + EXCLUDED.released_cents,
+      refunded_cents = ce.refunded_cents + EXCLUDED.refunded_cents,
+      paid_out_cents = ce.paid_out_cents + EXCLUDED.paid_out_cents,
+      payment_count = ce.payment_count + EXCLUDED.payment_count,
+      updated_at = now();
+END;
+$$ LANGUAGE plpgsql;
+
+-- Apply (p_sign = 1) or remove (p_sign = -1) one payment's contribution
+CREATE OR REPLACE FUNCTION apply_payment_to_creator_earnings(
+  p_offer_id UUID,
+  p_currency TEXT,
+  p_status TEXT,
+  p_amount_cents INTEGER,
+  p_sign INTEGER
+)
+RETURNS VOID AS $$
+DECLARE
+  v_creator_id UUID;
+  v_share BIGINT;
+BEGIN
+  IF p_status NOT IN ('paid_escrow', 'released', 'refunded') THEN
+    RETURN;
+  END IF;
+
+  SELECT o.creator_id, GREATEST(p_amount_cents - COALESCE(o.platform_fee_cents, 0), 0)
+  INTO v_creator_id, v_share
+  FROM offers o
+  WHERE o.id = p_offer_id;
+
+  v_share := v_share * p_sign;
+
+  PERFORM apply_creator_earnings_delta(
+    v_creator_id,
+    p_currency,
+    CASE WHEN p_status = 'paid_escrow' THEN v_share ELSE 0 END,
+    CASE WHEN p_status = 'released' THEN v_share ELSE 0 END,
+    CASE WHEN p_status = 'refunded' THEN v_share ELSE 0 END,
+    0,
+    p_sign
+  );
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION track_payment_creator_earnings()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    PERFORM apply_payment_to_creator_earnings(OLD.offer_id, OLD.currency, OLD.status, OLD.amount_cents, -1);
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    PERFORM apply_payment_to_creator_earnings(NEW.offer_id, NEW.currency, NEW.status, NEW.amount_cents, 1);
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE OR REPLACE FUNCTION track_payout_creator_earnings()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.status = 'released' THEN
+    PERFORM apply_creator_earnings_delta(OLD.creator_id, OLD.currency, p_paid_out_cents => -OLD.amount_cents::BIGINT);
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.status = 'released' THEN
+    PERFORM apply_creator_earnings_delta(NEW.creator_id, NEW.currency, p_paid_out_cents => NEW.amount_cents::BIGINT);
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- Hold writes while the triggers go on and the ledger is backfilled, so no change is missed
+LOCK TABLE payments, payouts IN SHARE ROW EXCLUSIVE MODE;
+
+DROP TRIGGER IF EXISTS payments_creator_earnings_write ON payments;
+CREATE TRIGGER payments_creator_earnings_write
+  AFTER INSERT OR DELETE ON payments
+  FOR EACH ROW EXECUTE PROCEDURE track_payment_creator_earnings();
+
+-- Only changes that move money between balances touch the ledger
+DROP TRIGGER IF EXISTS payments_creator_earnings_update ON payments;
+CREATE TRIGGER payments_creator_earnings_update
+  AFTER UPDATE ON payments
+  FOR EACH ROW
+  WHEN (
+    OLD.status IS DISTINCT FROM NEW.status OR
+    OLD.amount_cents IS DISTINCT FROM NEW.amount_cents OR
+    OLD.currency IS DISTINCT FROM NEW.currency OR
+    OLD.offer_id IS DISTINCT FROM NEW.offer_id
+  )
+  EXECUTE PROCEDURE track_payment_creator_earnings();
+
+DROP TRIGGER IF EXISTS payouts_creator_earnings_write ON payouts;
+CREATE TRIGGER payouts_creator_earnings_write
+  AFTER INSERT OR DELETE ON payouts
+  FOR EACH ROW EXECUTE PROCEDURE track_payout_creator_earnings();
+
+DROP TRIGGER IF EXISTS payouts_creator_earnings_update ON payouts;
+CREATE TRIGGER payouts_creator_earnings_update
+  AFTER UPDATE ON payouts
+  FOR EACH ROW
+  WHEN (
+    OLD.status IS DISTINCT FROM NEW.status OR
+    OLD.amount_cents IS DISTINCT FROM NEW.amount_cents OR
+    OLD.currency IS DISTINCT FROM NEW.currency OR
+    OLD.creator_id IS DISTINCT FROM NEW.creator_id
+  )
+  EXECUTE PROCEDURE track_payout_creator_earnings();
+
+-- Backfill from existing payments and payouts
+TRUNCATE creator_earnings;
+
+INSERT INTO creator_earnings (
+  creator_id, currency, escrow_cents, released_cents, refunded_cents, paid_out_cents, payment_count
+)
+SELECT
+  creator_id,
+  currency,
+  SUM(escrow_cents),
+  SUM(released_cents),
+  SUM(refunded_cents),
+  SUM(paid_out_cents),
+  SUM(payment_count)
+FROM (
+  SELECT
+    o.creator_id,
+    p.currency,
+    COALESCE(SUM(GREATEST(p.amount_cents - COALESCE(o.platform_fee_cents, 0), 0)) FILTER (WHERE p.status = 'paid_escrow'), 0) AS escrow_cents,
+    COALESCE(SUM(GREATEST(p.amount_cents - COALESCE(o.platform_fee_cents, 0), 0)) FILTER (WHERE p.status = 'released'), 0) AS released_cents,
+    COALESCE(SUM(GREATEST(p.amount_cents - COALESCE(o.platform_fee_cents, 0), 0)) FILTER (WHERE p.status = 'refunded'), 0) AS refunded_cents,
+    0::BIGINT AS paid_out_cents,
+    COUNT(*) AS payment_count
+  FROM payments p
+  JOIN offers o ON o.id = p.offer_id
+  WHERE p.status IN ('paid_escrow', 'released', 'refunded')
+  GROUP BY o.creator_id, p.currency
+
+  UNION ALL
+
+  SELECT
+    creator_id,
+    currency,
+    0, 0, 0,
+    SUM(amount_cents),
+    0
+  FROM payouts
+  WHERE status = 'released'
+  GROUP BY creator_id, currency
+) balances
+GROUP BY creator_id, currency;
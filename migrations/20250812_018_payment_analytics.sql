@@ -0,0 +1,59 @@
+-- Migration: 20250812_018_payment_analytics.sql
+-- Platform payment analytics aggregated in SQL, per currency and per period
+
+-- Status-filtered, date-bounded scans for the analytics aggregates and the admin payments list
+CREATE INDEX IF NOT EXISTS idx_payments_status_created
+  ON payments(status, created_at);
+
+-- One row per (currency, period) bucket plus one total row per currency (period IS NULL).
+-- Money columns:
+--   volume_cents   - gross captured: paid_escrow, released and refunded payments
+--   fees_cents     - offers.platform_fee_cents on paid_escrow and released payments
+--   escrow_cents   - paid_escrow payments still held
+--   refunded_cents - refunded payments
+-- Counts: completed (released), escrow (paid_escrow), pending, refunded, failed.
+-- Periods are truncated in UTC; p_until is exclusive
+CREATE OR REPLACE FUNCTION platform_payment_analytics(
+  p_since TIMESTAMPTZ DEFAULT NULL,
+  p_until TIMESTAMPTZ DEFAULT NULL,
+  p_bucket TEXT DEFAULT 'day'
+)
+RETURNS TABLE (
+  currency TEXT,
+  period TIMESTAMPTZ,
+  volume_cents BIGINT,
+  fees_cents BIGINT,
+  escrow_cents BIGINT,
+  refunded_cents BIGINT,
+  completed_count BIGINT,
+  escrow_count BIGINT,
+  pending_count BIGINT,
+  refunded_count BIGINT,
+  failed_count BIGINT
+) AS $$
+  SELECT
+    p.currency,
+    date_trunc(p_bucket, p.created_at, 'UTC'),
+    COALESCE(SUM(p.amount_cents) FILTER (WHERE p.status IN ('paid_escrow', 'released', 'refunded')), 0)::BIGINT,
+    COALESCE(SUM(o.platform_fee_cents) FILTER (WHERE p.status IN ('paid_escrow', 'released')), 0)::BIGINT,
+    COALESCE(SUM(p.amount_cents) FILTER (WHERE p.status = 'paid_escrow'), 0)::BIGINT,
+    COALESCE(SUM(p.amount_cents) FILTER (WHERE p.status = 'refunded'), 0)::BIGINT,
+    COUNT(*) FILTER (WHERE p.status = 'released'),
+    COUNT(*) FILTER (WHERE p.status = 'paid_escrow'),
+    COUNT(*) FILTER (WHERE p.status = 'pending'),
+    COUNT(*) FILTER (WHERE p.status = 'refunded'),
+    COUNT(*) FILTER (WHERE p.status = 'failed')
+  FROM payments p
+  LEFT JOIN offers o ON o.id = p.offer_id
+  WHERE p.status IN ('pending', 'paid_escrow', 'released', 'refunded', 'failed')
+    AND (p_since IS NULL OR p.created_at >= p_since)
+    AND (p_until IS NULL OR p.created_at < p_until)
+  GROUP BY GROUPING SETS (
+    (p.currency, date_trunc(p_bucket, p.created_at, 'UTC')),
+    (p.currency)
+  )
+  ORDER BY 1, 2 NULLS FIRST;
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
+
+REVOKE ALL ON FUNCTION platform_payment_analytics(TIMESTAMPTZ, TIMESTAMPTZ, TEXT) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION platform_payment_analytics(TIMESTAMPTZ, TIMESTAMPTZ, TEXT) TO service_role;
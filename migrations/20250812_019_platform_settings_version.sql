@@ -0,0 +1,20 @@
+-- Migration: 20250812_019_platform_settings_version.sql
+-- Version counter on platform_settings so cached copies can check for changes with a single
+-- narrow read instead of reloading the row
+
+ALTER TABLE platform_settings
+  ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+
+-- Every update bumps the version, whichever client writes it
+CREATE OR REPLACE FUNCTION bump_platform_settings_version()
+RETURNS TRIGGER AS $$
+BEGIN
+  NEW.version = OLD.version + 1;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS bump_platform_settings_version ON platform_settings;
+CREATE TRIGGER bump_platform_settings_version
+  BEFORE UPDATE ON platform_settings
+  FOR EACH ROW EXECUTE PROCEDURE bump_platform_settings_version();
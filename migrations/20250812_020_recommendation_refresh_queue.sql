@@ -0,0 +1,90 @@
+-- Migration: 20250812_020_recommendation_refresh_queue.sql
+-- Lock down the recommendation refresh functions and move campaign-driven refreshes out of
+-- campaign writes into a queue drained by /api/recommendations/refresh
+
+-- The refresh functions run as the table owner; only the service role may call them
+REVOKE ALL ON FUNCTION refresh_creator_recommendations(UUID, INTEGER, UUID) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION refresh_creator_recommendations(UUID, INTEGER, UUID) TO service_role;
+REVOKE ALL ON FUNCTION refresh_campaign_recommendations(UUID, INTEGER, BOOLEAN) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION refresh_campaign_recommendations(UUID, INTEGER, BOOLEAN) TO service_role;
+REVOKE ALL ON FUNCTION refresh_all_recommendations(INTEGER) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION refresh_all_recommendations(INTEGER) TO service_role;
+REVOKE ALL ON FUNCTION recommendations_on_campaign_change() FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION recommendations_on_campaign_change() TO service_role;
+REVOKE ALL ON FUNCTION recommendations_on_creator_change() FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION recommendations_on_creator_change() TO service_role;
+
+-- Pending refreshes: a campaign to score incrementally, or a creator to recompute in full.
+-- At most one queued row per campaign and per creator
+CREATE TABLE IF NOT EXISTS recommendation_refresh_queue (
+  id BIGSERIAL PRIMARY KEY,
+  campaign_id UUID,
+  creator_id UUID,
+  queued_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  CHECK ((campaign_id IS NULL) <> (creator_id IS NULL))
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_recommendation_queue_campaign
+  ON recommendation_refresh_queue(campaign_id) WHERE campaign_id IS NOT NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_recommendation_queue_creator
+  ON recommendation_refresh_queue(creator_id) WHERE creator_id IS NOT NULL;
+
+-- No policies: only the service role reads or writes the queue
+ALTER TABLE recommendation_refresh_queue ENABLE ROW LEVEL SECURITY;
+
+-- Campaign writes only enqueue. A deleted campaign is gone by the time the queue is drained, so
+-- the creators holding it are queued instead (the BEFORE trigger still sees their rows)
+CREATE OR REPLACE FUNCTION recommendations_on_campaign_change()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'DELETE' THEN
+    INSERT INTO recommendation_refresh_queue (creator_id)
+    SELECT creator_id FROM creator_campaign_recommendations WHERE campaign_id = OLD.id
+    ON CONFLICT (creator_id) WHERE creator_id IS NOT NULL DO NOTHING;
+    RETURN OLD;
+  END IF;
+
+  INSERT INTO recommendation_refresh_queue (campaign_id)
+  VALUES (NEW.id)
+  ON CONFLICT (campaign_id) WHERE campaign_id IS NOT NULL DO NOTHING;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Claim and apply up to p_limit queued refreshes, returning how many were processed.
+-- Claimed rows are deleted in the same transaction; SKIP LOCKED lets runs overlap safely
+CREATE OR REPLACE FUNCTION process_recommendation_refresh_queue(p_limit INTEGER DEFAULT 50)
+RETURNS INTEGER AS $$
+DECLARE
+  item RECORD;
+  processed INTEGER := 0;
+BEGIN
+  FOR item IN
+    WITH claimed AS (
+      SELECT id
+      FROM recommendation_refresh_queue
+      ORDER BY id
+      LIMIT p_limit
+      FOR UPDATE SKIP LOCKED
+    )
+    DELETE FROM recommendation_refresh_queue q
+    USING claimed c
+    WHERE q.id = c.id
+    RETURNING q.campaign_id, q.creator_id
+  LOOP
+    IF item.campaign_id IS NOT NULL THEN
+      IF EXISTS (SELECT 1 FROM campaigns WHERE id = item.campaign_id) THEN
+        PERFORM refresh_campaign_recommendations(item.campaign_id);
+      END IF;
+    ELSIF EXISTS (SELECT 1 FROM profiles WHERE id = item.creator_id AND role = 'creator') THEN
+      PERFORM refresh_creator_recommendations(item.creator_id);
+    END IF;
+    processed := processed + 1;
+  END LOOP;
+
+  RETURN processed;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE ALL ON FUNCTION process_recommendation_refresh_queue(INTEGER) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION process_recommendation_refresh_queue(INTEGER) TO service_role;
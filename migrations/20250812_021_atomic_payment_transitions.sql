@@ -0,0 +1,47 @@
+-- Migration: 20250812_021_atomic_payment_transitions.sql
+-- Move pending payments for a Stripe event and log them to payment_events in one statement,
+-- so a failure between the two can no longer leave a status change without its history row
+
+-- Match on the checkout session or the payment intent (exactly one should be given).
+-- p_set_payment_intent and p_last_error are written only when provided. Returns the payments moved
+CREATE OR REPLACE FUNCTION transition_pending_payments(
+  p_to_status TEXT,
+  p_stripe_event_id TEXT,
+  p_event_type TEXT,
+  p_session_id TEXT DEFAULT NULL,
+  p_payment_intent TEXT DEFAULT NULL,
+  p_set_payment_intent TEXT DEFAULT NULL,
+  p_last_error TEXT DEFAULT NULL
+)
+RETURNS TABLE (id UUID, offer_id UUID) AS $$
+  WITH moved AS (
+    UPDATE payments p
+    SET status = p_to_status,
+        stripe_payment_intent = COALESCE(p_set_payment_intent, p.stripe_payment_intent),
+        last_error = COALESCE(p_last_error, p.last_error),
+        updated_at = now()
+    WHERE p.status = 'pending'
+      AND (p_session_id IS NOT NULL OR p_payment_intent IS NOT NULL)
+      AND (p_session_id IS NULL OR p.stripe_session_id = p_session_id)
+      AND (p_payment_intent IS NULL OR p.stripe_payment_intent = p_payment_intent)
+    RETURNING p.id, p.offer_id
+  ),
+  -- Only a row this event already logged for the same payment is skipped
+  logged AS (
+    INSERT INTO payment_events (payment_id, stripe_event_id, type, from_status, to_status, stripe_session_id, data)
+    SELECT
+      m.id,
+      p_stripe_event_id,
+      p_event_type,
+      'pending',
+      p_to_status,
+      p_session_id,
+      CASE WHEN p_last_error IS NULL THEN '{}'::jsonb ELSE jsonb_build_object('error', p_last_error) END
+    FROM moved m
+    ON CONFLICT (payment_id, stripe_event_id) WHERE stripe_event_id IS NOT NULL DO NOTHING
+  )
+  SELECT m.id, m.offer_id FROM moved m;
+$$ LANGUAGE sql VOLATILE SECURITY DEFINER SET search_path = public;
+
+REVOKE ALL ON FUNCTION transition_pending_payments(TEXT, TEXT, TEXT, TEXT, TEXT, TEXT, TEXT) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION transition_pending_payments(TEXT, TEXT, TEXT, TEXT, TEXT, TEXT, TEXT) TO service_role;
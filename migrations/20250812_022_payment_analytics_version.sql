@@ -0,0 +1,29 @@
+-- Migration: 20250812_022_payment_analytics_version.sql
+-- Version counter for the payments table so cached analytics snapshots, in any route bundle or
+-- instance, can check for changes with a single-row read
+
+CREATE TABLE IF NOT EXISTS payment_analytics_version (
+  id BOOLEAN PRIMARY KEY DEFAULT true CHECK (id),
+  version BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+INSERT INTO payment_analytics_version (id, version) VALUES (true, 0)
+ON CONFLICT (id) DO NOTHING;
+
+-- No policies: only the service role reads the counter
+ALTER TABLE payment_analytics_version ENABLE ROW LEVEL SECURITY;
+
+-- Once per statement, so set-based releases and webhook batches bump it once
+CREATE OR REPLACE FUNCTION bump_payment_analytics_version()
+RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE payment_analytics_version SET version = version + 1, updated_at = now() WHERE id;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS bump_payment_analytics_version ON payments;
+CREATE TRIGGER bump_payment_analytics_version
+  AFTER INSERT OR UPDATE OR DELETE ON payments
+  FOR EACH STATEMENT EXECUTE PROCEDURE bump_payment_analytics_version();
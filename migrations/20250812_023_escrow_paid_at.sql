@@ -0,0 +1,118 @@
+-- Migration: 20250812_023_escrow_paid_at.sql
+-- Measure the escrow hold from when a payment was paid, not from its last update.
+-- payments.updated_at moves on every write (metadata, session reuse, events), which kept
+-- pushing auto-release back; paid_at is set once, on the transition into paid_escrow
+
+ALTER TABLE payments ADD COLUMN IF NOT EXISTS paid_at TIMESTAMPTZ;
+
+-- Stamp paid_at on every path into paid_escrow (webhook transitions, status sync, manual fixes)
+CREATE OR REPLACE FUNCTION set_payment_paid_at()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF NEW.status = 'paid_escrow'
+     AND (TG_OP = 'INSERT' OR OLD.status IS DISTINCT FROM 'paid_escrow') THEN
+    NEW.paid_at := COALESCE(NEW.paid_at, now());
+  END IF;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_payments_paid_at ON payments;
+CREATE TRIGGER trg_payments_paid_at
+  BEFORE INSERT OR UPDATE OF status ON payments
+  FOR EACH ROW EXECUTE FUNCTION set_payment_paid_at();
+
+-- Backfill from the logged transition where there is one, else the best available timestamp
+UPDATE payments p
+SET paid_at = COALESCE(
+  (SELECT min(e.created_at) FROM payment_events e WHERE e.payment_id = p.id AND e.to_status = 'paid_escrow'),
+  p.updated_at
+)
+WHERE p.paid_at IS NULL
+  AND p.status = 'paid_escrow';
+
+-- Release scan: only escrowed rows, oldest payment first
+DROP INDEX IF EXISTS idx_payments_escrow_release;
+CREATE INDEX IF NOT EXISTS idx_payments_escrow_release
+  ON payments(paid_at)
+  WHERE status = 'paid_escrow';
+
+-- Release up to p_limit due payments in one statement: mark them released, complete their offers,
+-- log the change and create one pending payout each (stripe when the creator has a Connect account
+-- and manual payouts aren't forced, manual otherwise). SKIP LOCKED lets concurrent runs split the
+-- backlog, and the 'release_<payment>' idempotency key stops a payment from being paid out twice.
+-- The hold is measured from paid_at, so later edits to a payment row don't restart it.
+-- Only offers whose work was submitted or approved are eligible. Returns one row per released
+-- payment; payout_id is NULL when no payout was created
+CREATE OR REPLACE FUNCTION claim_escrow_releases(
+  p_run_id UUID,
+  p_limit INTEGER DEFAULT 100
+)
+RETURNS TABLE (payment_id UUID, payout_id UUID, method TEXT) AS $$
+  WITH settings AS (
+    SELECT
+      COALESCE(auto_release_days, 7) AS auto_release_days,
+      COALESCE(fallback_manual_payouts, false) AS manual_only
+    FROM platform_settings
+    ORDER BY updated_at DESC
+    LIMIT 1
+  ),
+  due AS (
+    SELECT p.id
+    FROM payments p
+    JOIN offers o ON o.id = p.offer_id
+    WHERE p.status = 'paid_escrow'
+      AND p.paid_at < now() - make_interval(days => COALESCE((SELECT auto_release_days FROM settings), 7))
+      AND o.status IN ('submitted', 'approved')
+    ORDER BY p.paid_at
+    LIMIT p_limit
+    FOR UPDATE OF p SKIP LOCKED
+  ),
+  released AS (
+    UPDATE payments p
+    SET status = 'released',
+        released_at = now(),
+        release_run_id = p_run_id
+    FROM due
+    WHERE p.id = due.id
+    RETURNING p.id, p.offer_id, p.amount_cents, p.currency
+  ),
+  completed_offers AS (
+    UPDATE offers o
+    SET status = 'completed'
+    FROM released r
+    WHERE o.id = r.offer_id
+    RETURNING o.id, o.creator_id, o.platform_fee_cents
+  ),
+  logged AS (
+    INSERT INTO payment_events (payment_id, type, from_status, to_status, data)
+    SELECT r.id, 'escrow.auto_released', 'paid_escrow', 'released', jsonb_build_object('run_id', p_run_id)
+    FROM released r
+  ),
+  created_payouts AS (
+    INSERT INTO payouts (payment_id, creator_id, amount_cents, currency, method, status, idempotency_key)
+    SELECT
+      r.id,
+      o.creator_id,
+      r.amount_cents - COALESCE(o.platform_fee_cents, 0),
+      r.currency,
+      CASE
+        WHEN COALESCE((SELECT manual_only FROM settings), false) OR pr.stripe_account_id IS NULL THEN 'manual'
+        ELSE 'stripe'
+      END,
+      'pending',
+      'release_' || r.id
+    FROM released r
+    JOIN completed_offers o ON o.id = r.offer_id
+    JOIN profiles pr ON pr.id = o.creator_id
+    WHERE r.amount_cents - COALESCE(o.platform_fee_cents, 0) > 0
+    ON CONFLICT (idempotency_key) DO NOTHING
+    RETURNING payouts.payment_id, payouts.id, payouts.method
+  )
+  SELECT r.id, cp.id, cp.method
+  FROM released r
+  LEFT JOIN created_payouts cp ON cp.payment_id = r.id;
+$$ LANGUAGE sql VOLATILE SECURITY DEFINER;
+
+REVOKE ALL ON FUNCTION claim_escrow_releases(UUID, INTEGER) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION claim_escrow_releases(UUID, INTEGER) TO service_role;
@@ -0,0 +1,43 @@
+-- Migration: 20250812_024_stripe_event_claim_by_key.sql
+-- Let a webhook route drain just the payment it enqueued for, right after responding,
+-- instead of waiting for the next worker cron tick
+
+DROP FUNCTION IF EXISTS claim_stripe_events(INTEGER, TIMESTAMPTZ);
+
+-- Same claim as before; p_payment_key, when set, restricts it to one payment's events.
+-- The head-of-key rule still applies, so a targeted claim never overtakes an earlier event
+CREATE OR REPLACE FUNCTION claim_stripe_events(
+  p_limit INTEGER DEFAULT 50,
+  p_stale_before TIMESTAMPTZ DEFAULT now() - INTERVAL '2 minutes',
+  p_payment_key TEXT DEFAULT NULL
+)
+RETURNS SETOF stripe_events AS $$
+BEGIN
+  PERFORM pg_advisory_xact_lock(hashtext('claim_stripe_events'));
+
+  RETURN QUERY
+  UPDATE stripe_events e
+  SET status = 'processing',
+      locked_at = now(),
+      attempts = e.attempts + 1
+  WHERE e.id IN (
+    SELECT head.id
+    FROM (
+      SELECT DISTINCT ON (u.payment_key)
+        u.id, u.status, u.locked_at, u.available_at, u.stripe_created_at
+      FROM stripe_events u
+      WHERE u.status IN ('pending', 'processing')
+        AND (p_payment_key IS NULL OR u.payment_key = p_payment_key)
+      ORDER BY u.payment_key, u.stripe_created_at, u.id
+    ) head
+    WHERE (head.status = 'pending' AND head.available_at <= now())
+       OR (head.status = 'processing' AND head.locked_at < p_stale_before)
+    ORDER BY head.stripe_created_at
+    LIMIT p_limit
+  )
+  RETURNING e.*;
+END;
+$$ LANGUAGE plpgsql VOLATILE SECURITY DEFINER;
+
+REVOKE ALL ON FUNCTION claim_stripe_events(INTEGER, TIMESTAMPTZ, TEXT) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION claim_stripe_events(INTEGER, TIMESTAMPTZ, TEXT) TO service_role;